@@ -5,23 +5,30 @@
 import logging
 import uuid
 import collections.abc
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from itertools import groupby
 from typing import Any, Iterable, cast, Callable, Hashable, Mapping, Sequence
 import datetime
 
+import dask
 import deprecat
 import numpy
+import shapely
 import xarray
 from dask import array as da
+from dask.delayed import Delayed
 
 from datacube.cfg import GeneralisedRawCfg, GeneralisedCfg, GeneralisedEnv, ODCConfig
 from datacube.storage import reproject_and_fuse, BandInfo
 from datacube.utils import ignore_exceptions_if
+from datacube.utils.generic import batched
 from odc.geo import CRS, yx_, res_, resyx_, Resolution, XY
 from odc.geo.warp import Resampling
 from odc.geo.xr import xr_coords
 from datacube.utils.dates import normalise_dt
-from odc.geo.geom import intersects, box, bbox_union, Geometry
+from odc.geo.geom import box, bbox_union, Geometry
 from odc.geo.geobox import GeoBox, GeoboxTiles
 from datacube.model import (
     ExtraDimensions,
@@ -30,7 +37,6 @@ from datacube.model import (
     Measurement,
     GridSpec,
 )
-from datacube.model.utils import xr_apply
 
 from .query import Query, query_group_by, GroupBy
 from ..index import index_connect, Index, extract_geom_from_query
@@ -286,6 +292,7 @@ class Datacube:
         patch_url: Callable[[str], str] | None = None,
         limit: int | None = None,
         driver: Any | None = None,
+        read_concurrency: int | None = None,
         **query: QueryField,
     ):
         r"""
@@ -506,6 +513,11 @@ class Datacube:
 
         :param driver: Optional. If provided, use the specified driver to load the data.
 
+        :param read_concurrency: Optional. If greater than 1, read up to this many (time slice, measurement)
+            pairs concurrently on a thread pool. Data sources within a single output slice are still
+            read and fused one after another in the usual order, so results are identical to a serial load.
+            This is only applicable to non-lazy loads, ignored when using dask.
+
         :param query: Search parameters for products and dimension ranges as described above.
             For example: ``'x', 'y', 'time', 'crs'``.
 
@@ -526,6 +538,7 @@ class Datacube:
                 dataset_predicate=dataset_predicate,
                 like=like,
                 limit=limit,
+                lean=False,
                 product=product,
                 **query,
             )
@@ -606,6 +619,7 @@ class Datacube:
             extra_dims=extra_dims,
             patch_url=patch_url,
             driver=driver,
+            read_concurrency=read_concurrency,
         )
 
         return result
@@ -616,6 +630,7 @@ class Datacube:
         dataset_predicate: Callable[[Dataset], bool] | None = None,
         like: GeoBox | xarray.Dataset | xarray.DataArray | None = None,
         limit: int | None = None,
+        lean: bool = False,
         **search_terms: QueryField,
     ) -> list[Dataset]:
         """
@@ -631,6 +646,8 @@ class Datacube:
                 pq = dc.load(product='ls5_pq_albers', like=nbar_dataset)
 
         :param limit: if provided, limit the maximum number of datasets returned
+        :param lean: return lean datasets, whose metadata documents are only fetched from the index
+            when first needed (see :meth:`datacube.index.abstract.AbstractDatasetResource.search_lean`)
         :param search_terms: see :class:`datacube.api.query.Query`
         :return: list of datasets
 
@@ -642,6 +659,7 @@ class Datacube:
                 ensure_location=ensure_location,
                 dataset_predicate=dataset_predicate,
                 like=like,
+                lean=lean,
                 **search_terms,
             )
         )  # type: ignore[arg-type]
@@ -652,6 +670,7 @@ class Datacube:
         ensure_location: bool = False,
         dataset_predicate: Callable[[Dataset], bool] | None = None,
         like: GeoBox | xarray.Dataset | xarray.DataArray | None = None,
+        lean: bool = False,
         **kwargs: QueryField,
     ) -> Iterable[Dataset]:
         """
@@ -666,6 +685,8 @@ class Datacube:
             E.g.::
 
                 pq = dc.load(product='ls5_pq_albers', like=nbar_dataset)
+        :param lean: return lean datasets, whose metadata documents are only fetched from the index
+            when first needed
         :param kwargs: see :class:`datacube.api.query.Query`
         :return: iterator of datasets
         :rtype: __generator[:class:`datacube.model.Dataset`]
@@ -676,7 +697,10 @@ class Datacube:
         if not query.product:
             raise ValueError("must specify a product")
 
-        datasets = self.index.datasets.search(limit=limit, **query.search_terms)
+        if lean:
+            datasets = self.index.datasets.search_lean(limit=limit, **query.search_terms)
+        else:
+            datasets = self.index.datasets.search(limit=limit, **query.search_terms)
 
         if query.geopolygon is not None and not self.index.supports_spatial_indexes:
             datasets = select_datasets_inside_polygon(datasets, query.geopolygon)
@@ -724,18 +748,26 @@ class Datacube:
             dss = tuple(sorted(group, key=ds_sorter))
             return (norm_axis_value(group_by.group_key(dss)), dss)
 
-        datasets = sorted(datasets, key=group_by.group_by_func)
+        datasets = list(datasets)
+        grouped = None
+        if group_by.group_keys is not None and datasets:
+            grouped = _group_datasets_vectorised(datasets, group_by)
 
-        groups = [
-            mk_group(group) for _, group in groupby(datasets, group_by.group_by_func)
-        ]
+        if grouped is not None:
+            coords, data = grouped
+        else:
+            datasets.sort(key=group_by.group_by_func)
+
+            groups = [
+                mk_group(group) for _, group in groupby(datasets, group_by.group_by_func)
+            ]
 
-        groups.sort(key=lambda x: x[0])
+            groups.sort(key=lambda x: x[0])
 
-        coords = numpy.asarray([coord for coord, _ in groups])
-        data = numpy.empty(len(coords), dtype=object)
-        for i, (_, dss) in enumerate(groups):
-            data[i] = dss  # type: ignore[assignment, call-overload]
+            coords = numpy.asarray([coord for coord, _ in groups])
+            data = numpy.empty(len(coords), dtype=object)
+            for i, (_, dss) in enumerate(groups):
+                data[i] = dss  # type: ignore[assignment, call-overload]
 
         sources = xarray.DataArray(data, dims=[group_by.dimension], coords=[coords])
         if coords.dtype.kind == "M":
@@ -877,18 +909,21 @@ class Datacube:
             extra_dim_chunks = chunk_sizes[1]
         grid_chunks = chunk_sizes[-1]
         gbt = GeoboxTiles(geobox, grid_chunks)
-        dsk = {}
 
-        def chunk_datasets(dss, gbt):
-            out = {}
+        # Unique dataset objects, in the order they are first encountered
+        unique_dss = {id(ds): ds for dss in sources.values.ravel() for ds in dss}
+        ds_tiles = dict(zip(unique_dss, _dataset_tiles(list(unique_dss.values()), gbt)))
+
+        # (*irregular index, tile_y, tile_x) -> datasets for that chunk, in fusing order
+        chunked_srcs: dict[tuple[int, ...], list[Dataset]] = {}
+        for irr_index, dss in numpy.ndenumerate(sources.values):
             for ds in dss:
-                dsk[_tokenize_dataset(ds)] = ds
-                for idx in gbt.tiles(ds.extent):
-                    out.setdefault(idx, []).append(ds)
-            return out
+                for idx in ds_tiles[id(ds)]:
+                    chunked_srcs.setdefault(irr_index + idx, []).append(ds)
 
-        chunked_srcs = xr_apply(
-            sources, lambda _, dss: chunk_datasets(dss, gbt), dtype=object
+        # Stored once in the graph and shared by all the per-chunk tasks of all measurements
+        chunked_srcs_key = dask.delayed(
+            chunked_srcs, name="dc_load_srcs-" + uuid.uuid4().hex, traverse=False
         )
 
         def data_func(measurement, shape):
@@ -897,8 +932,8 @@ class Datacube:
             else:
                 chunks = needed_irr_chunks + grid_chunks
             return _make_dask_array(
-                chunked_srcs,
-                dsk,
+                chunked_srcs_key,
+                sources.shape,
                 gbt,
                 measurement,
                 chunks=chunks,
@@ -924,11 +959,23 @@ class Datacube:
         progress_cbk: ProgressFunction | None = None,
         extra_dims: ExtraDimensions | None = None,
         patch_url: Callable[[str], str] | None = None,
+        read_concurrency: int | None = None,
     ) -> xarray.Dataset:
+        concurrent = read_concurrency is not None and read_concurrency > 1
+        # Set when a concurrent load is terminated, checked by reads still in flight
+        cancelled = threading.Event()
 
         def mk_cbk(cbk: ProgressFunction | None) -> ProgressFunction | None:
             if cbk is None:
-                return None
+                if not concurrent:
+                    return None
+
+                def _check_cancelled(*ignored):
+                    if cancelled.is_set():
+                        raise TerminateCurrentLoad()
+
+                return _check_cancelled
+
             n = 0
             t_size = sum(len(x) for x in sources.values.ravel())
             n_total = 0
@@ -941,11 +988,20 @@ class Datacube:
                     )
                 else:
                     n_total += t_size
+            lock = threading.Lock()
 
             def _cbk(*ignored):
                 nonlocal n
-                n += 1
-                return cbk(n, n_total)
+                with lock:
+                    if cancelled.is_set():
+                        raise TerminateCurrentLoad()
+                    n += 1
+                    try:
+                        return cbk(n, n_total)
+                    except (TerminateCurrentLoad, KeyboardInterrupt):
+                        # Set while still holding the lock, so no later callback reaches cbk
+                        cancelled.set()
+                        raise
 
             return _cbk
 
@@ -977,20 +1033,38 @@ class Datacube:
                     extra_dim_index = m.get("extra_dim_index", None)
                     read_ios.append((index, (datasets, m, extra_dim_index)))
 
+        def do_read_io(index, datasets, m, extra_dim_index) -> None:
+            _fuse_measurement(
+                data[m.name].values[index],
+                datasets,
+                geobox,
+                m,
+                skip_broken_datasets=skip_broken_datasets,
+                progress_cbk=_cbk,
+                extra_dim_index=extra_dim_index,
+                patch_url=patch_url,
+            )
+
+        if concurrent:
+            # Every read IO operation writes into its own output slice, so they can run
+            # independently, while sources within a slice are still fused in order.
+            assert read_concurrency is not None  # for type-checker
+            completed = _run_read_ios_concurrently(
+                [
+                    functools.partial(do_read_io, index, *args)
+                    for index, args in read_ios
+                ],
+                read_concurrency,
+                cancelled,
+            )
+            if not completed:
+                data.attrs["dc_partial_load"] = True
+            return data
+
         # Perform the read IO operations
         for index, (datasets, m, extra_dim_index) in read_ios:
-            data_slice = data[m.name].values[index]
             try:
-                _fuse_measurement(
-                    data_slice,
-                    datasets,
-                    geobox,
-                    m,
-                    skip_broken_datasets=skip_broken_datasets,
-                    progress_cbk=_cbk,
-                    extra_dim_index=extra_dim_index,
-                    patch_url=patch_url,
-                )
+                do_read_io(index, datasets, m, extra_dim_index)
             except (TerminateCurrentLoad, KeyboardInterrupt):
                 data.attrs["dc_partial_load"] = True
                 return data
@@ -1010,6 +1084,7 @@ class Datacube:
         extra_dims: ExtraDimensions | None = None,
         patch_url: Callable[[str], str] | None = None,
         driver: Any | None = None,
+        read_concurrency: int | None = None,
         **extra,
     ) -> xarray.Dataset:
         """
@@ -1060,6 +1135,11 @@ class Datacube:
         :param driver:
             Optional. If provided, use the specified driver to load the data.
 
+        :param read_concurrency:
+            Optional. If greater than 1, read up to this many output slices (time slice and measurement)
+            concurrently on a thread pool. Sources within a slice are still fused in order. This is
+            only applicable to non-lazy loads, ignored when using dask.
+
         :rtype: xarray.Dataset
 
         .. seealso:: :meth:`find_datasets` :meth:`group_datasets`
@@ -1100,6 +1180,7 @@ class Datacube:
                 progress_cbk=progress_cbk,
                 extra_dims=extra_dims,
                 patch_url=patch_url,
+                read_concurrency=read_concurrency,
             )
 
     def __str__(self):
@@ -1159,6 +1240,44 @@ def per_band_load_data_settings(
     return measurements
 
 
+def _group_datasets_vectorised(
+    datasets: list[Dataset], group_by: GroupBy
+) -> tuple[numpy.ndarray, numpy.ndarray] | None:
+    """
+    Group datasets with the vectorised keys of a :class:`GroupBy`.
+
+    Gives the same groups, in the same order, as the generic implementation in
+    :meth:`Datacube.group_datasets`: datasets are sorted by group, then by sort key
+    and id, and groups are ordered by the sort key of their first dataset.
+
+    :return: (coordinates, datasets for each coordinate), or None if the datasets
+             do not all have UUIDs and the generic implementation must be used.
+    """
+    try:
+        ids = numpy.array([ds.id.bytes for ds in datasets], dtype="S16")
+    except AttributeError:
+        return None
+    group_ids, sort_keys = group_by.group_keys(datasets)
+
+    # lexsort is stable and sorts by the last key first
+    order = numpy.lexsort((ids, sort_keys, group_ids))
+    group_ids = group_ids[order]
+    starts = numpy.flatnonzero(numpy.r_[True, group_ids[1:] != group_ids[:-1]])
+    ends = numpy.r_[starts[1:], len(order)]
+    coords = sort_keys[order][starts]
+    group_order = numpy.argsort(coords, kind="stable")
+
+    ordered = [datasets[i] for i in order.tolist()]
+    data = numpy.empty(len(starts), dtype=object)
+    for i, g in enumerate(group_order.tolist()):
+        data[i] = tuple(ordered[starts[g]:ends[g]])
+
+    coords = coords[group_order]
+    if coords.dtype.kind == "M":
+        coords = coords.astype("datetime64[ns]")
+    return coords, data
+
+
 def output_geobox(
     like: GeoBox | xarray.Dataset | xarray.DataArray | None = None,
     output_crs: Any = None,
@@ -1257,15 +1376,27 @@ def output_geobox(
 
 
 def select_datasets_inside_polygon(
-    datasets: Iterable[Dataset], polygon: Geometry
+    datasets: Iterable[Dataset], polygon: Geometry, batch_size: int = 10000
 ) -> Iterable[Dataset]:
-    # Check against the bounding box of the original scene, can throw away some portions
-    # (Only needed for index drivers without spatial index support)
+    """
+    Filter datasets whose extent intersects a polygon (touching is not enough).
+
+    Only needed for index drivers without spatial index support. Datasets are
+    checked in batches: extents are reprojected with one call per source CRS and
+    tested against the prepared polygon with vectorised shapely predicates.
+    """
     assert polygon is not None
     query_crs = polygon.crs
-    for dataset in datasets:
-        if intersects(polygon, dataset.extent.to_crs(query_crs)):
-            yield dataset
+    assert query_crs is not None  # For type checker
+    geom = polygon.geom
+    shapely.prepare(geom)
+    for batch in batched(datasets, batch_size):
+        extents = _extents_to_crs(batch, query_crs)
+        # Same test as odc.geo.geom.intersects, only checking touches for candidates
+        (hits,) = numpy.nonzero(shapely.intersects(geom, extents))
+        hits = hits[~shapely.touches(geom, extents[hits])]
+        for i in hits.tolist():
+            yield batch[i]
 
 
 def fuse_lazy(
@@ -1333,8 +1464,37 @@ def _fuse_measurement(
     )
 
 
+def _run_read_ios_concurrently(
+    read_ios: Sequence[Callable[[], None]],
+    max_workers: int,
+    cancelled: threading.Event,
+) -> bool:
+    """
+    Run read IO operations on a thread pool of ``max_workers`` threads.
+
+    Returns ``False`` if the load was terminated early with :class:`TerminateCurrentLoad`
+    or ``KeyboardInterrupt``. Any other error is re-raised once in-flight reads have stopped.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = [pool.submit(read_io) for read_io in read_ios]
+        try:
+            for future in as_completed(futures):
+                future.result()
+        except (TerminateCurrentLoad, KeyboardInterrupt):
+            cancelled.set()
+            for future in futures:
+                future.cancel()
+            return False
+        except Exception:
+            cancelled.set()
+            for future in futures:
+                future.cancel()
+            raise
+    return True
+
+
 def get_bounds(datasets: Iterable[Dataset], crs: CRS) -> Geometry:
-    bbox = bbox_union(ds.extent.to_crs(crs).boundingbox for ds in datasets)
+    bbox = bbox_union(ds.extent.to_crs(crs).boundingbox for ds in datasets if ds.extent is not None)
     return box(*bbox, crs=crs)  # type: ignore[misc]
 
 
@@ -1397,112 +1557,195 @@ def _calculate_chunk_sizes(
         return irr_chunks, grid_chunks
 
 
-def _tokenize_dataset(dataset: Dataset) -> str:
-    return "dataset-{}".format(dataset.id.hex)
+def _extents_to_crs(datasets: Sequence[Dataset], crs: CRS) -> numpy.ndarray:
+    """
+    Dataset extents as an array of shapely geometries in a given CRS.
+
+    Extents are reprojected with one vectorised call per source CRS, rather than one
+    call per dataset. Datasets without an extent get ``None``.
+    """
+    out = numpy.full(len(datasets), None, dtype=object)
+    extents = [ds.extent for ds in datasets]
+
+    # Keyed on the CRS string, hashing CRS objects is slow
+    by_crs: dict[str, tuple[CRS, list[int]]] = {}
+    for i, extent in enumerate(extents):
+        if extent is not None:
+            assert extent.crs is not None  # Dataset extents are in the dataset CRS
+            by_crs.setdefault(str(extent.crs), (extent.crs, []))[1].append(i)
+
+    for src_crs, idx in by_crs.values():
+        src_extents = [cast(Geometry, extents[i]) for i in idx]
+        geoms = numpy.array([extent.geom for extent in src_extents], dtype=object)
+        if src_crs != crs:
+            tr = src_crs.transformer_to_crs(crs)
+            geoms = shapely.transform(
+                geoms, lambda xy: numpy.column_stack(tr(xy[:, 0], xy[:, 1]))
+            )
+            # Projection failed for some vertices, use the slow path that knows how to fix these up
+            for i in numpy.flatnonzero(~shapely.is_valid(geoms)):
+                geoms[i] = src_extents[i].to_crs(crs, check_and_fix=True).geom
+        out[idx] = geoms
 
+    return out
 
-# pylint: disable=too-many-locals
-def _make_dask_array(
-    chunked_srcs: xarray.DataArray,
-    dsk,
-    gbt,
+
+def _dataset_tiles(
+    datasets: Sequence[Dataset], gbt: GeoboxTiles
+) -> list[list[tuple[int, int]]]:
+    """
+    Compute tiles of ``gbt`` overlapping with each dataset.
+
+    Equivalent to ``[list(gbt.tiles(ds.extent)) for ds in datasets]``, but all the
+    datasets are processed together with vectorised shapely and numpy operations.
+    """
+    # pylint: disable=too-many-locals
+    geobox = gbt.base
+    if not isinstance(geobox, GeoBox) or geobox.crs is None:
+        return [
+            [] if ds.extent is None else list(gbt.tiles(ds.extent)) for ds in datasets
+        ]
+
+    out: list[list[tuple[int, int]]] = [[] for _ in datasets]
+    geoms = _extents_to_crs(datasets, geobox.crs)
+    valid = numpy.flatnonzero(
+        numpy.asarray([g is not None and not g.is_empty for g in geoms], dtype=bool)
+    )
+    if len(valid) == 0:
+        return out
+
+    # Move to pixel space of the geobox, where every tile is an axis aligned box
+    A = ~geobox.transform
+    pix = shapely.transform(
+        geoms[valid],
+        lambda xy: numpy.column_stack(
+            (
+                A.a * xy[:, 0] + A.b * xy[:, 1] + A.c,
+                A.d * xy[:, 0] + A.e * xy[:, 1] + A.f,
+            )
+        ),
+    )
+
+    # Tile ranges overlapping bounding boxes, same as ``GeoboxTiles.range_from_bbox``
+    ny, nx = geobox.shape.yx
+    y_edges, x_edges = (numpy.cumsum((0,) + ch) for ch in gbt.chunks)
+    x1, y1, x2, y2 = shapely.bounds(pix).T
+    x1 = numpy.clip(numpy.floor(x1), 0, nx - 1)
+    y1 = numpy.clip(numpy.floor(y1), 0, ny - 1)
+    x2 = numpy.clip(numpy.ceil(x2), 1, nx) - 1
+    y2 = numpy.clip(numpy.ceil(y2), 1, ny) - 1
+    ty1, ty2 = (numpy.searchsorted(y_edges, v, side="right") - 1 for v in (y1, y2))
+    tx1, tx2 = (numpy.searchsorted(x_edges, v, side="right") - 1 for v in (x1, x2))
+
+    # Candidate (dataset, tile) pairs, then exact intersection test for every pair
+    n_ty, n_tx = ty2 - ty1 + 1, tx2 - tx1 + 1
+    counts = n_ty * n_tx
+    pair_ds = numpy.repeat(numpy.arange(len(valid)), counts)
+    offset = numpy.arange(counts.sum()) - numpy.repeat(numpy.cumsum(counts) - counts, counts)
+    pair_ty = ty1[pair_ds] + offset // n_tx[pair_ds]
+    pair_tx = tx1[pair_ds] + offset % n_tx[pair_ds]
+
+    tile_boxes = shapely.box(
+        x_edges[pair_tx], y_edges[pair_ty], x_edges[pair_tx + 1], y_edges[pair_ty + 1]
+    )
+    hit = shapely.intersects(pix[pair_ds], tile_boxes)
+
+    for i, ty, tx in zip(pair_ds[hit], pair_ty[hit], pair_tx[hit]):
+        out[valid[i]].append((int(ty), int(tx)))
+
+    return out
+
+
+def _fuse_block(
+    chunked_srcs: Mapping[tuple[int, ...], Sequence[Dataset]],
+    gbt: GeoboxTiles,
     measurement: Measurement,
-    chunks,
+    prepend_dims: int,
     skip_broken_datasets: bool = False,
-    extra_dims: ExtraDimensions | None = None,
+    extra_dim_start: int | None = None,
     patch_url: Callable[[str], str] | None = None,
-):
-    dsk = dsk.copy()  # this contains mapping from dataset id to dataset object
-
-    token = uuid.uuid4().hex
-    dsk_name = "dc_load_{name}-{token}".format(name=measurement.name, token=token)
-
-    needed_irr_chunks, grid_chunks = chunks[:-2], chunks[-2:]
-    actual_irr_chunks = (1,) * len(needed_irr_chunks)
+    block_id: tuple[int, ...] | None = None,
+) -> numpy.ndarray:
+    assert block_id is not None
+    tile = cast(tuple[int, int], block_id[-2:])
+    if extra_dim_start is not None:
+        # 3D case: extra dimension chunk is the last one before the spatial ones
+        irr_index = block_id[:-3]
+        extra_dim_index = extra_dim_start + block_id[-3]
+    else:
+        irr_index = block_id[:-2]
+        extra_dim_index = measurement.get("extra_dim_index", None)
 
-    # we can have up to 4 empty chunk shapes: whole, right edge, bottom edge and
-    # bottom right corner
-    #  W R
-    #  B BR
-    empties: dict[tuple[int, int], str] = {}
-
-    def _mk_empty(shape: tuple[int, int]) -> str:
-        name = empties.get(shape, None)
-        if name is not None:
-            return name
-
-        name = "empty_{}x{}-{token}".format(*shape, token=token)
-        dsk[name] = (
-            numpy.full,
-            actual_irr_chunks + shape,
+    dss = chunked_srcs.get(irr_index + tile, None)
+    if dss is None:
+        return numpy.full(
+            (1,) * prepend_dims + gbt.chunk_shape(tile).yx,
             measurement.nodata,
-            measurement.dtype,
+            dtype=measurement.dtype,
         )
-        empties[shape] = name
 
-        return name
-
-    for irr_index, tiled_dss in numpy.ndenumerate(chunked_srcs.values):
-        key_prefix = (dsk_name, *irr_index)
+    geobox = gbt[tile]
+    assert isinstance(geobox, GeoBox)  # For type checker
+    return fuse_lazy(
+        dss,
+        geobox,
+        measurement,
+        skip_broken_datasets,
+        prepend_dims,
+        extra_dim_index,
+        patch_url,
+    )
 
-        # all spatial chunks
-        for idx in numpy.ndindex(gbt.shape.shape):
-            dss = tiled_dss.get(idx, None)
 
-            if dss is None:
-                val3d = _mk_empty(gbt.chunk_shape(idx).xy)
-                # 3D case
-                if "extra_dim" in measurement:
-                    assert extra_dims is not None  # For type checker
-                    index_subset = extra_dims.measurements_index(measurement.extra_dim)
-                    for result_index, extra_dim_index in numpy.ndenumerate(
-                        range(*index_subset)
-                    ):
-                        dsk[key_prefix + result_index + idx] = val3d
-                else:
-                    dsk[key_prefix + idx] = val3d
-            else:
-                val = (
-                    fuse_lazy,
-                    [_tokenize_dataset(ds) for ds in dss],
-                    gbt[idx],
-                    measurement,
-                    skip_broken_datasets,
-                    len(needed_irr_chunks),
-                )
-
-                # 3D case
-                if "extra_dim" in measurement:
-                    # Do extra_dim subsetting here
-                    assert extra_dims is not None  # For type checker
-                    index_subset = extra_dims.measurements_index(measurement.extra_dim)
-                    for result_index, extra_dim_index in enumerate(range(*index_subset)):  # type: ignore[assignment]
-                        dsk[key_prefix + (result_index,) + idx] = val + (
-                            extra_dim_index,
-                            patch_url,
-                        )
-                else:
-                    # Get extra_dim index if available
-                    extra_dim_index = measurement.get("extra_dim_index", None)
-                    dsk[key_prefix + idx] = val + (extra_dim_index, patch_url)
+def _make_dask_array(
+    chunked_srcs: Delayed,
+    irr_shape: tuple[int, ...],
+    gbt: GeoboxTiles,
+    measurement: Measurement,
+    chunks,
+    skip_broken_datasets: bool = False,
+    extra_dims: ExtraDimensions | None = None,
+    patch_url: Callable[[str], str] | None = None,
+) -> da.Array:
+    """
+    Build dask array for a single measurement.
 
-    y_shapes = [grid_chunks[0]] * gbt.shape[0]
-    x_shapes = [grid_chunks[1]] * gbt.shape[1]
+    The graph consists of a single blockwise layer, so tasks are only generated
+    for the chunks that end up being computed.
+    """
+    token = uuid.uuid4().hex
+    dsk_name = "dc_load_{name}-{token}".format(name=measurement.name, token=token)
 
-    y_shapes[-1], x_shapes[-1] = gbt.chunk_shape(tuple(n - 1 for n in gbt.shape))
+    needed_irr_chunks = chunks[:-2]
+    actual_irr_chunks = (1,) * len(needed_irr_chunks)
 
     extra_dim_shape: tuple = ()
+    extra_dim_start = None
     if "extra_dim" in measurement:
         assert extra_dims is not None  # For type checker
         dim_name = measurement.extra_dim
         extra_dim_shape += (len(extra_dims.measurements_values(dim_name)),)
+        # Do extra_dim subsetting here
+        extra_dim_start, _ = extra_dims.measurements_index(dim_name)
+
+    shape = irr_shape + extra_dim_shape
+    fuse_block = functools.partial(
+        _fuse_block,
+        gbt=gbt,
+        measurement=measurement,
+        prepend_dims=len(needed_irr_chunks),
+        skip_broken_datasets=skip_broken_datasets,
+        extra_dim_start=extra_dim_start,
+        patch_url=patch_url,
+    )
 
-    data = da.Array(
-        dsk,
-        dsk_name,
-        chunks=actual_irr_chunks + (tuple(y_shapes), tuple(x_shapes)),
+    data = da.map_blocks(
+        fuse_block,
+        chunked_srcs,
+        name=dsk_name,
+        chunks=tuple((1,) * n for n in shape) + gbt.chunks,
         dtype=measurement.dtype,
-        shape=(chunked_srcs.shape + extra_dim_shape + gbt.base.shape),
+        meta=numpy.empty((0,) * (len(shape) + 2), dtype=measurement.dtype),
     )
 
     if needed_irr_chunks != actual_irr_chunks:
@@ -27,7 +27,7 @@ _LOG = logging.getLogger(__name__)
 
 
 class GroupBy:
-    def __init__(self, group_by_func, dimension, units, sort_key=None, group_key=None):
+    def __init__(self, group_by_func, dimension, units, sort_key=None, group_key=None, group_keys=None):
         """
         GroupBy Object
 
@@ -37,6 +37,10 @@ class GroupBy:
         :param sort_key: how to sort datasets in a group internally
         :param group_key: the coordinate value for a group
                           list[Dataset] -> coord value
+        :param group_keys: optional vectorised form of group_by_func and sort_key
+                           list[Dataset] -> (group identifiers, sort keys) as numpy arrays.
+                           Only valid when the coordinate value of a group is the sort key
+                           of its first dataset.
         """
         self.group_by_func = group_by_func
 
@@ -50,6 +54,7 @@ class GroupBy:
         if group_key is None:
             group_key = lambda datasets: group_by_func(datasets[0])  # noqa: E731
         self.group_key = group_key
+        self.group_keys = group_keys
 
 
 OTHER_KEYS = ('measurements', 'group_by', 'output_crs', 'resolution', 'set_nan', 'product', 'geopolygon', 'like',
@@ -178,6 +183,7 @@ class Query:
 
 
 def _extract_time_from_ds(ds: Dataset) -> datetime.datetime:
+    assert ds.center_time is not None  # For type checker
     return normalise_dt(ds.center_time)
 
 
@@ -203,13 +209,15 @@ def query_group_by(group_by='time', **kwargs):
 
     time_grouper = GroupBy(group_by_func=_extract_time_from_ds,
                            dimension='time',
-                           units='seconds since 1970-01-01 00:00:00')
+                           units='seconds since 1970-01-01 00:00:00',
+                           group_keys=_time_keys)
 
     solar_day_grouper = GroupBy(group_by_func=solar_day,
                                 dimension='time',
                                 units='seconds since 1970-01-01 00:00:00',
                                 sort_key=_extract_time_from_ds,
-                                group_key=lambda datasets: _extract_time_from_ds(datasets[0]))
+                                group_key=lambda datasets: _extract_time_from_ds(datasets[0]),
+                                group_keys=_solar_day_keys)
 
     group_by_map = {
         None: time_grouper,
@@ -316,6 +324,7 @@ def solar_day(dataset: Dataset, longitude: Optional[float] = None) -> np.datetim
     :param longitude: If supplied correct timestamp for this longitude,
                       rather than mid-point of the Dataset's footprint
     """
+    assert dataset.center_time is not None  # For type checker
     utc = dataset.center_time.astimezone(datetime.timezone.utc)
 
     if longitude is None:
@@ -328,6 +337,53 @@ def solar_day(dataset: Dataset, longitude: Optional[float] = None) -> np.datetim
     return np.datetime64(solar_time.date(), 'D')
 
 
+_EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+_MICROSECOND = datetime.timedelta(microseconds=1)
+
+
+def _to_datetime64(times) -> np.ndarray:
+    """
+    Convert datetimes to UTC numpy datetimes, naive datetimes are assumed to be UTC like in normalise_dt.
+
+    Much faster than letting numpy convert datetime objects.
+    """
+    naive_epoch = _EPOCH.replace(tzinfo=None)
+    return np.array([(t - (naive_epoch if t.tzinfo is None else _EPOCH)) // _MICROSECOND for t in times],
+                    dtype='int64').view('datetime64[us]')
+
+
+def _time_keys(datasets):
+    """
+    Vectorised time grouping: every dataset is grouped and sorted by its UTC center time.
+    """
+    times = _to_datetime64([ds.center_time for ds in datasets])
+    return times, times
+
+
+def _solar_day_keys(datasets):
+    """
+    Vectorised solar day grouping: time and mid-longitude of every dataset are read in one pass,
+    and the solar days are computed with numpy.
+
+    Produces the same days as :func:`solar_day`.
+    """
+    times, utc_times, lons = [], [], []
+    for ds in datasets:
+        time = ds.center_time
+        lon = _ds_mid_longitude(ds)
+        if lon is None:
+            raise ValueError('Cannot compute solar_day: dataset is missing spatial info')
+        times.append(time)
+        # solar_day() treats naive timestamps as local time
+        utc_times.append(time if time.tzinfo is not None else time.astimezone(datetime.timezone.utc))
+        lons.append(lon)
+
+    # Same truncation to whole seconds as _convert_to_solar_time
+    offsets = np.trunc(np.array(lons, dtype='float64') * 240).astype('int64').astype('timedelta64[s]')
+    days = (_to_datetime64(utc_times) + offsets).astype('datetime64[D]')
+    return days, _to_datetime64(times)
+
+
 def solar_offset(geom: Union[Geometry, Dataset],
                  precision: str = 'h') -> datetime.timedelta:
     """
@@ -351,6 +351,16 @@ class ODCEnvironment:
         except KeyError:
             raise AttributeError(item)
 
+    def __getstate__(self) -> dict[str, Any]:
+        # Locks cannot be pickled, e.g. to pass an environment to a worker process.
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = Lock()
+
     def _handle_option(self, handler: ODCOptionHandler) -> None:
         val = handler.get_val_from_environment()
         if val:
@@ -19,6 +19,8 @@ if TYPE_CHECKING:
 
 _DEFAULT_IAM_TIMEOUT = 600
 _DEFAULT_CONN_TIMEOUT = 60
+_DEFAULT_SEARCH_FETCH_SIZE = 1000
+_DEFAULT_CATALOGUE_CACHE_TTL = 60
 _DEFAULT_HOSTNAME = 'localhost'
 _DEFAULT_DATABASE = 'datacube'
 
@@ -283,7 +285,9 @@ def config_options_for_psql_driver(env: "ODCEnvironment"):
                                  legacy_env_aliases=['DATACUBE_DB_URL']),
         IAMAuthenticationOptionHandler("db_iam_authentication", env,
                                        legacy_env_aliases=['DATACUBE_IAM_AUTHENTICATION']),
-        IntOptionHandler("db_connection_timeout", env, default=_DEFAULT_CONN_TIMEOUT, minval=1)
+        IntOptionHandler("db_connection_timeout", env, default=_DEFAULT_CONN_TIMEOUT, minval=1),
+        IntOptionHandler("db_search_fetch_size", env, default=_DEFAULT_SEARCH_FETCH_SIZE, minval=0),
+        IntOptionHandler("db_catalogue_cache_ttl", env, default=_DEFAULT_CATALOGUE_CACHE_TTL, minval=0),
     ]
 
 
@@ -14,9 +14,12 @@ Persistence API implementation for postgis.
 """
 
 import datetime
+import io
 import json
 import logging
 import uuid  # noqa: F401
+from contextlib import contextmanager
+from pyproj.exceptions import CRSError
 from sqlalchemy import (
     cast,
     delete,
@@ -27,20 +30,27 @@ from sqlalchemy import (
     or_,
     func,
     column,
+    case,
+    literal,
+    true,
+    Float,
+    table as sa_table,
 )
-from sqlalchemy.dialects.postgresql import insert
-from sqlalchemy.sql.expression import Select
+from sqlalchemy.dialects.postgresql import insert, array as postgres_array, ARRAY
+from sqlalchemy.sql.expression import Select, ColumnElement
 from sqlalchemy.dialects.postgresql import INTERVAL
 from sqlalchemy.exc import IntegrityError
 
-from typing import Iterable, Sequence, Optional, Set, Any
+from typing import Callable, Iterable, Sequence, Any
 from typing import cast as type_cast
 
 from datacube.index.fields import OrExpression
 from datacube.model import Range
 from odc.geo import CRS, Geometry
+from datacube.utils import jsonify_document
 from datacube.utils.uris import split_uri
-from datacube.index.abstract import DSID
+from datacube.index.abstract import DSID, dsid_to_uuid
+from datacube.index._spatial import crs_to_epsg, EPSG4326_LIKE_CODES
 from datacube.model.lineage import LineageRelation, LineageDirection
 from . import _core
 from ._fields import parse_fields, Expression, PgField, PgExpression, DateRangeDocField  # noqa: F401
@@ -53,6 +63,9 @@ from ...utils.changes import Offset
 
 _LOG = logging.getLogger(__name__)
 
+# Number of datasets per chunk when updating search and spatial indexes in bulk
+BULK_INDEX_UPDATE_BATCH_SIZE = 10000
+
 
 # Make a function because it's broken
 def _dataset_select_fields() -> tuple:
@@ -95,6 +108,29 @@ def _dataset_bulk_select_fields() -> tuple:
     )
 
 
+def _row_decoder(select_fields: Sequence[PgField]) -> Callable[[Iterable[Any]], dict[str, Any]]:
+    """
+    Build a function decoding raw result rows into dicts keyed by field name.
+
+    Only fields that override ``normalise_value`` are passed through it, as this is called
+    once for every row returned by a search.
+    """
+    names = tuple(f.name for f in select_fields)
+    converters = tuple(
+        (i, f.normalise_value)
+        for i, f in enumerate(select_fields)
+        if type(f).normalise_value is not PgField.normalise_value
+    )
+
+    def decode_row(raw: Iterable[Any]) -> dict[str, Any]:
+        values = list(raw)
+        for i, normalise in converters:
+            values[i] = normalise(values[i])
+        return dict(zip(names, values))
+
+    return decode_row
+
+
 def get_native_fields() -> dict[str, NativeField]:
     # Native fields (hard-coded into the schema)
     fields = {
@@ -229,6 +265,69 @@ def extract_dataset_fields(ds_metadata, fields):
     return result
 
 
+def extract_dataset_search_values(ds_metadata, fields):
+    """
+    As per extract_dataset_fields, but with plain Python values, as per search_value_to_python.
+
+    :param ds_metdata: A Dataset metadata document
+    :param fields: A dictionary of field names to Field objects
+
+    :return: A dictionary mapping search field names to (type_name, value) tuples.
+    """
+    result = {}
+    for field_name, field in fields.items():
+        try:
+            result[field_name] = (field.type_name, field.search_value_to_python(field.extract(ds_metadata)))
+        except UnindexableValue:
+            continue
+    return result
+
+
+def _copy_text(value) -> str:
+    """
+    Encode a value in the text format of the COPY command.
+    """
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        value = "true" if value else "false"
+    elif isinstance(value, datetime.datetime):
+        value = value.isoformat()
+    elif isinstance(value, (dict, list)):
+        value = json.dumps(jsonify_document(value))
+    else:
+        value = str(value)
+    return value.replace("\\", "\\\\").replace("\t", "\\t").replace("\n", "\\n").replace("\r", "\\r")
+
+
+def _eo3_extent_expression():
+    """
+    SQL expression for the extent of a dataset, without a CRS, the same as extract_geometry_from_eo3_projection().
+    """
+    projection = ("grid_spatial", "projection")
+    valid_data = Dataset.metadata_doc[projection + ("valid_data",)].astext
+
+    def corner(name):
+        x, y = (Dataset.metadata_doc[projection + ("geo_ref_points", name, axis)].astext for axis in "xy")
+        return func.ST_MakePoint(cast(x, Float), cast(y, Float))
+
+    return case(
+        (valid_data != None, func.ST_GeomFromGeoJSON(valid_data)),
+        else_=func.ST_MakePolygon(
+            func.ST_MakeLine(postgres_array([corner(key) for key in ("ll", "ul", "ur", "lr", "ll")]))
+        ),
+    )
+
+
+def _epsg_or_none(spatial_reference: str | None) -> int | None:
+    if spatial_reference is None:
+        return None
+    try:
+        return CRS(spatial_reference).epsg
+    except CRSError:
+        return None
+
+
 # Min/Max aggregating time fields for temporal_extent methods
 time_min = DateDocField('acquisition_time_min',
                         'Min of time when dataset was acquired',
@@ -257,6 +356,7 @@ class PostgisDbAPI:
         self._db = parentdb
         self._connection = connection
         self._sqla_txn = None
+        self._streaming = False
 
     @property
     def in_transaction(self):
@@ -281,6 +381,40 @@ class PostgisDbAPI:
     def execute(self, command):
         return self._connection.execute(command)
 
+    def _stream(self, query, fetch_size: int | None = None):
+        """
+        Execute a query, fetching rows from a server-side cursor ``fetch_size`` rows at a time.
+
+        Postgres only supports server-side cursors inside a transaction, so if the index
+        has no active transaction one is opened for the duration of the read.
+
+        :param fetch_size: Rows to fetch at a time, defaults to the configured
+                           ``db_search_fetch_size``. Zero disables streaming.
+        """
+        if fetch_size is None:
+            fetch_size = self._db.search_fetch_size
+        if not fetch_size:
+            yield from self._connection.execute(query)
+            return
+
+        opts = {"stream_results": True, "yield_per": fetch_size}
+        if self._sqla_txn is not None or self._streaming:
+            yield from self._connection.execute(query, execution_options=opts)
+            return
+
+        if self._connection.in_transaction():
+            # SQLAlchemy autobegin - nothing to commit in autocommit mode
+            self._connection.commit()
+        self._connection.execution_options(isolation_level="READ COMMITTED")
+        self._streaming = True
+        try:
+            with self._connection.begin():
+                yield from self._connection.execute(query, execution_options=opts)
+        finally:
+            self._streaming = False
+            if not self._connection.closed:
+                self._connection.execution_options(isolation_level="AUTOCOMMIT")
+
     def insert_dataset(self, metadata_doc, dataset_id, product_id):
         """
         Insert dataset if not already indexed.
@@ -310,6 +444,119 @@ class PostgisDbAPI:
         )
         return res.rowcount, requested - res.rowcount
 
+    def copy_dataset_batch(self, datasets, search_values, spatial_values):
+        """
+        Add a batch of datasets with their search and spatial index values.
+
+        Rows are streamed with COPY into temporary staging tables, then merged into the index tables with
+        INSERT ... SELECT.  Datasets that already exist are skipped, along with their search and spatial
+        index values.  Must be called within a transaction.
+
+        :param datasets: Dataset values, as for insert_dataset_bulk
+        :param search_values: Mapping of search table types ("string", "numeric", "datetime") to lists of
+                              search values, as for insert_dataset_search_bulk but with plain Python values
+                              (see search_value_to_python).
+        :param spatial_values: Mapping of CRSes to lists of spatial index values,
+                               as per generate_dataset_spatial_values.
+        :return: Tuple of the number of datasets added and the number skipped.
+        """
+        requested = len(datasets)
+        if not requested:
+            return 0, 0
+        ds_columns = [Dataset.id, Dataset.product_ref, Dataset.metadata_doc, Dataset.metadata_type_ref,
+                      Dataset.uri_scheme, Dataset.uri_body]
+        ds_stage = self._copy_to_stage(
+            "dataset", Dataset.__table__,  # type: ignore[attr-defined]
+            {col.name: col.name for col in ds_columns},
+            ([ds[col.name] for col in ds_columns] for ds in datasets)
+        )
+        self._connection.execute(text(
+            "CREATE TEMP TABLE IF NOT EXISTS odc_copy_added (id uuid) ON COMMIT DROP"
+        ))
+        self._connection.execute(text("TRUNCATE odc_copy_added"))
+        added = sa_table("odc_copy_added", column("id"))
+        new_datasets = insert(Dataset).from_select(
+            ds_columns, select(*ds_stage.c)
+        ).on_conflict_do_nothing().returning(Dataset.id).cte("new_datasets")
+        res = self._connection.execute(insert(added).from_select(["id"], select(new_datasets.c.id)))
+        b_added = res.rowcount
+
+        for search_type, values in search_values.items():
+            if not values:
+                continue
+            search_table = search_field_indexes[search_type]
+            if search_type == "string":
+                stage = self._copy_to_stage(
+                    f"search_{search_type}", search_table.__table__,
+                    {"dataset_ref": "dataset_ref", "search_key": "search_key", "search_val": "search_val"},
+                    ((v["dataset_ref"], v["search_key"], v["search_val"]) for v in values)
+                )
+                search_val = stage.c.search_val
+            else:
+                stage = self._copy_to_stage(
+                    f"search_{search_type}", search_table.__table__,
+                    {"dataset_ref": "dataset_ref", "search_key": "search_key",
+                     "low": "lower(search_val)", "high": "upper(search_val)"},
+                    ((v["dataset_ref"], v["search_key"], *v["search_val"]) for v in values)
+                )
+                range_func = func.numrange if search_type == "numeric" else func.tstzrange
+                search_val = range_func(stage.c.low, stage.c.high, '[]')
+            self._connection.execute(
+                insert(search_table).from_select(
+                    ["dataset_ref", "search_key", "search_val"],
+                    select(stage.c.dataset_ref, stage.c.search_key, search_val).join(
+                        added, added.c.id == stage.c.dataset_ref
+                    )
+                ).on_conflict_do_nothing()
+            )
+
+        for crs, values in spatial_values.items():
+            if not values:
+                continue
+            SpatialIndex = self._db.spatial_index(crs)  # noqa: N806
+            stage = self._copy_to_stage(
+                SpatialIndex.__tablename__, SpatialIndex.__table__,
+                {"dataset_ref": "dataset_ref", "extent": "extent"},
+                ((v["dataset_ref"], v["extent"]) for v in values)
+            )
+            self._connection.execute(
+                insert(SpatialIndex).from_select(
+                    ["dataset_ref", "extent"],
+                    select(stage.c.dataset_ref, stage.c.extent).join(added, added.c.id == stage.c.dataset_ref)
+                ).on_conflict_do_nothing()
+            )
+        return b_added, requested - b_added
+
+    def _copy_to_stage(self, name, target, columns, rows):
+        """
+        COPY rows into a temporary staging table, cleared first if it already exists in this transaction.
+
+        :param name: Name of the staging table, without the odc_copy_ prefix
+        :param target: The index table the staged rows are destined for
+        :param columns: Mapping of staging table column names to SQL expressions over the target table,
+                        giving the types of the staging table columns.
+        :param rows: Iterable of sequences of column values, in the order of columns
+        :return: The staging table
+        """
+        stage_name = f"odc_copy_{name}"
+        exprs = ", ".join(f"{expr} AS {col}" for col, expr in columns.items())
+        self._connection.execute(text(
+            f"CREATE TEMP TABLE IF NOT EXISTS {stage_name} ON COMMIT DROP AS "
+            f"SELECT {exprs} FROM {target.fullname} WITH NO DATA"
+        ))
+        self._connection.execute(text(f"TRUNCATE {stage_name}"))
+        buf = io.StringIO()
+        for row in rows:
+            buf.write("\t".join(_copy_text(v) for v in row))
+            buf.write("\n")
+        buf.seek(0)
+        cursor = self._connection.connection.cursor()
+        try:
+            cursor.copy_expert(f"COPY {stage_name} ({', '.join(columns)}) FROM STDIN", buf)
+        finally:
+            cursor.close()
+        return sa_table(stage_name, *(column(col) for col in columns))
+
     def update_dataset(self, metadata_doc, dataset_id, product_id):
         """
         Update dataset
@@ -493,31 +740,72 @@ class PostgisDbAPI:
         return self._connection.execute(query).fetchall()
 
     def archive_dataset(self, dataset_id):
+        return self.archive_datasets([dataset_id]) > 0
+
+    def archive_datasets(self, dataset_ids):
+        """
+        Archive the active datasets among the given ids.
+
+        :return: Number of datasets archived
+        """
         r = self._connection.execute(
             update(Dataset).where(
-                Dataset.id == dataset_id
+                Dataset.id.in_(dataset_ids)
             ).where(
                 Dataset.archived == None
             ).values(
                 archived=func.now()
             )
         )
-        return r.rowcount > 0
+        return r.rowcount
 
     def restore_dataset(self, dataset_id):
+        return self.restore_datasets([dataset_id]) > 0
+
+    def restore_datasets(self, dataset_ids):
+        """
+        Restore the given datasets.
+
+        :return: Number of datasets restored
+        """
         r = self._connection.execute(
             update(Dataset).where(
-                Dataset.id == dataset_id
+                Dataset.id.in_(dataset_ids)
             ).values(
                 archived=None
             )
         )
-        return r.rowcount > 0
+        return r.rowcount
+
+    def datasets_archived_status(self, dataset_ids):
+        """
+        Archived status of the datasets that exist among the given ids.
+
+        :return: dict of dataset id to True if archived
+        """
+        return {
+            row.id: row.is_archived
+            for row in self._connection.execute(
+                select(
+                    Dataset.id, Dataset.archived.is_not(None).label("is_archived")
+                ).where(
+                    Dataset.id.in_(dataset_ids)
+                )
+            )
+        }
 
     def delete_dataset(self, dataset_id):
+        return self.delete_datasets([dataset_id]) > 0
+
+    def delete_datasets(self, dataset_ids):
+        """
+        Delete datasets, with their search field and spatial index entries.
+
+        :return: Number of datasets deleted
+        """
         for table in search_field_indexes.values():
             self._connection.execute(
-                delete(table).where(table.dataset_ref == dataset_id)
+                delete(table).where(table.dataset_ref.in_(dataset_ids))
             )
         for crs in self._db.spatially_indexed_crses():
             SpatialIndex = self._db.spatial_index(crs)  # noqa: N806
@@ -525,15 +813,15 @@ class PostgisDbAPI:
                 delete(
                     SpatialIndex
                 ).where(
-                    SpatialIndex.dataset_ref == dataset_id
+                    SpatialIndex.dataset_ref.in_(dataset_ids)
                 )
             )
         r = self._connection.execute(
             delete(Dataset).where(
-                Dataset.id == dataset_id
+                Dataset.id.in_(dataset_ids)
             )
         )
-        return r.rowcount > 0
+        return r.rowcount
 
     def get_dataset(self, dataset_id):
         return self._connection.execute(
@@ -545,6 +833,14 @@ class PostgisDbAPI:
             select(*_dataset_select_fields()).where(Dataset.id.in_(dataset_ids))
         ).fetchall()
 
+    def get_dataset_docs(self, dataset_ids):
+        """
+        :return: (id, metadata_doc) rows of the nominated datasets
+        """
+        return self._connection.execute(
+            select(Dataset.id, Dataset.metadata_doc).where(Dataset.id.in_(dataset_ids))
+        ).fetchall()
+
     def get_derived_datasets(self, dataset_id):
         raise NotImplementedError()
 
@@ -674,13 +970,15 @@ class PostgisDbAPI:
     def search_datasets(self, expressions,
                         source_exprs=None, select_fields=None,
                         with_source_ids=False, limit=None, geom=None,
-                        archived: bool | None = False, order_by=None):
+                        archived: bool | None = False, order_by=None,
+                        raw_rows: bool = False):
         """
         :type with_source_ids: bool
         :type select_fields: tuple[datacube.drivers.postgis._fields.PgField]
         :type expressions: tuple[datacube.drivers.postgis._fields.PgExpression]
+        :param raw_rows: Return rows as returned by the database, without decoding them into dicts
 
-        :return: An iterable of tuples of decoded values
+        :return: An iterable of dicts of decoded values
         """
         assert source_exprs is None
         assert not with_source_ids
@@ -690,10 +988,11 @@ class PostgisDbAPI:
                                                   geom=geom, archived=archived, order_by=order_by)
         _LOG.debug("search_datasets SQL: %s", str(select_query))
 
-        def decode_row(raw: Iterable[Any]) -> dict[str, Any]:
-            return {f.name: f.normalise_value(r) for r, f in zip(raw, select_fields)}
-
-        for row in self._connection.execute(select_query):
+        if raw_rows:
+            yield from self._stream(select_query)
+            return
+        decode_row = _row_decoder(select_fields)
+        for row in self._stream(select_query):
             yield decode_row(row)
 
     def bulk_simple_dataset_search(self, products=None, batch_size=0):
@@ -933,67 +1232,166 @@ class PostgisDbAPI:
 
         return select(time_ranges.c.time_period, count_query.label('dataset_count'))
 
-    def update_search_index(self, product_names: Sequence[str] = [], dsids: Sequence[DSID] = []):
+    @contextmanager
+    def _bulk_update_chunk(self):
+        """
+        Run one chunk of a bulk index update in a transaction, with the session time zone set to UTC.
+
+        Naive timestamps in dataset documents are then read as UTC, as they are when extracted
+        in Python. Outside of an index transaction every chunk is committed on its own, so an
+        interrupted update can be resumed after the last completed chunk.
+        """
+        if self._sqla_txn is not None or self._streaming:
+            time_zone = self._connection.execute(select(func.current_setting('TimeZone'))).scalar()
+            self._connection.execute(select(func.set_config('TimeZone', 'UTC', True)))
+            yield
+            self._connection.execute(select(func.set_config('TimeZone', time_zone, True)))
+            return
+
+        if self._connection.in_transaction():
+            # SQLAlchemy autobegin - nothing to commit in autocommit mode
+            self._connection.commit()
+        self._connection.execution_options(isolation_level="READ COMMITTED")
+        try:
+            with self._connection.begin():
+                self._connection.execute(select(func.set_config('TimeZone', 'UTC', True)))
+                yield
+        finally:
+            if not self._connection.closed:
+                self._connection.execution_options(isolation_level="AUTOCOMMIT")
+
+    @staticmethod
+    def _dataset_selection(product_names: Sequence[str], dsids: Sequence[DSID]) -> ColumnElement[bool]:
+        """
+        Where clause selecting the datasets of the named products and the identified datasets.
+
+        Selects all datasets if neither are supplied.
+        """
+        clauses: list[ColumnElement[bool]] = []
+        if product_names:
+            clauses.append(
+                Dataset.product_ref.in_(select(Product.id).where(Product.name.in_(product_names)))
+            )
+        if dsids:
+            clauses.append(Dataset.id.in_(dsids))
+        return or_(*clauses) if clauses else true()
+
+    def _dataset_chunks(self, selection: ColumnElement[bool], batch_size: int, after: DSID | None, *columns):
+        """
+        Page through a selection of datasets in id order.
+
+        :param selection: Where clause selecting datasets
+        :param batch_size: Maximum number of rows per chunk
+        :param after: Only return datasets with a greater id than this
+        :param columns: Columns to select after the dataset id
+        :return: Iterable of lists of (id, *columns) rows
+        """
+        last = None if after is None else dsid_to_uuid(after)
+        while True:
+            page = true() if last is None else type_cast(ColumnElement[bool], Dataset.id > last)
+            query = select(Dataset.id, *columns).where(and_(selection, page))
+            rows = self._connection.execute(query.order_by(Dataset.id).limit(batch_size)).fetchall()
+            if not rows:
+                return
+            yield rows
+            last = rows[-1][0]
+
+    def update_search_index(self, product_names: Sequence[str] = [], dsids: Sequence[DSID] = [],
+                            batch_size: int = BULK_INDEX_UPDATE_BATCH_SIZE,
+                            after: DSID | None = None,
+                            progress: Callable[[int, uuid.UUID], None] | None = None):
         """
         Update search indexes
         :param product_names: Product names to update
         :param dsids: Dataset IDs to update
+        :param batch_size: Number of datasets to update per chunk
+        :param after: Only update datasets with a greater id than this - to resume an interrupted update
+        :param progress: Called after each chunk with the number of datasets updated so far
+                         and the id of the last dataset updated.
 
         if neither product_names nor dataset ids are supplied, update nothing (N.B. NOT all datasets)
 
         if both are supplied, both the named products and identified datasets are updated.
 
+        Search field values are calculated in SQL, one statement per search field for each chunk
+        of datasets. Only fields that cannot be expressed in SQL are extracted in Python.
+
         :return:  Number of datasets whose search indexes have been updated.
         """
         if not product_names and not dsids:
             return 0
 
-        ds_query = select(
-            Dataset.id,
-            Dataset.metadata_doc,
-            MetadataType.definition,
-        ).select_from(Dataset).join(MetadataType)
-        if product_names:
-            ds_query = ds_query.join(Product)
-        if product_names and dsids:
-            ds_query = ds_query.where(
-                or_(
-                    Product.name.in_(product_names),
-                    Dataset.id.in_(dsids)
-                )
-            )
-        elif product_names:
-            ds_query = ds_query.where(
-                Product.name.in_(product_names)
-            )
-        elif dsids:
-            ds_query = ds_query.where(
-                Dataset.id.in_(dsids)
-            )
+        mdt_fields: dict[int, dict[str, PgField]] = {}
         rowcount = 0
-        for result in self._connection.execute(ds_query):
-            dsid, ds_metadata, mdt_def = result
-            search_field_vals = extract_dataset_search_fields(ds_metadata, mdt_def)
-            for field_name, field_info in search_field_vals.items():
-                fld_type, fld_val = field_info
-                search_idx = search_field_index_map[fld_type]
-                self.insert_dataset_search(search_idx, dsid, field_name, fld_val)
-            rowcount += 1
+        for chunk in self._dataset_chunks(self._dataset_selection(product_names, dsids), batch_size, after,
+                                          Dataset.metadata_type_ref):
+            by_mdt: dict[int, list[uuid.UUID]] = {}
+            for dsid, mdt_id in chunk:
+                by_mdt.setdefault(mdt_id, []).append(dsid)
+            with self._bulk_update_chunk():
+                for mdt_id, ids in by_mdt.items():
+                    if mdt_id not in mdt_fields:
+                        mdt_fields[mdt_id] = non_native_fields(self.get_metadata_type(mdt_id).definition)
+                    python_fields = {}
+                    for field_name, field in mdt_fields[mdt_id].items():
+                        value = field.search_value_expression
+                        if value is None:
+                            python_fields[field_name] = field
+                        else:
+                            self._upsert_dataset_search(field.type_name, field_name, value, ids)
+                    if python_fields:
+                        query: Select = select(Dataset.id, Dataset.metadata_doc).where(Dataset.id.in_(ids))
+                        for dsid, ds_metadata in self._connection.execute(query):
+                            for field_name, (fld_type, fld_val) in extract_dataset_fields(ds_metadata,
+                                                                                          python_fields).items():
+                                self.insert_dataset_search(search_field_index_map[fld_type],
+                                                           dsid, field_name, fld_val)
+            rowcount += len(chunk)
+            _LOG.debug("Updated search indexes for %d datasets", rowcount)
+            if progress is not None:
+                progress(rowcount, chunk[-1][0])
         return rowcount
 
+    def _upsert_dataset_search(self, type_name, field_name, value, ids):
+        """
+        Add/update search field index entries for datasets, with the value calculated by an SQL expression
+        """
+        search_table = search_field_index_map[type_name]
+        stmt = insert(search_table).from_select(
+            ["dataset_ref", "search_key", "search_val"],
+            select(Dataset.id, literal(field_name), value).where(Dataset.id.in_(ids))
+        )
+        self._connection.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[search_table.dataset_ref, search_table.search_key],
+                set_=dict(search_val=stmt.excluded.search_val)
+            )
+        )
+
     def update_spindex(self, crs_seq: Sequence[CRS] = [],
                        product_names: Sequence[str] = [],
-                       dsids: Sequence[DSID] = []) -> int:
+                       dsids: Sequence[DSID] = [],
+                       batch_size: int = BULK_INDEX_UPDATE_BATCH_SIZE,
+                       after: DSID | None = None,
+                       progress: Callable[[int, uuid.UUID], None] | None = None) -> int:
         """
         Update a spatial index
         :param crs: CRSs for Spatial Indexes to update. Default=all indexes
         :param product_names: Product names to update
         :param dsids: Dataset IDs to update
+        :param batch_size: Number of datasets to update per chunk
+        :param after: Only update datasets with a greater id than this - to resume an interrupted update
+        :param progress: Called after each chunk with the number of datasets updated so far
+                         and the id of the last dataset updated.
 
         if neither product_names nor dataset ids are supplied, update for all datasets.
 
         if both are supplied, both the named products and identified datasets are updated.
 
+        Extents are read from the dataset documents and transformed with ST_Transform in the database,
+        one statement per native CRS and spatial index for each chunk of datasets. Extents in
+        non-EPSG CRSs and geographic extents crossing the anti-meridian are projected in Python.
+
         :return:  Number of spatial index entries updated or verified as unindexed.
         """
         verified = 0
@@ -1002,44 +1400,86 @@ class PostgisDbAPI:
         else:
             crses = self._db.spatially_indexed_crses()
 
-        # Update implementation.
-        # Design will change, but this method should be fairly low level to be as efficient as possible
-        query = select(
-            Dataset.id,
-            Dataset.metadata_doc["grid_spatial"]["projection"]
-        ).select_from(Dataset)
-        if product_names:
-            query = query.join(Product)
-        if product_names and dsids:
-            query = query.where(
-                or_(
-                    Product.name.in_(product_names),
-                    Dataset.id.in_(dsids)
-                )
-            )
-        elif product_names:
-            query = query.where(
-                Product.name.in_(product_names)
-            )
-        elif dsids:
-            query = query.where(
-                Dataset.id.in_(dsids)
-            )
+        projection = ("grid_spatial", "projection")
+        has_extent = or_(
+            Dataset.metadata_doc[projection + ("valid_data",)].astext != None,
+            Dataset.metadata_doc[projection + ("geo_ref_points",)].astext != None,
+        )
+        native_epsgs: dict[str | None, int | None] = {}
+        processed = 0
+        for chunk in self._dataset_chunks(self._dataset_selection(product_names, dsids), batch_size, after,
+                                          Dataset.metadata_doc[projection + ("spatial_reference",)].astext,
+                                          has_extent):
+            by_epsg: dict[int, list[uuid.UUID]] = {}
+            # Datasets whose spatial index entries are calculated in Python, and for which CRSes
+            in_python: dict[uuid.UUID, list[CRS]] = {}
+            for dsid, spatial_reference, extent in chunk:
+                if not extent:
+                    verified += 1
+                    continue
+                if spatial_reference not in native_epsgs:
+                    native_epsgs[spatial_reference] = _epsg_or_none(spatial_reference)
+                native_epsg = native_epsgs[spatial_reference]
+                if native_epsg is None:
+                    in_python[dsid] = list(crses)
+                else:
+                    by_epsg.setdefault(native_epsg, []).append(dsid)
+                verified += len(crses)
+
+            with self._bulk_update_chunk():
+                for native_epsg, ids in by_epsg.items():
+                    for crs in crses:
+                        updated = self._upsert_dataset_spatial(native_epsg, crs, ids)
+                        for dsid in ids:
+                            if dsid not in updated:
+                                in_python.setdefault(dsid, []).append(crs)
+                if in_python:
+                    query: Select = select(
+                        Dataset.id, Dataset.metadata_doc[projection]
+                    ).where(Dataset.id.in_(list(in_python)))
+                    for dsid, eo3_projection in self._connection.execute(query):
+                        geom = extract_geometry_from_eo3_projection(eo3_projection)
+                        if not geom:
+                            continue
+                        for crs in in_python[dsid]:
+                            self.insert_dataset_spatial(dsid, crs, geom)
+
+            processed += len(chunk)
+            _LOG.debug("Updated spatial indexes for %d datasets", processed)
+            if progress is not None:
+                progress(processed, chunk[-1][0])
 
-        def xytuple(o):
-            return (o['x'], o['y'])
+        return verified
 
-        for result in self._connection.execute(query):
-            dsid = result[0]
-            geom = extract_geometry_from_eo3_projection(result[1])
-            if not geom:
-                verified += 1
-                continue
-            for crs in crses:
-                self.insert_dataset_spatial(dsid, crs, geom)
-                verified += 1
+    def _upsert_dataset_spatial(self, native_epsg: int, crs: CRS, ids: Sequence[uuid.UUID]) -> set[uuid.UUID]:
+        """
+        Add/update spatial index entries for datasets whose extents are in the same EPSG CRS,
+        transforming the extents in the database.
 
-        return verified
+        Extents that must be fixed up for the anti-meridian are skipped.
+
+        :return: Ids of datasets whose spatial index entries were added or updated.
+        """
+        SpatialIndex = self._db.spatial_index(crs)  # noqa: N806
+        target_epsg = crs_to_epsg(crs)
+        extent = func.ST_SetSRID(_eo3_extent_expression(), native_epsg)
+        if target_epsg == 4326 or target_epsg in EPSG4326_LIKE_CODES:
+            # Same as sanitise_extent(), for extents that do not cross the anti-meridian
+            lonlat = func.ST_Transform(extent, 4326)
+            extent = lonlat if target_epsg == 4326 else func.ST_Transform(lonlat, target_epsg)
+            condition = func.ST_XMax(lonlat) - func.ST_XMin(lonlat) < 180
+        else:
+            extent = func.ST_Transform(extent, target_epsg)
+            condition = true()
+        stmt = insert(SpatialIndex).from_select(
+            ["dataset_ref", "extent"],
+            select(Dataset.id, func.ST_Multi(extent)).where(Dataset.id.in_(ids), condition)
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[SpatialIndex.dataset_ref],
+            set_=dict(extent=stmt.excluded.extent)
+        ).returning(SpatialIndex.dataset_ref)
+        return {row[0] for row in self._connection.execute(stmt)}
 
     @staticmethod
     def _join_tables(expressions=None, fields=None):
@@ -1193,6 +1633,19 @@ class PostgisDbAPI:
     def get_all_metadata_types(self):
         return self._connection.execute(select(MetadataType).order_by(MetadataType.name.asc())).fetchall()
 
+    def get_catalogue_generation(self):
+        """
+        A cheap summary of the metadata type and product tables, that changes whenever either of them does.
+
+        :return: Tuple of the row count, maximum id and most recent update time of each table
+        """
+        return tuple(
+            tuple(self._connection.execute(
+                select(func.count(), func.max(table.id), func.max(table.updated))
+            ).first())
+            for table in (MetadataType, Product)
+        )
+
     def get_all_metadata_type_defs(self):
         for r in self._connection.execute(select(MetadataType.definition).order_by(MetadataType.name.asc())):
             yield r[0]
@@ -1392,8 +1845,7 @@ class PostgisDbAPI:
     def load_lineage_relations(self,
                                roots: Iterable[uuid.UUID],
                                direction: LineageDirection,
-                               depth: int,
-                               ids_so_far: Optional[Set[uuid.UUID]] = None) -> Iterable[LineageRelation]:
+                               depth: int) -> Iterable[LineageRelation]:
         """
         Read from the database all indexed LineageRelation objects required to build all LineageTrees with
         the given roots, direction and depth.
@@ -1401,42 +1853,36 @@ class PostgisDbAPI:
         :param roots: Iterable of root dataset ids
         :param direction: tree direction
         :param depth: Maximum tree depth - zero indicates unlimited depth.
-        :param ids_so_far: Used for maintaining state through recursion - expected to be None on initial call
         :return: Iterable of LineageRelation objects read from database
         """
-        # Naive manually-recursive initial implementation.
-        # TODO: Reimplement using WITH RECURSIVE query
-        if ids_so_far is None:
-            ids_so_far = set(roots)
-        qry = select(DatasetLineage)
+        roots = list(set(roots))
+        if not roots:
+            return []
+        from_ref: ColumnElement[uuid.UUID]
+        to_ref: ColumnElement[uuid.UUID]
         if direction == LineageDirection.SOURCES:
-            qry = qry.where(DatasetLineage.derived_dataset_ref.in_(roots))
+            from_ref, to_ref = DatasetLineage.derived_dataset_ref, DatasetLineage.source_dataset_ref
         else:
-            qry = qry.where(DatasetLineage.source_dataset_ref.in_(roots))
-        relations = []
-        next_lvl_ids = set()
-        results = self._connection.execute(qry)
-        for row in results:
-            rel = LineageRelation(classifier=row.classifier,
-                                  source_id=row.source_dataset_ref,
-                                  derived_id=row.derived_dataset_ref)
-            relations.append(rel)
-            if direction == LineageDirection.SOURCES:
-                next_id = rel.source_id
-            else:
-                next_id = rel.derived_id
-            if next_id not in ids_so_far:
-                next_lvl_ids.add(next_id)
-                ids_so_far.add(next_id)
-        next_depth = depth - 1
-        recurse = True
+            from_ref, to_ref = DatasetLineage.source_dataset_ref, DatasetLineage.derived_dataset_ref
+
+        # Walk the tree in a single recursive query, collecting the ids of every dataset whose relations are
+        # needed. UNION discards rows that have already been reached, so cycles in the lineage terminate.
+        root_ids = func.unnest(literal(roots, ARRAY(from_ref.type))).label("id")
         if depth == 0:
-            next_depth = 0
-        elif depth == 1:
-            recurse = False
-        if recurse and next_lvl_ids:
-            relations.extend(self.load_lineage_relations(next_lvl_ids, direction, next_depth, ids_so_far))
-        return relations
+            nodes = select(root_ids).cte("lineage_nodes", recursive=True)
+            nodes = nodes.union(select(to_ref).where(from_ref == nodes.c.id))
+        else:
+            nodes = select(root_ids, literal(1).label("depth")).cte("lineage_nodes", recursive=True)
+            nodes = nodes.union(
+                select(to_ref, nodes.c.depth + 1).where(from_ref == nodes.c.id, nodes.c.depth < depth)
+            )
+        qry = select(DatasetLineage).where(from_ref.in_(select(nodes.c.id)))
+        return [
+            LineageRelation(classifier=row.classifier,
+                            source_id=row.source_dataset_ref,
+                            derived_id=row.derived_dataset_ref)
+            for row in self._connection.execute(qry)
+        ]
 
     def remove_lineage_relations(self,
                                  ids: Iterable[DSID],
@@ -55,10 +55,12 @@ class PostGisDb:
 
     driver_name = 'postgis'  # Mostly to support parametrised tests
 
-    def __init__(self, engine: Engine):
+    def __init__(self, engine: Engine, search_fetch_size: int = 0):
         # We don't recommend using this constructor directly as it may change.
         # Use static methods PostGisDb.create() or PostGisDb.from_config()
         self._engine = engine
+        # Rows fetched at a time from server-side cursors when searching, zero disables streaming
+        self.search_fetch_size = search_fetch_size
         self._spindexes: Optional[Mapping[int, Any]] = None
 
     @classmethod
@@ -96,7 +98,7 @@ class PostGisDb:
                     'An administrator must run init:\n\t{init_command}'.format(
                         init_command='datacube -v system init'
                     ))
-        return PostGisDb(engine)
+        return PostGisDb(engine, search_fetch_size=config_env.db_search_fetch_size)
 
     @staticmethod
     def _create_engine(url, application_name=None, iam_rds_auth=False, iam_rds_timeout=600, pool_timeout=60) -> Engine:
@@ -13,8 +13,8 @@ from datetime import datetime, date
 from decimal import Decimal
 from typing import Any, Callable, Type, Tuple, Union
 
-from sqlalchemy.types import TIMESTAMP
-from sqlalchemy import cast, func, and_
+from sqlalchemy.types import TIMESTAMP, TypeEngine
+from sqlalchemy import cast, func, and_, case, null
 from sqlalchemy.dialects import postgresql as postgres
 from sqlalchemy.dialects.postgresql import NUMRANGE, TSTZRANGE, Range as PgRange
 from sqlalchemy.dialects.postgresql import INTERVAL
@@ -103,6 +103,16 @@ class PgField(Field):
         else:
             return self.alchemy_expression
 
+    @property
+    def search_value_expression(self) -> ColumnElement | None:
+        """
+        SQL expression calculating the value stored in the search tables from the dataset document.
+
+        Equivalent to search_value_to_alchemy(extract(doc)), or None if the value can only be
+        extracted in Python.
+        """
+        return None
+
     @property
     def sql_expression(self):
         """
@@ -178,6 +188,14 @@ class PgDocField(PgField):
         """
         return self.value_to_alchemy(value)
 
+    def search_value_to_python(self, value):
+        """
+        Plain Python equivalent of search_value_to_alchemy, e.g. for COPYing into the search tables.
+
+        Values of range-typed search tables are (low, high) tuples, inclusive on both sides.
+        """
+        return value
+
     def parse_value(self, value):
         """
         Parse the value from a string. May be overridden by subclasses.
@@ -187,7 +205,7 @@ class PgDocField(PgField):
     def _alchemy_offset_value(self,
                               doc_offsets: Tuple[Tuple[str]],
                               agg_function: Callable[[Any], ColumnElement],
-                              type_: Type | None = None) -> ColumnElement:
+                              type_: TypeEngine | Type[TypeEngine] | None = None) -> ColumnElement:
         """
         Get an sqlalchemy value for the given offsets of this field's sqlalchemy column.
         If there are multiple they will be combined using the given aggregate function.
@@ -266,6 +284,17 @@ class SimpleDocField(PgDocField):
         """
         raise NotImplementedError('Simple field between expression')
 
+    @property
+    def search_offset_value(self) -> ColumnElement:
+        """
+        Unlabelled SQL expression for the value of this field, as used in the search tables.
+        """
+        return self._alchemy_offset_value(self.offset, self.aggregation.pg_calc)
+
+    @property
+    def search_value_expression(self) -> ColumnElement | None:
+        return self.search_offset_value
+
     can_extract = True
 
     def extract(self, document):
@@ -296,6 +325,16 @@ class NumericDocField(SimpleDocField):
             type_=NUMRANGE,
         )
 
+    def search_value_to_python(self, value):
+        if isinstance(value, float) and math.isnan(value):
+            raise UnindexableValue("Cannot index NaNs")
+        return value, value
+
+    @property
+    def search_value_expression(self) -> ColumnElement | None:
+        value = self.search_offset_value
+        return func.numrange(value, value, '[]', type_=NUMRANGE)
+
     def between(self, low, high):
         # Numeric fields actually stored as ranges in current schema.
         # return ValueBetweenExpression(self, low, high)
@@ -354,6 +393,22 @@ class DateDocField(SimpleDocField):
             type_=TSTZRANGE,
         )
 
+    def search_value_to_python(self, value):
+        # Strings are parsed by the database, as for search_value_to_alchemy
+        if isinstance(value, datetime):
+            value = tz_as_utc(value)
+        return value, value
+
+    @property
+    def search_offset_value(self) -> ColumnElement:
+        # Every value is cast before aggregating, so that they are compared as timestamps rather than text
+        return self._alchemy_offset_value(self.offset, self.aggregation.pg_calc, TIMESTAMP(timezone=True))
+
+    @property
+    def search_value_expression(self) -> ColumnElement | None:
+        value = self.search_offset_value
+        return func.tstzrange(value, value, '[]', type_=TSTZRANGE)
+
     def between(self, low, high):
         return ValueBetweenExpression(self, low, high)
 
@@ -412,6 +467,15 @@ class RangeDocField(PgDocField):
         casted_val = self.lower.value_to_alchemy(value)
         return RangeContainsExpression(self, casted_val)
 
+    @property
+    def search_value_expression(self) -> ColumnElement | None:
+        lower = self.lower.search_offset_value
+        greater = self.greater.search_offset_value
+        return case(
+            (and_(lower.is_(None), greater.is_(None)), null()),
+            else_=self.value_to_alchemy((lower, greater)),
+        )
+
     can_extract = True
 
     def extract(self, document):
@@ -443,6 +507,14 @@ class NumericRangeDocField(RangeDocField):
             raise UnindexableValue("Cannot index NaNs")
         return self.value_to_alchemy(value)
 
+    def search_value_to_python(self, value):
+        low, high = value
+        if isinstance(low, float) and math.isnan(low):
+            raise UnindexableValue("Cannot index NaNs")
+        if isinstance(high, float) and math.isnan(high):
+            raise UnindexableValue("Cannot index NaNs")
+        return low, high
+
     def between(self, low, high):
         """
         :rtype: Expression
@@ -491,6 +563,14 @@ class DateRangeDocField(RangeDocField):
             type_=TSTZRANGE,
         )
 
+    def search_value_to_python(self, value):
+        low, high = value
+        if isinstance(low, datetime):
+            low = tz_as_utc(low)
+        if isinstance(high, datetime):
+            high = tz_as_utc(high)
+        return low, high
+
     def normalise_value(self, value):
         if isinstance(value, datetime):
             return tz_as_utc(value)
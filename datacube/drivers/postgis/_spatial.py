@@ -14,14 +14,13 @@ from sqlalchemy import ForeignKey, select, delete
 from sqlalchemy.dialects import postgresql as postgres
 from geoalchemy2 import Geometry
 
-from antimeridian import fix_shape
-
 from sqlalchemy.engine import Engine
 from sqlalchemy import Column, text
 from sqlalchemy.orm import Session
 
 from odc.geo import CRS, Geometry as Geom
 from odc.geo.geom import multipolygon, polygon
+from datacube.index._spatial import crs_to_epsg, sanitise_extent
 from sqlalchemy.sql.ddl import DropTable
 
 from ._core import METADATA
@@ -117,15 +116,6 @@ def spindex_for_epsg(epsg: int) -> Type[SpatialIndex]:
     return spindex
 
 
-def crs_to_epsg(crs: CRS) -> int:
-    if not str(crs).upper().startswith("EPSG:") and crs.epsg is None:
-        raise ValueError("Non-EPSG-style CRS.")
-    elif crs.epsg is not None:
-        return crs.epsg
-    else:
-        return int(str(crs)[5:])
-
-
 def spindex_for_crs(crs: CRS) -> Type[SpatialIndex]:
     """Return ORM class of a SpatialIndex for CRS - dynamically creating if necessary"""
     try:
@@ -233,28 +223,6 @@ def geom_alchemy(geom: Geom) -> str:
     return f"SRID={epsg};{geom.wkt}"
 
 
-# 4326-like EPSG codes.
-# extents in these CRSs will be projected to 4326, antimeridian-fixed, and then projected back, so it
-# is very important that only CRSs where this is appropriate are included.
-# It should only include CRSs that use the WGS84 datum, an equatorial cylindrical projection and are centred on
-# the prime meridian (and therefore have a discontinuity at the anti-meridian).
-#
-# Just epsg:3857 for now (Web Mercator)
-EPSG4326_LIKE_CODES = [3857]
-
-
-def sanitise_extent(extent, crs):
-    if crs.epsg == 4326:
-        prelim = extent.to_crs(crs)
-        return Geom(fix_shape(prelim.geom), crs=crs)
-    elif crs.epsg in EPSG4326_LIKE_CODES:
-        prelim = extent.to_crs("epsg:4326")
-        fixed = Geom(fix_shape(prelim.geom), crs="epsg:4326")
-        return fixed.to_crs(crs)
-    else:
-        return extent.to_crs(crs)
-
-
 def generate_dataset_spatial_values(dataset_id, crs, extent):
     extent = sanitise_extent(extent, crs)
     if extent is None:
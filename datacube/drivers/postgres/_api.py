@@ -202,9 +202,11 @@ def get_dataset_fields(metadata_type_definition):
 
 
 class PostgresDbAPI(object):
-    def __init__(self, connection):
+    def __init__(self, connection, search_fetch_size: int = 0):
         self._connection = connection
         self._sqla_txn = None
+        self._search_fetch_size = search_fetch_size
+        self._streaming = False
 
     @property
     def in_transaction(self):
@@ -229,6 +231,40 @@ class PostgresDbAPI(object):
     def execute(self, command):
         return self._connection.execute(command)
 
+    def _stream(self, query, fetch_size: int | None = None):
+        """
+        Execute a query, fetching rows from a server-side cursor ``fetch_size`` rows at a time.
+
+        Postgres only supports server-side cursors inside a transaction, so if the index
+        has no active transaction one is opened for the duration of the read.
+
+        :param fetch_size: Rows to fetch at a time, defaults to the configured
+                           ``db_search_fetch_size``. Zero disables streaming.
+        """
+        if fetch_size is None:
+            fetch_size = self._search_fetch_size
+        if not fetch_size:
+            yield from self._connection.execute(query)
+            return
+
+        opts = {"stream_results": True, "yield_per": fetch_size}
+        if self._sqla_txn is not None or self._streaming:
+            yield from self._connection.execute(query, execution_options=opts)
+            return
+
+        if self._connection.in_transaction():
+            # SQLAlchemy autobegin - nothing to commit in autocommit mode
+            self._connection.commit()
+        self._connection.execution_options(isolation_level="READ COMMITTED")
+        self._streaming = True
+        try:
+            with self._connection.begin():
+                yield from self._connection.execute(query, execution_options=opts)
+        finally:
+            self._streaming = False
+            if not self._connection.closed:
+                self._connection.execution_options(isolation_level="AUTOCOMMIT")
+
     def insert_dataset(self, metadata_doc, dataset_id, product_id):
         """
         Insert dataset if not already indexed.
@@ -398,41 +434,85 @@ class PostgresDbAPI(object):
             raise
 
     def archive_dataset(self, dataset_id):
-        self._connection.execute(
+        self.archive_datasets([dataset_id])
+
+    def archive_datasets(self, dataset_ids):
+        """
+        Archive the active datasets among the given ids.
+
+        :return: Number of datasets archived
+        """
+        r = self._connection.execute(
             DATASET.update().where(
-                DATASET.c.id == dataset_id
+                DATASET.c.id.in_(dataset_ids)
             ).where(
                 DATASET.c.archived == None
             ).values(
                 archived=func.now()
             )
         )
+        return r.rowcount
 
     def restore_dataset(self, dataset_id):
-        self._connection.execute(
+        self.restore_datasets([dataset_id])
+
+    def restore_datasets(self, dataset_ids):
+        """
+        Restore the given datasets.
+
+        :return: Number of datasets restored
+        """
+        r = self._connection.execute(
             DATASET.update().where(
-                DATASET.c.id == dataset_id
+                DATASET.c.id.in_(dataset_ids)
             ).values(
                 archived=None
             )
         )
+        return r.rowcount
+
+    def datasets_archived_status(self, dataset_ids):
+        """
+        Archived status of the datasets that exist among the given ids.
+
+        :return: dict of dataset id to True if archived
+        """
+        return {
+            row.id: row.is_archived
+            for row in self._connection.execute(
+                select(
+                    DATASET.c.id, DATASET.c.archived.is_not(None).label("is_archived")
+                ).where(
+                    DATASET.c.id.in_(dataset_ids)
+                )
+            )
+        }
 
     def delete_dataset(self, dataset_id):
+        self.delete_datasets([dataset_id])
+
+    def delete_datasets(self, dataset_ids):
+        """
+        Delete datasets, with their locations and lineage.
+
+        :return: Number of datasets deleted
+        """
         self._connection.execute(
             DATASET_LOCATION.delete().where(
-                DATASET_LOCATION.c.dataset_ref == dataset_id
+                DATASET_LOCATION.c.dataset_ref.in_(dataset_ids)
             )
         )
         self._connection.execute(
             DATASET_SOURCE.delete().where(
-                DATASET_SOURCE.c.dataset_ref == dataset_id
+                DATASET_SOURCE.c.dataset_ref.in_(dataset_ids)
             )
         )
-        self._connection.execute(
+        r = self._connection.execute(
             DATASET.delete().where(
-                DATASET.c.id == dataset_id
+                DATASET.c.id.in_(dataset_ids)
             )
         )
+        return r.rowcount
 
     def get_dataset(self, dataset_id):
         return self._connection.execute(
@@ -455,8 +535,26 @@ class PostgresDbAPI(object):
             )
         ).fetchall()
 
+    def get_derived_dataset_ids(self, dataset_ids):
+        """
+        Ids of the datasets directly derived from any of the given datasets.
+        """
+        return {
+            row.dataset_ref
+            for row in self._connection.execute(
+                select(
+                    DATASET_SOURCE.c.dataset_ref
+                ).where(
+                    DATASET_SOURCE.c.source_dataset_ref.in_(dataset_ids)
+                ).distinct()
+            )
+        }
+
     def get_dataset_sources(self, dataset_id):
-        # recursively build the list of (dataset_ref, source_dataset_ref) pairs starting from dataset_id
+        return self.get_datasets_sources([dataset_id])
+
+    def get_datasets_sources(self, dataset_ids):
+        # recursively build the list of (dataset_ref, source_dataset_ref) pairs starting from dataset_ids
         # include (dataset_ref, NULL) [hence the left join]
         sources = select(
             DATASET.c.id.label('dataset_ref'),
@@ -467,10 +565,11 @@ class PostgresDbAPI(object):
                          DATASET.c.id == DATASET_SOURCE.c.dataset_ref,
                          isouter=True)
         ).where(
-            DATASET.c.id == dataset_id
+            DATASET.c.id.in_(dataset_ids)
         ).cte(name="sources", recursive=True)
 
-        sources = sources.union_all(
+        # UNION rather than UNION ALL: sources shared by several datasets are only walked once
+        sources = sources.union(
             select(
                 sources.c.source_dataset_ref.label('dataset_ref'),
                 DATASET_SOURCE.c.source_dataset_ref,
@@ -684,7 +783,7 @@ class PostgresDbAPI(object):
         select_query = self.search_datasets_query(expressions, source_exprs,
                                                   select_fields, with_source_ids, limit,
                                                   archived=archived, order_by=order_by)
-        return self._connection.execute(select_query)
+        return self._stream(select_query)
 
     def bulk_simple_dataset_search(self, products=None, batch_size=0):
         """
@@ -1152,6 +1251,19 @@ class PostgresDbAPI(object):
     def get_all_metadata_types(self):
         return self._connection.execute(METADATA_TYPE.select().order_by(METADATA_TYPE.c.name.asc())).fetchall()
 
+    def get_catalogue_generation(self):
+        """
+        A cheap summary of the metadata type and product tables, that changes whenever either of them does.
+
+        :return: Tuple of the row count, maximum id and most recent update time of each table
+        """
+        return tuple(
+            tuple(self._connection.execute(
+                select(func.count(), func.max(table.c.id), func.max(table.c.updated))
+            ).first())
+            for table in (METADATA_TYPE, PRODUCT)
+        )
+
     def get_all_metadata_type_docs(self):
         return self._connection.execute(
             select(METADATA_TYPE.c.definition)
@@ -52,10 +52,12 @@ class PostgresDb(object):
 
     driver_name = 'postgres'   # Mostly to support parametrised tests
 
-    def __init__(self, engine):
+    def __init__(self, engine, search_fetch_size: int = 0):
         # We don't recommend using this constructor directly as it may change.
         # Use static methods PostgresDb.create() or PostgresDb.from_config()
         self._engine = engine
+        # Rows fetched at a time from server-side cursors when searching, zero disables streaming
+        self.search_fetch_size = search_fetch_size
 
     @classmethod
     def from_config(cls,
@@ -89,7 +91,7 @@ class PostgresDb(object):
                     'An administrator must run init:\n\t{init_command}'.format(
                         init_command='datacube -v system init'
                     ))
-        return PostgresDb(engine)
+        return PostgresDb(engine, search_fetch_size=config_env.db_search_fetch_size)
 
     @staticmethod
     def _create_engine(url, application_name=None, iam_rds_auth=False, iam_rds_timeout=600, pool_timeout=60):
@@ -198,7 +200,7 @@ class PostgresDb(object):
         with self._engine.connect() as connection:
             try:
                 connection.execution_options(isolation_level="AUTOCOMMIT")
-                yield _api.PostgresDbAPI(connection)
+                yield _api.PostgresDbAPI(connection, search_fetch_size=self.search_fetch_size)
             finally:
                 connection.close()
 
@@ -4,8 +4,11 @@
 # SPDX-License-Identifier: Apache-2.0
 """ reader
 """
+from collections import OrderedDict
+from contextlib import contextmanager
+from threading import Lock
 from typing import (
-    List, Optional, Union, Any, Iterable,
+    List, Optional, Union, Any, Iterable, Iterator,
     Tuple, NamedTuple, TypeVar
 )
 import numpy as np
@@ -38,6 +41,8 @@ Overrides = NamedTuple('Overrides', [('crs', Optional[CRS]),
 RioWindow = Tuple[Tuple[int, int], Tuple[int, int]]  # pylint: disable=invalid-name
 T = TypeVar('T')
 
+DEFAULT_MAX_OPEN_FILES = 64
+
 
 def pick(a: Optional[T], b: Optional[T]) -> Optional[T]:
     """ Return first non-None value or None if all are None
@@ -126,23 +131,126 @@ def _rio_band_idx(band: BandInfo, src: DatasetReader) -> int:
     raise DeprecationWarning("Stacked netcdf without explicit time index is not supported anymore")
 
 
+class _FileHandle:
+    """ Open rasterio file plus bookkeeping needed to share it between readers.
+    """
+
+    def __init__(self, src: DatasetReader):
+        self.src = src
+        self.lock = Lock()  # GDAL handles are not safe for concurrent use
+        self.users = 0
+        self.evicted = False
+
+
+class RIOLoadContext:
+    """ Load context of the RIO reader driver: bounded LRU cache of open files.
+
+        Files are keyed by normalised URI, so all bands stored in the same file
+        share one handle. Handles are closed when evicted, or when the last
+        reader using an already evicted handle is done with it.
+    """
+
+    def __init__(self, max_open_files: int = DEFAULT_MAX_OPEN_FILES):
+        if max_open_files < 1:
+            raise ValueError("max_open_files should be at least 1")
+
+        self._max_open_files = max_open_files
+        self._handles: OrderedDict[str, _FileHandle] = OrderedDict()
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def max_open_files(self) -> int:
+        return self._max_open_files
+
+    def __len__(self) -> int:
+        return len(self._handles)
+
+    def __contains__(self, uri: str) -> bool:
+        return uri in self._handles
+
+    def _acquire(self, uri: str) -> _FileHandle:
+        with self._lock:
+            h = self._handles.get(uri)
+            if h is not None:
+                self._handles.move_to_end(uri)
+                self.hits += 1
+                h.users += 1
+                return h
+            self.misses += 1
+
+        # Open outside of the lock, so that slow opens (e.g. over network) can overlap
+        src = rasterio.open(uri, 'r')
+
+        with self._lock:
+            h = self._handles.get(uri)
+            if h is not None:
+                # Some other thread opened the same file while we were opening it
+                src.close()
+                self._handles.move_to_end(uri)
+            else:
+                h = _FileHandle(src)
+                self._handles[uri] = h
+                self._evict(self._max_open_files)
+            h.users += 1
+            return h
+
+    def _release(self, h: _FileHandle) -> None:
+        with self._lock:
+            h.users -= 1
+            if h.evicted and h.users == 0:
+                h.src.close()
+
+    def _evict(self, max_size: int) -> None:
+        while len(self._handles) > max_size:
+            _, h = self._handles.popitem(last=False)
+            h.evicted = True
+            if h.users == 0:
+                h.src.close()
+
+    @contextmanager
+    def open(self, uri: str) -> Iterator[DatasetReader]:
+        """ Access open file for ``uri``, opening it if it's not already in the cache.
+
+            The handle is locked for the duration of the ``with`` block.
+        """
+        h = self._acquire(uri)
+        try:
+            with h.lock:
+                yield h.src
+        finally:
+            self._release(h)
+
+    def close(self) -> None:
+        """ Close all cached file handles.
+        """
+        with self._lock:
+            self._evict(0)
+
+
 class RIOReader(GeoRasterReader):
     def __init__(self,
                  src: DatasetReader,
                  band_idx: int,
                  pool: ThreadPoolExecutor,
-                 overrides: Overrides = Overrides(None, None, None)):
+                 overrides: Overrides = Overrides(None, None, None),
+                 ctx: Optional[RIOLoadContext] = None,
+                 uri: Optional[str] = None):
 
         transform = pick(overrides.transform, src.transform)
         if transform is not None and transform.is_identity:
             transform = None
 
         self._src = src
+        self._ctx = ctx
+        self._uri = uri
         self._crs = overrides.crs or _dc_crs(src.crs)
         self._transform = transform
         self._nodata = pick(overrides.nodata, src.nodatavals[band_idx-1])
         self._band_idx = band_idx
         self._dtype = src.dtypes[band_idx-1]
+        self._shape = src.shape
         self._pool = pool
 
     @property
@@ -159,16 +267,25 @@ class RIOReader(GeoRasterReader):
 
     @property
     def shape(self) -> RasterShape:
-        return self._src.shape
+        return self._shape
 
     @property
     def nodata(self) -> Optional[Union[int, float]]:
         return self._nodata
 
+    def _read_cached(self,
+                     window: Optional[RasterWindow],
+                     out_shape: Optional[RasterShape]) -> np.ndarray:
+        assert self._ctx is not None and self._uri is not None
+        with self._ctx.open(self._uri) as src:
+            return _read(src, self._band_idx, window, out_shape)
+
     def read(self,
              window: Optional[RasterWindow] = None,
              out_shape: Optional[RasterShape] = None) -> FutureNdarray:
-        return self._pool.submit(_read, self._src, self._band_idx, window, out_shape)
+        if self._ctx is None:
+            return self._pool.submit(_read, self._src, self._band_idx, window, out_shape)
+        return self._pool.submit(self._read_cached, window, out_shape)
 
 
 def _compute_overrides(src: DatasetReader, bi: BandInfo) -> Overrides:
@@ -193,13 +310,21 @@ def _rdr_open(band: BandInfo, ctx: Any, pool: ThreadPoolExecutor) -> RIOReader:
 
         raises Exception on failure
 
-        TODO: start using ctx for handle cache
+        When ``ctx`` is a :class:`RIOLoadContext` file handles are taken from,
+        and shared via, its cache. Reads then go through the cache too, so that
+        handles evicted in the meantime are transparently re-opened.
     """
     normalised_uri = _rio_uri(band)
-    src = rasterio.open(normalised_uri, 'r')
-    bidx = _rio_band_idx(band, src)
 
-    return RIOReader(src, bidx, pool, _compute_overrides(src, band))
+    if not isinstance(ctx, RIOLoadContext):
+        src = rasterio.open(normalised_uri, 'r')
+        bidx = _rio_band_idx(band, src)
+        return RIOReader(src, bidx, pool, _compute_overrides(src, band))
+
+    with ctx.open(normalised_uri) as src:
+        bidx = _rio_band_idx(band, src)
+        return RIOReader(src, bidx, pool, _compute_overrides(src, band),
+                         ctx=ctx, uri=normalised_uri)
 
 
 class RIORdrDriver(ReaderDriver):
@@ -210,7 +335,11 @@ class RIORdrDriver(ReaderDriver):
     def new_load_context(self,
                          bands: Iterable[BandInfo],
                          old_ctx: Optional[Any]) -> Any:
-        return None  # TODO: implement file handle cache with this
+        """ Re-use file handle cache of the previous load if there is one.
+        """
+        if isinstance(old_ctx, RIOLoadContext):
+            return old_ctx
+        return RIOLoadContext(self._cfg.get('max_open_files', DEFAULT_MAX_OPEN_FILES))
 
     def open(self, band: BandInfo, ctx: Any) -> FutureGeoRasterReader:
         return self._pool.submit(_rdr_open, band, ctx, self._pool)
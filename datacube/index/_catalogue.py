@@ -0,0 +1,198 @@
+# This file is part of the Open Data Cube, see https://opendatacube.org for more information
+#
+# Copyright (c) 2015-2025 ODC Contributors
+# SPDX-License-Identifier: Apache-2.0
+"""
+Cache of the metadata types and products of a database index.
+"""
+import threading
+from time import monotonic
+from typing import Any, Callable, Collection, Hashable, Iterable, Iterator, Mapping
+
+from datacube.index import fields
+from datacube.model import MetadataType, Product
+
+
+def _listify(v) -> list:
+    if isinstance(v, tuple):
+        return list(v)
+    elif isinstance(v, list):
+        return v
+    else:
+        return [v]
+
+
+def _is_hashable(v) -> bool:
+    try:
+        hash(v)
+    except TypeError:
+        return False
+    return True
+
+
+class Catalogue:
+    """
+    An immutable snapshot of the metadata types and products of an index.
+    """
+
+    def __init__(self, metadata_types: Iterable[MetadataType], products: Iterable[Product]) -> None:
+        self.metadata_types = tuple(sorted(metadata_types, key=lambda mt: mt.name))
+        self.metadata_types_by_id = {mt.id: mt for mt in self.metadata_types}
+        self.metadata_types_by_name = {mt.name: mt for mt in self.metadata_types}
+        self.products = tuple(sorted(products, key=lambda p: p.name))
+        self.products_by_id = {p.id: p for p in self.products}
+        self.products_by_name = {p.name: p for p in self.products}
+        # Search field values defined by each product's metadata, extracted once rather than on every search.
+        self._field_values: dict[str, dict[str, Any]] = {}
+        for product in self.products:
+            values = {}
+            for name, field in product.metadata_type.dataset_fields.items():
+                if field.can_extract:
+                    value = field.extract(product.metadata_doc)
+                    if value is not None:
+                        values[name] = value
+            self._field_values[product.name] = values
+
+    def search_robust(self,
+                      query: Mapping[str, Any],
+                      ignore_fields: Collection[str] = ()) -> Iterator[tuple[Product, dict[str, Any]]]:
+        """
+        Return products that match match-able fields and dict of remaining un-matchable fields.
+
+        :param query: Search query
+        :param ignore_fields: Query fields that are handled elsewhere and never match or exclude a product
+        """
+        query = dict(query)
+        product_names = query.pop('product', None)
+        if product_names is not None:
+            product_names = _listify(product_names)
+        metadata_type_names = query.pop('metadata_type', None)
+        if metadata_type_names is not None:
+            metadata_type_names = _listify(metadata_type_names)
+
+        # Products sharing a metadata type and a field value share the result of matching it,
+        # so each expression is built and evaluated once per distinct value rather than per product.
+        expressions: dict[tuple[str, str], fields.Expression] = {}
+        matches: dict[tuple[str, str, Any], bool] = {}
+        for product in self.products:
+            # If they specified specific product/metadata-types, we can quickly skip non-matches.
+            if product_names is not None and product.name not in product_names:
+                continue
+            metadata_type = product.metadata_type
+            if metadata_type_names is not None and metadata_type.name not in metadata_type_names:
+                continue
+
+            product_values = self._field_values[product.name]
+            remaining_matchable = dict(query)
+            # Check that all the keys they specified match this product.
+            for key, value in query.items():
+                if key in ignore_fields:
+                    continue
+                field = metadata_type.dataset_fields.get(key)
+                if not field:
+                    # This type doesn't have that field, so it cannot match.
+                    break
+                if key not in product_values:
+                    # Non-document/native field, or it has this field but it's not defined in the type doc,
+                    # so it's unmatchable.
+                    continue
+
+                product_value = product_values[key]
+                memo_key = (metadata_type.name, key, product_value)
+                if _is_hashable(product_value) and memo_key in matches:
+                    matched = matches[memo_key]
+                else:
+                    expr = expressions.get((metadata_type.name, key))
+                    if expr is None:
+                        expr = expressions[(metadata_type.name, key)] = fields.as_expression(field, value)
+                    matched = expr.evaluate(product.metadata_doc)
+                    if _is_hashable(product_value):
+                        matches[memo_key] = matched
+                if matched:
+                    remaining_matchable.pop(key)
+                else:
+                    # A property doesn't match this type, skip to next type.
+                    break
+            else:
+                yield product, remaining_matchable
+
+
+class CatalogueCache:
+    """
+    Thread-safe cache of the catalogue of an index.
+
+    A loaded catalogue is trusted for ``ttl`` seconds. After that, the cheap ``generation`` summary of the
+    catalogue tables is compared with the one the catalogue was loaded at, and the catalogue is only reloaded
+    if it has changed.
+
+    :param generation: Return a value that changes whenever any metadata type or product is added, updated
+                       or deleted.
+    :param load: Load a new catalogue.
+    :param ttl: Seconds to trust the catalogue for without checking its generation.
+    """
+
+    def __init__(self,
+                 generation: Callable[[], Hashable],
+                 load: Callable[[], Catalogue],
+                 ttl: float = 60) -> None:
+        self._generation = generation
+        self._load = load
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._catalogue: Catalogue | None = None
+        self._catalogue_generation: Hashable = None
+        self._checked = float('-inf')
+        # The transaction the catalogue was last checked in, if any
+        self._checked_in: object | None = None
+
+    def get(self, validate: bool = False, transaction: object | None = None) -> Catalogue:
+        """
+        Return the catalogue, reloading it if necessary.
+
+        Inside a transaction, the catalogue is checked the first time it is used and then trusted for the rest
+        of the transaction. As it may include changes that are not yet committed, it is checked again on its
+        next use outside the transaction.
+
+        :param validate: Check the generation of the catalogue even if the TTL has not expired.
+        :param transaction: An object identifying the active transaction, if any.
+        """
+        with self._lock:
+            now = monotonic()
+            if transaction is None:
+                stale = self._checked_in is not None or now - self._checked >= self.ttl
+            else:
+                stale = self._checked_in is not transaction
+            if self._catalogue is None or validate or stale:
+                generation = self._generation()
+                if self._catalogue is None or generation != self._catalogue_generation:
+                    self._catalogue = self._load()
+                    self._catalogue_generation = generation
+                self._checked = now
+                self._checked_in = transaction
+            return self._catalogue
+
+    def lookup(self, kind: str, key: Hashable, transaction: object | None = None) -> Any:
+        """
+        Look up a metadata type or product in the catalogue.
+
+        If it is not found, the catalogue is checked for changes and the lookup retried, as it may have been
+        added since the catalogue was cached.
+
+        :param kind: Catalogue mapping to look in, e.g. "products_by_name"
+        :param key: Id or name to look up
+        :param transaction: An object identifying the active transaction, if any (see :meth:`get`).
+        :return: The metadata type or product, or None if there is none.
+        """
+        found = getattr(self.get(transaction=transaction), kind).get(key)
+        if found is None:
+            found = getattr(self.get(validate=True, transaction=transaction), kind).get(key)
+        return found
+
+    def invalidate(self) -> None:
+        """
+        Discard the catalogue, so it is reloaded on next use.
+        """
+        with self._lock:
+            self._catalogue = None
+            self._checked = float('-inf')
+            self._checked_in = None
@@ -0,0 +1,203 @@
+# This file is part of the Open Data Cube, see https://opendatacube.org for more information
+#
+# Copyright (c) 2015-2025 ODC Contributors
+# SPDX-License-Identifier: Apache-2.0
+"""
+Support for cloning the datasets of an index product by product, in parallel and resumably.
+"""
+import json
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from time import monotonic
+from typing import Any, Iterable, TYPE_CHECKING
+
+from datacube.cfg import ODCEnvironment
+from datacube.utils import report_to_user
+
+from .abstract._types import BatchStatus
+
+if TYPE_CHECKING:
+    from .abstract import AbstractIndex
+
+_LOG = logging.getLogger(__name__)
+
+
+def format_batch_status(res: BatchStatus, objects: str) -> str:
+    """
+    Describe the throughput of a bulk add operation.
+
+    :param res: BatchStatus of the bulk add
+    :param objects: Name of the objects added (e.g. "datasets")
+    """
+    rate = res.completed * 60 / res.seconds_elapsed if res.seconds_elapsed else 0.0
+    return f'{res.completed} {objects} loaded ({res.skipped} skipped) in {res.seconds_elapsed:.2f}seconds ' \
+           f'({rate:.2f} {objects}/min)'
+
+
+class CloneCheckpoint:
+    """
+    Record of the progress of a clone, so an interrupted clone can resume where it stopped.
+
+    Progress is recorded per clone phase (metadata types, products, datasets, lineage) and per product
+    within the datasets phase.  If a path is supplied, the record is saved to it (as JSON) after every
+    change, and read from it if it already exists.
+
+    :param path: Path of the checkpoint file.  None: progress is not saved.
+    :param origin_id: index_id of the index being cloned
+    :param destination_id: index_id of the index being cloned into
+    """
+
+    def __init__(self, path: str | os.PathLike | None, origin_id: str, destination_id: str) -> None:
+        self.path = Path(path) if path is not None else None
+        self._state: dict[str, Any] = {
+            "origin": origin_id,
+            "destination": destination_id,
+            "phases": {},
+            "products": {},
+        }
+        if self.path is not None and self.path.exists():
+            with self.path.open() as fh:
+                state = json.load(fh)
+            if (state.get("origin"), state.get("destination")) != (origin_id, destination_id):
+                raise ValueError(f"Checkpoint file {self.path} is for a clone of {state.get('origin')} "
+                                 f"into {state.get('destination')}")
+            self._state = state
+
+    def phase(self, name: str) -> BatchStatus | None:
+        """
+        :return: The result of a completed phase, or None if it has not been completed.
+        """
+        return self._load_status(self._state["phases"].get(name))
+
+    def record_phase(self, name: str, res: BatchStatus) -> None:
+        self._state["phases"][name] = self._dump_status(res)
+        self._save()
+
+    def product(self, name: str) -> BatchStatus | None:
+        """
+        :return: The result of cloning the datasets of a product, or None if it has not been completed.
+        """
+        return self._load_status(self._state["products"].get(name))
+
+    def record_product(self, name: str, res: BatchStatus) -> None:
+        self._state["products"][name] = self._dump_status(res)
+        self._save()
+
+    @staticmethod
+    def _dump_status(res: BatchStatus) -> dict[str, Any]:
+        return {
+            "completed": res.completed,
+            "skipped": res.skipped,
+            "seconds_elapsed": res.seconds_elapsed,
+            "safe": sorted(res.safe) if res.safe is not None else None,
+        }
+
+    @staticmethod
+    def _load_status(state: dict[str, Any] | None) -> BatchStatus | None:
+        if state is None:
+            return None
+        safe = set(state["safe"]) if state["safe"] is not None else None
+        return BatchStatus(state["completed"], state["skipped"], state["seconds_elapsed"], safe)
+
+    def _save(self) -> None:
+        if self.path is None:
+            return
+        # Write then rename, so an interruption never leaves a truncated checkpoint.
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        with tmp_path.open("w") as fh:
+            json.dump(self._state, fh, indent=2)
+        os.replace(tmp_path, self.path)
+
+
+def clone_product_datasets(index: "AbstractIndex",
+                           origin_index: "AbstractIndex",
+                           product_name: str,
+                           batch_size: int = 1000) -> BatchStatus:
+    """
+    Clone the datasets of one product from origin_index into index.
+
+    The product must already have been cloned.
+    """
+    product = index.products.get_by_name_unsafe(product_name)
+    return index.datasets.bulk_add(
+        origin_index.datasets.get_all_docs(products=[product], batch_size=batch_size),
+        batch_size=batch_size
+    )
+
+
+def _clone_product_datasets_worker(env: ODCEnvironment,
+                                   origin_env: ODCEnvironment,
+                                   product_name: str,
+                                   batch_size: int) -> BatchStatus:
+    # Runs in a worker process, with its own connections to both indexes.
+    from datacube.index import index_connect
+
+    index = index_connect(env, application_name="odc-clone", validate_connection=False)
+    origin_index = index_connect(origin_env, application_name="odc-clone", validate_connection=False)
+    try:
+        return clone_product_datasets(index, origin_index, product_name, batch_size=batch_size)
+    finally:
+        origin_index.close()
+        index.close()
+
+
+def clone_datasets(index: "AbstractIndex",
+                   origin_index: "AbstractIndex",
+                   product_names: Iterable[str],
+                   checkpoint: CloneCheckpoint,
+                   batch_size: int = 1000,
+                   workers: int = 1) -> BatchStatus:
+    """
+    Clone the datasets of the named products from origin_index into index, one product at a time.
+
+    Products already recorded as complete in the checkpoint are skipped.  Each product is recorded in
+    the checkpoint as it completes.
+
+    :param workers: Number of products to clone at once, each in a separate worker process with its own
+                    database connections.  Default 1: clone in this process, using the existing connections.
+    :return: BatchStatus of the datasets cloned from the products that were not already complete.
+    """
+    if workers < 1:
+        raise ValueError("Must have at least one worker")
+    todo = []
+    for name in product_names:
+        if checkpoint.product(name) is None:
+            todo.append(name)
+        else:
+            report_to_user(f"{name}: already cloned", logger=_LOG)
+
+    added = 0
+    skipped = 0
+    started = monotonic()
+
+    def record(name: str, res: BatchStatus) -> None:
+        nonlocal added, skipped
+        added += res.completed
+        skipped += res.skipped
+        checkpoint.record_product(name, res)
+        report_to_user(f"{name}: {format_batch_status(res, 'datasets')}", logger=_LOG)
+
+    if workers == 1:
+        for name in todo:
+            record(name, clone_product_datasets(index, origin_index, name, batch_size=batch_size))
+    elif todo:
+        if not (index.supports_persistance and origin_index.supports_persistance):
+            raise ValueError("Cloning with multiple workers requires persistent indexes")
+        # Spawn rather than fork, so workers never share the database connections of this process.
+        with ProcessPoolExecutor(max_workers=min(workers, len(todo)),
+                                 mp_context=multiprocessing.get_context("spawn")) as executor:
+            futures = {
+                executor.submit(_clone_product_datasets_worker,
+                                index.environment, origin_index.environment, name, batch_size): name
+                for name in todo
+            }
+            try:
+                for future in as_completed(futures):
+                    record(futures[future], future.result())
+            except BaseException:
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
+    return BatchStatus(added, skipped, monotonic() - started)
@@ -3,6 +3,8 @@
 # Copyright (c) 2015-2025 ODC Contributors
 # SPDX-License-Identifier: Apache-2.0
 from typing import cast
+
+from antimeridian import fix_shape
 from odc.geo.geom import CRS, Geometry, box
 from datacube.model import Range, QueryDict, QueryField
 from datacube.utils.documents import JsonDict
@@ -108,3 +110,46 @@ def extract_geom_from_query(**q: QueryField | tuple) -> Geometry | None:
             lon = Range(begin, end)
         geom = box(lon.begin, lat.begin, lon.end, lat.end, crs=crs)
     return geom
+
+
+# 4326-like EPSG codes.
+# extents in these CRSs will be projected to 4326, antimeridian-fixed, and then projected back, so it
+# is very important that only CRSs where this is appropriate are included.
+# It should only include CRSs that use the WGS84 datum, an equatorial cylindrical projection and are centred on
+# the prime meridian (and therefore have a discontinuity at the anti-meridian).
+#
+# Just epsg:3857 for now (Web Mercator)
+EPSG4326_LIKE_CODES = [3857]
+
+
+def sanitise_extent(extent, crs):
+    """
+    Utility method for index drivers supporting spatial indexes.
+
+    Project a dataset extent into the CRS of a spatial index, fixing up geometries that cross the anti-meridian.
+    """
+    if crs.epsg == 4326:
+        prelim = extent.to_crs(crs)
+        return Geometry(fix_shape(prelim.geom), crs=crs)
+    elif crs.epsg in EPSG4326_LIKE_CODES:
+        prelim = extent.to_crs("epsg:4326")
+        fixed = Geometry(fix_shape(prelim.geom), crs="epsg:4326")
+        return fixed.to_crs(crs)
+    else:
+        return extent.to_crs(crs)
+
+
+def crs_to_epsg(crs: CRS) -> int:
+    """
+    Utility method for index drivers supporting spatial indexes.
+
+    Spatial indexes are identified by EPSG code.
+
+    :raises ValueError: if the CRS does not have an EPSG code.
+    """
+    if not str(crs).upper().startswith("EPSG:") and crs.epsg is None:
+        raise ValueError("Non-EPSG-style CRS.")
+    elif crs.epsg is not None:
+        return crs.epsg
+    else:
+        return int(str(crs)[5:])
@@ -3,23 +3,30 @@
 # Copyright (c) 2015-2025 ODC Contributors
 # SPDX-License-Identifier: Apache-2.0
 import datetime
+import json
 import logging
 from abc import ABC, abstractmethod
 from datetime import timedelta
 from time import monotonic
-from typing import Iterable, Mapping, Sequence, Any
+from typing import Iterable, Mapping, Sequence, Any, TYPE_CHECKING
 from uuid import UUID
 
+import numpy
 from deprecat import deprecat
 from odc.geo import CRS, Geometry
 
+from datacube.index.fields import to_columns
 from datacube.migration import ODC2DeprecationWarning
 from datacube.model import Dataset, Product, Field, Range, QueryDict, QueryField
 from datacube.utils import report_to_user
 from datacube.utils.changes import Offset, AllowPolicy, Change, DocumentMismatchError
 from datacube.utils.documents import JsonDict
+from datacube.utils.generic import batched
 
-from ._types import DSID, DatasetTuple, BatchStatus
+from ._types import DSID, DatasetTuple, BatchStatus, dsid_to_uuid
+
+if TYPE_CHECKING:
+    import pyarrow
 
 _LOG = logging.getLogger(__name__)
 
@@ -111,11 +118,14 @@ class AbstractDatasetResource(ABC):
                 )
 
     @abstractmethod
-    def bulk_get(self, ids: Iterable[DSID]) -> Iterable[Dataset]:
+    def bulk_get(self, ids: Iterable[DSID], include_sources: bool = False) -> Iterable[Dataset]:
         """
-        Get multiple datasets by id. (Lineage sources NOT included)
+        Get multiple datasets by id.
+
+        Index drivers should read the lineage of all the datasets together, rather than a dataset at a time.
 
         :param ids: ids to retrieve
+        :param include_sources: include the full provenance tree of each dataset.
         :return: Iterable of Dataset models
         """
 
@@ -132,6 +142,31 @@ class AbstractDatasetResource(ABC):
         :rtype: list[Dataset]
         """
 
+    def get_all_derived_ids(self, ids: Iterable[DSID]) -> set[UUID]:
+        """
+        Get the ids of all datasets derived from any of the given datasets, recursively
+        (children, grandchildren, great-grandchildren...)
+
+        Default implementation uses the lineage API, or looks up derived datasets one at a time.
+        Index drivers are encouraged to look up a whole generation at once.
+
+        :param ids: dataset ids
+        :return: Ids of derived datasets, not including the given datasets
+        """
+        roots = {dsid_to_uuid(id_) for id_ in ids}
+        derived: set[UUID] = set()
+        if self._index.supports_external_lineage:
+            for tree in self._index.lineage.get_derived_trees(roots).values():
+                derived.update(tree.child_datasets())
+            return derived - roots
+        to_process = set(roots)
+        while to_process:
+            for ds in self.get_derived(to_process.pop()):
+                if ds.id not in derived and ds.id not in roots:
+                    derived.add(ds.id)
+                    to_process.add(ds.id)
+        return derived
+
     @abstractmethod
     def has(self, id_: DSID) -> bool:
         """
@@ -551,6 +586,31 @@ class AbstractDatasetResource(ABC):
         :return: Matching datasets
         """
 
+    def search_lean(self,
+                    limit: int | None = None,
+                    archived: bool | None = False,
+                    batch_size: int = 1000,
+                    **query: QueryField) -> Iterable[Dataset]:
+        """
+        Perform a search, returning lean Dataset objects.
+
+        Lean datasets only hold their id, product, uri, time range, CRS and extent. The metadata document
+        of a lean dataset is fetched from the index when it is first needed (e.g. to load the dataset).
+
+        Default implementation returns full datasets from search(). Index drivers that can fetch less than
+        the whole metadata document of each dataset override it.
+
+        :param limit: Limit number of datasets per product (None/default = unlimited)
+        :param archived: False (default): Return active datasets only.
+                         None: Include archived and active datasets.
+                         True: Return archived datasets only.
+        :param batch_size: Number of datasets whose metadata documents are fetched together, if the index
+                           driver fetches them later (ignored by the default implementation)
+        :param query: search query parameters
+        :return: Matching datasets
+        """
+        return self.search(limit=limit, archived=archived, **query)
+
     def get_all_docs_for_product(self, product: Product, batch_size: int = 1000) -> Iterable[DatasetTuple]:
         for ds in self.search(product=[product.name]):
             yield DatasetTuple(product,
@@ -711,6 +771,125 @@ class AbstractDatasetResource(ABC):
         :return: Namedtuple of requested fields, for each matching dataset.
         """
 
+    def _columnar_fields(self,
+                         field_names: Iterable[str] | None,
+                         custom_offsets: Mapping[str, Offset] | None,
+                         query: QueryDict) -> dict[str, Field | None]:
+        """
+        Output fields of a columnar search, by name.
+
+        Field types are taken from the first product matching the query that has the field.
+        Custom offsets are returned untyped (None).
+        """
+        if field_names is None and custom_offsets is None:
+            field_names = self._index.products.get_field_names()
+        products = [product for product, _ in self._index.products.search_robust(**query)]
+        fields: dict[str, Field | None] = {}
+        for name in field_names or ():
+            fields[name] = next((product.metadata_type.dataset_fields[name]
+                                 for product in products
+                                 if name in product.metadata_type.dataset_fields), None)
+        for name in custom_offsets or ():
+            fields[name] = None
+        return fields
+
+    def search_columnar(self,
+                        field_names: Iterable[str] | None = None,
+                        custom_offsets: Mapping[str, Offset] | None = None,
+                        limit: int | None = None,
+                        archived: bool | None = False,
+                        batch_size: int = 10000,
+                        **query: QueryField
+                       ) -> Iterable[dict[str, numpy.ndarray]]:
+        """
+        Perform a search, returning the specified fields as NumPy arrays.
+
+        Results are returned in batches of up to ``batch_size`` datasets, each a dictionary of one array per
+        field, as built by :func:`datacube.index.fields.to_columns`: integer, numeric and datetime fields become
+        int64, float64 and UTC datetime64 arrays, range fields are split into ``<name>_begin`` and ``<name>_end``
+        columns, and other fields become object arrays. Every batch has the same columns.
+
+        Default implementation collects the rows returned by search_returning(). Index drivers override it
+        to build the columns without creating an object per row.
+
+        :param field_names: Names of desired fields (default = all known search fields, unless custom_offsets
+                            is set, as for search_returning())
+        :param custom_offsets: A dictionary of offsets in the metadata doc for custom fields
+        :param limit: Limit number of datasets (None/default = unlimited)
+        :param archived: False (default): Return active datasets only.
+                         None: Include archived and active datasets.
+                         True: Return archived datasets only.
+        :param batch_size: Maximum number of datasets in each batch of columns
+        :param query: search query parameters
+        :return: Dictionaries of arrays by column name, for each batch of matching datasets.
+        """
+        fields = self._columnar_fields(field_names, custom_offsets, query)
+        rows = self.search_returning(field_names=[name for name, field in fields.items()
+                                                  if name not in (custom_offsets or {})],
+                                     custom_offsets=custom_offsets,
+                                     limit=limit,
+                                     archived=archived,
+                                     order_by=None,
+                                     **query)
+        for batch in batched(rows, batch_size):
+            yield to_columns(fields, batch)
+
+    def search_to_arrow(self,
+                        field_names: Iterable[str] | None = None,
+                        custom_offsets: Mapping[str, Offset] | None = None,
+                        limit: int | None = None,
+                        archived: bool | None = False,
+                        batch_size: int = 10000,
+                        **query: QueryField) -> "pyarrow.Table":
+        """
+        Perform a search, returning the specified fields as an Arrow table.
+
+        Columns are as for search_columnar(), missing values are nulls, datetimes are UTC timestamps, and
+        object columns are converted to strings (JSON for lists and dictionaries).  Call ``to_pandas()``
+        on the result for a pandas DataFrame.
+
+        Requires pyarrow (``pip install datacube[arrow]``).
+
+        :param field_names: Names of desired fields (default = all known search fields, unless custom_offsets
+                            is set, as for search_returning())
+        :param custom_offsets: A dictionary of offsets in the metadata doc for custom fields
+        :param limit: Limit number of datasets (None/default = unlimited)
+        :param archived: False (default): Return active datasets only.
+                         None: Include archived and active datasets.
+                         True: Return archived datasets only.
+        :param batch_size: Number of datasets read from the index at a time
+        :param query: search query parameters
+        :return: Table with a row for each matching dataset
+        """
+        try:
+            import pyarrow
+        except ImportError:
+            raise ImportError("search_to_arrow requires pyarrow: pip install datacube[arrow]") from None
+
+        def to_arrow(column: numpy.ndarray):
+            if column.dtype.kind == 'M':
+                return pyarrow.array(column, type=pyarrow.timestamp('us', tz='UTC'), from_pandas=True)
+            if column.dtype.kind == 'O':
+                return pyarrow.array([
+                    value if value is None or isinstance(value, str)
+                    else json.dumps(value) if isinstance(value, (dict, list))
+                    else str(value)
+                    for value in column
+                ], type=pyarrow.string())
+            return pyarrow.array(column, from_pandas=True)
+
+        tables = [
+            pyarrow.table({name: to_arrow(column) for name, column in columns.items()})
+            for columns in self.search_columnar(field_names, custom_offsets, limit=limit, archived=archived,
+                                                batch_size=batch_size, **query)
+        ]
+        if not tables:
+            fields = self._columnar_fields(field_names, custom_offsets, query)
+            return pyarrow.table({name: to_arrow(column)
+                                  for name, column in to_columns(fields, []).items()})
+        # Integer columns with missing values in some batches are promoted to float
+        return pyarrow.concat_tables(tables, promote_options="permissive")
+
     @abstractmethod
     def count(self, archived: bool | None = False, **query: QueryField) -> int:
         """
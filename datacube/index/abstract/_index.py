@@ -3,9 +3,11 @@
 # Copyright (c) 2015-2025 ODC Contributors
 # SPDX-License-Identifier: Apache-2.0
 import logging
+import os
 from abc import ABC, abstractmethod
-from typing import Mapping, Iterable, Sequence, Type
+from typing import Callable, Mapping, Iterable, Sequence, Type
 from urllib.parse import ParseResult, urlparse
+from uuid import UUID
 
 from deprecat import deprecat
 from odc.geo import CRS
@@ -178,7 +180,9 @@ class AbstractIndex(ABC):
     def update_spatial_index(self,
                              crses: Sequence[CRS] = [],
                              product_names: Sequence[str] = [],
-                             dataset_ids: Sequence[DSID] = []
+                             dataset_ids: Sequence[DSID] = [],
+                             after: DSID | None = None,
+                             progress: Callable[[int, UUID], None] | None = None,
                              ) -> int:
         """
         Populate a newly created spatial index (or indexes).
@@ -199,6 +203,10 @@ class AbstractIndex(ABC):
         :param dataset_ids: A list of ids of specific datasets to update in the spatial index.
                             Default is to update for all datasets (or all datasts in the products
                             in the product_names list)
+        :param after: Only update datasets with an id greater than this. Datasets are updated in id order,
+                      so this can be used to resume an interrupted update after the last id passed to progress.
+        :param progress: Optional callback, called as the update proceeds with the number of datasets updated
+                         so far and the id of the last dataset updated.
         :return: The number of dataset extents processed - i.e. the number of datasets updated multiplied by the
                  number of spatial indexes updated.
         """
@@ -228,7 +236,9 @@ class AbstractIndex(ABC):
               origin_index: "AbstractIndex",
               batch_size: int = 1000,
               skip_lineage=False,
-              lineage_only=False) -> Mapping[str, BatchStatus]:
+              lineage_only=False,
+              workers: int = 1,
+              checkpoint: str | os.PathLike | None = None) -> Mapping[str, BatchStatus]:
         """
         Clone an existing index into this one.
 
@@ -247,6 +257,7 @@ class AbstractIndex(ABC):
         3) Clone all datasets with "safe" products
            - Datasets are included or excluded by product and metadata type, as discussed above.
            - Archived datasets and locations are not cloned.
+           - Datasets are cloned product by product, in parallel if workers is greater than one.
 
         4) Clone all lineage relations that can be cloned.
            - All lineage relations are skipped if either index driver does not support lineage,
@@ -254,13 +265,25 @@ class AbstractIndex(ABC):
            - If this index does not support external lineage then lineage relations that reference datasets
              that do not exist in this index after step 3 above are skipped.
 
+        If a checkpoint file is supplied, the completed steps (and the products completed in step 3) are
+        recorded in it.  If the clone is interrupted, calling clone again with the same checkpoint file
+        resumes from where it stopped.
+
         API Note: This API method is not finalised and may be subject to change.
 
         :param origin_index: Index whose contents we wish to clone.
         :param batch_size: Maximum number of objects to write to the database in one go.
+        :param workers: Number of products to clone datasets for at once, each in a separate process with its
+                        own database connections.  Both indexes must be persistent if greater than one.
+                        Default: 1, clone in this process.
+        :param checkpoint: Path of a checkpoint file to record and resume progress.
+                           Default: None, progress is not recorded.
         :return: Dictionary containing a BatchStatus named tuple for "metadata_types", "products"
                  and "datasets", and optionally "lineage".
         """
+        from datacube.index._clone import CloneCheckpoint, clone_datasets, format_batch_status
+
+        progress = CloneCheckpoint(checkpoint, origin_index.index_id, self.index_id)
         results = {}
         if not lineage_only:
             if self.supports_spatial_indexes and origin_index.supports_spatial_indexes:
@@ -270,51 +293,54 @@ class AbstractIndex(ABC):
                 self.update_spatial_index(list(origin_index.spatial_indexes(refresh=False)))
             # Clone Metadata Types
             report_to_user("Cloning Metadata Types:")
-            results["metadata_types"] = self.metadata_types.bulk_add(origin_index.metadata_types.get_all_docs(),
-                                                                     batch_size=batch_size)
-            res = results["metadata_types"]
-            msg = f'{res.completed} metadata types loaded ({res.skipped} skipped) in ' \
-                  f'{res.seconds_elapsed:.2f}seconds ' \
-                  f'({res.completed * 60 / res.seconds_elapsed:.2f} metadata_types/min)'
-            report_to_user(msg, logger=_LOG)
+            res = progress.phase("metadata_types")
+            if res is None:
+                res = self.metadata_types.bulk_add(origin_index.metadata_types.get_all_docs(),
+                                                   batch_size=batch_size)
+                progress.record_phase("metadata_types", res)
+            results["metadata_types"] = res
+            report_to_user(format_batch_status(res, "metadata types"), logger=_LOG)
             if res.safe:
                 metadata_cache = {name: self.metadata_types.get_by_name_unsafe(name) for name in res.safe}
             else:
                 metadata_cache = {}
             # Clone Products
             report_to_user("Cloning Products:")
-            results["products"] = self.products.bulk_add(origin_index.products.get_all_docs(),
-                                                         metadata_types=metadata_cache,
-                                                         batch_size=batch_size)
-            res = results["products"]
-            msg = f'{res.completed} products loaded ({res.skipped} skipped) in {res.seconds_elapsed:.2f}seconds ' \
-                  f'({res.completed * 60 / res.seconds_elapsed:.2f} products/min)'
-            report_to_user(msg, logger=_LOG)
-            # Clone Datasets (group by product for now for convenience)
+            res = progress.phase("products")
+            if res is None:
+                res = self.products.bulk_add(origin_index.products.get_all_docs(),
+                                             metadata_types=metadata_cache,
+                                             batch_size=batch_size)
+                progress.record_phase("products", res)
+            results["products"] = res
+            report_to_user(format_batch_status(res, "products"), logger=_LOG)
+            # Clone Datasets, by product
             report_to_user("Cloning Datasets:")
-            if res.safe:
-                products = [p for p in self.products.get_all() if p.name in res.safe]
-            else:
-                products = []
-            results["datasets"] = self.datasets.bulk_add(
-                origin_index.datasets.get_all_docs(products=products, batch_size=batch_size),
-                batch_size=batch_size
-            )
-            res = results["datasets"]
+            res_datasets = progress.phase("datasets")
+            if res_datasets is None:
+                safe_products = set(res.safe) if res.safe else set()
+                res_datasets = clone_datasets(
+                    self, origin_index,
+                    [p.name for p in self.products.get_all() if p.name in safe_products],
+                    progress,
+                    batch_size=batch_size,
+                    workers=workers
+                )
+                progress.record_phase("datasets", res_datasets)
+            results["datasets"] = res_datasets
             report_to_user("")
-            msg = f'{res.completed} datasets loaded ({res.skipped} skipped) in {res.seconds_elapsed:.2f}seconds ' \
-                  f'({res.completed * 60 / res.seconds_elapsed:.2f} datasets/min)'
-            report_to_user(msg, logger=_LOG)
+            report_to_user(format_batch_status(res_datasets, "datasets"), logger=_LOG)
         if not self.supports_lineage or not origin_index.supports_lineage or skip_lineage:
             report_to_user("Skipping lineage")
             return results
         report_to_user("Cloning Lineage:")
-        results["lineage"] = self.lineage.bulk_add(origin_index.lineage.get_all_lineage(batch_size), batch_size)
-        res = results["lineage"]
+        res = progress.phase("lineage")
+        if res is None:
+            res = self.lineage.bulk_add(origin_index.lineage.get_all_lineage(batch_size), batch_size)
+            progress.record_phase("lineage", res)
+        results["lineage"] = res
         report_to_user("")
-        msg = f'{res.completed} lineage relations loaded ({res.skipped} skipped) in {res.seconds_elapsed:.2f}seconds ' \
-              f'({res.completed * 60 / res.seconds_elapsed:.2f} lineage relations/min)'
-        report_to_user(msg, logger=_LOG)
+        report_to_user(format_batch_status(res, "lineage relations"), logger=_LOG)
         return results
 
     @abstractmethod
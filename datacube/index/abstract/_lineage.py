@@ -12,7 +12,7 @@ from datacube.model import LineageTree, LineageDirection, LineageRelation
 from datacube.model.lineage import LineageRelations
 from datacube.utils import report_to_user
 
-from ._types import DSID, BatchStatus
+from ._types import DSID, BatchStatus, dsid_to_uuid
 
 _LOG = logging.getLogger(__name__)
 
@@ -66,6 +66,32 @@ class AbstractLineageResource(ABC):
         :return: A source-direction Lineage tree with id at the root.
         """
 
+    def get_derived_trees(self, ids: Iterable[DSID], max_depth: int = 0) -> Mapping[UUID, LineageTree]:
+        """
+        Extract derived-direction LineageTrees for multiple datasets, as per get_derived_tree.
+
+        Default implementation extracts each tree separately.  Index drivers are encouraged to
+        read the lineage of all the datasets at once.
+
+        :param ids: the ids of the datasets at the roots of the returned trees
+        :param max_depth: Maximum recursion depth.  Default/Zero = unlimited depth
+        :return: Mapping of root dataset ids to derived-direction Lineage trees.
+        """
+        return {dsid_to_uuid(id_): self.get_derived_tree(id_, max_depth) for id_ in ids}
+
+    def get_source_trees(self, ids: Iterable[DSID], max_depth: int = 0) -> Mapping[UUID, LineageTree]:
+        """
+        Extract source-direction LineageTrees for multiple datasets, as per get_source_tree.
+
+        Default implementation extracts each tree separately.  Index drivers are encouraged to
+        read the lineage of all the datasets at once.
+
+        :param ids: the ids of the datasets at the roots of the returned trees
+        :param max_depth: Maximum recursion depth.  Default/Zero = unlimited depth
+        :return: Mapping of root dataset ids to source-direction Lineage trees.
+        """
+        return {dsid_to_uuid(id_): self.get_source_tree(id_, max_depth) for id_ in ids}
+
     @abstractmethod
     def merge(self, rels: LineageRelations, allow_updates: bool = False, validate_only: bool = False) -> None:
         """
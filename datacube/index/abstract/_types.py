@@ -8,7 +8,7 @@ from uuid import UUID
 from deprecat import deprecat
 
 from datacube.migration import ODC2DeprecationWarning
-from datacube.model import Product, Dataset
+from datacube.model import Product, Dataset, _crs_from_grid_spatial, _extent_from_grid_spatial
 from datacube.utils import cached_property
 from datacube.utils.documents import JsonDict
 
@@ -102,11 +102,11 @@ class DatasetSpatialMixin:
 
     @property
     def crs(self):
-        return Dataset.crs.__get__(self)
+        return _crs_from_grid_spatial(self._gs)
 
     @cached_property
     def extent(self):
-        return Dataset.extent.func(self)
+        return _extent_from_grid_spatial(self._gs, self.crs)
 
     @property
     def transform(self):
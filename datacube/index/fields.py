@@ -6,19 +6,23 @@
 Common datatypes for DB drivers.
 """
 
-from datetime import date, datetime, time
+from datetime import date, datetime, time, timedelta, timezone
 from dateutil.tz import tz
-from typing import List
+from typing import Any, List, Mapping, Sequence
+
+import numpy
 
 from datacube.model import Range, Not
 from datacube.model.fields import Expression, Field
+from datacube.utils.dates import parse_time
 
 __all__ = ['Field',
            'Expression',
            'OrExpression',
            'UnknownFieldError',
            'to_expressions',
-           'as_expression']
+           'as_expression',
+           'to_columns']
 
 
 class UnknownFieldError(Exception):
@@ -83,3 +87,90 @@ def to_expressions(get_field, **query) -> List[Expression]:
     :type query: dict[str,str|float|datacube.model.Range]
     """
     return [_to_expression(get_field, name, value) for name, value in query.items()]
+
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_NAIVE_EPOCH = _EPOCH.replace(tzinfo=None)
+_MICROSECOND = timedelta(microseconds=1)
+_NAT = numpy.iinfo('int64').min
+
+
+def _datetime_column(values) -> numpy.ndarray:
+    # Integer microseconds are much faster than letting numpy convert datetime objects.
+    # Naive datetimes are taken to be UTC.
+    def to_us(value):
+        if value is None:
+            return _NAT
+        if isinstance(value, str):
+            value = parse_time(value)
+        return (value - (_NAIVE_EPOCH if value.tzinfo is None else _EPOCH)) // _MICROSECOND
+
+    return numpy.array([to_us(v) for v in values], dtype='int64').view('datetime64[us]')
+
+
+def _float_column(values) -> numpy.ndarray:
+    return numpy.array([numpy.nan if v is None else v for v in values], dtype='float64')
+
+
+def _integer_column(values) -> numpy.ndarray:
+    if any(v is None for v in values):
+        return _float_column(values)
+    return numpy.array(values, dtype='int64')
+
+
+def _object_column(values) -> numpy.ndarray:
+    column = numpy.empty(len(values), dtype=object)
+    column[:] = values
+    return column
+
+
+_COLUMN_TYPES = {
+    'integer': _integer_column,
+    'numeric': _float_column,
+    'double': _float_column,
+    'float': _float_column,
+    'datetime': _datetime_column,
+}
+
+
+def _range_bounds(value):
+    if value is None:
+        return None, None
+    if hasattr(value, 'lower'):
+        # Range types of the database drivers
+        return value.lower, value.upper
+    return value[0], value[1]
+
+
+def to_columns(fields: Mapping[str, Field | None],
+               rows: Sequence[Sequence[Any]],
+               names: Sequence[str] | None = None) -> dict[str, numpy.ndarray]:
+    """
+    Convert a batch of search result rows into one NumPy array per field.
+
+    Integer, numeric and datetime fields become int64, float64 and UTC datetime64[us] arrays, with
+    NaN or NaT for missing values (integer fields with missing values become float64). Range fields
+    are split into ``<name>_begin`` and ``<name>_end`` columns. Anything else becomes an object array.
+
+    :param fields: The fields to return, in column order. None for fields of unknown type.
+    :param rows: Field values of each row
+    :param names: The field names of the values in each row, if not all of ``fields``.
+                  Fields missing from the rows are returned as missing values.
+    :return: Arrays by column name
+    """
+    if names is None:
+        names = list(fields)
+    values_by_name = dict(zip(names, zip(*rows))) if rows else {}
+    missing = (None,) * len(rows)
+    columns = {}
+    for name, field in fields.items():
+        values = values_by_name.get(name, missing)
+        type_name = 'string' if field is None else field.type_name
+        if type_name.endswith('-range'):
+            make_column = _COLUMN_TYPES.get(type_name[:-len('-range')], _object_column)
+            bounds = [_range_bounds(v) for v in values]
+            columns[f'{name}_begin'] = make_column([b[0] for b in bounds])
+            columns[f'{name}_end'] = make_column([b[1] for b in bounds])
+        else:
+            columns[name] = _COLUMN_TYPES.get(type_name, _object_column)(list(values))
+    return columns
@@ -9,14 +9,19 @@ import logging
 
 import json
 import toolz
+from collections import Counter
 from uuid import UUID
-from typing import cast, Any, Callable, Optional, Iterable, List, Mapping, Sequence, Tuple, Union, MutableMapping
+from typing import (cast, Any, Callable, Optional, Iterable, Iterator, List, Mapping, Sequence, Tuple, Union,
+                    MutableMapping)
+
+from cachetools import LRUCache
 
 from datacube.model import Dataset, LineageTree, Product
 from datacube.index.abstract import AbstractIndex
 from datacube.utils import changes, InvalidDocException, SimpleDocNav, jsonify_document
 from datacube.model.utils import BadMatch, dedup_lineage, remap_lineage_doc, flatten_datasets
 from datacube.utils.changes import get_doc_changes
+from datacube.utils.generic import batched
 from datacube.model import LineageDirection
 from .eo3 import prep_eo3, is_doc_eo3, is_doc_geo  # type: ignore[attr-defined]
 
@@ -55,6 +60,81 @@ def load_rules_from_types(index: AbstractIndex,
 
 ProductMatcher = Callable[[Mapping[str, Any]], Product]
 
+_MISSING = object()
+
+
+def _signature_leaves(signature: Any, path: Tuple[str, ...] = ()) -> Iterator[Tuple[Tuple[str, ...], Any]]:
+    if signature is None:
+        return
+    if isinstance(signature, dict):
+        for k, v in signature.items():
+            yield from _signature_leaves(v, path + (k,))
+    else:
+        yield path, signature
+
+
+def _signature_key(value: Any) -> Any:
+    # changes.contains compares strings case-insensitively
+    return value.lower() if isinstance(value, str) else value
+
+
+class ProductRuleIndex:
+    """
+    Product rules grouped by the value of the signature field that best tells them apart.
+
+    Only rules in the group matching a document (and rules that do not constrain that
+    field at all) can match the document, so they are the only ones that need to be
+    checked with :func:`datacube.utils.changes.contains`.
+    """
+    def __init__(self, rules: Sequence[ProductRule]):
+        self.rules = list(rules)
+        leaves = [dict(_signature_leaves(rule.signature)) for rule in self.rules]
+        values: dict[Tuple[str, ...], set] = {}
+        for rule_leaves in leaves:
+            for path, value in rule_leaves.items():
+                try:
+                    values.setdefault(path, set()).add(_signature_key(value))
+                except TypeError:
+                    # Unhashable signature value, e.g. a list: cannot be used for lookups
+                    pass
+        # Index on the path with the most distinct values, preferring paths used by more rules
+        counts = Counter(path for rule_leaves in leaves for path in rule_leaves)
+        self.path: Optional[Tuple[str, ...]] = max(
+            values, key=lambda path: (len(values[path]), counts[path]), default=None
+        )
+        self._by_value: dict[Any, List[int]] = {}
+        self._unindexed: List[int] = []
+        for i, rule_leaves in enumerate(leaves):
+            value = rule_leaves.get(self.path, _MISSING)  # type: ignore[arg-type]
+            if value is not _MISSING:
+                try:
+                    self._by_value.setdefault(_signature_key(value), []).append(i)
+                    continue
+                except TypeError:
+                    pass
+            self._unindexed.append(i)
+
+    def candidates(self, doc: Mapping[str, Any]) -> List[ProductRule]:
+        """
+        Rules that may match a document, in their original order.
+        """
+        if self.path is None:
+            return self.rules
+        value: Any = doc
+        for k in self.path:
+            if not isinstance(value, dict):
+                value = _MISSING
+                break
+            value = value.get(k, _MISSING)
+        if value is _MISSING:
+            matched = self._unindexed
+        else:
+            try:
+                matched = self._by_value.get(_signature_key(value), []) + self._unindexed
+            except TypeError:
+                return self.rules
+        return [self.rules[i] for i in sorted(matched)]
+
 
 def product_matcher(rules: Sequence[ProductRule]) -> ProductMatcher:
     """Given product matching rules return a function mapping a document to a
@@ -82,8 +162,10 @@ def product_matcher(rules: Sequence[ProductRule]) -> ProductMatcher:
     if len(rules) == 1:
         return single_product_matcher(rules[0])
 
+    rule_index = ProductRuleIndex(rules)
+
     def match(doc: Mapping[str, Any]) -> Product:
-        matched = [rule.product for rule in rules if changes.contains(doc, rule.signature)]
+        matched = [rule.product for rule in rule_index.candidates(doc) if changes.contains(doc, rule.signature)]
 
         if len(matched) == 1:
             return matched[0]
@@ -212,12 +294,53 @@ def resolve_with_lineage(doc: SimpleDocNav,
                    uri=uri), None
 
 
+class LineageCache:
+    """
+    Bounded cache of datasets read from the index while resolving legacy lineage.
+
+    Datasets found in the index are kept until they are pushed out by more recently
+    used ones. Ids that were not found are only remembered until the next call to
+    :meth:`prefetch`, so that datasets added to the index in the meantime are seen.
+    """
+    def __init__(self, index: AbstractIndex, maxsize: int = 10000):
+        self._index = index
+        self._cache: LRUCache = LRUCache(maxsize=maxsize)
+        self._missing: set[UUID] = set()
+
+    def prefetch(self, ids: Iterable[UUID]) -> None:
+        """
+        Look up all datasets that will be needed to resolve the next batch of documents at once.
+        """
+        self._missing = set()
+        self.get_many(ids)
+
+    def get_many(self, ids: Iterable[UUID]) -> dict[UUID, Dataset]:
+        """
+        Datasets with the given ids that exist in the index, by id.
+        """
+        found: dict[UUID, Dataset] = {}
+        lookup = set()
+        for id_ in ids:
+            ds = self._cache.get(id_)
+            if ds is not None:
+                found[id_] = ds
+            elif id_ not in self._missing:
+                lookup.add(id_)
+        if lookup:
+            for ds in self._index.datasets.bulk_get(lookup):
+                self._cache[ds.id] = ds
+                found[ds.id] = ds
+            self._missing.update(lookup - found.keys())
+        return found
+
+
 def resolve_legacy_lineage(main_ds_doc: SimpleDocNav, uri: str, matcher: ProductMatcher,
                            index: AbstractIndex,
                            fail_on_missing_lineage: bool,
                            verify_lineage: bool,
                            source_tree: Optional[LineageTree] = None,
-                           home_index: str | None = None
+                           home_index: str | None = None,
+                           lineage_cache: Optional[LineageCache] = None
                            ) -> DatasetOrError:
     if source_tree or home_index:
         raise ValueError("source_tree passed to non-external lineage resolver")
@@ -233,7 +356,10 @@ def resolve_legacy_lineage(main_ds_doc: SimpleDocNav, uri: str, matcher: Product
 
     ds_by_uuid = toolz.valmap(toolz.first, flatten_datasets(main_ds))
     all_uuid = list(ds_by_uuid)
-    db_dss = {ds.id: ds for ds in index.datasets.bulk_get(all_uuid)}
+    if lineage_cache is not None:
+        db_dss = lineage_cache.get_many(all_uuid)
+    else:
+        db_dss = {ds.id: ds for ds in index.datasets.bulk_get(all_uuid)}
 
     lineage_uuids = set(filter(lambda x: x != main_uuid, all_uuid))
     missing_lineage = lineage_uuids - set(db_dss)
@@ -298,9 +424,10 @@ def dataset_resolver(index: AbstractIndex,
                      fail_on_missing_lineage: bool = False,
                      verify_lineage: bool = True,
                      skip_lineage: bool = False,
-                     home_index: Optional[str] = None) -> Callable[[SimpleDocNav, str, LineageTree | None],
-                                                                   DatasetOrError
-                                                                   ]:
+                     home_index: Optional[str] = None,
+                     lineage_cache: Optional[LineageCache] = None) -> Callable[[SimpleDocNav, str, LineageTree | None],
+                                                                               DatasetOrError
+                                                                               ]:
     if skip_lineage or not index.supports_lineage:
         # Resolver that ignores lineage.
         resolver: Callable[..., DatasetOrError] = resolve_no_lineage
@@ -322,6 +449,7 @@ def dataset_resolver(index: AbstractIndex,
             "index": index,
             "fail_on_missing_lineage": fail_on_missing_lineage,
             "verify_lineage": verify_lineage,
+            "lineage_cache": lineage_cache,
         }
 
     def resolve(doc: SimpleDocNav, uri: str, source_tree: Optional[LineageTree] = None) -> DatasetOrError:
@@ -407,13 +535,15 @@ class Doc2Dataset:
 
         self.index = index
         self._eo3 = eo3
-        matcher = product_matcher(rules)
-        self._ds_resolve = dataset_resolver(index,
-                                            matcher,
-                                            fail_on_missing_lineage=fail_on_missing_lineage,
-                                            verify_lineage=verify_lineage,
-                                            skip_lineage=skip_lineage,
-                                            home_index=home_index)
+        self._matcher = product_matcher(rules)
+        self._resolver_args: dict[str, Any] = {
+            "fail_on_missing_lineage": fail_on_missing_lineage,
+            "verify_lineage": verify_lineage,
+            "skip_lineage": skip_lineage,
+            "home_index": home_index,
+        }
+        self._legacy_lineage = not skip_lineage and not index.supports_external_lineage
+        self._ds_resolve = dataset_resolver(index, self._matcher, **self._resolver_args)
 
     def __call__(self, doc_in: Union[SimpleDocNav, Mapping[str, Any]], uri: str,
                  source_tree: Optional[LineageTree] = None) -> DatasetOrError:
@@ -425,6 +555,48 @@ class Doc2Dataset:
         :return: (dataset, None) is successful,
         :return: (None, ErrorMessage) on failure
         """
+        return self._resolve(self._ds_resolve, self._prep_doc(doc_in), uri, source_tree)
+
+    def resolve_many(self,
+                     docs: Iterable[Tuple[Union[SimpleDocNav, Mapping[str, Any]], str]],
+                     batch_size: int = 1000,
+                     cache_size: int = 10000) -> Iterator[DatasetOrError]:
+        """Construct datasets from a stream of metadata documents and uris.
+
+        Equivalent to calling the resolver on each document in turn, but for
+        indexes with legacy lineage the lineage datasets referenced by a whole
+        batch of documents are read from the index at once, and recently read
+        lineage datasets are cached across batches.
+
+        Lineage datasets added to the index while a batch is being resolved
+        are only seen from the next batch on.
+
+        :param docs: (document, uri) pairs
+        :param batch_size: Number of documents to look up lineage datasets for at once
+        :param cache_size: Maximum number of lineage datasets to cache
+        :return: (dataset, None) or (None, ErrorMessage) for each document, in order
+        """
+        lineage_cache = LineageCache(self.index, maxsize=cache_size) if self._legacy_lineage else None
+        resolve = dataset_resolver(self.index, self._matcher, lineage_cache=lineage_cache, **self._resolver_args)
+        for batch in batched(docs, batch_size):
+            prepped = [(self._prep_doc(doc), uri) for doc, uri in batch]
+            if lineage_cache is not None:
+                lineage_cache.prefetch(self._lineage_ids(doc for doc, _ in prepped))
+            for doc, uri in prepped:
+                yield self._resolve(resolve, doc, uri)
+
+    @staticmethod
+    def _lineage_ids(docs: Iterable[SimpleDocNav]) -> set[UUID]:
+        ids: set[UUID] = set()
+        for doc in docs:
+            try:
+                ids.update(id_ for id_ in flatten_datasets(doc) if id_ is not None)
+            except Exception:  # pylint: disable=broad-except
+                # Invalid documents are reported when they are resolved
+                continue
+        return ids
+
+    def _prep_doc(self, doc_in: Union[SimpleDocNav, Mapping[str, Any]]) -> SimpleDocNav:
         if isinstance(doc_in, SimpleDocNav):
             doc: SimpleDocNav = doc_in
         else:
@@ -441,8 +613,13 @@ class Doc2Dataset:
                 sources_path=('lineage',) if self.index.supports_external_lineage
                 else ('lineage', 'source_datasets')
             )
+        return doc
 
-        dataset, err = self._ds_resolve(doc, uri, source_tree)
+    @staticmethod
+    def _resolve(resolve: Callable[[SimpleDocNav, str, LineageTree | None], DatasetOrError],
+                 doc: SimpleDocNav, uri: str,
+                 source_tree: Optional[LineageTree] = None) -> DatasetOrError:
+        dataset, err = resolve(doc, uri, source_tree)
         if dataset is None:
             return None, cast(Union[str, Exception], err)
 
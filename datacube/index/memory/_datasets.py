@@ -14,8 +14,11 @@ from time import monotonic
 from typing import (Any, Callable, Iterable, Mapping, Sequence, cast)
 from uuid import UUID
 
+from odc.geo import CRS, Geometry
+
 from datacube.migration import ODC2DeprecationWarning
-from datacube.index import fields
+from datacube.index import fields, extract_geom_from_query
+from datacube.index._spatial import crs_to_epsg
 from datacube.index.abstract import (AbstractDatasetResource, DSID, BatchStatus,
                                      NoLineageResource,
                                      dsid_to_uuid, DatasetSpatialMixin,
@@ -23,6 +26,8 @@ from datacube.index.abstract import (AbstractDatasetResource, DSID, BatchStatus,
 from datacube.model._base import QueryField
 from datacube.index.fields import Field
 from datacube.index.memory._fields import build_custom_fields, get_dataset_fields
+from datacube.index.memory._search import ProductSearchIndex
+from datacube.index.memory._spatial import SpatialIndex
 from datacube.model import Dataset, LineageRelation, Product, Range, ranges_overlap
 from datacube.utils import jsonify_document, _readable_offset
 from datacube.utils import changes
@@ -50,19 +55,36 @@ class DatasetResource(AbstractDatasetResource):
         # Active Index By Product
         self._by_product: dict[str, set[UUID]] = {}
         self._archived_by_product: dict[str, set[UUID]] = {}
+        # Search field indexes by product, built on first search
+        self._search_indexes: dict[str, ProductSearchIndex] = {}
+        # Spatial indexes of dataset extents by EPSG code - EPSG:4326 is always created
+        self._spatial_indexes: dict[int, SpatialIndex] = {4326: SpatialIndex(CRS("EPSG:4326"))}
 
     def get_unsafe(self, id_: DSID, include_sources: bool = False,
                    include_deriveds: bool = False, max_depth: int = 0) -> Dataset:
         self._check_get_legacy(include_deriveds, max_depth)
-        ds = self.clone(self._by_id[dsid_to_uuid(id_)])  # N.B. raises KeyError if id not in index.
         if include_sources:
+            return self._get_with_sources(dsid_to_uuid(id_), {})  # N.B. raises KeyError if id not in index.
+        return self.clone(self._by_id[dsid_to_uuid(id_)])  # N.B. raises KeyError if id not in index.
+
+    def _get_with_sources(self, id_: UUID, so_far: dict[UUID, Dataset]) -> Dataset:
+        # Source datasets shared by several datasets (i.e. diamond dependencies) are only cloned once.
+        if id_ not in so_far:
+            ds = so_far[id_] = self.clone(self._by_id[id_])
             ds.sources = {
-                classifier: cast(Dataset, self.get(dsid, include_sources=True))
-                for classifier, dsid in self._derived_from.get(ds.id, {}).items()
+                classifier: cast(Dataset, self._get_with_sources(dsid, so_far) if dsid in self._by_id else None)
+                for classifier, dsid in self._derived_from.get(id_, {}).items()
             }
-        return ds
+        return so_far[id_]
 
-    def bulk_get(self, ids: Iterable[DSID]) -> Iterable[Dataset]:
+    def bulk_get(self, ids: Iterable[DSID], include_sources: bool = False) -> Iterable[Dataset]:
+        if include_sources:
+            so_far: dict[UUID, Dataset] = {}
+            return [
+                self._get_with_sources(dsid, so_far)
+                for dsid in (dsid_to_uuid(id_) for id_ in ids)
+                if dsid in self._by_id
+            ]
         return (ds for ds in (self.get(dsid) for dsid in ids) if ds is not None)
 
     def get_derived(self, id_: DSID) -> Iterable[Dataset]:
@@ -104,6 +126,9 @@ class DatasetResource(AbstractDatasetResource):
                 self._by_product[dataset.product.name].add(dataset.id)
             else:
                 self._by_product[dataset.product.name] = {dataset.id}
+            if dataset.product.name in self._search_indexes:
+                self._search_indexes[dataset.product.name].add(persistable.id, persistable.metadata_doc)
+            self._update_extents(persistable)
         if archive_less_mature is not None:
             _LOG.warning("archive-less-mature functionality is not implemented for memory driver")
         return cast(Dataset, self.get(dataset.id))
@@ -235,8 +260,13 @@ class DatasetResource(AbstractDatasetResource):
         _LOG.info("Updating dataset %s", dataset.id)
         self._update_locations(dataset, existing)
         persistable = self.clone(dataset, for_save=True)
+        if persistable.product.name in self._search_indexes:
+            search_index = self._search_indexes[persistable.product.name]
+            search_index.remove(dataset.id, self._by_id[dataset.id].metadata_doc)
+            search_index.add(dataset.id, persistable.metadata_doc)
         self._by_id[dataset.id] = persistable
         self._active_by_id[dataset.id] = persistable
+        self._update_extents(persistable)
         if archive_less_mature is not None:
             _LOG.warning("archive-less-mature functionality is not implemented for memory driver")
         return cast(Dataset, self.get(dataset.id))
@@ -286,13 +316,18 @@ class DatasetResource(AbstractDatasetResource):
         for id_ in ids:
             id_ = dsid_to_uuid(id_)
             if id_ in self._by_id:
-                ds = self._by_id.pop(id_)
+                ds = self._by_id[id_]
                 if id_ in self._active_by_id:
                     if not allow_delete_active:
                         _LOG.warning(f"Cannot purge unarchived dataset: {id_}")
                         continue
                     del self._active_by_id[id_]
                     self._by_product[ds.product.name].remove(id_)
+                del self._by_id[id_]
+                if ds.product.name in self._search_indexes:
+                    self._search_indexes[ds.product.name].remove(id_, ds.metadata_doc)
+                for spatial_index in self._spatial_indexes.values():
+                    spatial_index.remove(id_)
                 if id_ in self._archived_by_id:
                     del self._archived_by_id[id_]
                     self._archived_by_product[ds.product.name].remove(id_)
@@ -473,8 +508,12 @@ class DatasetResource(AbstractDatasetResource):
             archived: bool | None = False,
             **query: QueryField
     ) -> Iterable[Dataset | tuple[Iterable[Dataset], Product]]:
-        if "geopolygon" in query:
-            raise NotImplementedError("Spatial search index API not supported by this index.")
+        geopolygon = query.pop("geopolygon", None)
+        if geopolygon is not None:
+            geom = cast(Geometry, extract_geom_from_query(geopolygon=geopolygon, **query))
+            spatial_ids: set[UUID] | None = self._spatial_search(geom)
+        else:
+            spatial_ids = None
         if source_filter:
             product_queries = list(self._get_prod_queries(**source_filter))
             if not product_queries:
@@ -512,17 +551,26 @@ class DatasetResource(AbstractDatasetResource):
             else:
                 dsids = self._by_product.get(product.name, set())
 
+            candidates = self._search_index(product).candidates(query_exprs)
+            if candidates is not None:
+                if archived is None:
+                    dsids = candidates
+                else:
+                    dsids = candidates & cast(set[UUID], dsids)
+            if spatial_ids is not None:
+                dsids = spatial_ids.intersection(dsids)
+
             for dsid in dsids:
                 if limit is not None and matches >= limit:
                     break
-                ds = cast(Dataset, self.get(dsid, include_sources=True))
                 query_matches = True
                 for expr in query_exprs:
-                    if not expr.evaluate(ds.metadata_doc):
+                    if not expr.evaluate(self._by_id[dsid].metadata_doc):
                         query_matches = False
                         break
                 if not query_matches:
                     continue
+                ds = cast(Dataset, self.get(dsid, include_sources=True))
                 if source_product:
                     matching_source = None
                     for sds in cast(Mapping[str, Dataset], ds.sources).values():
@@ -546,6 +594,98 @@ class DatasetResource(AbstractDatasetResource):
             if return_format == self.RET_FORMAT_PRODUCT_GROUPED and product_results:
                 yield (product_results, product)
 
+    def _search_index(self, product: Product) -> ProductSearchIndex:
+        search_index = self._search_indexes.get(product.name)
+        if search_index is None or not search_index.is_current(product.metadata_type):
+            search_index = ProductSearchIndex(product.metadata_type)
+            for dsid in chain(self._by_product.get(product.name, set()),
+                              self._archived_by_product.get(product.name, set())):
+                search_index.add(dsid, self._by_id[dsid].metadata_doc)
+            self._search_indexes[product.name] = search_index
+        return search_index
+
+    def _get_spatial_index(self, crs: CRS) -> SpatialIndex | None:
+        try:
+            return self._spatial_indexes.get(crs_to_epsg(crs))
+        except ValueError:
+            return None
+
+    def _spatial_search(self, geom: Geometry) -> set[UUID]:
+        if not geom.crs:
+            raise ValueError("Search geometry must have a CRS")
+        spatial_index = self._get_spatial_index(geom.crs)
+        if spatial_index is None:
+            _LOG.info("No spatial index for crs %s - converting to 4326", geom.crs)
+            spatial_index = self._spatial_indexes.get(4326)
+            if spatial_index is None:
+                raise ValueError(f"No spatial index for crs {geom.crs} or EPSG:4326")
+        return spatial_index.intersects(geom)
+
+    def _update_extents(self, ds: Dataset) -> None:
+        extent = ds.extent
+        for spatial_index in self._spatial_indexes.values():
+            if extent is None:
+                spatial_index.remove(ds.id)
+            else:
+                spatial_index.add(ds.id, extent)
+
+    def _create_spatial_index(self, crs: CRS) -> bool:
+        try:
+            epsg = crs_to_epsg(crs)
+        except ValueError:
+            _LOG.warning("Could not create a spatial index for non-EPSG-style CRS %s", crs)
+            return False
+        if epsg not in self._spatial_indexes:
+            self._spatial_indexes[epsg] = SpatialIndex(CRS(f"EPSG:{epsg}"))
+        return True
+
+    def _drop_spatial_index(self, crs: CRS) -> bool:
+        return self._spatial_indexes.pop(crs_to_epsg(crs), None) is not None
+
+    def _spatially_indexed_crses(self) -> list[CRS]:
+        return [spatial_index.crs for spatial_index in self._spatial_indexes.values()]
+
+    def _update_spatial_index(self,
+                              crses: Sequence[CRS] = [],
+                              product_names: Sequence[str] = [],
+                              dataset_ids: Sequence[DSID] = [],
+                              after: DSID | None = None,
+                              progress: Callable[[int, UUID], None] | None = None,
+                              ) -> int:
+        if crses:
+            spatial_indexes = [self._spatial_indexes[crs_to_epsg(crs)] for crs in crses]
+        else:
+            spatial_indexes = list(self._spatial_indexes.values())
+        if product_names or dataset_ids:
+            ids: Iterable[UUID] = set(dsid_to_uuid(id_) for id_ in dataset_ids).union(
+                *(self._by_product.get(name, set()) for name in product_names),
+                *(self._archived_by_product.get(name, set()) for name in product_names),
+            )
+        else:
+            ids = self._by_id.keys()
+        # Same order as the database drivers, so that updates can be resumed
+        ids = sorted(ids)
+        if after is not None:
+            after_id = dsid_to_uuid(after)
+            ids = [id_ for id_ in ids if id_ > after_id]
+        verified = 0
+        updated = 0
+        for id_ in ids:
+            ds = self._by_id.get(id_)
+            if ds is None:
+                continue
+            updated += 1
+            extent = ds.extent
+            if extent is None:
+                verified += 1
+                continue
+            for spatial_index in spatial_indexes:
+                spatial_index.add(id_, extent)
+                verified += 1
+        if progress is not None and ids:
+            progress(updated, ids[-1])
+        return verified
+
     def _search_flat(
             self,
             limit: int | None = None,
@@ -613,8 +753,6 @@ class DatasetResource(AbstractDatasetResource):
                          archived: bool | None = False,
                          order_by: Iterable[Any] | None = None,
                          **query: QueryField) -> Iterable[tuple]:
-        if "geopolygon" in query:
-            raise NotImplementedError("Spatial search index API not supported by this index.")
         if order_by:
             raise NotImplementedError("order_by argument is not currently supported by the memory index driver.")
         # Note that this implementation relies on dictionaries being ordered by insertion - this has been the case
@@ -791,8 +929,17 @@ class DatasetResource(AbstractDatasetResource):
         for ds in self.search(**query):  # type: ignore[arg-type]
             yield make_summary(ds)
 
-    def spatial_extent(self, ids, crs=None):
-        return None
+    def spatial_extent(self, ids: Iterable[DSID], crs: CRS = CRS("EPSG:4326")) -> Geometry | None:
+        uuids = [dsid_to_uuid(id_) for id_ in ids]
+        spatial_index = self._get_spatial_index(crs)
+        if spatial_index is not None:
+            return spatial_index.extent(uuids)
+        # Requested a CRS that has no spatial index, so use 4326 and reproject to requested CRS.
+        spatial_index = self._spatial_indexes.get(4326)
+        if spatial_index is None:
+            return None
+        extent = spatial_index.extent(uuids)
+        return None if extent is None else extent.to_crs(crs)
 
     def temporal_extent(self, ids: Iterable[DSID]) -> tuple[datetime.datetime, datetime.datetime]:
         min_time: datetime.datetime | None = None
@@ -8,6 +8,8 @@ import logging
 from typing import Iterable, Sequence, cast
 from uuid import UUID
 
+from odc.geo import CRS, Geometry
+
 from datacube.index.fields import as_expression
 from datacube.index.abstract import AbstractProductResource, AbstractIndex
 from datacube.model._base import QueryField, QueryDict
@@ -155,6 +157,9 @@ class ProductResource(AbstractProductResource):
                 continue
             # Check that all search keys match this product
             for key, value in list(unmatched.items()):
+                if key == "geopolygon":
+                    # Geometry field is handled by the dataset spatial indexes.
+                    continue
                 field = prod.metadata_type.dataset_fields.get(key)
                 if not field:
                     # Product doesn't have this field - can't match
@@ -191,8 +196,11 @@ class ProductResource(AbstractProductResource):
             id_=orig.id
         )
 
-    def spatial_extent(self, product, crs=None):
-        return None
+    def spatial_extent(self, product: str | Product, crs: CRS = CRS("EPSG:4326")) -> Geometry | None:
+        if isinstance(product, str):
+            product = self._index.products.get_by_name_unsafe(product)
+        ids: Iterable[UUID] = self._index.datasets._by_product.get(product.name, set())
+        return self._index.datasets.spatial_extent(ids, crs)
 
     def temporal_extent(self, product: str | Product) -> tuple[datetime.datetime, datetime.datetime]:
         if isinstance(product, str):
@@ -0,0 +1,214 @@
+# This file is part of the Open Data Cube, see https://opendatacube.org for more information
+#
+# Copyright (c) 2015-2025 ODC Contributors
+# SPDX-License-Identifier: Apache-2.0
+"""
+Secondary indexes on dataset search fields for the memory index driver.
+
+Indexes are only used to narrow down the datasets considered by a search. Every
+candidate is still checked against the full query, so a field that cannot be
+indexed (or an expression that the index does not understand) simply falls back
+to scanning.
+"""
+from bisect import bisect_left, bisect_right
+from typing import Any, Iterable, Mapping
+from uuid import UUID
+
+from datacube.index.fields import OrExpression
+from datacube.model import MetadataType
+from datacube.model.fields import (Expression, Field, SimpleField, RangeField, SimpleEqualsExpression,
+                                   ValueBetweenExpression, RangeBetweenExpression, comparable_value)
+
+
+class ValueIndex:
+    """
+    Dataset ids by value of a simple field, with values kept sorted for range lookups.
+    """
+    def __init__(self) -> None:
+        self._ids: dict[Any, set[UUID]] = {}
+        self._sorted: list[Any] | None = None
+        self._orderable = True
+
+    def add(self, value: Any, id_: UUID) -> None:
+        value = comparable_value(value)
+        ids = self._ids.get(value)
+        if ids is None:
+            self._ids[value] = {id_}
+            self._sorted = None
+        else:
+            ids.add(id_)
+
+    def remove(self, value: Any, id_: UUID) -> None:
+        value = comparable_value(value)
+        ids = self._ids.get(value)
+        if ids is not None:
+            ids.discard(id_)
+            if not ids:
+                del self._ids[value]
+                self._sorted = None
+
+    def equals(self, value: Any) -> set[UUID] | None:
+        try:
+            return set(self._ids.get(comparable_value(value), ()))
+        except TypeError:
+            return None
+
+    def between(self, low: Any, high: Any) -> set[UUID] | None:
+        values = self._sorted_values()
+        if values is None:
+            return None
+        try:
+            start = 0 if low is None else bisect_left(values, comparable_value(low))
+            stop = len(values) if high is None else bisect_right(values, comparable_value(high))
+        except TypeError:
+            return None
+        return set().union(*(self._ids[v] for v in values[start:stop]))
+
+    def _sorted_values(self) -> list[Any] | None:
+        if self._sorted is None and self._orderable:
+            try:
+                self._sorted = sorted(v for v in self._ids if v is not None)
+            except TypeError:
+                # Mixed value types, e.g. numbers and strings
+                self._orderable = False
+        return self._sorted
+
+
+class IntervalIndex:
+    """
+    Dataset ids by value of a range field, kept sorted by start of the range.
+
+    The widest range seen so far bounds how far before the start of a query a
+    matching range can begin.
+    """
+    def __init__(self) -> None:
+        self._ranges: dict[UUID, tuple[Any, Any]] = {}
+        self._unbounded: set[UUID] = set()
+        self._max_span: Any = None
+        self._begins: list[Any] | None = None
+        self._ids: list[UUID] = []
+
+    def add(self, value: Any, id_: UUID) -> None:
+        if value is None:
+            return
+        if value.begin is None or value.end is None:
+            self._unbounded.add(id_)
+            return
+        begin, end = comparable_value(value.begin), comparable_value(value.end)
+        span = end - begin
+        if self._max_span is None:
+            self._max_span = begin - begin
+        if span > self._max_span:
+            self._max_span = span
+        self._ranges[id_] = (begin, end)
+        self._begins = None
+
+    def remove(self, value: Any, id_: UUID) -> None:
+        self._unbounded.discard(id_)
+        if self._ranges.pop(id_, None) is not None:
+            self._begins = None
+
+    def overlaps(self, low: Any, high: Any) -> set[UUID] | None:
+        if self._begins is None:
+            items = sorted(self._ranges.items(), key=lambda item: item[1][0])
+            self._begins = [begin for _, (begin, _) in items]
+            self._ids = [id_ for id_, _ in items]
+        try:
+            stop = len(self._begins) if high is None else bisect_right(self._begins, comparable_value(high))
+            if low is None:
+                return set(self._ids[:stop]) | self._unbounded
+            low = comparable_value(low)
+            try:
+                start = bisect_left(self._begins, low - self._max_span)
+            except TypeError:
+                start = 0
+            return {
+                id_ for id_ in self._ids[start:stop] if self._ranges[id_][1] >= low
+            } | self._unbounded
+        except TypeError:
+            return None
+
+
+class ProductSearchIndex:
+    """
+    Secondary indexes on the search fields of all datasets of one product.
+    """
+    def __init__(self, metadata_type: MetadataType) -> None:
+        self._search_fields = self._search_fields_doc(metadata_type)
+        self._fields: dict[str, Field] = {}
+        self._indexes: dict[str, ValueIndex | IntervalIndex] = {}
+        for name, field in metadata_type.dataset_fields.items():
+            if isinstance(field, RangeField):
+                self._indexes[name] = IntervalIndex()
+            elif isinstance(field, SimpleField):
+                self._indexes[name] = ValueIndex()
+            else:
+                continue
+            self._fields[name] = field
+
+    @staticmethod
+    def _search_fields_doc(metadata_type: MetadataType) -> Mapping[str, Any]:
+        return metadata_type.definition.get('dataset', {}).get('search_fields', {})
+
+    def is_current(self, metadata_type: MetadataType) -> bool:
+        """
+        Were the indexes built for the current search fields of the metadata type?
+        """
+        return self._search_fields == self._search_fields_doc(metadata_type)
+
+    def add(self, id_: UUID, doc: Mapping[str, Any]) -> None:
+        for name, field in self._fields.items():
+            index = self._indexes.get(name)
+            if index is None:
+                continue
+            try:
+                index.add(field.extract(doc), id_)  # type: ignore[attr-defined]
+            except Exception:  # pylint: disable=broad-except
+                # Unhashable or unparseable values - stop using this index
+                del self._indexes[name]
+
+    def remove(self, id_: UUID, doc: Mapping[str, Any]) -> None:
+        for name, field in self._fields.items():
+            index = self._indexes.get(name)
+            if index is None:
+                continue
+            try:
+                index.remove(field.extract(doc), id_)  # type: ignore[attr-defined]
+            except Exception:  # pylint: disable=broad-except
+                del self._indexes[name]
+
+    def candidates(self, exprs: Iterable[Expression]) -> set[UUID] | None:
+        """
+        Find ids of datasets that may match all the expressions.
+
+        :return: Superset of the matching dataset ids, or None if the indexes cannot narrow down the search.
+        """
+        result: set[UUID] | None = None
+        for expr in exprs:
+            ids = self._expr_candidates(expr)
+            if ids is None:
+                continue
+            result = ids if result is None else result & ids
+            if not result:
+                break
+        return result
+
+    def _expr_candidates(self, expr: Expression) -> set[UUID] | None:
+        if isinstance(expr, OrExpression):
+            parts = [self._expr_candidates(e) for e in expr.exprs]
+            if any(part is None for part in parts):
+                return None
+            return set().union(*parts)  # type: ignore[arg-type]
+
+        field = getattr(expr, "field", None)
+        if field is None:
+            return None
+        index = self._indexes.get(field.name)
+        if isinstance(index, ValueIndex):
+            if isinstance(expr, SimpleEqualsExpression):
+                return index.equals(expr.value)
+            if isinstance(expr, ValueBetweenExpression):
+                return index.between(expr.low_value, expr.high_value)
+        elif isinstance(index, IntervalIndex) and isinstance(expr, RangeBetweenExpression):
+            return index.overlaps(expr.low_value, expr.high_value)
+        return None
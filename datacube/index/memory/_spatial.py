@@ -0,0 +1,76 @@
+# This file is part of the Open Data Cube, see https://opendatacube.org for more information
+#
+# Copyright (c) 2015-2025 ODC Contributors
+# SPDX-License-Identifier: Apache-2.0
+"""
+Spatial indexes of dataset extents for the memory index driver.
+"""
+from typing import Iterable
+from uuid import UUID
+
+import shapely
+from odc.geo import CRS, Geometry
+
+from datacube.index._spatial import sanitise_extent
+
+
+class SpatialIndex:
+    """
+    Dataset extents in a single CRS, searched with a Shapely STRtree.
+
+    STRtrees cannot be modified once built, so the tree is discarded whenever an
+    extent is added or removed and rebuilt by the next search.
+    """
+    def __init__(self, crs: CRS) -> None:
+        self.crs = crs
+        self._extents: dict[UUID, shapely.Geometry] = {}
+        self._tree: shapely.STRtree | None = None
+        self._tree_ids: list[UUID] = []
+
+    def __len__(self) -> int:
+        return len(self._extents)
+
+    def add(self, id_: UUID, extent: Geometry) -> bool:
+        """
+        Add or replace the extent of a dataset.
+
+        :param id_: The dataset id
+        :param extent: The dataset extent, in any CRS
+        :return: True if the extent could be indexed in the CRS of this index.
+        """
+        sanitised = sanitise_extent(extent, self.crs)
+        if sanitised is None or sanitised.is_empty:
+            self.remove(id_)
+            return False
+        geom = sanitised.geom
+        if not geom.is_valid:
+            geom = shapely.make_valid(geom)
+        self._extents[id_] = geom
+        self._tree = None
+        return True
+
+    def remove(self, id_: UUID) -> None:
+        if self._extents.pop(id_, None) is not None:
+            self._tree = None
+
+    def intersects(self, geom: Geometry) -> set[UUID]:
+        """
+        Find datasets whose extent intersects a geometry.
+
+        :param geom: Search geometry, in any CRS
+        :return: Ids of intersecting datasets
+        """
+        if self._tree is None:
+            self._tree_ids = list(self._extents)
+            self._tree = shapely.STRtree([self._extents[id_] for id_ in self._tree_ids])
+        hits = self._tree.query(geom.to_crs(self.crs).geom, predicate="intersects")
+        return {self._tree_ids[i] for i in hits}
+
+    def extent(self, ids: Iterable[UUID]) -> Geometry | None:
+        """
+        Combined extent of the nominated datasets, or None if none of them are indexed.
+        """
+        extents = [self._extents[id_] for id_ in ids if id_ in self._extents]
+        if not extents:
+            return None
+        return Geometry(shapely.union_all(extents), crs=self.crs)
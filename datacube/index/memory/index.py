@@ -4,7 +4,8 @@
 # SPDX-License-Identifier: Apache-2.0
 import logging
 from threading import Lock
-from typing import Type
+from typing import Callable, Iterable, Sequence, Type
+from uuid import UUID
 
 from deprecat import deprecat
 from datacube.cfg import ODCEnvironment
@@ -13,7 +14,7 @@ from datacube.index.memory._fields import get_dataset_fields
 from datacube.index.memory._metadata_types import MetadataTypeResource
 from datacube.index.memory._products import ProductResource
 from datacube.index.memory._users import UserResource
-from datacube.index.abstract import AbstractIndex, AbstractIndexDriver, UnhandledTransaction
+from datacube.index.abstract import AbstractIndex, AbstractIndexDriver, DSID, UnhandledTransaction
 from datacube.model import MetadataType
 from datacube.migration import ODC2DeprecationWarning
 from odc.geo import CRS
@@ -36,6 +37,7 @@ class Index(AbstractIndex):
 
     #   Database/storage feature support flags
     supports_write = True
+    supports_spatial_indexes = True
 
     #   User management support flags
     supports_users = True
@@ -112,8 +114,22 @@ class Index(AbstractIndex):
         pass
 
     def create_spatial_index(self, crs: CRS) -> bool:
-        _LOG.warning("memory index driver does not support spatio-temporal indexes")
-        return False
+        return self._datasets._create_spatial_index(crs)
+
+    def spatial_indexes(self, refresh=False) -> Iterable[CRS]:
+        return self._datasets._spatially_indexed_crses()
+
+    def update_spatial_index(self,
+                             crses: Sequence[CRS] = [],
+                             product_names: Sequence[str] = [],
+                             dataset_ids: Sequence[DSID] = [],
+                             after: DSID | None = None,
+                             progress: Callable[[int, UUID], None] | None = None,
+                             ) -> int:
+        return self._datasets._update_spatial_index(crses, product_names, dataset_ids, after, progress)
+
+    def drop_spatial_index(self, crs: CRS) -> bool:
+        return self._datasets._drop_spatial_index(crs)
 
     def __repr__(self):
         return "Index<memory>"
@@ -19,7 +19,7 @@ class DatasetResource(AbstractDatasetResource):
     def get_unsafe(self, id_: DSID, include_sources: bool = False, include_deriveds: bool = False, max_depth: int = 0):
         raise KeyError(id_)
 
-    def bulk_get(self, ids):
+    def bulk_get(self, ids, include_sources=False):
         return []
 
     def get_derived(self, id_):
@@ -8,6 +8,7 @@ API for dataset indexing, access and search.
 import datetime
 import json
 import logging
+import threading
 import warnings
 from collections import namedtuple
 from time import monotonic
@@ -16,30 +17,60 @@ from uuid import UUID
 
 from deprecat import deprecat
 
-from datacube.drivers.postgis._fields import SimpleDocField, PgField, PgExpression
+from datacube.drivers.postgis._fields import SimpleDocField, PgField, PgExpression, NativeField
 from datacube.drivers.postgis._schema import Dataset as SQLDataset, search_field_map
-from datacube.drivers.postgis._api import non_native_fields, extract_dataset_fields, mk_simple_offset_field
+from datacube.drivers.postgis._api import (non_native_fields, extract_dataset_fields, extract_dataset_search_values,
+                                           mk_simple_offset_field)
 from datacube.utils.uris import split_uri
 from datacube.drivers.postgis._spatial import generate_dataset_spatial_values, extract_geometry_from_eo3_projection
 from datacube.migration import ODC2DeprecationWarning
-from datacube.index.abstract import AbstractDatasetResource, DSID, BatchStatus, DatasetTuple, DatasetSpatialMixin
+from datacube.index.abstract import (AbstractDatasetResource, DSID, BatchStatus, DatasetTuple,
+                                     DatasetSpatialMixin, dsid_to_uuid)
 from datacube.utils.documents import JsonDict
 from datacube.model._base import QueryField
 from datacube.index.postgis._transaction import IndexResourceAddIn
-from datacube.model import Dataset, Product, Range, LineageTree
+from datacube.model import Dataset, Product, Range, LineageTree, LineageDirection
 from datacube.model.fields import Field
 from datacube.utils import jsonify_document, _readable_offset, changes
 from datacube.utils.changes import get_doc_changes, Offset
+from datacube.utils.generic import batched
 from odc.geo import CRS, Geometry
 from datacube.index import fields, extract_geom_from_query, strip_all_spatial_fields_from_query
+from datacube.index.fields import to_columns
 
 _LOG = logging.getLogger(__name__)
 
+# Number of dataset ids per statement when archiving, restoring or purging datasets
+BULK_UPDATE_BATCH_SIZE = 10000
+
 
 # It's a public api, so we can't reorganise old methods.
 # pylint: disable=too-many-public-methods, too-many-lines
 
 
+class _DocumentBatch:
+    """
+    Metadata documents of a batch of lean datasets, fetched with one query when the first is needed.
+    """
+    def __init__(self, resource: "DatasetResource", ids: list[UUID]) -> None:
+        self._resource = resource
+        self._ids = ids
+        self._docs: dict[UUID, JsonDict] | None = None
+        self._lock = threading.Lock()
+
+    def __call__(self, id_: UUID) -> JsonDict:
+        with self._lock:
+            if self._docs is None:
+                with self._resource._db_connection() as connection:
+                    self._docs = dict(connection.get_dataset_docs(self._ids))
+            # Each dataset keeps its own document once fetched
+            try:
+                return self._docs.pop(id_)
+            except KeyError:
+                raise KeyError(f"Dataset {id_} is no longer in the index, its metadata document cannot be loaded") \
+                    from None
+
+
 class DatasetResource(AbstractDatasetResource, IndexResourceAddIn):
     """
     :type _db: datacube.drivers.postgis._connections.PostgresDb
@@ -52,6 +83,8 @@ class DatasetResource(AbstractDatasetResource, IndexResourceAddIn):
         :type product_resource: datacube.index._products.ProductResource
         """
         self._db = db
+        # Add datasets in batches with COPY rather than INSERT (see the db_bulk_add_copy config option)
+        self._bulk_add_copy: bool = index.environment.db_bulk_add_copy
         super().__init__(index)
 
     def get_unsafe(self, id_: DSID,
@@ -80,15 +113,36 @@ class DatasetResource(AbstractDatasetResource, IndexResourceAddIn):
                 raise KeyError(id_)
             return self._make(dataset, full_info=True, source_tree=source_tree, derived_tree=derived_tree)
 
-    def bulk_get(self, ids):
+    def bulk_get(self, ids, include_sources: bool = False, include_deriveds: bool = False, max_depth: int = 0):
+        """
+        Get multiple datasets by id.
+
+        :param ids: ids to retrieve
+        :param include_sources: include the full provenance tree for each dataset.
+        :param include_deriveds: include the full derivative tree for each dataset.
+        :param max_depth: The maximum depth of the source and/or derived trees.  Defaults to 0, meaning no limit.
+        :return: Iterable of Dataset models
+        """
         def to_uuid(x):
             return x if isinstance(x, UUID) else UUID(x)
 
         ids = [to_uuid(i) for i in ids]
 
+        # The lineage trees of all the datasets are read at once
+        source_trees: Mapping[UUID, LineageTree] = {}
+        derived_trees: Mapping[UUID, LineageTree] = {}
+        if include_sources:
+            source_trees = self._index.lineage.get_source_trees(ids, max_depth=max_depth)
+        if include_deriveds:
+            derived_trees = self._index.lineage.get_derived_trees(ids, max_depth=max_depth)
+
         with self._db_connection() as connection:
             rows = connection.get_datasets(ids)
-            return [self._make(r, full_info=True) for r in rows]
+            return [
+                self._make(r, full_info=True,
+                           source_tree=source_trees.get(r.id), derived_tree=derived_trees.get(r.id))
+                for r in rows
+            ]
 
     @deprecat(
         reason="The 'get_derived' static method is deprecated in favour of the new lineage API.",
@@ -109,6 +163,22 @@ class DatasetResource(AbstractDatasetResource, IndexResourceAddIn):
                 for result in connection.get_derived_datasets(id_)
             ]
 
+    def get_all_derived_ids(self, ids: Iterable[DSID]) -> set[UUID]:
+        """
+        Get the ids of all datasets derived from any of the given datasets, recursively
+
+        Lineage relations are read for a generation of datasets at a time.
+
+        :param ids: dataset ids
+        :return: Ids of derived datasets, not including the given datasets
+        """
+        roots = {dsid_to_uuid(id_) for id_ in ids}
+        if not roots:
+            return set()
+        with self._db_connection() as connection:
+            relations = connection.load_lineage_relations(roots, LineageDirection.DERIVED, 0)
+        return {rel.derived_id for rel in relations} - roots
+
     def has(self, id_):
         """
         Have we already indexed this dataset?
@@ -189,6 +259,9 @@ class DatasetResource(AbstractDatasetResource, IndexResourceAddIn):
         # Add a "batch" of datasets.
         b_started = monotonic()
         crses = self._db.spatially_indexed_crses()
+        # COPY needs plain Python search values, INSERT takes SQLAlchemy expressions
+        use_copy = self._bulk_add_copy
+        extract_search_values = extract_dataset_search_values if use_copy else extract_dataset_fields
 
         class BatchRep(NamedTuple):
             datasets: list[dict[str, Any]]
@@ -235,7 +308,7 @@ class DatasetResource(AbstractDatasetResource, IndexResourceAddIn):
             else:
                 search_fields = non_native_fields(prod.metadata_type.definition)
                 cache[prod.metadata_type.name] = search_fields  # type: ignore[index]
-            search_field_vals = extract_dataset_fields(metadata_doc, search_fields)
+            search_field_vals = extract_search_values(metadata_doc, search_fields)
             for fname, finfo in search_field_vals.items():
                 ftype, fval = finfo
                 if isinstance(fval, Range):
@@ -247,14 +320,20 @@ class DatasetResource(AbstractDatasetResource, IndexResourceAddIn):
                     "search_val": fval
                 })
         with self._db_connection(transaction=True) as connection:
-            if batch.datasets:
-                b_added, b_skipped = connection.insert_dataset_bulk(batch.datasets)
-            for crs in crses:
-                crs_values = batch.spatial_indexes[crs]
-                if crs_values:
-                    connection.insert_dataset_spatial_bulk(crs, crs_values)
-            for search_type, values in batch.search_indexes.items():
-                connection.insert_dataset_search_bulk(search_type, values)
+            if use_copy:
+                # Stream the batch into the database with COPY, skipping datasets that already exist.
+                b_added, b_skipped = connection.copy_dataset_batch(batch.datasets,
+                                                                   batch.search_indexes,
+                                                                   batch.spatial_indexes)
+            else:
+                if batch.datasets:
+                    b_added, b_skipped = connection.insert_dataset_bulk(batch.datasets)
+                for crs in crses:
+                    crs_values = batch.spatial_indexes[crs]
+                    if crs_values:
+                        connection.insert_dataset_spatial_bulk(crs, crs_values)
+                for search_type, values in batch.search_indexes.items():
+                    connection.insert_dataset_search_bulk(search_type, values)
         return BatchStatus(b_added, b_skipped, monotonic() - b_started)
 
     def search_product_duplicates(self, product: Product, *args):
@@ -376,9 +455,13 @@ class DatasetResource(AbstractDatasetResource, IndexResourceAddIn):
 
         :param Iterable[UUID] ids: list of dataset ids to archive
         """
+        started = monotonic()
+        requested = archived = 0
         with self._db_connection(transaction=True) as transaction:
-            for id_ in ids:
-                transaction.archive_dataset(id_)
+            for batch in batched(ids, BULK_UPDATE_BATCH_SIZE):
+                requested += len(batch)
+                archived += transaction.archive_datasets(batch)
+        _LOG.info("Archived %d of %d datasets in %.2fs", archived, requested, monotonic() - started)
 
     def restore(self, ids):
         """
@@ -386,9 +469,13 @@ class DatasetResource(AbstractDatasetResource, IndexResourceAddIn):
 
         :param Iterable[UUID] ids: list of dataset ids to restore
         """
+        started = monotonic()
+        requested = restored = 0
         with self._db_connection(transaction=True) as transaction:
-            for id_ in ids:
-                transaction.restore_dataset(id_)
+            for batch in batched(ids, BULK_UPDATE_BATCH_SIZE):
+                requested += len(batch)
+                restored += transaction.restore_datasets(batch)
+        _LOG.info("Restored %d of %d datasets in %.2fs", restored, requested, monotonic() - started)
 
     def purge(self, ids: Iterable[DSID], allow_delete_active: bool = False) -> Sequence[DSID]:
         """
@@ -398,18 +485,26 @@ class DatasetResource(AbstractDatasetResource, IndexResourceAddIn):
         :param allow_delete_active: whether active datasets can be deleted
         :return: list of purged dataset ids
         """
-        purged = []
+        started = monotonic()
+        requested = 0
+        purged: list[DSID] = []
         with self._db_connection(transaction=True) as transaction:
-            for id_ in ids:
-                ds = self.get(id_)
-                if ds is None:
-                    continue
-                if not ds.is_archived and not allow_delete_active:
-                    _LOG.warning(f"Cannot purge unarchived dataset: {id_}")
-                    continue
-                transaction.delete_dataset(id_)
-                purged.append(id_)
-
+            for batch in batched(ids, BULK_UPDATE_BATCH_SIZE):
+                requested += len(batch)
+                archived = transaction.datasets_archived_status([dsid_to_uuid(id_) for id_ in batch])
+                to_delete = {}
+                for id_ in batch:
+                    uuid_ = dsid_to_uuid(id_)
+                    if uuid_ not in archived or uuid_ in to_delete:
+                        continue
+                    if not archived[uuid_] and not allow_delete_active:
+                        _LOG.warning(f"Cannot purge unarchived dataset: {id_}")
+                        continue
+                    to_delete[uuid_] = id_
+                if to_delete:
+                    transaction.delete_datasets(list(to_delete))
+                    purged.extend(to_delete.values())
+        _LOG.info("Purged %d of %d datasets in %.2fs", len(purged), requested, monotonic() - started)
         return purged
 
     def get_all_dataset_ids(self, archived: bool | None = False):
@@ -597,11 +692,27 @@ class DatasetResource(AbstractDatasetResource, IndexResourceAddIn):
             **kwargs
         )
 
-    def _make_many(self, query_result, product=None):
+    def _make_many(self, query_result, product=None, batch_size: int = 1000):
         """
-        :rtype list[Dataset]
+        Decode query results into Datasets a batch of rows at a time.
+
+        Products are resolved once per batch rather than once per row.
+
+        :param batch_size: Number of rows to decode at once
+        :rtype: __generator[Dataset]
         """
-        return (self._make(dataset, product=product) for dataset in query_result)
+        for rows in batched(query_result, batch_size):
+            rows = [row if isinstance(row, dict) else row._asdict() for row in rows]
+            if product is None:
+                products = {product_id: self.products.get(product_id)
+                            for product_id in {row["product_id"] for row in rows}}
+            for row in rows:
+                yield Dataset._from_index(
+                    product or products[row["product_id"]],
+                    row["metadata_doc"],
+                    uri=row.get("uri"),
+                    archived_time=row["archived"],
+                )
 
     def search_by_metadata(self, metadata: JsonDict, archived: bool | None = False):
         """
@@ -643,6 +754,49 @@ class DatasetResource(AbstractDatasetResource, IndexResourceAddIn):
                                                             order_by=order_by):
             yield from self._make_many(datasets, product)
 
+    def search_lean(self,
+                    limit: int | None = None,
+                    archived: bool | None = False,
+                    batch_size: int = 1000,
+                    **query: QueryField) -> Iterable[Dataset]:
+        """
+        Perform a search, returning lean Dataset objects.
+
+        Only the id, uri, time range and grid_spatial section of each dataset are read by the search.
+        Metadata documents are fetched ``batch_size`` datasets at a time, when the first dataset of
+        a batch needs its document.
+
+        :param limit: Limit number of datasets per product
+        :param batch_size: Number of datasets whose documents are fetched together
+        """
+        lean_fields = {
+            'archived': NativeField('archived', 'Time when dataset was archived', SQLDataset.archived),
+            'grid_spatial': NativeField(
+                'grid_spatial', 'Grid spatial metadata', SQLDataset.metadata_doc,
+                alchemy_expression=SQLDataset.metadata_doc[('grid_spatial', 'projection')]
+            ),
+        }
+        for product, rows in self._do_search_by_product(query,
+                                                        return_fields=True,
+                                                        select_field_names=['id', 'uri', 'time',
+                                                                            'archived', 'grid_spatial'],
+                                                        additional_fields=lean_fields,
+                                                        limit=limit,
+                                                        archived=archived):
+            for batch in batched(rows, batch_size):
+                load_doc = _DocumentBatch(self, [row['id'] for row in batch])
+                for row in batch:
+                    time = row.get('time')
+                    yield Dataset._lean(
+                        product,
+                        row['id'],
+                        load_doc,
+                        uri=row['uri'],
+                        time=None if time is None else Range(time.lower, time.upper),
+                        grid_spatial=row['grid_spatial'],
+                        archived_time=row['archived'],
+                    )
+
     def search_by_product(self, archived: bool | None = False, **query):
         """
         Perform a search, returning datasets grouped by product type.
@@ -707,6 +861,45 @@ class DatasetResource(AbstractDatasetResource, IndexResourceAddIn):
                 kwargs = {f: extract_field(f) for f in field_name_d}
                 yield result_type(**kwargs)
 
+    def search_columnar(self,
+                        field_names: Iterable[str] | None = None,
+                        custom_offsets: Mapping[str, Offset] | None = None,
+                        limit: int | None = None,
+                        archived: bool | None = False,
+                        batch_size: int = 10000,
+                        **query: QueryField):
+        """
+        Perform a search, returning the specified fields as NumPy arrays.
+
+        Result rows are streamed from the database and converted to columns a batch at a time,
+        without building an object per row.
+        """
+        fields = self._columnar_fields(field_names, custom_offsets, query)
+        custom_fields = {
+            name: mk_simple_offset_field(name, name, offset)
+            for name, offset in (custom_offsets or {}).items()
+        }
+        for product, rows in self._do_search_by_product(query,
+                                                        return_fields=True,
+                                                        select_field_names=list(fields),
+                                                        additional_fields=custom_fields,
+                                                        limit=limit,
+                                                        archived=archived,
+                                                        raw_rows=True):
+            # Only fields defined for the product are selected
+            dataset_fields = product.metadata_type.dataset_fields
+            names = [name for name in fields if name in dataset_fields or name in custom_fields]
+            json_columns = [i for i, name in enumerate(names) if name in custom_fields]
+            for batch in batched(rows, batch_size):
+                if json_columns:
+                    # Custom fields are not type-aware and returned as stringified json.
+                    batch = [list(row) for row in batch]
+                    for row in batch:
+                        for i in json_columns:
+                            if row[i] is not None:
+                                row[i] = json.loads(row[i])
+                yield to_columns(fields, batch, names)
+
     def count(self, archived: bool | None = False, **query):
         """
         Perform a search, returning count of results.
@@ -767,7 +960,7 @@ class DatasetResource(AbstractDatasetResource, IndexResourceAddIn):
                               additional_fields: Mapping[str, Field] | None = None,
                               select_field_names=None,
                               with_source_ids=False, source_filter=None, limit=None,
-                              archived: bool | None = False, order_by=None):
+                              archived: bool | None = False, order_by=None, raw_rows: bool = False):
         assert not with_source_ids
         assert source_filter is None
         product_queries = list(self._get_product_queries(query))
@@ -785,7 +978,8 @@ class DatasetResource(AbstractDatasetResource, IndexResourceAddIn):
             q = strip_all_spatial_fields_from_query(q)
             dataset_fields = product.metadata_type.dataset_fields
             if additional_fields:
-                dataset_fields.update(additional_fields)
+                # Copy, so the additional fields do not leak into the metadata type
+                dataset_fields = dict(dataset_fields, **additional_fields)
             query_exprs = tuple(fields.to_expressions(dataset_fields.get, **q))
             select_fields = None
             if return_fields:
@@ -808,7 +1002,8 @@ class DatasetResource(AbstractDatasetResource, IndexResourceAddIn):
                            with_source_ids=with_source_ids,
                            geom=geom,
                            archived=archived,
-                           order_by=order_by
+                           order_by=order_by,
+                           raw_rows=raw_rows
                        ))
 
     def _do_count_by_product(self, query, archived: bool | None = False):
@@ -931,16 +1126,16 @@ class DatasetResource(AbstractDatasetResource, IndexResourceAddIn):
                     archived=archived
                 )
 
-            for result in results:
-                field_values = dict()
-                for i_, field in enumerate(select_fields):
-                    # We need to load the simple doc fields
-                    if isinstance(field, SimpleDocField):
-                        field_values[field.name] = json.loads(result[i_])
-                    else:
-                        field_values[field.name] = result[i_]
+                for result in results:
+                    field_values = dict()
+                    for i_, field in enumerate(select_fields):
+                        # We need to load the simple doc fields
+                        if isinstance(field, SimpleDocField):
+                            field_values[field.name] = json.loads(result[i_])
+                        else:
+                            field_values[field.name] = result[i_]
 
-                yield DatasetLight(**field_values)  # type: ignore
+                    yield DatasetLight(**field_values)  # type: ignore
 
     def make_select_fields(self, product, field_names, custom_offsets):
         """
@@ -28,6 +28,32 @@ class LineageResource(AbstractLineageResource, IndexResourceAddIn):
     def get_source_tree(self, id_: DSID, max_depth: int = 0) -> LineageTree:
         return self.get_lineage_tree(id_, LineageDirection.SOURCES, max_depth)
 
+    def get_derived_trees(self, ids: Iterable[DSID], max_depth: int = 0) -> Mapping[UUID, LineageTree]:
+        return self.get_lineage_trees(ids, LineageDirection.DERIVED, max_depth)
+
+    def get_source_trees(self, ids: Iterable[DSID], max_depth: int = 0) -> Mapping[UUID, LineageTree]:
+        return self.get_lineage_trees(ids, LineageDirection.SOURCES, max_depth)
+
+    def get_lineage_trees(self,
+                          ids: Iterable[DSID],
+                          direction: LineageDirection,
+                          max_depth: int) -> Mapping[UUID, LineageTree]:
+        roots = list(dict.fromkeys(dsid_to_uuid(id_) for id_ in ids))
+        with self._db_connection() as connection:
+            # Extract the lineage relations of all trees at once
+            relations = connection.load_lineage_relations(roots, direction, max_depth)
+            all_rels = LineageRelations(relations=relations)
+            homes = connection.select_homes(all_rels.dataset_ids)
+        trees = {}
+        for root in roots:
+            # Trees may overlap, so separate out the relations within max_depth of each root
+            tree_rels = _tree_relations(all_rels, root, direction, max_depth)
+            tree_ids = {dsid for rel in tree_rels for dsid in (rel.source_id, rel.derived_id)}
+            rels = LineageRelations(relations=tree_rels,
+                                    homes={dsid: homes[dsid] for dsid in tree_ids if dsid in homes})
+            trees[root] = rels.extract_tree(root, direction)
+        return trees
+
     def get_lineage_tree(self, id_: DSID, direction: LineageDirection, max_depth: int):
         id_ = dsid_to_uuid(id_)
         with self._db_connection() as connection:
@@ -150,3 +176,34 @@ class LineageResource(AbstractLineageResource, IndexResourceAddIn):
                 ]
             )
         return BatchStatus(b_added, b_skipped, monotonic() - b_started)
+
+
+def _tree_relations(rels: LineageRelations,
+                    root: UUID,
+                    direction: LineageDirection,
+                    max_depth: int) -> list[LineageRelation]:
+    """
+    The relations of a LineageRelations collection in the tree with the given root, direction and depth.
+    """
+    if direction == LineageDirection.SOURCES:
+        edges = rels.by_derived
+    else:
+        edges = rels.by_source
+    relations = []
+    level = [root]
+    reached = {root}
+    depth = 0
+    while level and (max_depth == 0 or depth < max_depth):
+        next_level = []
+        for dsid in level:
+            for other, classifier in edges.get(dsid, {}).items():
+                if direction == LineageDirection.SOURCES:
+                    relations.append(LineageRelation(classifier=classifier, source_id=other, derived_id=dsid))
+                else:
+                    relations.append(LineageRelation(classifier=classifier, source_id=dsid, derived_id=other))
+                if other not in reached:
+                    reached.add(other)
+                    next_level.append(other)
+        level = next_level
+        depth += 1
+    return relations
@@ -4,9 +4,7 @@
 # SPDX-License-Identifier: Apache-2.0
 import logging
 from time import monotonic
-from typing import Iterable
-
-from cachetools.func import lru_cache
+from typing import Iterable, TYPE_CHECKING
 
 from datacube.index.abstract import AbstractMetadataTypeResource, BatchStatus
 from datacube.index.postgis._transaction import IndexResourceAddIn
@@ -14,10 +12,15 @@ from datacube.model import MetadataType
 from datacube.utils import jsonify_document, changes, _readable_offset
 from datacube.utils.changes import check_doc_unchanged, get_doc_changes
 
+if TYPE_CHECKING:
+    from datacube.index.postgis.index import Index
+
 _LOG = logging.getLogger(__name__)
 
 
 class MetadataTypeResource(AbstractMetadataTypeResource, IndexResourceAddIn):
+    _index: "Index"
+
     def __init__(self, db, index):
         """
         :type db: datacube.drivers.postgis._connections.PostgresDb
@@ -25,21 +28,6 @@ class MetadataTypeResource(AbstractMetadataTypeResource, IndexResourceAddIn):
         self._db = db
         self._index = index
 
-        self.get_unsafe = lru_cache()(self.get_unsafe)
-        self.get_by_name_unsafe = lru_cache()(self.get_by_name_unsafe)
-
-    def __getstate__(self):
-        """
-        We define getstate/setstate to avoid pickling the caches
-        """
-        return (self._db,)
-
-    def __setstate__(self, state):
-        """
-        We define getstate/setstate to avoid pickling the caches
-        """
-        self.__init__(*state)
-
     def from_doc(self, definition):
         """
         :param dict definition:
@@ -75,6 +63,7 @@ class MetadataTypeResource(AbstractMetadataTypeResource, IndexResourceAddIn):
                     name=metadata_type.name,
                     definition=metadata_type.definition,
                 )
+            self._index._invalidate_catalogue()
         return self.get_by_name(metadata_type.name)
 
     def _add_batch(self, batch_types: Iterable[MetadataType]) -> BatchStatus:
@@ -83,7 +72,8 @@ class MetadataTypeResource(AbstractMetadataTypeResource, IndexResourceAddIn):
         values = [{"name": mdt.name, "definition": mdt.definition} for mdt in batch_types]
         with self._db_connection() as connection:
             added, skipped = connection.insert_metadata_bulk(values)
-            return BatchStatus(added, skipped, monotonic() - b_started)
+        self._index._invalidate_catalogue()
+        return BatchStatus(added, skipped, monotonic() - b_started)
 
     def can_update(self, metadata_type, allow_unsafe_updates=False):
         """
@@ -157,8 +147,7 @@ class MetadataTypeResource(AbstractMetadataTypeResource, IndexResourceAddIn):
                 definition=metadata_type.definition,
             )
 
-        self.get_by_name_unsafe.cache_clear()   # type: ignore[attr-defined]
-        self.get_unsafe.cache_clear()           # type: ignore[attr-defined]
+        self._index._invalidate_catalogue()
         return self.get_by_name(metadata_type.name)
 
     def update_document(self, definition, allow_unsafe_updates=False):
@@ -173,23 +162,17 @@ class MetadataTypeResource(AbstractMetadataTypeResource, IndexResourceAddIn):
         """
         return self.update(self.from_doc(definition), allow_unsafe_updates=allow_unsafe_updates)
 
-    # This is memoized in the constructor
-    # pylint: disable=method-hidden
     def get_unsafe(self, id_):  # type: ignore
-        with self._db_connection() as connection:
-            record = connection.get_metadata_type(id_)
-        if record is None:
-            raise KeyError('%s is not a valid MetadataType id')
-        return self._make_from_query_row(record)
+        metadata_type = self._index._lookup("metadata_types_by_id", id_)
+        if metadata_type is None:
+            raise KeyError('%s is not a valid MetadataType id' % id_)
+        return metadata_type
 
-    # This is memoized in the constructor
-    # pylint: disable=method-hidden
     def get_by_name_unsafe(self, name):  # type: ignore
-        with self._db_connection() as connection:
-            record = connection.get_metadata_type_by_name(name)
-        if not record:
+        metadata_type = self._index._lookup("metadata_types_by_name", name)
+        if metadata_type is None:
             raise KeyError('%s is not a valid MetadataType name' % name)
-        return self._make_from_query_row(record)
+        return metadata_type
 
     def check_field_indexes(self, allow_table_lock=False,
                             rebuild_views=False, rebuild_indexes=False):
@@ -209,8 +192,7 @@ class MetadataTypeResource(AbstractMetadataTypeResource, IndexResourceAddIn):
 
         :rtype: iter[datacube.model.MetadataType]
         """
-        with self._db_connection() as connection:
-            return self._make_many(connection.get_all_metadata_types())
+        return iter(self._index._get_catalogue().metadata_types)
 
     def get_all_docs(self):
         with self._db_connection() as connection:
@@ -6,10 +6,8 @@ import datetime
 import logging
 
 from time import monotonic
-from cachetools.func import lru_cache
 
 from odc.geo.geom import CRS, Geometry
-from datacube.index import fields
 from datacube.index.abstract import AbstractProductResource, BatchStatus
 from datacube.utils.documents import JsonDict
 from datacube.index.postgis._transaction import IndexResourceAddIn
@@ -17,7 +15,10 @@ from datacube.model import Product, MetadataType
 from datacube.utils import jsonify_document, changes, _readable_offset
 from datacube.utils.changes import check_doc_unchanged, get_doc_changes
 
-from typing import Iterable, Sequence, cast
+from typing import Iterable, Sequence, cast, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from datacube.index.postgis.index import Index
 
 _LOG = logging.getLogger(__name__)
 
@@ -27,6 +28,8 @@ class ProductResource(AbstractProductResource, IndexResourceAddIn):
     Postgis driver product resource implementation
     """
 
+    _index: "Index"
+
     def __init__(self, db, index):
         """
         :type db: datacube.drivers.postgis._connections.PostgresDb
@@ -34,20 +37,6 @@ class ProductResource(AbstractProductResource, IndexResourceAddIn):
         """
         super().__init__(index)
         self._db = db
-        self.get_unsafe = lru_cache()(self.get_unsafe)
-        self.get_by_name_unsafe = lru_cache()(self.get_by_name_unsafe)
-
-    def __getstate__(self):
-        """
-        We define getstate/setstate to avoid pickling the caches
-        """
-        return self._db, self._index.metadata_types
-
-    def __setstate__(self, state):
-        """
-        We define getstate/setstate to avoid pickling the caches
-        """
-        self.__init__(*state)
 
     def add(self, product, allow_table_lock=False):
         """
@@ -84,6 +73,7 @@ class ProductResource(AbstractProductResource, IndexResourceAddIn):
                     metadata_type_id=metadata_type.id,
                     definition=product.definition,
                 )
+            self._index._invalidate_catalogue()
         return self.get_by_name(product.name)
 
     def _add_batch(self, batch_products: Iterable[Product]) -> BatchStatus:
@@ -102,7 +92,8 @@ class ProductResource(AbstractProductResource, IndexResourceAddIn):
         ]
         with self._db_connection() as connection:
             added, skipped = connection.insert_product_bulk(values)
-            return BatchStatus(added, skipped, monotonic() - b_started)
+        self._index._invalidate_catalogue()
+        return BatchStatus(added, skipped, monotonic() - b_started)
 
     def can_update(self, product, allow_unsafe_updates=False):
         """
@@ -211,8 +202,7 @@ class ProductResource(AbstractProductResource, IndexResourceAddIn):
                 update_metadata_type=changing_metadata_type
             )
 
-        self.get_by_name_unsafe.cache_clear()  # type: ignore[attr-defined]
-        self.get_unsafe.cache_clear()          # type: ignore[attr-defined]
+        self._index._invalidate_catalogue()
         return self.get_by_name(product.name)
 
     def update_document(self, definition, allow_unsafe_updates=False, allow_table_lock=False):
@@ -250,7 +240,7 @@ class ProductResource(AbstractProductResource, IndexResourceAddIn):
                 # First find and delete all related datasets
                 product_datasets = self._index.datasets.search_returning(('id',),
                                                                          archived=None, product=product.name)
-                product_datasets = [ds.id for ds in product_datasets]  # type: ignore[attr-defined]
+                product_datasets = [ds.id for ds in product_datasets]  # type: ignore[attr-defined, union-attr]
                 purged = self._index.datasets.purge(product_datasets, allow_delete_active)
                 # if not all product datasets are purged, it must be because
                 # we're not allowing active datasets to be purged
@@ -260,76 +250,33 @@ class ProductResource(AbstractProductResource, IndexResourceAddIn):
                 # Now we can safely delete the Product
                 conn.delete_product(product.name)
                 deleted.append(product)
+        if deleted:
+            self._index._invalidate_catalogue()
         return deleted
 
-    # This is memoized in the constructor
-    # pylint: disable=method-hidden
     def get_unsafe(self, id_):  # type: ignore
-        with self._db_connection() as connection:
-            result = connection.get_product(id_)
-        if not result:
+        product = self._index._lookup("products_by_id", id_)
+        if product is None:
             raise KeyError('"%s" is not a valid Product id' % id_)
-        return self._make(result)
+        return product
 
-    # This is memoized in the constructor
-    # pylint: disable=method-hidden
     def get_by_name_unsafe(self, name):  # type: ignore
-        with self._db_connection() as connection:
-            result = connection.get_product_by_name(name)
-        if not result:
+        product = self._index._lookup("products_by_name", name)
+        if product is None:
             raise KeyError('"%s" is not a valid Product name' % name)
-        return self._make(result)
+        return product
 
     def search_robust(self, **query):
         """
         Return dataset types that match match-able fields and dict of remaining un-matchable fields.
 
+        Products are matched against the cached catalogue, without querying the database.
+
         :param dict query:
         :rtype: __generator[(Product, dict)]
         """
-
-        def _listify(v):
-            if isinstance(v, tuple):
-                return list(v)
-            elif isinstance(v, list):
-                return v
-            else:
-                return [v]
-
-        for type_ in self.get_all():
-            remaining_matchable = query.copy()
-            # If they specified specific product/metadata-types, we can quickly skip non-matches.
-            if type_.name not in _listify(remaining_matchable.pop('product', type_.name)):
-                continue
-            if type_.metadata_type.name not in _listify(remaining_matchable.pop('metadata_type',
-                                                                                type_.metadata_type.name)):
-                continue
-
-            # Check that all the keys they specified match this product.
-            for key, value in list(remaining_matchable.items()):
-                if key == "geopolygon":
-                    # Geometry field is handled elsewhere by index drivers that support spatial indexes.
-                    continue
-                field = type_.metadata_type.dataset_fields.get(key)
-                if not field:
-                    # This type doesn't have that field, so it cannot match.
-                    break
-                if not field.can_extract:
-                    # non-document/native field
-                    continue
-                if field.extract(type_.metadata_doc) is None:
-                    # It has this field but it's not defined in the type doc, so it's unmatchable.
-                    continue
-
-                expr = fields.as_expression(field, value)
-                if expr.evaluate(type_.metadata_doc):
-                    remaining_matchable.pop(key)
-                else:
-                    # A property doesn't match this type, skip to next type.
-                    break
-
-            else:
-                yield type_, remaining_matchable
+        # Geometry field is handled elsewhere by index drivers that support spatial indexes.
+        return self._index._get_catalogue().search_robust(query, ignore_fields=('geopolygon',))
 
     def search_by_metadata(self, metadata):
         """
@@ -348,8 +295,7 @@ class ProductResource(AbstractProductResource, IndexResourceAddIn):
         """
         Retrieve all Products
         """
-        with self._db_connection() as connection:
-            return self._make_many(connection.get_all_products())
+        return iter(self._index._get_catalogue().products)
 
     def get_all_docs(self) -> Iterable[JsonDict]:
         with self._db_connection() as connection:
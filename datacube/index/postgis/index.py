@@ -5,12 +5,14 @@
 import logging
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Iterable, Iterator, Sequence, Type
+from typing import Any, Callable, Hashable, Iterable, Iterator, Sequence, Type
+from uuid import UUID
 
 from deprecat import deprecat
 from datacube.cfg.api import ODCEnvironment, ODCOptionHandler
-from datacube.cfg.opt import config_options_for_psql_driver
+from datacube.cfg.opt import BoolOptionHandler, config_options_for_psql_driver
 from datacube.drivers.postgis import PostGisDb, PostgisDbAPI
+from datacube.index._catalogue import Catalogue, CatalogueCache
 from datacube.index.postgis._transaction import PostgisTransaction
 from datacube.index.postgis._datasets import DatasetResource
 from datacube.index.postgis._metadata_types import MetadataTypeResource
@@ -21,7 +23,7 @@ from datacube.index.abstract import (
     AbstractIndex, AbstractIndexDriver, AbstractTransaction,
     default_metadata_type_docs, DSID
 )
-from datacube.model import MetadataType
+from datacube.model import MetadataType, Product
 from datacube.migration import ODC2DeprecationWarning
 from odc.geo import CRS
 
@@ -75,6 +77,9 @@ class Index(AbstractIndex):
         self._db = db
         self._env = env
 
+        self._catalogue = CatalogueCache(self._catalogue_generation, self._load_catalogue,
+                                         ttl=env.db_catalogue_cache_ttl)
+
         self._users = UserResource(db, self)
         self._metadata_types = MetadataTypeResource(db, self)
         self._products = ProductResource(db, self)
@@ -167,10 +172,13 @@ class Index(AbstractIndex):
     def update_spatial_index(self,
                              crses: Sequence[CRS] = [],
                              product_names: Sequence[str] = [],
-                             dataset_ids: Sequence[DSID] = []
+                             dataset_ids: Sequence[DSID] = [],
+                             after: DSID | None = None,
+                             progress: Callable[[int, UUID], None] | None = None,
                              ) -> int:
-        with self._active_connection(transaction=True) as conn:
-            return conn.update_spindex(crses, product_names, dataset_ids)
+        # Not one big transaction: each chunk is committed as it is done, so the update can be resumed
+        with self._active_connection() as conn:
+            return conn.update_spindex(crses, product_names, dataset_ids, after=after, progress=progress)
 
     def __repr__(self):
         return "Index<db={!r}>".format(self._db)
@@ -178,6 +186,51 @@ class Index(AbstractIndex):
     def drop_spatial_index(self, crs: CRS) -> bool:
         return self._db.drop_spatial_index(crs)
 
+    def _get_catalogue(self, validate: bool = False) -> Catalogue:
+        """
+        The cached metadata types and products of the index.
+
+        Inside a transaction, the catalogue is checked for changes when first used, and rechecked on its next
+        use outside the transaction as it may include changes that are not yet committed.
+
+        :param validate: Check for changes even if the cache TTL has not expired.
+        """
+        return self._catalogue.get(validate=validate, transaction=self._catalogue_transaction())
+
+    def _lookup(self, kind: str, key: Hashable) -> Any:
+        """
+        Look up a metadata type or product by id or name in the cached catalogue (see CatalogueCache.lookup).
+        """
+        return self._catalogue.lookup(kind, key, transaction=self._catalogue_transaction())
+
+    def _catalogue_transaction(self) -> object | None:
+        # Transaction objects can be reused, their connection identifies one transaction
+        trans = self.thread_transaction()
+        return None if trans is None else trans._connection
+
+    def _invalidate_catalogue(self) -> None:
+        """
+        Discard the cached metadata types and products, so they are reloaded from the database on next use.
+        """
+        self._catalogue.invalidate()
+
+    def _catalogue_generation(self):
+        with self._active_connection() as conn:
+            return conn.get_catalogue_generation()
+
+    def _load_catalogue(self) -> Catalogue:
+        with self._active_connection() as conn:
+            metadata_types = [self._metadata_types._make_from_query_row(row)
+                              for row in conn.get_all_metadata_types()]
+            metadata_types_by_id = {mt.id: mt for mt in metadata_types}
+            products = [
+                Product(definition=row.definition,
+                        metadata_type=metadata_types_by_id[row.metadata_type_ref],
+                        id_=row.id)
+                for row in conn.get_all_products()
+            ]
+        return Catalogue(metadata_types, products)
+
     @contextmanager
     def _active_connection(self, transaction: bool = False) -> Iterator[PostgisDbAPI]:
         """
@@ -243,7 +296,10 @@ class PostgisIndexDriver(AbstractIndexDriver):
 
     @staticmethod
     def get_config_option_handlers(env: ODCEnvironment) -> Iterable[ODCOptionHandler]:
-        return config_options_for_psql_driver(env)
+        return [
+            *config_options_for_psql_driver(env),
+            BoolOptionHandler("db_bulk_add_copy", env, default=False),
+        ]
 
 
 def index_driver_init():
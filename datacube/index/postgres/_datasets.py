@@ -18,19 +18,23 @@ from deprecat import deprecat
 from datacube.drivers.postgres._fields import SimpleDocField
 from datacube.drivers.postgres._schema import DATASET
 from datacube.index.abstract import (AbstractDatasetResource, DSID,
-                                     DatasetTuple, BatchStatus, DatasetSpatialMixin)
+                                     DatasetTuple, BatchStatus, DatasetSpatialMixin, dsid_to_uuid)
 from datacube.index.postgres._transaction import IndexResourceAddIn
 from datacube.model import Dataset, Product
 from datacube.model.fields import Field, Expression
 from datacube.model.utils import flatten_datasets
 from datacube.utils import jsonify_document, _readable_offset, changes
 from datacube.utils.changes import get_doc_changes, Offset
+from datacube.utils.generic import batched
 from datacube.index import fields
 from datacube.drivers.postgres._api import split_uri
 from datacube.migration import ODC2DeprecationWarning
 
 _LOG = logging.getLogger(__name__)
 
+# Number of dataset ids per statement when archiving, restoring or purging datasets
+BULK_UPDATE_BATCH_SIZE = 10000
+
 
 # It's a public api, so we can't reorganise old methods.
 # pylint: disable=too-many-public-methods, too-many-lines
@@ -68,13 +72,19 @@ class DatasetResource(AbstractDatasetResource, IndexResourceAddIn):
                     raise KeyError(id_)
                 return self._make(dataset, full_info=True)
 
-            datasets = {result.id: (self._make(result, full_info=True), result)
-                        for result in connection.get_dataset_sources(id_)}
+            datasets = self._make_with_sources(connection.get_dataset_sources(id_))
 
         if not datasets:
             # No dataset found
             raise KeyError(id_)
+        return datasets[id_]
 
+    def _make_with_sources(self, results) -> dict[UUID, Dataset]:
+        """
+        Make datasets from the rows returned by get_datasets_sources, linked to their source datasets.
+        """
+        datasets = {result.id: (self._make(result, full_info=True), result)
+                    for result in results}
         for dataset, result in datasets.values():
             dataset.metadata.sources = {
                 classifier: datasets[source][0].metadata_doc
@@ -84,15 +94,19 @@ class DatasetResource(AbstractDatasetResource, IndexResourceAddIn):
                 classifier: datasets[source][0]
                 for source, classifier in zip(result.sources, result.classes) if source
             }
-        return datasets[id_][0]
+        return {id_: dataset for id_, (dataset, _) in datasets.items()}
 
-    def bulk_get(self, ids):
+    def bulk_get(self, ids, include_sources=False):
         def to_uuid(x):
             return x if isinstance(x, UUID) else UUID(x)
 
         ids = [to_uuid(i) for i in ids]
 
         with self._db_connection() as connection:
+            if include_sources:
+                # Read all the datasets and their provenance in one query
+                datasets = self._make_with_sources(connection.get_datasets_sources(ids))
+                return [datasets[id_] for id_ in dict.fromkeys(ids) if id_ in datasets]
             rows = connection.get_datasets(ids)
             return [self._make(r, full_info=True) for r in rows]
 
@@ -111,6 +125,27 @@ class DatasetResource(AbstractDatasetResource, IndexResourceAddIn):
                 for result in connection.get_derived_datasets(id_)
             ]
 
+    def get_all_derived_ids(self, ids: Iterable[DSID]) -> set[UUID]:
+        """
+        Get the ids of all datasets derived from any of the given datasets, recursively
+
+        Derived datasets are looked up a generation at a time.
+
+        :param ids: dataset ids
+        :return: Ids of derived datasets, not including the given datasets
+        """
+        roots = {dsid_to_uuid(id_) for id_ in ids}
+        derived: set[UUID] = set()
+        generation = roots
+        with self._db_connection() as connection:
+            while generation:
+                next_generation: set[UUID] = set()
+                for batch in batched(generation, BULK_UPDATE_BATCH_SIZE):
+                    next_generation.update(connection.get_derived_dataset_ids(batch))
+                generation = next_generation - derived - roots
+                derived.update(generation)
+        return derived
+
     def has(self, id_):
         """
         Have we already indexed this dataset?
@@ -370,9 +405,13 @@ class DatasetResource(AbstractDatasetResource, IndexResourceAddIn):
 
         :param Iterable[UUID] ids: list of dataset ids to archive
         """
+        started = monotonic()
+        requested = archived = 0
         with self._db_connection(transaction=True) as transaction:
-            for id_ in ids:
-                transaction.archive_dataset(id_)
+            for batch in batched(ids, BULK_UPDATE_BATCH_SIZE):
+                requested += len(batch)
+                archived += transaction.archive_datasets(batch)
+        _LOG.info("Archived %d of %d datasets in %.2fs", archived, requested, monotonic() - started)
 
     def restore(self, ids):
         """
@@ -380,9 +419,13 @@ class DatasetResource(AbstractDatasetResource, IndexResourceAddIn):
 
         :param Iterable[UUID] ids: list of dataset ids to restore
         """
+        started = monotonic()
+        requested = restored = 0
         with self._db_connection(transaction=True) as transaction:
-            for id_ in ids:
-                transaction.restore_dataset(id_)
+            for batch in batched(ids, BULK_UPDATE_BATCH_SIZE):
+                requested += len(batch)
+                restored += transaction.restore_datasets(batch)
+        _LOG.info("Restored %d of %d datasets in %.2fs", restored, requested, monotonic() - started)
 
     def purge(self, ids: Iterable[DSID], allow_delete_active: bool = False) -> Sequence[DSID]:
         """
@@ -392,18 +435,26 @@ class DatasetResource(AbstractDatasetResource, IndexResourceAddIn):
         :param allow_delete_active: whether active datasets can be deleted
         :return: list of purged dataset ids
         """
-        purged = []
+        started = monotonic()
+        requested = 0
+        purged: list[DSID] = []
         with self._db_connection(transaction=True) as transaction:
-            for id_ in ids:
-                ds = self.get(id_)
-                if ds is None:
-                    continue
-                if not ds.is_archived and not allow_delete_active:
-                    _LOG.warning(f"Cannot purge unarchived dataset: {id_}")
-                    continue
-                transaction.delete_dataset(id_)
-                purged.append(id_)
-
+            for batch in batched(ids, BULK_UPDATE_BATCH_SIZE):
+                requested += len(batch)
+                archived = transaction.datasets_archived_status([dsid_to_uuid(id_) for id_ in batch])
+                to_delete = {}
+                for id_ in batch:
+                    uuid_ = dsid_to_uuid(id_)
+                    if uuid_ not in archived or uuid_ in to_delete:
+                        continue
+                    if not archived[uuid_] and not allow_delete_active:
+                        _LOG.warning(f"Cannot purge unarchived dataset: {id_}")
+                        continue
+                    to_delete[uuid_] = id_
+                if to_delete:
+                    transaction.delete_datasets(list(to_delete))
+                    purged.extend(to_delete.values())
+        _LOG.info("Purged %d of %d datasets in %.2fs", len(purged), requested, monotonic() - started)
         return purged
 
     def get_all_dataset_ids(self, archived: bool | None = False):
@@ -707,6 +758,47 @@ class DatasetResource(AbstractDatasetResource, IndexResourceAddIn):
                 kwargs = {f: extract_field(f) for f in field_name_d}
                 yield result_type(**kwargs)
 
+    def search_columnar(self,
+                        field_names: Iterable[str] | None = None,
+                        custom_offsets: Mapping[str, Offset] | None = None,
+                        limit: int | None = None,
+                        archived: bool | None = False,
+                        batch_size: int = 10000,
+                        **query):
+        """
+        Perform a search, returning the specified fields as NumPy arrays.
+
+        Result rows are streamed from the database and converted to columns a batch at a time,
+        without building an object per row.
+        """
+        fields_ = self._columnar_fields(field_names, custom_offsets, query)
+        custom_fields = {
+            name: SimpleDocField(
+                name=name, description="",
+                alchemy_column=DATASET.c.metadata, indexed=False,
+                offset=offset)
+            for name, offset in (custom_offsets or {}).items()
+        }
+        for product, rows in self._do_search_by_product(query,
+                                                        return_fields=True,
+                                                        select_field_names=list(fields_),
+                                                        additional_fields=custom_fields,
+                                                        limit=limit,
+                                                        archived=archived):
+            # Only fields defined for the product are selected
+            dataset_fields = product.metadata_type.dataset_fields
+            names = [name for name in fields_ if name in dataset_fields or name in custom_fields]
+            json_columns = [i for i, name in enumerate(names) if name in custom_fields]
+            for batch in batched(rows, batch_size):
+                if json_columns:
+                    # Custom fields are not type-aware and returned as stringified json.
+                    batch = [list(row) for row in batch]
+                    for row in batch:
+                        for i in json_columns:
+                            if row[i] is not None:
+                                row[i] = json.loads(row[i])
+                yield fields.to_columns(fields_, batch, names)
+
     def count(self, archived: bool | None = False, **query):
         """
         Perform a search, returning count of results.
@@ -966,16 +1058,16 @@ class DatasetResource(AbstractDatasetResource, IndexResourceAddIn):
                     archived=archived
                 )
 
-            for result in results:
-                field_values = dict()
-                for i_, field in enumerate(select_fields):
-                    # We need to load the simple doc fields
-                    if isinstance(field, SimpleDocField):
-                        field_values[field.name] = json.loads(result[i_])
-                    else:
-                        field_values[field.name] = result[i_]
+                for result in results:
+                    field_values = dict()
+                    for i_, field in enumerate(select_fields):
+                        # We need to load the simple doc fields
+                        if isinstance(field, SimpleDocField):
+                            field_values[field.name] = json.loads(result[i_])
+                        else:
+                            field_values[field.name] = result[i_]
 
-                yield DatasetLight(**field_values)  # type: ignore
+                    yield DatasetLight(**field_values)  # type: ignore
 
     def make_select_fields(self, product, field_names, custom_offsets):
         """
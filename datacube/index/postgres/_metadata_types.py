@@ -3,8 +3,7 @@
 # Copyright (c) 2015-2025 ODC Contributors
 # SPDX-License-Identifier: Apache-2.0
 import logging
-
-from cachetools.func import lru_cache
+from typing import TYPE_CHECKING
 
 from datacube.index.abstract import AbstractMetadataTypeResource
 from datacube.index.postgres._transaction import IndexResourceAddIn
@@ -12,10 +11,15 @@ from datacube.model import MetadataType
 from datacube.utils import jsonify_document, changes, _readable_offset
 from datacube.utils.changes import check_doc_unchanged, get_doc_changes
 
+if TYPE_CHECKING:
+    from datacube.index.postgres.index import Index
+
 _LOG = logging.getLogger(__name__)
 
 
 class MetadataTypeResource(AbstractMetadataTypeResource, IndexResourceAddIn):
+    _index: "Index"
+
     def __init__(self, db, index):
         """
         :type db: datacube.drivers.postgres._connections.PostgresDb
@@ -23,21 +27,6 @@ class MetadataTypeResource(AbstractMetadataTypeResource, IndexResourceAddIn):
         self._db = db
         self._index = index
 
-        self.get_unsafe = lru_cache()(self.get_unsafe)
-        self.get_by_name_unsafe = lru_cache()(self.get_by_name_unsafe)
-
-    def __getstate__(self):
-        """
-        We define getstate/setstate to avoid pickling the caches
-        """
-        return (self._db,)
-
-    def __setstate__(self, state):
-        """
-        We define getstate/setstate to avoid pickling the caches
-        """
-        self.__init__(*state)
-
     def from_doc(self, definition):
         """
         :param dict definition:
@@ -76,6 +65,7 @@ class MetadataTypeResource(AbstractMetadataTypeResource, IndexResourceAddIn):
                     definition=metadata_type.definition,
                     concurrently=not allow_table_lock
                 )
+            self._index._invalidate_catalogue()
         return self.get_by_name(metadata_type.name)
 
     def can_update(self, metadata_type, allow_unsafe_updates=False):
@@ -151,8 +141,7 @@ class MetadataTypeResource(AbstractMetadataTypeResource, IndexResourceAddIn):
                 concurrently=not allow_table_lock
             )
 
-        self.get_by_name_unsafe.cache_clear()   # type: ignore[attr-defined]
-        self.get_unsafe.cache_clear()           # type: ignore[attr-defined]
+        self._index._invalidate_catalogue()
         return self.get_by_name(metadata_type.name)
 
     def update_document(self, definition, allow_unsafe_updates=False):
@@ -167,23 +156,17 @@ class MetadataTypeResource(AbstractMetadataTypeResource, IndexResourceAddIn):
         """
         return self.update(self.from_doc(definition), allow_unsafe_updates=allow_unsafe_updates)
 
-    # This is memoized in the constructor
-    # pylint: disable=method-hidden
     def get_unsafe(self, id_):  # type: ignore
-        with self._db_connection() as connection:
-            record = connection.get_metadata_type(id_)
-        if record is None:
-            raise KeyError('%s is not a valid MetadataType id')
-        return self._make_from_query_row(record)
+        metadata_type = self._index._lookup("metadata_types_by_id", id_)
+        if metadata_type is None:
+            raise KeyError('%s is not a valid MetadataType id' % id_)
+        return metadata_type
 
-    # This is memoized in the constructor
-    # pylint: disable=method-hidden
     def get_by_name_unsafe(self, name):  # type: ignore
-        with self._db_connection() as connection:
-            record = connection.get_metadata_type_by_name(name)
-        if not record:
+        metadata_type = self._index._lookup("metadata_types_by_name", name)
+        if metadata_type is None:
             raise KeyError('%s is not a valid MetadataType name' % name)
-        return self._make_from_query_row(record)
+        return metadata_type
 
     def check_field_indexes(self, allow_table_lock=False,
                             rebuild_views=False, rebuild_indexes=False):
@@ -208,8 +191,7 @@ class MetadataTypeResource(AbstractMetadataTypeResource, IndexResourceAddIn):
 
         :rtype: iter[datacube.model.MetadataType]
         """
-        with self._db_connection() as connection:
-            return self._make_many(connection.get_all_metadata_types())
+        return iter(self._index._get_catalogue().metadata_types)
 
     def get_all_docs(self):
         with self._db_connection() as connection:
@@ -18,7 +18,7 @@ class PostgresTransaction(AbstractTransaction):
 
     def _new_connection(self) -> Any:
         dbconn = self._db.give_me_a_connection()
-        conn = PostgresDbAPI(dbconn)
+        conn = PostgresDbAPI(dbconn, search_fetch_size=self._db.search_fetch_size)
         conn.begin()
         return conn
 
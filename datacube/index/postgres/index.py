@@ -4,12 +4,13 @@
 # SPDX-License-Identifier: Apache-2.0
 import logging
 from contextlib import contextmanager
-from typing import Iterable, Iterator, Type
+from typing import Any, Hashable, Iterable, Iterator, Type
 
 from deprecat import deprecat
 from datacube.cfg.opt import ODCOptionHandler, config_options_for_psql_driver
 from datacube.cfg.api import ODCEnvironment
 from datacube.drivers.postgres import PostgresDb, PostgresDbAPI
+from datacube.index._catalogue import Catalogue, CatalogueCache
 from datacube.index.postgres._transaction import PostgresTransaction
 from datacube.index.postgres._datasets import DatasetResource  # type: ignore
 from datacube.index.postgres._lineage import LineageResource
@@ -18,7 +19,7 @@ from datacube.index.postgres._products import ProductResource
 from datacube.index.postgres._users import UserResource
 from datacube.index.abstract import AbstractIndex, AbstractIndexDriver, AbstractTransaction, \
     default_metadata_type_docs
-from datacube.model import MetadataType
+from datacube.model import MetadataType, Product
 from datacube.migration import ODC2DeprecationWarning
 
 _LOG = logging.getLogger(__name__)
@@ -66,6 +67,9 @@ class Index(AbstractIndex):
     def __init__(self, db: PostgresDb, env: ODCEnvironment) -> None:
         self._db = db
         self._env = env
+        self._catalogue = CatalogueCache(self._catalogue_generation, self._load_catalogue,
+                                         ttl=env.db_catalogue_cache_ttl)
+
         self._users = UserResource(db, self)
         self._metadata_types = MetadataTypeResource(db, self)
         self._products = ProductResource(db, self)
@@ -148,6 +152,51 @@ class Index(AbstractIndex):
     def __repr__(self):
         return "Index<db={!r}>".format(self._db)
 
+    def _get_catalogue(self, validate: bool = False) -> Catalogue:
+        """
+        The cached metadata types and products of the index.
+
+        Inside a transaction, the catalogue is checked for changes when first used, and rechecked on its next
+        use outside the transaction as it may include changes that are not yet committed.
+
+        :param validate: Check for changes even if the cache TTL has not expired.
+        """
+        return self._catalogue.get(validate=validate, transaction=self._catalogue_transaction())
+
+    def _lookup(self, kind: str, key: Hashable) -> Any:
+        """
+        Look up a metadata type or product by id or name in the cached catalogue (see CatalogueCache.lookup).
+        """
+        return self._catalogue.lookup(kind, key, transaction=self._catalogue_transaction())
+
+    def _catalogue_transaction(self) -> object | None:
+        # Transaction objects can be reused, their connection identifies one transaction
+        trans = self.thread_transaction()
+        return None if trans is None else trans._connection
+
+    def _invalidate_catalogue(self) -> None:
+        """
+        Discard the cached metadata types and products, so they are reloaded from the database on next use.
+        """
+        self._catalogue.invalidate()
+
+    def _catalogue_generation(self):
+        with self._active_connection() as conn:
+            return conn.get_catalogue_generation()
+
+    def _load_catalogue(self) -> Catalogue:
+        with self._active_connection() as conn:
+            metadata_types = [self._metadata_types._make_from_query_row(row)
+                              for row in conn.get_all_metadata_types()]
+            metadata_types_by_id = {mt.id: mt for mt in metadata_types}
+            products = [
+                Product(definition=row.definition,
+                        metadata_type=metadata_types_by_id[row.metadata_type_ref],
+                        id_=row.id)
+                for row in conn.get_all_products()
+            ]
+        return Catalogue(metadata_types, products)
+
     @contextmanager
     def _active_connection(self, transaction: bool = False) -> Iterator[PostgresDbAPI]:
         """
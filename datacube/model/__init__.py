@@ -14,7 +14,8 @@ from pathlib import Path
 from uuid import UUID
 
 from affine import Affine
-from typing import Optional, List, Mapping, Any, Dict, Tuple, Iterator, Iterable, Union, Sequence
+from typing import (Optional, List, Mapping, Any, Dict, Tuple, Iterator, Iterable, Union, Sequence, Callable,
+                    TYPE_CHECKING)
 
 from urllib.parse import urlparse
 from datacube.utils import without_lineage_sources, parse_time, cached_property, uri_to_local_path, \
@@ -48,6 +49,37 @@ DEFAULT_SPATIAL_DIMS = ('y', 'x')  # Used when product lacks grid_spec
 
 SCHEMA_PATH = Path(__file__).parent / 'schema'
 
+# Marks a cached Dataset attribute that has not been computed yet (None is a valid value)
+_UNSET: Any = object()
+
+
+def _crs_from_grid_spatial(projection: Optional[Dict[str, Any]]) -> Optional[CRS]:
+    if not projection:
+        return None
+    crs = projection.get('spatial_reference', None)
+    if crs:
+        return CRS(str(crs))
+    return None
+
+
+def _extent_from_grid_spatial(projection: Optional[Dict[str, Any]], crs: Optional[CRS]) -> Optional[Geometry]:
+    def xytuple(obj):
+        return obj['x'], obj['y']
+
+    # If no projection or crs, they have no extent.
+    if not projection or not crs:
+        return None
+
+    valid_data = projection.get('valid_data')
+    geo_ref_points = projection.get('geo_ref_points')
+    if valid_data:
+        return Geometry(valid_data, crs=crs)
+    elif geo_ref_points:
+        return polygon([xytuple(geo_ref_points[key]) for key in ('ll', 'ul', 'ur', 'lr', 'll')],
+                       crs=crs)
+
+    return None
+
 
 # TODO: Multi-dimension code is has incomplete type hints and significant type issues that will require attention
 
@@ -63,6 +95,17 @@ class Dataset:
     :param metadata_doc: the document (typically a parsed JSON/YAML)
     :param uris: All active uris for the dataset
     """
+    __slots__ = ('product', '_metadata_doc', '_load_doc', '_uris', 'uri',
+                 'sources', 'source_tree', 'derived_tree',
+                 'indexed_by', 'indexed_time', 'archived_time',
+                 # Values derived from the metadata document, computed on first access
+                 '_metadata', '_id', '_time', '_center_time', '_key_time', '_crs', '_extent')
+
+    if TYPE_CHECKING:
+        # None in lean datasets until the document is loaded with _load_doc
+        _metadata_doc: Optional[Dict[str, Any]]
+        _load_doc: Optional[Callable[[UUID], Dict[str, Any]]]
+        _id: UUID
 
     @deprecat(
         deprecated_args={
@@ -123,6 +166,95 @@ class Dataset:
         # When the dataset was archived. Null if not archived.
         self.archived_time = archived_time
 
+    @classmethod
+    def _from_index(cls,
+                    product: "Product",
+                    metadata_doc: Dict[str, Any],
+                    uri: Optional[str] = None,
+                    indexed_by: Optional[str] = None,
+                    indexed_time: Optional[datetime] = None,
+                    archived_time: Optional[datetime] = None) -> "Dataset":
+        """
+        Lean constructor for index drivers building many datasets from search results.
+
+        Skips the argument checks of the public constructor, no lineage is attached and
+        nothing is read from ``metadata_doc`` until it is accessed.
+        """
+        ds = cls.__new__(cls)
+        ds.product = product
+        ds.metadata_doc = metadata_doc
+        ds._uris = [uri] if uri else []
+        ds.uri = uri or None
+        ds.sources = None
+        ds.source_tree = None
+        ds.derived_tree = None
+        ds.indexed_by = indexed_by
+        ds.indexed_time = indexed_time
+        ds.archived_time = archived_time
+        return ds
+
+    @classmethod
+    def _lean(cls,
+              product: "Product",
+              id_: UUID,
+              load_doc: Callable[[UUID], Dict[str, Any]],
+              uri: Optional[str] = None,
+              time: Optional[Range] = None,
+              grid_spatial: Optional[Dict[str, Any]] = None,
+              archived_time: Optional[datetime] = None) -> "Dataset":
+        """
+        Constructor for index drivers returning datasets without their metadata document.
+
+        Only the id, uri, time range, and the CRS and extent read from ``grid_spatial`` are kept.
+        The metadata document is fetched with ``load_doc(id_)`` the first time it, or anything
+        else read from it, is needed.
+        """
+        ds = cls._from_index(product, {}, uri=uri, archived_time=archived_time)
+        ds._metadata_doc = None
+        ds._load_doc = load_doc
+        ds._id = id_
+        ds._time = time
+        ds._crs = _crs_from_grid_spatial(grid_spatial)
+        ds._extent = _extent_from_grid_spatial(grid_spatial, ds._crs)
+        return ds
+
+    @property
+    def metadata_doc(self) -> Dict[str, Any]:
+        """
+        The document describing the dataset as a dictionary. It is often serialised as YAML on disk
+        or inside a NetCDF file, and as JSON-B inside the database index.
+        """
+        if self._metadata_doc is None and self._load_doc is not None:
+            self._metadata_doc = self._load_doc(self._id)
+            self._load_doc = None
+        return self._metadata_doc  # type: ignore[return-value]
+
+    @metadata_doc.setter
+    def metadata_doc(self, metadata_doc: Dict[str, Any]) -> None:
+        self._metadata_doc = metadata_doc
+        self._load_doc = None
+        self._metadata = self._id = self._time = self._center_time = self._key_time = _UNSET
+        self._crs = self._extent = _UNSET
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Lean datasets are sent with their document, derived values are recomputed on the other side
+        return {
+            'product': self.product,
+            'metadata_doc': self.metadata_doc,
+            '_uris': self._uris,
+            'uri': self.uri,
+            'sources': self.sources,
+            'source_tree': self.source_tree,
+            'derived_tree': self.derived_tree,
+            'indexed_by': self.indexed_by,
+            'indexed_time': self.indexed_time,
+            'archived_time': self.archived_time,
+        }
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        for name, value in state.items():
+            setattr(self, name, value)
+
     @property
     @deprecat(
         reason="Multiple locations are now deprecated. Please use the 'uri' attribute instead.",
@@ -207,8 +339,10 @@ class Dataset:
     def id(self) -> UUID:
         """ UUID of a dataset
         """
-        # This is a string in a raw document.
-        return UUID(self.metadata.id)
+        if self._id is _UNSET:
+            # This is a string in a raw document.
+            self._id = UUID(self.metadata.id)
+        return self._id
 
     @property
     def managed(self) -> bool:
@@ -237,36 +371,59 @@ class Dataset:
             return {}
         return metadata.measurements
 
-    @cached_property
+    @property
     def center_time(self) -> Optional[datetime]:
         """ mid-point of time range
         """
-        time = self.time
-        if time is None:
-            return None
-        return time.begin + (time.end - time.begin) // 2
+        if self._center_time is _UNSET:
+            time = self.time
+            if time is None:
+                self._center_time = None
+            else:
+                self._center_time = time.begin + (time.end - time.begin) // 2
+        return self._center_time
+
+    # center_time, key_time and extent used to be cached properties, which can be overridden or reset
+    @center_time.setter
+    def center_time(self, value: Optional[datetime]) -> None:
+        self._center_time = value
+
+    @center_time.deleter
+    def center_time(self) -> None:
+        self._center_time = _UNSET
 
     @property
     def time(self) -> Optional[Range]:
-        try:
-            time = self.metadata.time
-            return Range(parse_time(time.begin), parse_time(time.end))
-        except AttributeError:
-            return None
+        if self._time is _UNSET:
+            try:
+                time = self.metadata.time
+                self._time = Range(parse_time(time.begin), parse_time(time.end))
+            except AttributeError:
+                self._time = None
+        return self._time
 
-    @cached_property
+    @property
     def key_time(self):
         """
         :rtype: datetime.datetime
         """
-        if 'key_time' in self.metadata.fields:
-            return self.metadata.key_time
+        if self._key_time is _UNSET:
+            if 'key_time' in self.metadata.fields:
+                self._key_time = self.metadata.key_time
+            else:
+                # Existing datasets are already using the computed "center_time" for their storage index key
+                # if 'center_time' in self.metadata.fields:
+                #     return self.metadata.center_time
+                self._key_time = self.center_time
+        return self._key_time
 
-        # Existing datasets are already using the computed "center_time" for their storage index key
-        # if 'center_time' in self.metadata.fields:
-        #     return self.metadata.center_time
+    @key_time.setter
+    def key_time(self, value) -> None:
+        self._key_time = value
 
-        return self.center_time
+    @key_time.deleter
+    def key_time(self) -> None:
+        self._key_time = _UNSET
 
     @property
     def bounds(self) -> Optional[BoundingBox]:
@@ -334,42 +491,28 @@ class Dataset:
     def crs(self) -> Optional[CRS]:
         """ Return CRS if available
         """
-        projection = self._gs
-
-        if not projection:
-            return None
+        if self._crs is _UNSET:
+            self._crs = _crs_from_grid_spatial(self._gs)
+        return self._crs
 
-        crs = projection.get('spatial_reference', None)
-        if crs:
-            return CRS(str(crs))
-        return None
-
-    @cached_property
+    @property
     def extent(self) -> Optional[Geometry]:
         """ :returns: valid extent of the dataset or None
         """
+        if self._extent is _UNSET:
+            projection = self._gs
+            if projection and not self.crs:
+                _LOG.debug("No CRS, assuming no extent (dataset %s)", self.id)
+            self._extent = _extent_from_grid_spatial(projection, self.crs)
+        return self._extent
 
-        def xytuple(obj):
-            return obj['x'], obj['y']
-
-        # If no projection or crs, they have no extent.
-        projection = self._gs
-        if not projection:
-            return None
-        crs = self.crs
-        if not crs:
-            _LOG.debug("No CRS, assuming no extent (dataset %s)", self.id)
-            return None
+    @extent.setter
+    def extent(self, value: Optional[Geometry]) -> None:
+        self._extent = value
 
-        valid_data = projection.get('valid_data')
-        geo_ref_points = projection.get('geo_ref_points')
-        if valid_data:
-            return Geometry(valid_data, crs=crs)
-        elif geo_ref_points:
-            return polygon([xytuple(geo_ref_points[key]) for key in ('ll', 'ul', 'ur', 'lr', 'll')],
-                           crs=crs)
-
-        return None
+    @extent.deleter
+    def extent(self) -> None:
+        self._extent = _UNSET
 
     def __eq__(self, other) -> bool:
         if isinstance(other, Dataset):
@@ -390,7 +533,9 @@ class Dataset:
 
     @property
     def metadata(self) -> DocReader:
-        return self.metadata_type.dataset_reader(self.metadata_doc)
+        if self._metadata is _UNSET:
+            self._metadata = self.metadata_type.dataset_reader(self.metadata_doc)
+        return self._metadata
 
     def metadata_doc_without_lineage(self) -> Dict[str, Any]:
         """ Return metadata document without nested lineage datasets
@@ -8,8 +8,10 @@ This allows extraction of fields of interest from dataset metadata document.
 """
 from typing import Mapping, Dict, Any
 import toolz  # type: ignore[import]
+import datetime
 import decimal
 from datacube.utils import parse_time
+from datacube.utils.dates import tz_as_utc
 from ._base import Range
 
 # Allowed values for field 'type' (specified in a metadata type document)
@@ -56,6 +58,61 @@ class SimpleEqualsExpression(Expression):
         return self.field.extract(ctx) == self.value
 
 
+def comparable_value(value):
+    """
+    Normalise a field or search value for ordering comparisons.
+
+    Naive datetimes cannot be compared with timezone aware ones, and are assumed to be UTC.
+    Dates are treated as midnight UTC.
+    """
+    if isinstance(value, datetime.datetime):
+        return tz_as_utc(value)
+    if isinstance(value, datetime.date):
+        return datetime.datetime.combine(value, datetime.time(), tzinfo=datetime.timezone.utc)
+    return value
+
+
+def _overlaps(begin, end, low, high) -> bool:
+    # Inclusive overlap of [begin, end] and [low, high], None is unbounded.
+    if begin is not None and high is not None and comparable_value(begin) > comparable_value(high):
+        return False
+    if end is not None and low is not None and comparable_value(end) < comparable_value(low):
+        return False
+    return True
+
+
+class ValueBetweenExpression(Expression):
+    """
+    Field value is within the inclusive range [low_value, high_value].
+    """
+    def __init__(self, field, low_value, high_value):
+        self.field = field
+        self.low_value = low_value
+        self.high_value = high_value
+
+    def evaluate(self, ctx):
+        v = self.field.extract(ctx)
+        if v is None:
+            return False
+        return _overlaps(v, v, self.low_value, self.high_value)
+
+
+class RangeBetweenExpression(Expression):
+    """
+    Field range overlaps the inclusive range [low_value, high_value].
+    """
+    def __init__(self, field, low_value, high_value):
+        self.field = field
+        self.low_value = low_value
+        self.high_value = high_value
+
+    def evaluate(self, ctx):
+        v = self.field.extract(ctx)
+        if v is None:
+            return False
+        return _overlaps(v.begin, v.end, self.low_value, self.high_value)
+
+
 class Field:
     """
     A searchable field within a dataset/storage metadata document.
@@ -112,6 +169,9 @@ class SimpleField(Field):
     def __eq__(self, value) -> Expression:  # type: ignore[override]
         return SimpleEqualsExpression(self, value)
 
+    def between(self, low, high) -> Expression:
+        return ValueBetweenExpression(self, _parse_bound(self._converter, low), _parse_bound(self._converter, high))
+
     can_extract = True
 
     def extract(self, doc):
@@ -121,6 +181,13 @@ class SimpleField(Field):
         return self._converter(v)
 
 
+def _parse_bound(converter, value):
+    # Search values given as strings are parsed like values in the document
+    if isinstance(value, str):
+        return converter(value)
+    return value
+
+
 class RangeField(Field):
     def __init__(self,
                  min_offset,
@@ -135,6 +202,9 @@ class RangeField(Field):
         self._max_offset = max_offset
         super().__init__(name, description)
 
+    def between(self, low, high) -> Expression:
+        return RangeBetweenExpression(self, _parse_bound(self._converter, low), _parse_bound(self._converter, high))
+
     can_extract = True
 
     def extract(self, doc):
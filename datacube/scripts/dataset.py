@@ -8,6 +8,7 @@ import logging
 import sys
 from collections import OrderedDict
 from textwrap import dedent
+from time import monotonic
 from typing import cast, Iterable, Mapping, MutableMapping, Any, List, Set
 from uuid import UUID
 
@@ -20,11 +21,13 @@ from datacube.index.exceptions import MissingRecordError
 from datacube.index.hl import Doc2Dataset, check_dataset_consistent
 from datacube.index.eo3 import prep_eo3  # type: ignore[attr-defined]
 from datacube.index import Index
+from datacube.index.abstract import DatasetTuple, DSID
 from datacube.model import Dataset
 from datacube.ui import click as ui
 from datacube.ui.click import cli, print_help_msg
 from datacube.ui.common import ui_path_doc_stream
 from datacube.utils import changes, SimpleDocNav
+from datacube.utils.generic import batched, prefetch_map
 from datacube.utils.serialise import SafeDatacubeDumper
 from datacube.utils.uris import uri_resolve
 
@@ -71,14 +74,38 @@ def dataset_cmd():
     pass
 
 
-def dataset_stream(doc_stream, ds_resolve):
+def dataset_stream(doc_stream, ds_resolve, batch_size=None):
     """ Convert a stream `(uri, doc)` pairs into a stream of resolved datasets
 
         skips failures with logging
+
+        If a batch size is given, documents are resolved in batches with
+        :meth:`datacube.index.hl.Doc2Dataset.resolve_many`.
+    """
+    if batch_size is None:
+        results = (ds_resolve(ds, uri) for uri, ds in doc_stream)
+    else:
+        results = ds_resolve.resolve_many(((ds, uri) for uri, ds in doc_stream), batch_size=batch_size)
+
+    for dataset, err in results:
+        if dataset is None:
+            _LOG.error('%s', str(err))
+            continue
+
+        yield dataset
+
+
+def parallel_dataset_stream(dataset_paths, ds_resolve, jobs):
+    """ Read and resolve the dataset documents at a stream of paths on pools of worker threads
+
+        Documents are fetched ``jobs`` files at a time by :func:`ui_path_doc_stream`, and resolved
+        on another ``jobs`` threads. Datasets are returned in input order, and failures are skipped
+        with logging, as for :func:`dataset_stream`.
     """
-    for uri, ds in doc_stream:
-        dataset, err = ds_resolve(ds, uri)
+    doc_stream = remap_uri_from_doc(ui_path_doc_stream(dataset_paths, logger=_LOG, uri=True, jobs=jobs))
 
+    for _, resolved in prefetch_map(lambda uri_doc: ds_resolve(uri_doc[1], uri_doc[0]), doc_stream, jobs):
+        dataset, err = resolved.result()
         if dataset is None:
             _LOG.error('%s', str(err))
             continue
@@ -164,6 +191,13 @@ def load_datasets_for_update(doc_stream, index):
               is_flag=True, default=False)
 @click.option('--archive-less-mature', help='Archive less mature versions of the dataset',
               is_flag=True, default=False)
+@click.option('--jobs', '-j', type=click.IntRange(min=1), default=1, show_default=True,
+              help=('Number of worker threads reading and resolving dataset documents. '
+                    'Lineage is only verified against datasets already in the index, so datasets '
+                    'that are sources of others should be added in an earlier run'))
+@click.option('--batch-size', type=click.IntRange(min=1), default=None,
+              help=('Add datasets to the index in batches of this size, rather than one at a time. '
+                    'Datasets with embedded source datasets are still added one at a time'))
 @click.argument('dataset-paths', type=str, nargs=-1)
 @ui.pass_index()
 def index_cmd(index, product_names,
@@ -174,6 +208,8 @@ def index_cmd(index, product_names,
               ignore_lineage,
               confirm_ignore_lineage,
               archive_less_mature,
+              jobs,
+              batch_size,
               dataset_paths):
 
     if not dataset_paths:
@@ -195,13 +231,30 @@ def index_cmd(index, product_names,
         sys.exit(2)
 
     def run_it(dataset_paths):
-        doc_stream = ui_path_doc_stream(dataset_paths, logger=_LOG, uri=True)
-        doc_stream = remap_uri_from_doc(doc_stream)
-        dss = dataset_stream(doc_stream, ds_resolve)
-        index_datasets(dss,
-                       index,
-                       auto_add_lineage=auto_add_lineage and not confirm_ignore_lineage,
-                       dry_run=dry_run, archive_less_mature=archive_less_mature)
+        if jobs > 1:
+            dss = parallel_dataset_stream(dataset_paths, ds_resolve, jobs)
+        else:
+            doc_stream = ui_path_doc_stream(dataset_paths, logger=_LOG, uri=True)
+            doc_stream = remap_uri_from_doc(doc_stream)
+            dss = dataset_stream(doc_stream, ds_resolve, batch_size=batch_size)
+        if batch_size is None and jobs == 1:
+            index_datasets(dss,
+                           index,
+                           auto_add_lineage=auto_add_lineage and not confirm_ignore_lineage,
+                           dry_run=dry_run, archive_less_mature=archive_less_mature)
+            return
+        started = monotonic()
+        added, existing, failed = index_datasets_in_batches(
+            dss,
+            index,
+            batch_size=batch_size or 1,
+            auto_add_lineage=auto_add_lineage and not confirm_ignore_lineage,
+            dry_run=dry_run, archive_less_mature=archive_less_mature
+        )
+        elapsed = monotonic() - started
+        echo(f"{'Matched' if dry_run else 'Added'} {added} datasets in {elapsed:.1f}s "
+             f"({added / elapsed if elapsed else 0.0:.1f} datasets/s): "
+             f"{existing} already indexed, {failed} failed", err=True)
 
     # If outputting directly to terminal, show a progress bar.
     if sys.stdout.isatty():
@@ -222,6 +275,77 @@ def index_datasets(dss, index, auto_add_lineage, dry_run, archive_less_mature):
                 _LOG.error('Failed to add dataset %s: %s', dataset.local_uri, e)
 
 
+def index_datasets_in_batches(dss, index, batch_size, auto_add_lineage, dry_run, archive_less_mature):
+    """ Add a stream of resolved datasets to the index in batches, through the index's bulk add path
+
+        Datasets already in the index are skipped.  Datasets with embedded source datasets or more than one
+        location need the full ``datasets.add()`` path, and are added one at a time.  If a batch fails,
+        its datasets are retried one at a time so that errors are reported per dataset.
+
+        :return: Number of datasets added, already in the index, and failed
+    """
+    added = existing = failed = 0
+    cache = index.datasets._init_bulk_add_cache()
+
+    def add_one(dataset):
+        nonlocal added, failed
+        try:
+            index.datasets.add(dataset, with_lineage=auto_add_lineage,
+                               archive_less_mature=archive_less_mature)
+            added += 1
+        except (ValueError, MissingRecordError) as e:
+            _LOG.error('Failed to add dataset %s: %s', dataset.local_uri, e)
+            failed += 1
+
+    for batch in batched(dss, batch_size):
+        new = []
+        for dataset, present in zip(batch, index.datasets.bulk_has([ds.id for ds in batch])):
+            _LOG.info('Matched %s', dataset)
+            if present:
+                _LOG.warning('Dataset %s is already in the database', dataset.id)
+                existing += 1
+            else:
+                new.append(dataset)
+        if dry_run:
+            added += len(new)
+            continue
+        bulk = []
+        for dataset in new:
+            if dataset.sources or dataset.uri is None or dataset.has_multiple_uris():
+                add_one(dataset)
+            else:
+                bulk.append(dataset)
+        if not bulk:
+            continue
+        try:
+            status = index.datasets._add_batch(
+                [DatasetTuple(ds.product, ds.metadata_doc_without_lineage(), ds.uri) for ds in bulk],
+                cache
+            )
+        except Exception as e:  # pylint: disable=broad-except
+            _LOG.warning('Failed to add batch of %d datasets, retrying one at a time: %s', len(bulk), e)
+            for dataset in bulk:
+                add_one(dataset)
+            continue
+        # Drivers differ in what they count as skipped (already in the index, or failed),
+        # so check which datasets of the batch are now in the index.
+        in_index = [ds for ds, present in zip(bulk, index.datasets.bulk_has([ds.id for ds in bulk])) if present]
+        added += status.completed
+        existing += len(in_index) - status.completed
+        failed += len(bulk) - len(in_index)
+        for dataset in in_index:
+            try:
+                if index.supports_external_lineage:
+                    for tree in (dataset.source_tree, dataset.derived_tree):
+                        if tree is not None:
+                            index.lineage.add(tree)
+                if archive_less_mature is not None:
+                    index.datasets.archive_less_mature(dataset, archive_less_mature)
+            except (ValueError, MissingRecordError) as e:
+                _LOG.error('Failed to add lineage for dataset %s: %s', dataset.local_uri, e)
+    return added, existing, failed
+
+
 def parse_update_rules(keys_that_can_change):
     updates_allowed = {}
     for key_str in keys_that_can_change:
@@ -422,13 +546,15 @@ def info_cmd(index: Index, show_sources: bool, show_derived: bool,
     missing_datasets = [0]
 
     def get_datasets(ids):
-        for id_ in ids:
-            dataset = index.datasets.get(id_, include_sources=show_sources)
-            if dataset:
-                yield dataset
-            else:
-                click.echo('%s missing' % id_, err=True)
-                missing_datasets[0] += 1
+        for batch in batched(ids, 1000):
+            datasets = {ds.id: ds for ds in index.datasets.bulk_get(batch, include_sources=show_sources)}
+            for id_ in batch:
+                dataset = datasets.get(UUID(str(id_)))
+                if dataset:
+                    yield dataset
+                else:
+                    click.echo('%s missing' % id_, err=True)
+                    missing_datasets[0] += 1
 
     _OUTPUT_WRITERS[f](
         build_dataset_info(index,
@@ -461,16 +587,11 @@ def search_cmd(index, limit, f, expressions):
 
 def _get_derived_set(index: Index, id_: UUID) -> Set[Dataset]:
     """
-    Get a single flat set of all derived datasets.
+    Get a single flat set of a dataset and all derived datasets.
     (children, grandchildren, great-grandchildren...)
     """
-    derived_set = {cast(Dataset, index.datasets.get(id_))}
-    to_process = {id_}
-    while to_process:
-        derived = index.datasets.get_derived(to_process.pop())
-        to_process.update(d.id for d in derived)
-        derived_set.update(derived)
-    return derived_set
+    derived_ids = index.datasets.get_all_derived_ids([id_])
+    return {cast(Dataset, index.datasets.get(id_)), *index.datasets.bulk_get(derived_ids)}
 
 
 @dataset_cmd.command('uri-search')
@@ -529,9 +650,8 @@ def archive_cmd(index: Index, archive_derived: bool, dry_run: bool, all_ds: bool
             sys.exit(-1)
 
         if archive_derived:
-            derived_datasets = [_get_derived_set(index, dataset) for dataset in datasets_for_archive]
-            # Get the UUID of our found derived datasets
-            derived_dataset_ids = [derived.id for derived_dataset in derived_datasets for derived in derived_dataset]
+            derived_dataset_ids = list(index.datasets.get_all_derived_ids(datasets_for_archive)
+                                       - set(datasets_for_archive))
 
     all_datasets = derived_dataset_ids + [uuid for uuid in datasets_for_archive.keys()]
 
@@ -539,7 +659,9 @@ def archive_cmd(index: Index, archive_derived: bool, dry_run: bool, all_ds: bool
         click.echo(f'Archiving dataset: {dataset}')
 
     if not dry_run:
+        started = monotonic()
         index.datasets.archive(all_datasets)
+        click.echo(f'Archived {len(all_datasets)} datasets in {monotonic() - started:.1f}s')
 
     click.echo('Completed dataset archival.')
 
@@ -558,7 +680,7 @@ def archive_cmd(index: Index, archive_derived: bool, dry_run: bool, all_ds: bool
 @click.argument('ids', nargs=-1)
 @ui.pass_index()
 def restore_cmd(index: Index, restore_derived: bool, derived_tolerance_seconds: int,
-                dry_run: bool, all_ds: bool, ids: List[str]):
+                dry_run: bool, all_ds: bool, ids: Iterable[DSID]):
     if not ids and not all_ds:
         click.echo('Error: no datasets provided\n')
         print_help_msg(restore_cmd)
@@ -566,36 +688,45 @@ def restore_cmd(index: Index, restore_derived: bool, derived_tolerance_seconds:
 
     tolerance = datetime.timedelta(seconds=derived_tolerance_seconds)
     if all_ds:
-        ids = index.datasets.get_all_dataset_ids(archived=True)  # type: ignore[assignment]
-
-    for id_ in ids:
-        target_dataset = index.datasets.get(id_)
-        if target_dataset is None:
-            echo(f'No dataset found with id {id_}')
-            sys.exit(-1)
-
-        to_process = _get_derived_set(index, UUID(id_)) if restore_derived else {target_dataset}
-        _LOG.debug("%s selected", len(to_process))
-
-        # Only the already-archived ones.
-        to_process = {d for d in to_process if d.is_archived}
-        _LOG.debug("%s selected are archived", len(to_process))
-
-        def within_tolerance(dataset):
-            if not dataset.is_archived:
-                return False
-            t = target_dataset.archived_time
-            return (t - tolerance) <= dataset.archived_time <= (t + tolerance)
-
-        # Only those archived around the same time as the target.
-        if restore_derived and target_dataset.is_archived:
-            to_process = set(filter(within_tolerance, to_process))
-            _LOG.debug("%s selected were archived within the tolerance", len(to_process))
-
-        for d in to_process:
-            click.echo('restoring %s %s %s' % (d.product.name, d.id, d.local_uri))
+        ids = index.datasets.get_all_dataset_ids(archived=True)
+
+    started = monotonic()
+    restored = 0
+    for batch in batched(ids, 1000):
+        targets = {ds.id: ds for ds in index.datasets.bulk_get(batch)}
+        to_restore: Set[Dataset] = set()
+        for id_ in batch:
+            target_dataset = targets.get(UUID(str(id_)))
+            if target_dataset is None:
+                echo(f'No dataset found with id {id_}')
+                sys.exit(-1)
+
+            to_process = _get_derived_set(index, target_dataset.id) if restore_derived else {target_dataset}
+            _LOG.debug("%s selected", len(to_process))
+
+            # Only the already-archived ones.
+            to_process = {d for d in to_process if d.is_archived}
+            _LOG.debug("%s selected are archived", len(to_process))
+
+            def within_tolerance(dataset, target_dataset=target_dataset):
+                if not dataset.is_archived:
+                    return False
+                t = target_dataset.archived_time
+                return (t - tolerance) <= dataset.archived_time <= (t + tolerance)
+
+            # Only those archived around the same time as the target.
+            if restore_derived and target_dataset.is_archived:
+                to_process = set(filter(within_tolerance, to_process))
+                _LOG.debug("%s selected were archived within the tolerance", len(to_process))
+
+            for d in to_process:
+                click.echo('restoring %s %s %s' % (d.product.name, d.id, d.local_uri))
+            to_restore.update(to_process)
         if not dry_run:
-            index.datasets.restore(d.id for d in to_process)
+            index.datasets.restore(d.id for d in to_restore)
+            restored += len(to_restore)
+    if not dry_run:
+        click.echo(f'Restored {restored} datasets in {monotonic() - started:.1f}s')
 
 
 @dataset_cmd.command('purge', help="Purge archived datasets")
@@ -634,13 +765,15 @@ def purge_cmd(index: Index, dry_run: bool, all_ds: bool, force: bool, ids: List[
 
     if not dry_run:
         # Perform purge
+        started = monotonic()
         purged = index.datasets.purge(datasets_for_purge.keys(), force)
+        elapsed = monotonic() - started
         not_purged = set(datasets_for_purge.keys()).difference(set(purged))
         if not force and not_purged:
             click.echo("The following datasets are still active and could not be purged: "
                        f"{', '.join([str(id_) for id_ in not_purged])}\n"
                        "Use the --force option to delete anyway.")
-        click.echo(f'{len(purged)} of {len(datasets_for_purge)} datasets purged')
+        click.echo(f'{len(purged)} of {len(datasets_for_purge)} datasets purged in {elapsed:.1f}s')
     else:
         click.echo(f'{len(datasets_for_purge)} datasets not purged (dry run)')
 
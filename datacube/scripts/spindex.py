@@ -5,6 +5,7 @@
 import logging
 import sys
 from typing import Sequence
+from uuid import UUID
 
 import click
 import pyproj
@@ -103,9 +104,14 @@ def list_spindex(index):
     '--dataset', '-d', multiple=True,
     help="The id of a dataset to update the spatial index for (can be used multiple times for multiple datasets)"
 )
+@click.option(
+    '--after', default=None,
+    help="Only update datasets with an id greater than this. "
+         "Used to resume an interrupted update from the last dataset id reported."
+)
 @click.argument('srids', nargs=-1)
 @ui.pass_index()
-def update(index: Index, product: Sequence[str], dataset: Sequence[str], srids: Sequence[str]):
+def update(index: Index, product: Sequence[str], dataset: Sequence[str], after: str | None, srids: Sequence[str]):
     if not index.supports_spatial_indexes:
         echo("The active index driver does not support spatial indexes")
         exit(1)
@@ -135,7 +141,12 @@ def update(index: Index, product: Sequence[str], dataset: Sequence[str], srids:
     if not for_update:
         echo("Nothing to update!")
         exit(len(cant_update))
-    result = index.update_spatial_index(for_update, product_names=product, dataset_ids=dataset)
+
+    def progress(count: int, last_id: UUID) -> None:
+        echo(f'{count} datasets updated, last dataset id {last_id}')
+
+    result = index.update_spatial_index(for_update, product_names=product, dataset_ids=dataset,
+                                        after=after, progress=progress)
     echo(f'{result} extents checked and updated in {len(for_update)} spatial indexes')
     exit(len(cant_update))
 
@@ -110,9 +110,18 @@ def check(cfg_env: ODCEnvironment):
     '--lineage-only/--no-lineage-only', is_flag=True, default=False,
     help="Clone lineage data only. (default: false)"
 )
+@click.option('--workers',
+              help='Number of products to clone datasets for in parallel, in separate processes',
+              type=click.IntRange(min=1),
+              default=1)
+@click.option('--checkpoint',
+              help='Checkpoint file to record progress in, and to resume an interrupted clone from',
+              type=click.Path(dir_okay=False),
+              default=None)
 @click.argument('source-env', type=str, nargs=1)
 @ui.pass_config
-def clone(env: ODCEnvironment, batch_size: int, skip_lineage: bool, lineage_only: bool, source_env: str):
+def clone(env: ODCEnvironment, batch_size: int, skip_lineage: bool, lineage_only: bool,
+          workers: int, checkpoint: str | None, source_env: str):
     if skip_lineage and lineage_only:
         echo("Cannot set both lineage-only and skip-lineage")
         exit(1)
@@ -140,5 +149,6 @@ def clone(env: ODCEnvironment, batch_size: int, skip_lineage: bool, lineage_only
         handle_exception('Source database not initialised: %s', e)
         exit(1)
     # Any errors will have be logged.
-    destination_index.clone(src_index, batch_size=batch_size, skip_lineage=skip_lineage, lineage_only=lineage_only)
+    destination_index.clone(src_index, batch_size=batch_size, skip_lineage=skip_lineage, lineage_only=lineage_only,
+                            workers=workers, checkpoint=checkpoint)
     exit(0)
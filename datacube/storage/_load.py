@@ -9,20 +9,19 @@ Important functions are:
 
 """
 import logging
-import numbers
 from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 import numpy as np
 from xarray.core.dataarray import DataArray as XrDataArray, DataArrayCoordinates
 from xarray.core.dataset import Dataset as XrDataset
 from typing import (
     Union, Optional, Callable,
-    List, Any, Iterator, Iterable, Mapping, Tuple, Hashable, cast
+    Dict, List, Any, Iterator, Iterable, Mapping, Tuple, Hashable, cast
 )
 
 from datacube.utils import ignore_exceptions_if
 from datacube.utils.math import invalid_mask
 from odc.geo.geobox import GeoBox
-from odc.geo.roi import roi_is_empty
 from odc.geo.xr import xr_coords
 from odc.geo.warp import Resampling
 from datacube.model import Measurement
@@ -65,14 +64,9 @@ def reproject_and_fuse(datasources: List[DataSource],
                          after reading each file.
     """
     # pylint: disable=too-many-locals
-    from ._read import read_time_slice
+    from ._read import read_time_slice, read_time_slice_roi
     assert len(destination.shape) == 2
 
-    def copyto_fuser(dest: np.ndarray, src: np.ndarray) -> None:
-        _default_fuser(dest, src, dst_nodata)
-
-    fuse_func = fuse_func or copyto_fuser
-
     destination.fill(dst_nodata)
     if len(datasources) == 0:
         return destination
@@ -86,21 +80,21 @@ def reproject_and_fuse(datasources: List[DataSource],
 
         return destination
     else:
-        # Multiple sources, we need to fuse them together into a single array
-        buffer_ = np.full(destination.shape, dst_nodata, dtype=destination.dtype)
+        # Multiple sources, we need to fuse them together into a single array.
+        #
+        # Every source is read into a buffer covering just the region it overlaps,
+        # with invalid pixels set to nodata, and then fused into `destination`.
         for n_so_far, source in enumerate(datasources, 1):
             with ignore_exceptions_if(skip_broken_datasets):
                 with source.open() as rdr:
-                    roi = read_time_slice(rdr, buffer_, dst_geobox, resampling, dst_nodata, extra_dim_index)
-
-                if not roi_is_empty(roi):
-                    fuse_func(destination[roi], buffer_[roi])
-                    if dst_nodata is not None:
-                        buffer_[roi] = dst_nodata  # clean up for next read
-                    elif issubclass(destination.dtype.type, numbers.Real):
-                        buffer_[roi] = float("nan")
+                    pix, roi = read_time_slice_roi(rdr, dst_geobox, destination.dtype,
+                                                   resampling, dst_nodata, extra_dim_index)
+
+                if pix is not None:
+                    if fuse_func is None:
+                        _default_fuser(destination[roi], pix, dst_nodata)
                     else:
-                        buffer_[roi] = 0
+                        fuse_func(destination[roi], pix)
 
             if progress_cbk:
                 progress_cbk(n_so_far, len(datasources))
@@ -135,10 +129,24 @@ def xr_load(sources: XrDataArray,
             measurements: List[Measurement],
             driver: ReaderDriver,
             driver_ctx_prev: Optional[Any] = None,
-            skip_broken_datasets: bool = False) -> Tuple[XrDataset, Any]:
+            skip_broken_datasets: bool = False,
+            max_in_flight: int = 4) -> Tuple[XrDataset, Any]:
+    """
+    Load data using a :class:`~datacube.drivers._types.ReaderDriver`.
+
+    Up to ``max_in_flight`` bands are opened and read concurrently. Results are fused
+    into the output as they arrive, but always in the original order within each
+    output slice, so fusers that depend on order behave exactly as with a serial load.
+
+    :returns: Loaded data and the driver load context, which can be passed back in
+              as ``driver_ctx_prev`` on the next call.
+    """
     # pylint: disable=too-many-locals
     from ._read import read_time_slice_v2
 
+    if max_in_flight < 1:
+        raise ValueError("max_in_flight should be at least 1")
+
     out = _allocate_storage(sources.coords, geobox, measurements)
 
     def all_groups() -> Iterator[Tuple[Measurement, Tuple[int, ...], List[BandInfo]]]:
@@ -154,22 +162,62 @@ def xr_load(sources: XrDataArray,
     groups = list(all_groups())
     ctx = driver.new_load_context(just_bands(groups), driver_ctx_prev)
 
-    # TODO: run upto N concurrently
-    for m, idx, bbi in groups:
+    dsts = []
+    for m, idx, _ in groups:
         dst = out.data_vars[m.name].values[idx]
         dst[:] = m.nodata
-        resampling = m.get('resampling_method', 'nearest')
-        fuse_func = m.get('fuser', None)
+        dsts.append(dst)
 
-        for band in bbi:
-            rdr = driver.open(band, ctx).result()
+    def load_band(band: BandInfo, m: Measurement) -> Tuple[Optional[np.ndarray], Tuple[slice, slice]]:
+        rdr = driver.open(band, ctx).result()
+        return read_time_slice_v2(rdr, geobox, m.get('resampling_method', 'nearest'), m.nodata)
 
-            pix, roi = read_time_slice_v2(rdr, geobox, resampling, m.nodata)
-
-            if pix is not None:
-                if fuse_func:
-                    fuse_func(dst[roi], pix)
-                else:
-                    _default_fuser(dst[roi], pix, m.nodata)
+    def fuse(group_idx: int, fut: Future) -> None:
+        m = groups[group_idx][0]
+        pix = None
+        with ignore_exceptions_if(skip_broken_datasets):
+            pix, roi = fut.result()
+
+        if pix is not None:
+            fuse_func = m.get('fuser', None)
+            if fuse_func:
+                fuse_func(dsts[group_idx][roi], pix)
+            else:
+                _default_fuser(dsts[group_idx][roi], pix, m.nodata)
+
+    # (group index, position within the group) of every band to load, in fusing order
+    todo = iter([(gi, bi) for gi, (_, _, bbi) in enumerate(groups) for bi in range(len(bbi))])
+    next_pos = [0] * len(groups)                  # next position to fuse, per group
+    in_flight: Dict[Future, Tuple[int, int]] = {}
+    ready: Dict[Tuple[int, int], Future] = {}     # completed but waiting on an earlier band of the same group
+
+    # Completed results that can not be fused yet still count against the window,
+    # so a single slow read can not cause unbounded buffering.
+    window = 2 * max_in_flight
+
+    with ThreadPoolExecutor(max_workers=max_in_flight) as pool:
+        def submit_more() -> None:
+            while len(in_flight) < max_in_flight and len(in_flight) + len(ready) < window:
+                item = next(todo, None)
+                if item is None:
+                    return
+                gi, bi = item
+                in_flight[pool.submit(load_band, groups[gi][2][bi], groups[gi][0])] = item
+
+        try:
+            submit_more()
+            while in_flight:
+                done, _ = wait(list(in_flight), return_when=FIRST_COMPLETED)
+                for fut in done:
+                    gi, bi = in_flight.pop(fut)
+                    ready[(gi, bi)] = fut
+                    while (gi, next_pos[gi]) in ready:
+                        fuse(gi, ready.pop((gi, next_pos[gi])))
+                        next_pos[gi] += 1
+                submit_more()
+        except BaseException:
+            for fut in in_flight:
+                fut.cancel()
+            raise
 
     return out, ctx
@@ -5,9 +5,10 @@
 """ Dataset -> Raster
 """
 import numpy as np
+from cachetools.func import lru_cache
 from typing import Optional, Tuple, cast
 
-from ..utils.math import valid_mask
+from ..utils.math import dtype_is_float, invalid_mask, valid_mask
 
 from odc.geo import wh_
 from odc.geo.roi import (
@@ -28,6 +29,9 @@ from odc.geo.warp import (
 from odc.geo.overlap import compute_reproject_roi, is_affine_st
 from odc.geo.math import is_almost_int
 
+# Number of (source grid, destination grid) reprojection plans to remember
+REPROJECT_PLAN_CACHE_SIZE = 1024
+
 
 def rdr_geobox(rdr) -> GeoBox:
     """ Construct GeoBox from opened dataset reader.
@@ -60,6 +64,116 @@ def pick_read_scale(scale: float, rdr=None, tol=1e-3):
     return scale
 
 
+def _same_nodata(a: Nodata, b: Nodata) -> bool:
+    if a is None or b is None:
+        return a is None and b is None
+    if np.isnan(a) or np.isnan(b):
+        return bool(np.isnan(a) and np.isnan(b))
+    return a == b
+
+
+@lru_cache(maxsize=REPROJECT_PLAN_CACHE_SIZE)
+def cached_reproject_roi(src_geobox: GeoBox, dst_geobox: GeoBox, ttol: float):
+    """ Compute reprojection ROI, padded as needed for warping reads.
+
+    Results are cached, as in a typical load many datasets share the same
+    source pixel grid. Returned object is shared and must not be modified,
+    use ``cached_reproject_roi.cache_info()`` for cache statistics.
+    """
+    rr = compute_reproject_roi(src_geobox, dst_geobox, ttol=ttol)
+
+    if not roi_is_empty(rr.roi_dst) and not rr.paste_ok:
+        is_st = False if rr.transform.linear is None else is_affine_st(rr.transform.linear)
+        if is_st:
+            # add padding on src/dst ROIs, it was set to tight bounds
+            # TODO: this should probably happen inside compute_reproject_roi
+            rr.roi_dst = roi_pad(rr.roi_dst, 1, dst_geobox.shape)  # type: ignore[call-overload]
+            rr.roi_src = roi_pad(rr.roi_src, 1, src_geobox.shape)  # type: ignore[call-overload]
+
+    return rr
+
+
+def _reproject_roi(src_geobox: GeoBox, dst_geobox: GeoBox, resampling: Resampling):
+    is_nn = is_resampling_nn(resampling)
+    return cached_reproject_roi(src_geobox, dst_geobox, 0.9 if is_nn else 0.01)
+
+
+def _norm_read_args(rdr, roi, shape, extra_dim_index):
+    if roi_is_full(roi, rdr.shape):
+        roi = None
+
+    if roi is None and shape == rdr.shape:
+        shape = None
+
+    w = w_[roi]
+
+    # Build 3D read window
+    # Note: Might be a good idea to natively support nD read windows.
+    if extra_dim_index is not None:
+        if w is None:
+            w = ()
+        return (extra_dim_index,) + w, shape
+    else:
+        # 2D read window
+        return w, shape
+
+
+def _read_paste(rdr, rr, shape, extra_dim_index) -> np.ndarray:
+    """ Read pixels that map directly onto destination ROI of a given ``shape``.
+    """
+    A = rr.transform.linear
+    assert A is not None  # For type checker
+    sx, sy = A.a, A.e
+
+    pix = rdr.read(*_norm_read_args(rdr, rr.roi_src, shape, extra_dim_index))
+
+    if sx < 0:
+        pix = pix[:, ::-1]
+    if sy < 0:
+        pix = pix[::-1, :]
+
+    return pix
+
+
+def _read_warp(rdr, rr, dst, src_geobox, dst_geobox, resampling, dst_nodata, extra_dim_index) -> None:
+    """ Read and warp pixels into ``dst``, which covers destination ROI.
+    """
+    scale = pick_read_scale(rr.scale, rdr)
+
+    dst_geobox = dst_geobox[rr.roi_dst]
+    src_geobox = src_geobox[rr.roi_src]
+    if scale > 1:
+        src_geobox = zoom_out(src_geobox, scale)
+
+    pix = rdr.read(*_norm_read_args(rdr, rr.roi_src, src_geobox.shape, extra_dim_index))
+
+    # XSCALE and YSCALE are (currently) undocumented arguments that rasterio passed through to
+    # GDAL.  Not using them results in very inaccurate warping in images with highly
+    # non-square (i.e. long and thin) aspect ratios.
+    #
+    # See https://github.com/OSGeo/gdal/issues/7750 as well as
+    # https://github.com/opendatacube/datacube-core/pull/1450 and
+    # https://github.com/opendatacube/datacube-core/issues/1456
+    #
+    # In theory we might be able to get better results for queries with significantly
+    # different vertical and horizontal scales, but explicitly using XSCALE=1, YSCALE=1
+    # appears to be most appropriate for most requests, and is demonstrably better
+    # than not setting them at all.
+    gdal_scale_params = {
+        "XSCALE": 1,
+        "YSCALE": 1,
+    }
+    if rr.transform.linear is not None:
+        A = (~src_geobox.transform)*dst_geobox.transform
+        warp_affine(pix, dst, A, resampling,
+                    src_nodata=rdr.nodata, dst_nodata=dst_nodata,
+                    **gdal_scale_params)
+    else:
+        rio_reproject(pix, dst, src_geobox, dst_geobox, resampling,
+                      src_nodata=rdr.nodata, dst_nodata=dst_nodata,
+                      **gdal_scale_params)
+
+
 def read_time_slice(rdr,
                     dst: np.ndarray,
                     dst_geobox: GeoBox,
@@ -72,95 +186,77 @@ def read_time_slice(rdr,
     """
     assert dst.shape == dst_geobox.shape
     src_geobox = rdr_geobox(rdr)
-
-    is_nn = is_resampling_nn(resampling)
-
-    rr = compute_reproject_roi(src_geobox, dst_geobox, ttol=0.9 if is_nn else 0.01)
+    rr = _reproject_roi(src_geobox, dst_geobox, resampling)
 
     if roi_is_empty(rr.roi_dst):
         return cast(tuple[slice, slice], rr.roi_dst)
 
-    scale = pick_read_scale(rr.scale, rdr)
+    dst = dst[rr.roi_dst]  # type: ignore[index]
 
-    def norm_read_args(roi, shape, extra_dim_index):
-        if roi_is_full(roi, rdr.shape):
-            roi = None
+    if rr.paste_ok:
+        pix = _read_paste(rdr, rr, dst.shape, extra_dim_index)
 
-        if roi is None and shape == rdr.shape:
-            shape = None
+        if rdr.nodata is None:
+            np.copyto(dst, pix)
+        else:
+            np.copyto(dst, pix, where=valid_mask(pix, rdr.nodata))
+    else:
+        _read_warp(rdr, rr, dst, src_geobox, dst_geobox, resampling, dst_nodata, extra_dim_index)
 
-        w = w_[roi]
+    return cast(tuple[slice, slice], rr.roi_dst)
 
-        # Build 3D read window
-        # Note: Might be a good idea to natively support nD read windows.
-        if extra_dim_index is not None:
-            if w is None:
-                w = ()
-            return (extra_dim_index,) + w, shape
-        else:
-            # 2D read window
-            return w, shape
 
-    if rr.paste_ok:
-        A = rr.transform.linear
-        assert A is not None  # For type checker
-        sx, sy = A.a, A.e
+def read_time_slice_roi(rdr,
+                        dst_geobox: GeoBox,
+                        dst_dtype: np.dtype,
+                        resampling: Resampling,
+                        dst_nodata: Nodata,
+                        extra_dim_index: Optional[int] = None) -> Tuple[Optional[np.ndarray], Tuple[slice, slice]]:
+    """ From opened reader object read pixels covering just the affected region of `dst_geobox`
 
-        dst = dst[rr.roi_dst]  # type: ignore[index]
-        pix = rdr.read(*norm_read_args(rr.roi_src, dst.shape, extra_dim_index))
+    Unlike :func:`read_time_slice` no full-size destination buffer is needed. Returned pixels
+    have type ``dst_dtype`` and all invalid pixels are set to ``dst_nodata`` (``NaN`` or ``0``
+    if ``dst_nodata`` is ``None``, for float and other types respectively). Pixels are
+    returned without copying whenever the source already satisfies these requirements.
 
-        if sx < 0:
-            pix = pix[:, ::-1]
-        if sy < 0:
-            pix = pix[::-1, :]
+    :returns: pixels read (``None`` if there is no overlap) and the affected destination region
+    """
+    src_geobox = rdr_geobox(rdr)
+    rr = _reproject_roi(src_geobox, dst_geobox, resampling)
+    roi = cast(tuple[slice, slice], rr.roi_dst)
+
+    if roi_is_empty(roi):
+        return None, roi
 
+    dst_dtype = np.dtype(dst_dtype)
+    fill_value = dst_nodata
+    if fill_value is None:
+        fill_value = float("nan") if dtype_is_float(dst_dtype) else 0
+
+    if not rr.paste_ok:
+        dst = np.full(roi_shape(roi), fill_value, dtype=dst_dtype)
+        _read_warp(rdr, rr, dst, src_geobox, dst_geobox, resampling, dst_nodata, extra_dim_index)
+        return dst, roi
+
+    pix = _read_paste(rdr, rr, roi_shape(roi), extra_dim_index)
+
+    if pix.dtype != dst_dtype:
+        dst = np.full(pix.shape, fill_value, dtype=dst_dtype)
         if rdr.nodata is None:
             np.copyto(dst, pix)
         else:
             np.copyto(dst, pix, where=valid_mask(pix, rdr.nodata))
-    else:
-        is_st = False if rr.transform.linear is None else is_affine_st(rr.transform.linear)
-        if is_st:
-            # add padding on src/dst ROIs, it was set to tight bounds
-            # TODO: this should probably happen inside compute_reproject_roi
-            rr.roi_dst = roi_pad(rr.roi_dst, 1, dst_geobox.shape)  # type: ignore[call-overload]
-            rr.roi_src = roi_pad(rr.roi_src, 1, src_geobox.shape)  # type: ignore[call-overload]
-
-        dst = dst[rr.roi_dst]  # type: ignore[index]
-        dst_geobox = dst_geobox[rr.roi_dst]
-        src_geobox = src_geobox[rr.roi_src]
-        if scale > 1:
-            src_geobox = zoom_out(src_geobox, scale)
+        return dst, roi
 
-        pix = rdr.read(*norm_read_args(rr.roi_src, src_geobox.shape, extra_dim_index))
-
-        # XSCALE and YSCALE are (currently) undocumented arguments that rasterio passed through to
-        # GDAL.  Not using them results in very inaccurate warping in images with highly
-        # non-square (i.e. long and thin) aspect ratios.
-        #
-        # See https://github.com/OSGeo/gdal/issues/7750 as well as
-        # https://github.com/opendatacube/datacube-core/pull/1450 and
-        # https://github.com/opendatacube/datacube-core/issues/1456
-        #
-        # In theory we might be able to get better results for queries with significantly
-        # different vertical and horizontal scales, but explicitly using XSCALE=1, YSCALE=1
-        # appears to be most appropriate for most requests, and is demonstrably better
-        # than not setting them at all.
-        gdal_scale_params = {
-            "XSCALE": 1,
-            "YSCALE": 1,
-        }
-        if rr.transform.linear is not None:
-            A = (~src_geobox.transform)*dst_geobox.transform
-            warp_affine(pix, dst, A, resampling,
-                        src_nodata=rdr.nodata, dst_nodata=dst_nodata,
-                        **gdal_scale_params)
-        else:
-            rio_reproject(pix, dst, src_geobox, dst_geobox, resampling,
-                          src_nodata=rdr.nodata, dst_nodata=dst_nodata,
-                          **gdal_scale_params)
+    if rdr.nodata is not None and not (
+            _same_nodata(rdr.nodata, fill_value) and (
+                not dtype_is_float(pix.dtype) or np.isnan(fill_value))):
+        # normalise nodata to be equal to `dst_nodata`, in a copy: the reader may still hold the array
+        # it returned (or it may be read-only)
+        pix = pix.copy()
+        np.copyto(pix, fill_value, where=invalid_mask(pix, rdr.nodata))
 
-    return cast(tuple[slice, slice], rr.roi_dst)
+    return pix, roi
 
 
 def read_time_slice_v2(rdr,
@@ -173,9 +269,7 @@ def read_time_slice_v2(rdr,
     """
     # pylint: disable=too-many-locals
     src_geobox = rdr_geobox(rdr)
-
-    is_nn = is_resampling_nn(resampling)
-    rr = compute_reproject_roi(src_geobox, dst_geobox, ttol=0.9 if is_nn else 0.01)
+    rr = _reproject_roi(src_geobox, dst_geobox, resampling)
 
     if roi_is_empty(rr.roi_dst):
         return None, cast(tuple[slice, slice], rr.roi_dst)
@@ -210,13 +304,6 @@ def read_time_slice_v2(rdr,
 
         dst = pix
     else:
-        is_st = False if rr.transform.linear is None else is_affine_st(rr.transform.linear)
-        if is_st:
-            # add padding on src/dst ROIs, it was set to tight bounds
-            # TODO: this should probably happen inside compute_reproject_roi
-            rr.roi_dst = roi_pad(rr.roi_dst, 1, dst_geobox.shape)  # type: ignore[call-overload]
-            rr.roi_src = roi_pad(rr.roi_src, 1, src_geobox.shape)  # type: ignore[call-overload]
-
         dst_geobox = dst_geobox[rr.roi_dst]
         src_geobox = src_geobox[rr.roi_src]
         if scale > 1:
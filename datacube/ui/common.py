@@ -11,6 +11,8 @@ from typing import Union, Optional
 from toolz.functoolz import identity  # type: ignore[import]
 
 from datacube.utils import read_documents, InvalidDocException, SimpleDocNav, is_supported_document_type, is_url
+from datacube.utils.documents import ConnectionPool
+from datacube.utils.generic import prefetch_map
 
 
 def get_metadata_path(possible_path: Union[str, Path]) -> str:
@@ -68,7 +70,7 @@ def _find_any_metadata_suffix(path: Path) -> Optional[Path]:
     return existing_paths[0]
 
 
-def ui_path_doc_stream(paths, logger=None, uri=True, raw=False):
+def ui_path_doc_stream(paths, logger=None, uri=True, raw=False, jobs=1):
     """Given a stream of URLs, or Paths that could be directories, generate a stream of
     (path, doc) tuples.
 
@@ -78,6 +80,9 @@ def ui_path_doc_stream(paths, logger=None, uri=True, raw=False):
     2. Load all documents from that path and return one at a time (parsing
     errors are logged, but processing should continue)
 
+    Files are fetched ahead of the consumer on ``jobs`` worker threads, over persistent
+    connections shared by the workers, and are returned in input order.
+
     :param paths: Filesystem paths
 
     :param logger: Logger to use to report errors
@@ -87,6 +92,8 @@ def ui_path_doc_stream(paths, logger=None, uri=True, raw=False):
     :param raw: By default docs are wrapped in :class:`SimpleDocNav`, but you can
     instead request them to be raw dictionaries
 
+    :param jobs: Number of files to fetch concurrently
+
     """
 
     def _resolve_doc_files(paths):
@@ -97,16 +104,23 @@ def ui_path_doc_stream(paths, logger=None, uri=True, raw=False):
                 if logger is not None:
                     logger.error(str(e))
 
-    def _path_doc_stream(files, uri=True, raw=False):
+    def _path_doc_stream(files, connections, uri=True, raw=False):
         maybe_wrap = identity if raw else SimpleDocNav
 
-        for fname in files:
+        def read_file(fname):
+            return list(read_documents(fname, uri=uri, connections=connections))
+
+        for fname, docs in prefetch_map(read_file, files, jobs):
             try:
-                for p, doc in read_documents(fname, uri=uri):
+                for p, doc in docs.result():
                     yield p, maybe_wrap(doc)
 
             except InvalidDocException as e:
                 if logger is not None:
                     logger.error('Failed reading documents from %s', str(fname))
 
-    yield from _path_doc_stream(_resolve_doc_files(paths), uri=uri, raw=raw)
+    connections = ConnectionPool()
+    try:
+        yield from _path_doc_stream(_resolve_doc_files(paths), connections, uri=uri, raw=raw)
+    finally:
+        connections.close()
@@ -6,16 +6,19 @@
 Functions for working with YAML documents and configurations
 """
 import gzip
+import io
 import json
 import logging
 import math
 import sys
+import threading
 import collections.abc
 from collections import OrderedDict
 from contextlib import contextmanager
+from http.client import HTTPConnection, HTTPException, HTTPSConnection
 from pathlib import Path
 from urllib.parse import urlparse
-from urllib.request import urlopen
+from urllib.request import getproxies, proxy_bypass, urlopen
 from typing import Dict, Any, Mapping
 from copy import deepcopy
 from uuid import UUID
@@ -29,7 +32,12 @@ try:
 except ImportError:
     from yaml import SafeLoader  # type: ignore
 
-from datacube.utils.generic import map_with_lookahead
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+from datacube.utils.generic import map_with_lookahead, prefetch_map
 from datacube.utils.uris import mk_part_uri, as_url, uri_to_local_path
 
 
@@ -42,19 +50,88 @@ _LOG = logging.getLogger(__name__)
 
 
 @contextmanager
-def _open_from_s3(url):
+def _open_from_s3(url, s3=None):
     o = urlparse(url)
     if o.scheme != 's3':
         raise RuntimeError("Abort abort I don't know how to open non s3 urls")
 
     from .aws import s3_open
-    yield s3_open(url)
+    yield s3_open(url, s3=s3)
 
 
 def _open_with_urllib(url):
     return urlopen(url)
 
 
+class ConnectionPool:
+    """
+    Persistent HTTP connections and an S3 client, shared by the threads of a
+    prefetching document reader.
+
+    HTTP requests fall back to urllib for proxied hosts and for anything but a
+    plain 200 response, so that redirects and errors are handled as before.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._idle = {}
+        self._s3 = None
+
+    def open(self, url):
+        scheme = urlparse(url).scheme
+        if scheme == 's3':
+            return _open_from_s3(url, s3=self._s3_client())
+        if scheme in ('http', 'https'):
+            return self._open_http(url)
+        return _PROTOCOL_OPENERS[scheme](url)
+
+    def close(self):
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for conns in idle.values():
+            for conn in conns:
+                conn.close()
+
+    def _s3_client(self):
+        with self._lock:
+            if self._s3 is None:
+                from .aws import s3_client
+                self._s3 = s3_client()
+            return self._s3
+
+    def _open_http(self, url):
+        o = urlparse(url)
+        if o.username or (o.scheme in getproxies() and not proxy_bypass(o.hostname or '')):
+            return urlopen(url)
+
+        key = (o.scheme, o.netloc)
+        path = (o.path or '/') + ('?' + o.query if o.query else '')
+        while True:
+            with self._lock:
+                idle = self._idle.get(key)
+                conn = idle.pop() if idle else None
+            reused = conn is not None
+            if conn is None:
+                conn = (HTTPSConnection if o.scheme == 'https' else HTTPConnection)(o.netloc)
+            try:
+                conn.request('GET', path)
+                response = conn.getresponse()
+                body = response.read()
+            except (HTTPException, OSError):
+                conn.close()
+                if reused:
+                    # Server closed an idle connection, retry on a new one
+                    continue
+                raise
+            if response.will_close:
+                conn.close()
+            else:
+                with self._lock:
+                    self._idle.setdefault(key, []).append(conn)
+            if response.status != 200:
+                return urlopen(url)
+            return io.BytesIO(body)
+
+
 _PROTOCOL_OPENERS = {
     's3': _open_from_s3,
     'ftp': _open_with_urllib,
@@ -75,8 +152,28 @@ def parse_yaml(doc: str) -> Mapping[str, Any]:
     return yaml.load(doc, Loader=SafeLoader)
 
 
+# Maps every digit to b'0' and anything else to b' ', to find runs of digits quickly
+_DIGITS_TABLE = bytes(0x30 if 0x30 <= i <= 0x39 else 0x20 for i in range(256))
+# orjson reads integers outside the int64/uint64 range as floats: anything with 19 digits
+# or more may be one (e.g. -9223372036854775809)
+_LONG_DIGITS = b'0' * 19
+
+
+def _json_loads(data):
+    if orjson is not None and _LONG_DIGITS not in data.translate(_DIGITS_TABLE):
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    # NaN, UTF-16 and integers that orjson would read as floats are left to the standard library
+    return json.loads(data)
+
+
 def load_from_json(handle):
-    yield json.load(handle)
+    data = handle.read()
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    yield _json_loads(data)
 
 
 def load_from_netcdf(path):
@@ -91,7 +188,7 @@ _PARSERS = {
 }
 
 
-def load_documents(path):
+def load_documents(path, connections=None):
     """
     Load document/s from the specified path.
 
@@ -102,6 +199,7 @@ def load_documents(path):
      - Data Cube Dataset Documents inside local NetCDF files.
 
     :param path: path or URI to load documents from
+    :param connections: Connections to reuse for remote documents (optional)
     :return: generator of dicts
     """
     path = str(path)
@@ -113,7 +211,8 @@ def load_documents(path):
         path = uri_to_local_path(url)
         yield from load_from_netcdf(path)
     else:
-        with _PROTOCOL_OPENERS[scheme](url) as fh:
+        opener = _PROTOCOL_OPENERS[scheme] if connections is None else connections.open
+        with opener(url) as fh:
             if compressed:
                 fh = gzip.open(fh)
                 path = path[:-3]
@@ -125,7 +224,7 @@ def load_documents(path):
             yield from parser(fh)
 
 
-def read_documents(*paths, uri=False):
+def read_documents(*paths, uri=False, jobs=1, connections=None):
     """
     Read and parse documents from the filesystem or remote URLs (yaml or json).
 
@@ -135,14 +234,22 @@ def read_documents(*paths, uri=False):
     Data Cube we store JSONB in PostgreSQL and it will turn our dates
     into strings anyway.
 
+    With more than one job, files are fetched and parsed ahead of the consumer
+    on a pool of threads that share persistent HTTP connections and an S3 client.
+    Documents are still returned in the order of ``paths``, and a file
+    that fails to load raises in its place in the stream.
+
     :param uri: When True yield URIs instead of Paths
     :param paths: input Paths or URIs
+    :param jobs: Number of files to fetch concurrently
+    :param connections: Connection pool to fetch remote files with, e.g. one shared by several
+                        concurrent readers. By default a pool is only used with more than one job.
     :type uri: Bool
     :rtype: tuple[(str, dict)]
     """
 
-    def process_file(path):
-        docs = load_documents(path)
+    def process_file(path, connections=None):
+        docs = load_documents(path, connections=connections)
 
         if not uri:
             for doc in docs:
@@ -162,9 +269,9 @@ def read_documents(*paths, uri=False):
                                           if_one=add_uri_no_part,
                                           if_many=add_uri_with_part)
 
-    for path in paths:
+    def read_file(path, connections=None):
         try:
-            yield from process_file(path)
+            yield from process_file(path, connections)
         except InvalidDocException as e:
             raise e
         except (yaml.YAMLError, ValueError) as e:
@@ -172,6 +279,18 @@ def read_documents(*paths, uri=False):
         except Exception as e:
             raise InvalidDocException('Failed to load %s: %s' % (path, e))
 
+    if jobs > 1:
+        pool = ConnectionPool() if connections is None else connections
+        try:
+            for _, docs in prefetch_map(lambda path: list(read_file(path, pool)), paths, jobs):
+                yield from docs.result()
+        finally:
+            if connections is None:
+                pool.close()
+    else:
+        for path in paths:
+            yield from read_file(path, connections)
+
 
 def netcdf_extract_string(chars):
     """
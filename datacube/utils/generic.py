@@ -4,14 +4,20 @@
 # SPDX-License-Identifier: Apache-2.0
 import itertools
 import threading
-from typing import Any
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Iterable, Iterator, Optional, Tuple, TypeVar
 
 EOS = object()
 _LCL = threading.local()
+T = TypeVar("T")
+R = TypeVar("R")
 
 __all__ = (
     "EOS",
+    "batched",
     "map_with_lookahead",
+    "prefetch_map",
     "qmap",
     "it2q",
     "thread_local_cache",
@@ -45,6 +51,50 @@ def map_with_lookahead(it, if_one=None, if_many=None):
         yield proc(v)
 
 
+def batched(it: Iterable[T], n: int) -> Iterator[list[T]]:
+    """
+    Split an iterable into lists of length ``n``, last list can be shorter.
+
+    [1, 2, 3, 4, 5], 2 => [1, 2], [3, 4], [5]
+    """
+    if n < 1:
+        raise ValueError("Batch size must be at least one")
+    it = iter(it)
+    while batch := list(itertools.islice(it, n)):
+        yield batch
+
+
+def prefetch_map(func: Callable[[T], R],
+                 it: Iterable[T],
+                 jobs: int,
+                 lookahead: Optional[int] = None) -> Iterator[Tuple[T, "Future[R]"]]:
+    """
+    Apply a function to every element of a stream on a pool of worker threads.
+
+    At most ``lookahead`` calls (by default twice the number of workers) are
+    submitted ahead of the consumer, so long streams are not read into memory.
+
+    :param func: Function to apply
+    :param it: Stream of inputs
+    :param jobs: Number of worker threads
+    :param lookahead: Maximum number of calls in flight
+    :return: ``(input, future)`` pairs in input order. Errors raised by ``func``
+             are re-raised by ``future.result()``.
+    """
+    if jobs < 1:
+        raise ValueError("Need at least one worker thread")
+    lookahead = max(lookahead or 2 * jobs, 1)
+
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        pending: deque = deque()
+        for item in it:
+            pending.append((item, pool.submit(func, item)))
+            if len(pending) >= lookahead:
+                yield pending.popleft()
+        while pending:
+            yield pending.popleft()
+
+
 def qmap(func, q, eos_marker=EOS):
     """ Converts queue to an iterator.
 
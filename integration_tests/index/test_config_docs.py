@@ -339,7 +339,7 @@ def test_product_update_cli(index: Index,
     def get_current(index, product_doc):
         # It's calling out to a separate instance to update the product (through the cli),
         # so we need to clear our local index object's cache to get the updated one.
-        index.products.get_by_name_unsafe.cache_clear()
+        index._invalidate_catalogue()
 
         return sanitise_doc(index.products.get_by_name(product_doc['name']).definition)
     # Update an unchanged file, should be unchanged.
@@ -400,7 +400,7 @@ def test_product_delete(index, ls8_eo3_product: Product):
 
     index.products.delete([ls8_eo3_product])
 
-    index.products.get_by_name_unsafe.cache_clear()
+    index._invalidate_catalogue()
     assert index.products.get_by_name(ls8_eo3_product.name) is None
     assert not _object_exists(index, "dix_ga_ls8c_ard_3_region_code")
     assert not _object_exists(index, "dv_ga_ls8c_ard_3_dataset")
@@ -422,7 +422,7 @@ def test_product_delete_cli(index: Index,
     assert "ga_ls8c_ard_3 could not be deleted" in runner.output
     assert runner.exit_code == 0
 
-    index.products.get_by_name_unsafe.cache_clear()
+    index._invalidate_catalogue()
     assert index.products.get_by_name("ga_ls8c_ard_3") is not None
     assert index.products.get_by_name("ga_ls_wo_3") is None
 
@@ -439,7 +439,7 @@ def test_product_delete_cli(index: Index,
                        verbose_flag=False, expect_success=False)
     assert "No dataset found with id" in runner.output
 
-    index.products.get_by_name_unsafe.cache_clear()
+    index._invalidate_catalogue()
     assert index.products.get_by_name("ga_ls8c_ard_3") is None
 
     # should be able to add product back now
@@ -24,6 +24,18 @@ def test_index_clone_small_batch(index_pair_populated_empty):
     assert results["datasets"].skipped == 0
 
 
+def test_index_clone_parallel_resume(index_pair_populated_empty, tmp_path):
+    pop_idx, empty_idx = index_pair_populated_empty
+    checkpoint = tmp_path / "clone.json"
+    results = empty_idx.clone(pop_idx, workers=2, checkpoint=checkpoint)
+    assert "ga_ls8c_ard_3" in results["products"].safe
+    assert results["datasets"].completed > 0
+    assert results["datasets"].skipped == 0
+    assert checkpoint.exists()
+    # Completed clone is not repeated
+    assert empty_idx.clone(pop_idx, workers=2, checkpoint=checkpoint) == results
+
+
 def test_index_clone_cli(cfg_env_pair, index_pair_populated_empty, clirunner):
     source_cfg, target_cfg = cfg_env_pair
     clirunner([
@@ -47,3 +59,14 @@ def test_index_clone_cli_small_batch(cfg_env_pair, index_pair_populated_empty, c
         '--batch-size', '2',
         source_cfg._name
     ], skip_env=True, expect_success=True)
+
+
+def test_index_clone_cli_parallel(cfg_env_pair, index_pair_populated_empty, clirunner, tmp_path):
+    source_cfg, target_cfg = cfg_env_pair
+    clirunner([
+        '-E', target_cfg._name,
+        'system', 'clone',
+        '--workers', '2',
+        '--checkpoint', str(tmp_path / "clone.json"),
+        source_cfg._name
+    ], skip_env=True, expect_success=True)
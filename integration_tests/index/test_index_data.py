@@ -11,7 +11,7 @@ import copy
 import datetime
 import sys
 from pathlib import Path
-from uuid import UUID
+from uuid import UUID, uuid4
 
 import pytest
 
@@ -166,6 +166,33 @@ def test_purge_datasets(index, ls8_eo3_dataset):
     assert index.datasets.get(ls8_eo3_dataset.id) is None
 
 
+def test_bulk_archive_restore_purge(index, ls8_eo3_dataset, ls8_eo3_dataset2, monkeypatch):
+    # One statement per dataset id
+    monkeypatch.setattr("datacube.index.postgis._datasets.BULK_UPDATE_BATCH_SIZE", 1)
+    monkeypatch.setattr("datacube.index.postgres._datasets.BULK_UPDATE_BATCH_SIZE", 1)
+    ids = [ls8_eo3_dataset.id, str(ls8_eo3_dataset2.id), uuid4()]
+
+    index.datasets.archive(ids)
+    assert index.datasets.get(ls8_eo3_dataset.id).is_archived
+    assert index.datasets.get(ls8_eo3_dataset2.id).is_archived
+    index.datasets.restore(ids[1:])
+    assert index.datasets.get(ls8_eo3_dataset.id).is_archived
+    assert not index.datasets.get(ls8_eo3_dataset2.id).is_archived
+
+    # Only archived datasets are purged, in the order given, and only once
+    assert index.datasets.purge(ids + [ls8_eo3_dataset.id]) == [ls8_eo3_dataset.id]
+    assert index.datasets.get(ls8_eo3_dataset.id) is None
+    assert index.datasets.get(ls8_eo3_dataset2.id) is not None
+    assert index.datasets.purge(ids, allow_delete_active=True) == [ids[1]]
+    assert index.datasets.get(ls8_eo3_dataset2.id) is None
+
+
+def test_get_all_derived_ids(index, ls8_eo3_dataset, wo_eo3_dataset):
+    with suppress_deprecations():
+        assert index.datasets.get_all_derived_ids([ls8_eo3_dataset.id]) == {wo_eo3_dataset.id}
+        assert index.datasets.get_all_derived_ids([wo_eo3_dataset.id]) == set()
+
+
 def test_purge_datasets_cli(index, ls8_eo3_dataset, clirunner):
     dsid = ls8_eo3_dataset.id
 
@@ -102,6 +102,26 @@ def test_lineage_tree_index_api_simple(index, src_lineage_tree):
     assert not src_tree.children
 
 
+@pytest.mark.parametrize('datacube_env_name', ('postgis',))
+def test_lineage_trees_index_api(index, src_lineage_tree):
+    tree, ids = src_lineage_tree
+    index.lineage.add(tree, max_depth=0)
+
+    def tree_rels(tree):
+        return set(LineageRelations(tree=tree).relations)
+
+    # Overlapping trees are each extracted in full, as for a single tree.
+    roots = [ids["root"], ids["ard1"], ids["atmos"]]
+    for max_depth in (0, 1, 2):
+        trees = index.lineage.get_source_trees(roots, max_depth=max_depth)
+        assert list(trees) == roots
+        for root in roots:
+            assert tree_rels(trees[root]) == tree_rels(index.lineage.get_source_tree(root, max_depth=max_depth))
+    trees = index.lineage.get_derived_trees([ids["atmos_parent"], ids["ard2"]])
+    assert trees[ids["atmos_parent"]].find_subtree(ids["root"]).dataset_id == ids["root"]
+    assert tree_rels(trees[ids["ard2"]]) == tree_rels(index.lineage.get_derived_tree(ids["ard2"]))
+
+
 @pytest.mark.parametrize('datacube_env_name', ('postgis',))
 def test_lineage_tree_index_api_consistent(index, src_lineage_tree, compatible_derived_tree):
     tree1, ids = src_lineage_tree
@@ -5,7 +5,10 @@
 import datetime
 from uuid import uuid4
 
+import numpy
 import pytest
+from odc.geo import CRS
+from odc.geo.geom import box
 
 from datacube.cfg import ODCEnvironment
 from datacube.testutils import gen_dataset_test_dag, suppress_deprecations
@@ -216,6 +219,17 @@ def test_mem_ds_lineage(mem_eo3_data: tuple):
     assert "cloud_cover" in dc.index.products.get_field_names(ls8_ds.product)
 
 
+def test_mem_ds_bulk_get_sources(mem_eo3_data: tuple):
+    dc, ls8_id, wo_id = mem_eo3_data
+    wo_ds, ls8_ds = dc.index.datasets.bulk_get((wo_id, ls8_id), include_sources=True)
+    assert (wo_ds.id, ls8_ds.id) == (wo_id, ls8_id)
+    # Datasets shared between the requested trees are only cloned once
+    assert wo_ds.sources["ard"] is ls8_ds
+    assert not ls8_ds.sources
+    wo_ds, = dc.index.datasets.bulk_get((wo_id,))
+    assert not wo_ds.sources
+
+
 def test_mem_ds_search_dups(mem_eo3_data: tuple):
     dc, ls8_id, wo_id = mem_eo3_data
     ls8_ds = dc.index.datasets.get(ls8_id)
@@ -421,12 +435,29 @@ def test_spatiotemporal_extent(mem_eo3_data: tuple):
         assert tmin2 == tmin and tmax2 == tmax
 
     # Spatial extent
-    assert dc.index.products.spatial_extent(ls8.product) is None
-    assert dc.index.datasets.spatial_extent([ls8_id, wo_id]) is None
+    epsg4326 = CRS("EPSG:4326")
+    epsg3577 = CRS("EPSG:3577")
+    ext_ls8 = dc.index.datasets.spatial_extent([ls8_id], crs=epsg4326)
+    ext_both = dc.index.datasets.spatial_extent([ls8_id, wo_id], crs=epsg4326)
+    assert ext_ls8 is not None and ext_both is not None
+    assert ext_ls8.difference(ext_both).area < 0.001
+    assert ls8.extent.to_crs(epsg4326).intersects(ext_ls8)
+    assert dc.index.products.spatial_extent(ls8.product, crs=epsg4326) == ext_ls8
+    assert dc.index.products.spatial_extent(ls8.product.name, crs=epsg4326) == ext_ls8
+    # No spatial index for 3577, so reprojected from 4326
+    ext_ls8_3577 = dc.index.datasets.spatial_extent([ls8_id], crs=epsg3577)
+    assert ext_ls8_3577.crs == epsg3577
+    assert ext_ls8_3577.intersects(ls8.extent.to_crs(epsg3577))
+    assert dc.index.datasets.spatial_extent([uuid4()]) is None
+    with pytest.raises(KeyError):
+        dc.index.products.spatial_extent("spaghetti_product")
 
 
 def test_mem_ds_archive_purge(mem_eo3_data: tuple):
     dc, ls8_id, wo_id = mem_eo3_data
+    with suppress_deprecations():
+        assert dc.index.datasets.get_all_derived_ids([ls8_id]) == {wo_id}
+        assert dc.index.datasets.get_all_derived_ids([str(ls8_id), wo_id]) == set()
     # Test archiving, restoring and purging datasets
     # Both datasets are not archived
     all_ids = list(dc.index.datasets.get_all_dataset_ids(False))
@@ -497,6 +528,84 @@ def test_mem_ds_search_and_count(mem_eo3_data: tuple):
     assert len(lds) == 2
 
 
+def test_mem_ds_search_ranges(mem_eo3_data: tuple):
+    dc, ls8_id, wo_id = mem_eo3_data
+    day = Range(datetime.datetime(2016, 5, 12), datetime.datetime(2016, 5, 13))
+    lds = list(dc.index.datasets.search(time=day))
+    assert {ds.id for ds in lds} == {ls8_id, wo_id}
+    assert not list(dc.index.datasets.search(time=Range(datetime.datetime(2017, 1, 1), None)))
+    lds = list(dc.index.datasets.search(product="ga_ls_wo_3", lat=Range(-38.0, -37.0), lon=Range(None, 180.0)))
+    assert [ds.id for ds in lds] == [wo_id]
+    lds = list(dc.index.datasets.search(product="ga_ls8c_ard_3", cloud_cover=Range(None, 100.0), time=day))
+    assert [ds.id for ds in lds] == [ls8_id]
+    assert dc.index.datasets.count(lat=Range(0, 10)) == 0
+
+    # Search indexes follow updates and purges
+    from datacube.utils import changes
+    ls8 = dc.index.datasets.get(ls8_id)
+    ls8.metadata_doc["properties"]["eo:cloud_cover"] = 5.0
+    dc.index.datasets.update(ls8, updates_allowed={("properties", "eo:cloud_cover"): changes.allow_any})
+    lds = list(dc.index.datasets.search(cloud_cover=Range(0.0, 10.0)))
+    assert [ds.id for ds in lds] == [ls8_id]
+    assert dc.index.datasets.get(ls8_id).sources is None
+    assert list(dc.index.datasets.search(cloud_cover=Range(0.0, 10.0)))[0].sources is not None
+
+    assert dc.index.datasets.purge([ls8_id]) == []
+    assert dc.index.datasets.has(ls8_id)
+    dc.index.datasets.archive([ls8_id])
+    assert dc.index.datasets.purge([ls8_id]) == [ls8_id]
+    assert not list(dc.index.datasets.search(archived=None, cloud_cover=Range(0.0, 10.0)))
+
+
+def test_mem_ds_spatial_search(mem_eo3_data: tuple):
+    dc, ls8_id, wo_id = mem_eo3_data
+    epsg4326 = CRS("EPSG:4326")
+    epsg3577 = CRS("EPSG:3577")
+    assert dc.index.supports_spatial_indexes
+    assert list(dc.index.spatial_indexes()) == [epsg4326]
+    # WKT CRS which cannot be mapped to an EPSG number.
+    assert not dc.index.create_spatial_index(CRS(
+        'GEOGCS["GCS_WGS_1984",DATUM["D_WGS_1984",SPHEROID["WGS_1984",6378137,298.257223563]]'
+        ',PRIMEM["Weird",22.3],UNIT["Degree",0.017453292519943295]]'
+    ))
+    assert dc.index.create_spatial_index(epsg3577)
+    assert set(dc.index.spatial_indexes(refresh=True)) == {epsg3577, epsg4326}
+    # Newly created indexes are empty until updated
+    assert dc.index.datasets.spatial_extent([ls8_id], crs=epsg3577) is None
+    assert dc.index.update_spatial_index(crses=[epsg3577], dataset_ids=[ls8_id]) == 1
+    assert dc.index.update_spatial_index(product_names=["ga_ls_wo_3"], dataset_ids=[ls8_id]) == 4
+    assert dc.index.update_spatial_index() == 4
+    # Resuming after the first dataset id
+    first_id, last_id = sorted((ls8_id, wo_id))
+    progress = []
+    assert dc.index.update_spatial_index(
+        after=first_id, progress=lambda count, last: progress.append((count, last))
+    ) == 2
+    assert progress == [(1, last_id)]
+
+    ls8 = dc.index.datasets.get(ls8_id)
+    for crs in (epsg4326, epsg3577):
+        exact = ls8.extent.to_crs(crs)
+        assert {ds.id for ds in dc.index.datasets.search(geopolygon=exact)} == {ls8_id, wo_id}
+        assert dc.index.datasets.count(product=ls8.product.name, geopolygon=exact) == 1
+        results = dc.index.datasets.search_returning(["id"], product=ls8.product.name, geopolygon=exact)
+        assert [str(r.id) for r in results] == [str(ls8_id)]
+    # CRS with no spatial index is searched in 4326
+    assert dc.index.datasets.count(geopolygon=ls8.extent.to_crs("EPSG:3857")) == 2
+    far_away = box(10, 10, 11, 11, crs=epsg4326)
+    assert dc.index.datasets.count(geopolygon=far_away) == 0
+    with pytest.raises(ValueError):
+        list(dc.index.datasets.search(geopolygon=far_away, lat=Range(10, 11)))
+
+    # Spatial indexes follow purges and can be dropped
+    dc.index.datasets.archive([wo_id])
+    assert dc.index.datasets.purge([wo_id]) == [wo_id]
+    assert [ds.id for ds in dc.index.datasets.search(geopolygon=ls8.extent)] == [ls8_id]
+    assert dc.index.drop_spatial_index(epsg3577)
+    assert dc.index.spatial_indexes() == [epsg4326]
+    assert [ds.id for ds in dc.index.datasets.search(geopolygon=ls8.extent.to_crs(epsg3577))] == [ls8_id]
+
+
 def test_mem_ds_search_and_count_by_product(mem_eo3_data: tuple):
     dc, ls8_id, wo_id = mem_eo3_data
     # No source_filter; no results
@@ -559,6 +668,35 @@ def test_mem_ds_search_returning(mem_eo3_data: tuple):
             assert res.id in (str(ls8_id), str(wo_id))
 
 
+def test_mem_ds_search_columnar(mem_eo3_data: tuple):
+    dc, ls8_id, wo_id = mem_eo3_data
+    batches = list(dc.index.datasets.search_columnar(
+        field_names=["id", "platform", "time"],
+        custom_offsets={"cloud_cover": ["properties", "eo:cloud_cover"]},
+        platform='landsat-8',
+        batch_size=1,
+    ))
+    assert len(batches) == 2
+    for columns in batches:
+        assert list(columns) == ["id", "platform", "time_begin", "time_end", "cloud_cover"]
+        assert columns["platform"].tolist() == ["landsat-8"]
+        assert columns["time_begin"].dtype == numpy.dtype("datetime64[us]")
+        assert 58.9 < columns["cloud_cover"][0] < 59.0
+    assert {str(columns["id"][0]) for columns in batches} == {str(ls8_id), str(wo_id)}
+
+
+def test_mem_ds_search_to_arrow(mem_eo3_data: tuple):
+    pa = pytest.importorskip("pyarrow")
+    dc, ls8_id, wo_id = mem_eo3_data
+    table = dc.index.datasets.search_to_arrow(field_names=["id", "platform", "time"], platform='landsat-8')
+    assert table.num_rows == 2
+    assert table.schema.field("time_begin").type == pa.timestamp("us", tz="UTC")
+    assert set(table.column("id").to_pylist()) == {str(ls8_id), str(wo_id)}
+    table = dc.index.datasets.search_to_arrow(field_names=["id", "platform"], platform='sentinel-2')
+    assert table.num_rows == 0
+    assert table.column_names == ["id", "platform"]
+
+
 def test_mem_ds_search_summary(mem_eo3_data: tuple):
     dc, ls8_id, wo_id = mem_eo3_data
     lds = list(dc.index.datasets.search_returning(platform='landsat-8'))
@@ -684,6 +822,67 @@ def test_memory_dataset_add(dataset_add_configs, mem_index_fresh: Datacube):
     assert ds_from_idx.sources['ac'].sources["cd"].id == ds_.sources['ac'].sources['cd'].id
 
 
+def test_memory_dataset_add_batched(dataset_add_configs, mem_index_fresh: Datacube):
+    from datacube.index.hl import Doc2Dataset
+    from datacube.scripts.dataset import index_datasets_in_batches, parallel_dataset_stream
+    idx = mem_index_fresh.index
+    for path, metadata_doc in read_documents(dataset_add_configs.metadata):
+        idx.metadata_types.add(idx.metadata_types.from_doc(metadata_doc))
+    for path, product_doc in read_documents(dataset_add_configs.products):
+        idx.products.add_document(product_doc)
+    paths = [dataset_add_configs.datasets, dataset_add_configs.datasets_bad1, dataset_add_configs.datasets_eo3]
+    resolver = Doc2Dataset(idx)
+    dss = list(parallel_dataset_stream(paths, resolver, jobs=3))
+    # Datasets are returned in input order, with failures skipped
+    expected = [ds.id for path in paths for ds in parallel_dataset_stream([path], resolver, jobs=1)]
+    assert [ds.id for ds in dss] == expected
+
+    assert index_datasets_in_batches(dss, idx, batch_size=2, auto_add_lineage=True,
+                                     dry_run=True, archive_less_mature=None) == (len(dss), 0, 0)
+    assert not any(idx.datasets.bulk_has([ds.id for ds in dss]))
+    added, existing, failed = index_datasets_in_batches(dss, idx, batch_size=2, auto_add_lineage=True,
+                                                        dry_run=False, archive_less_mature=None)
+    assert (added, existing, failed) == (len(dss), 0, 0)
+    assert all(idx.datasets.bulk_has([ds.id for ds in dss]))
+    # Datasets with sources were added with their lineage
+    ds_ = SimpleDocNav(gen_dataset_test_dag(1, force_tree=True))
+    ds_from_idx = idx.datasets.get(ds_.id, include_sources=True)
+    assert ds_from_idx.sources['ab'].id == ds_.sources['ab'].id
+    assert index_datasets_in_batches(dss, idx, batch_size=2, auto_add_lineage=True,
+                                     dry_run=False, archive_less_mature=None) == (0, len(dss), 0)
+
+
+def test_memory_dataset_add_batched_skipped(dataset_add_configs, mem_index_fresh: Datacube, monkeypatch):
+    from datacube.index.abstract import BatchStatus
+    from datacube.index.hl import Doc2Dataset
+    from datacube.scripts.dataset import index_datasets_in_batches, dataset_stream
+    from datacube.ui.common import ui_path_doc_stream
+    idx = mem_index_fresh.index
+    for path, metadata_doc in read_documents(dataset_add_configs.metadata):
+        idx.metadata_types.add(idx.metadata_types.from_doc(metadata_doc))
+    for path, product_doc in read_documents(dataset_add_configs.products):
+        idx.products.add_document(product_doc)
+    dss = list(dataset_stream(ui_path_doc_stream([dataset_add_configs.datasets_eo3], uri=True), Doc2Dataset(idx)))
+    add_batch = idx.datasets._add_batch
+
+    # Drivers report datasets that could not be added as skipped
+    monkeypatch.setattr(idx.datasets, "_add_batch",
+                        lambda batch_ds, cache: BatchStatus(0, len(batch_ds), 0.0))
+    assert index_datasets_in_batches(dss, idx, batch_size=10, auto_add_lineage=False,
+                                     dry_run=False, archive_less_mature=None) == (0, 0, len(dss))
+    assert not any(idx.datasets.bulk_has([ds.id for ds in dss]))
+
+    # ... and also datasets already in the index, e.g. added by another process after the batch was checked
+    def add_batch_after_another_process(batch_ds, cache):
+        res = add_batch(batch_ds, cache)
+        return BatchStatus(0, res.completed, res.seconds_elapsed)
+
+    monkeypatch.setattr(idx.datasets, "_add_batch", add_batch_after_another_process)
+    assert index_datasets_in_batches(dss, idx, batch_size=10, auto_add_lineage=False,
+                                     dry_run=False, archive_less_mature=None) == (0, len(dss), 0)
+    assert all(idx.datasets.bulk_has([ds.id for ds in dss]))
+
+
 def test_mem_transactions(mem_index_fresh: Datacube):
     trans = mem_index_fresh.index.transaction()
     assert not trans.active
@@ -729,6 +928,35 @@ def test_default_clone_bulk_ops_multiloc(
         assert len(mem_index_fresh.index.datasets.get(ls8_eo3_dataset.id)._uris) == 2
 
 
+def test_mem_clone_checkpoint(mem_eo3_data: tuple, in_memory_config, tmp_path):
+    import json
+    dc, ls8_id, wo_id = mem_eo3_data
+    checkpoint = tmp_path / "clone.json"
+    with Datacube(env=in_memory_config) as clone_dc:
+        results = clone_dc.index.clone(dc.index, checkpoint=checkpoint)
+        assert results["datasets"].completed == 2
+        assert clone_dc.index.datasets.has(ls8_id)
+        assert clone_dc.index.datasets.has(wo_id)
+        # A completed clone has nothing left to do
+        assert clone_dc.index.clone(dc.index, checkpoint=checkpoint) == results
+
+        # Resume a clone interrupted part way through the datasets
+        state = json.loads(checkpoint.read_text())
+        del state["phases"]["datasets"]
+        del state["phases"]["lineage"]
+        del state["products"][clone_dc.index.datasets.get(wo_id).product.name]
+        checkpoint.write_text(json.dumps(state))
+        resumed = clone_dc.index.clone(dc.index, checkpoint=checkpoint)
+        assert resumed["products"] == results["products"]
+        # Only the interrupted product is cloned again
+        assert resumed["datasets"].completed + resumed["datasets"].skipped == 1
+
+    # Checkpoints are specific to the indexes being cloned
+    with Datacube(env=in_memory_config) as other_dc:
+        with pytest.raises(ValueError):
+            other_dc.index.clone(dc.index, checkpoint=checkpoint)
+
+
 def test_default_clone_bulk_ops_reverse(mem_eo3_data: tuple, index):
     mem_idx, ls8id, woid = mem_eo3_data
     index.clone(mem_idx.index)
@@ -84,6 +84,159 @@ def test_spatial_index_crs_validity(index: Index,
     assert index.update_spatial_index(crses=[epsg3577]) == 2
 
 
+@pytest.mark.parametrize('datacube_env_name', ('postgis',))
+def test_spatial_index_resume(index: Index,
+                              ls8_eo3_product,
+                              ls8_eo3_dataset, ls8_eo3_dataset2,
+                              ls8_eo3_dataset3, ls8_eo3_dataset4):
+    epsg3577 = CRS("EPSG:3577")
+    datasets = sorted((ls8_eo3_dataset, ls8_eo3_dataset2, ls8_eo3_dataset3, ls8_eo3_dataset4),
+                      key=lambda ds: ds.id)
+    index.create_spatial_index(epsg3577)
+    progress = []
+    assert index.update_spatial_index(
+        crses=[epsg3577],
+        after=datasets[1].id,
+        progress=lambda count, last: progress.append((count, last))
+    ) == 2
+    assert progress == [(2, datasets[3].id)]
+    assert index.datasets.spatial_extent([ds.id for ds in datasets[:2]], crs=epsg3577) is None
+    # Extents transformed by the database match those transformed by odc-geo
+    for ds in datasets[2:]:
+        expected = ds.extent.to_crs(epsg3577)
+        ext = index.datasets.spatial_extent([ds.id], crs=epsg3577)
+        assert ext.symmetric_difference(expected).area < expected.area * 1e-6
+    assert index.update_spatial_index(crses=[epsg3577], product_names=[ls8_eo3_product.name]) == 4
+
+
+@pytest.mark.parametrize('datacube_env_name', ('postgis',))
+def test_search_index_update(index: Index,
+                             ls8_eo3_product,
+                             ls8_eo3_dataset, ls8_eo3_dataset2,
+                             ls8_eo3_dataset3, ls8_eo3_dataset4):
+    from sqlalchemy import delete, select
+    from datacube.drivers.postgis._schema import search_field_indexes
+
+    def search_rows(conn):
+        return {
+            tuple(row)
+            for table in search_field_indexes.values()
+            for row in conn.execute(select(table.dataset_ref, table.search_key, table.search_val))
+        }
+
+    with index._active_connection() as conn:
+        # Rows extracted in Python when the datasets were added
+        expected = search_rows(conn)
+        assert expected
+        for table in search_field_indexes.values():
+            conn.execute(delete(table))
+        progress = []
+        assert conn.update_search_index(
+            product_names=[ls8_eo3_product.name],
+            batch_size=3,
+            progress=lambda count, last: progress.append(count)
+        ) == 4
+        assert progress == [3, 4]
+        assert search_rows(conn) == expected
+
+
+@pytest.mark.parametrize('datacube_env_name', ('postgis',))
+@pytest.mark.parametrize('bulk_add_copy', (False, True))
+def test_add_batch(index: Index,
+                   ls8_eo3_product,
+                   ls8_eo3_dataset, ls8_eo3_dataset2,
+                   ls8_eo3_dataset3, ls8_eo3_dataset4,
+                   bulk_add_copy, monkeypatch):
+    from sqlalchemy import select
+    from datacube.drivers.postgis._schema import search_field_indexes
+
+    def index_rows(conn):
+        spatial_index = conn._db.spatial_index(CRS("EPSG:4326"))
+        return {
+            tuple(row)
+            for table in search_field_indexes.values()
+            for row in conn.execute(select(table.dataset_ref, table.search_key, table.search_val))
+        }, {
+            tuple(row)
+            for row in conn.execute(select(spatial_index.dataset_ref, spatial_index.extent.ST_AsText()))
+        }
+
+    # Set from the db_bulk_add_copy config option, INSERT by default
+    assert not index.datasets._bulk_add_copy
+    monkeypatch.setattr(index.datasets, "_bulk_add_copy", bulk_add_copy)
+    ids = [ls8_eo3_dataset.id, ls8_eo3_dataset2.id, ls8_eo3_dataset3.id, ls8_eo3_dataset4.id]
+    docs = list(index.datasets.get_all_docs(products=[ls8_eo3_product]))
+    with index._active_connection() as conn:
+        # Rows written when the datasets were added one at a time
+        expected = index_rows(conn)
+
+    index.datasets.archive(ids)
+    index.datasets.purge(ids)
+    res = index.datasets.bulk_add(docs, batch_size=3)
+    assert (res.completed, res.skipped) == (4, 0)
+    with index._active_connection() as conn:
+        assert index_rows(conn) == expected
+
+    if bulk_add_copy:
+        # Existing datasets are skipped
+        res = index.datasets.bulk_add(docs + docs[:1], batch_size=10)
+        assert (res.completed, res.skipped) == (0, 5)
+        with index._active_connection() as conn:
+            assert index_rows(conn) == expected
+
+
+@pytest.mark.parametrize('datacube_env_name', ('postgis',))
+def test_search_lean(index: Index,
+                     ls8_eo3_product,
+                     ls8_eo3_dataset, ls8_eo3_dataset2,
+                     ls8_eo3_dataset3, ls8_eo3_dataset4):
+    full = {ds.id: ds for ds in index.datasets.search(product=ls8_eo3_product.name)}
+    lean = list(index.datasets.search_lean(product=ls8_eo3_product.name, batch_size=3))
+    assert {ds.id for ds in lean} == set(full)
+    for ds in lean:
+        # Read from the search results, without fetching the document
+        assert ds._metadata_doc is None
+        assert ds.uri == full[ds.id].uri
+        assert ds.time == full[ds.id].time
+        assert ds.crs == full[ds.id].crs
+        assert ds.extent == full[ds.id].extent
+    for ds in lean:
+        assert ds.metadata_doc == full[ds.id].metadata_doc
+        assert ds.measurements == full[ds.id].measurements
+
+
+@pytest.mark.parametrize('datacube_env_name', ('postgis',))
+def test_load_lineage_relations(index: Index):
+    from uuid import uuid4
+    from datacube.model import LineageDirection, LineageRelation
+
+    a, b, c, d = (uuid4() for _ in range(4))
+    # a <- b <- c <- d, with d also derived directly from b
+    relations = {
+        LineageRelation(classifier="x", source_id=a, derived_id=b),
+        LineageRelation(classifier="x", source_id=b, derived_id=c),
+        LineageRelation(classifier="x", source_id=c, derived_id=d),
+        LineageRelation(classifier="y", source_id=b, derived_id=d),
+    }
+    with index._active_connection() as conn:
+        conn.write_relations(relations, allow_updates=False)
+        assert set(conn.load_lineage_relations([d], LineageDirection.SOURCES, 0)) == relations
+        assert set(conn.load_lineage_relations([d], LineageDirection.SOURCES, 1)) == {
+            rel for rel in relations if rel.derived_id == d
+        }
+        assert set(conn.load_lineage_relations([c], LineageDirection.SOURCES, 2)) == {
+            rel for rel in relations if rel.derived_id in (b, c)
+        }
+        assert set(conn.load_lineage_relations([a], LineageDirection.DERIVED, 0)) == relations
+        assert conn.load_lineage_relations([], LineageDirection.DERIVED, 0) == []
+
+        # Cycles terminate
+        cycle = LineageRelation(classifier="z", source_id=d, derived_id=a)
+        conn.write_relations([cycle], allow_updates=False)
+        assert set(conn.load_lineage_relations([d], LineageDirection.SOURCES, 0)) == relations | {cycle}
+        assert set(conn.load_lineage_relations([b], LineageDirection.DERIVED, 0)) == relations | {cycle}
+
+
 def test_spatial_index_crs_sanitise():
     epsg4326 = CRS("EPSG:4326")
     epsg3857 = CRS("EPSG:3857")
@@ -233,6 +233,32 @@ def test_dataset_eo3_no_schema(dataset_add_configs, index_empty, clirunner, capl
     assert "will not be recognised as an eo3 dataset" in warnings[0].msg
 
 
+def test_dataset_add_batched(dataset_add_configs, index_empty, clirunner):
+    p = dataset_add_configs
+    index = index_empty
+    clirunner(['metadata', 'add', p.metadata])
+    clirunner(['product', 'add', p.products])
+    r = clirunner(['dataset', 'add', '--jobs', '2', '--batch-size', '2',
+                   p.datasets, p.datasets_bad1, p.datasets_eo3])
+    assert "0 already indexed, 0 failed" in r.output
+
+    ds = load_dataset_definition(p.datasets)
+    ds_bad1 = load_dataset_definition(p.datasets_bad1)
+    ds_eo3 = load_dataset_definition(p.datasets_eo3)
+    assert index.datasets.has(ds.id)
+    assert not index.datasets.has(ds_bad1.id)
+    x = index.datasets.get(ds.id, include_sources=True)
+    assert x.sources['ac'].sources['cd'].id == ds.sources['ac'].sources['cd'].id
+    _ds = index.datasets.get(ds_eo3.id, include_sources=True)
+    assert sorted(_ds.sources) == ['a', 'bc1', 'bc2']
+    assert _ds.uri == ds_eo3.location
+
+    # Re-adding skips datasets already in the index
+    r = clirunner(['dataset', 'add', '--batch-size', '10', p.datasets, p.datasets_eo3])
+    assert "Added 0 datasets" in r.output
+    assert "2 already indexed, 0 failed" in r.output
+
+
 # Current formulation of this test relies on non-EO3 test data
 @pytest.mark.parametrize('datacube_env_name', ('datacube', ))
 def test_dataset_add(dataset_add_configs, index_empty, clirunner):
@@ -0,0 +1,54 @@
+"""
+Compare adding batches of datasets to a postgis index with INSERT statements (the default)
+against COPYing them into staging tables (the db_bulk_add_copy config option).
+
+Synthetic datasets are made by copying the document of an existing dataset of the
+product with new ids. Batches of 1k, 10k and 100k datasets are added to a postgis
+index with each implementation, and purged again afterwards.
+
+Usage: python odc_add_batch_profile.py [ENV] [PRODUCT]
+"""
+import sys
+
+from uuid import uuid4
+
+from datacube import Datacube
+from datacube.index._clone import format_batch_status
+
+BATCH_SIZES = (1000, 10000, 100000)
+
+
+def make_batch(product, template, size):
+    return [(product, dict(template.metadata_doc, id=str(uuid4())), template.uri) for _ in range(size)]
+
+
+def run(label, use_copy, dc, batch):
+    dc.index.datasets._bulk_add_copy = use_copy
+    res = dc.index.datasets._add_batch(batch, {})
+    print(f"Test {label}: {format_batch_status(res, 'datasets')}")
+    ids = [doc["id"] for _, doc, _ in batch]
+    dc.index.datasets.purge(ids, allow_delete_active=True)
+    return res.seconds_elapsed
+
+
+def main(args):
+    env = args[0] if args else "datacube_real"
+    product_name = args[1] if len(args) > 1 else "ga_ls8c_ard_3"
+    print("Testing on database ", env)
+    dc = Datacube(env=env)
+    if dc.index.name != "pgis_index":
+        print("Requires a postgis index")
+        return
+    product = dc.index.products.get_by_name_unsafe(product_name)
+    template = next(iter(dc.index.datasets.search(product=product_name, limit=1)))
+    for size in BATCH_SIZES:
+        batch = make_batch(product, template, size)
+        before = run(f"insert-{size}", False, dc, batch)
+        after = run(f"copy-{size}", True, dc, batch)
+        print(f"Speedup: {before / after if after else float('inf'):.1f}x")
+        print()
+        print("-----------------------------------------------------------------")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,89 @@
+"""
+Compare memory use and speed of find_datasets with full and lean datasets.
+
+For each query, find_datasets is run returning full datasets and returning lean
+datasets (lean=True), measuring the time taken and the peak memory allocated
+while holding the results. The datasets are then grouped by time, as load does,
+and the time, CRS and extent of every dataset are read repeatedly, comparing
+the cached readers against a copy of the previous implementation which built
+a new DocReader on every access.
+
+Lean datasets only differ from full datasets on index drivers that can search
+without fetching metadata documents (e.g. postgis).
+
+Usage: python odc_find_datasets_profile.py [ENV] [PRODUCT]
+"""
+import sys
+import tracemalloc
+
+from datetime import datetime, timezone
+from time import monotonic
+
+from datacube import Datacube
+from datacube.api.query import query_group_by
+from datacube.model import Range
+from datacube.utils import parse_time
+
+QUERIES = {
+    "year": dict(time=Range(datetime(2016, 1, 1, tzinfo=timezone.utc), datetime(2017, 1, 1, tzinfo=timezone.utc))),
+    "region": dict(lat=Range(-30.0, -25.0), lon=Range(140.0, 145.0)),
+}
+
+
+def legacy_read(ds):
+    # Every attribute access built its own DocReader
+    time = ds.metadata_type.dataset_reader(ds.metadata_doc).time
+    time = Range(parse_time(time.begin), parse_time(time.end))
+    spatial_reference = ds.metadata_type.dataset_reader(ds.metadata_doc).grid_spatial.get("spatial_reference")
+    return ds.metadata_type.dataset_reader(ds.metadata_doc).id, time, spatial_reference
+
+
+def current_read(ds):
+    return ds.id, ds.time, ds.crs
+
+
+def find(dc, label, product, query, lean):
+    tracemalloc.start()
+    start = monotonic()
+    datasets = dc.find_datasets(product=product, lean=lean, **query)
+    elapsed = monotonic() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"Test {label}: {len(datasets)} datasets in {elapsed:.4f}s, {peak / 2**20:.1f}MiB peak")
+    return datasets
+
+
+def read(label, impl, datasets, repeats):
+    start = monotonic()
+    for _ in range(repeats):
+        for ds in datasets:
+            impl(ds)
+    elapsed = monotonic() - start
+    print(f"Test {label}: {len(datasets) * repeats} reads in {elapsed:.4f}s")
+    return elapsed
+
+
+def main(args):
+    env = args[0] if args else "datacube_real"
+    product = args[1] if len(args) > 1 else "ga_ls8c_ard_3"
+    print("Testing on database ", env)
+    dc = Datacube(env=env)
+    for name, query in QUERIES.items():
+        full = find(dc, f"full-{name}", product, query, lean=False)
+        lean = find(dc, f"lean-{name}", product, query, lean=True)
+        if {ds.id for ds in full} != {ds.id for ds in lean}:
+            print(f"Datasets differ for {name}")
+
+        start = monotonic()
+        dc.group_datasets(lean, query_group_by(group_by="time"))
+        print(f"Test group-lean-{name}: {monotonic() - start:.4f}s")
+
+        before = read(f"legacy-read-{name}", legacy_read, full, 5)
+        after = read(f"cached-read-{name}", current_read, full, 5)
+        print(f"Speedup: {before / after if after else float('inf'):.1f}x")
+        print()
+        print("-----------------------------------------------------------------")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
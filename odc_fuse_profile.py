@@ -0,0 +1,98 @@
+"""
+Compare wall time and memory use of fusing many overlapping sources.
+
+Runs `reproject_and_fuse` against a copy of the previous implementation, which
+used a full-size scratch buffer that was reset back to nodata after every source.
+
+Usage: python odc_fuse_profile.py [N_SOURCES ...]
+"""
+import sys
+import tempfile
+import tracemalloc
+
+from pathlib import Path
+from time import monotonic
+
+import numpy as np
+from odc.geo import geobox as gbx
+from odc.geo.roi import roi_is_empty
+
+from datacube.storage import reproject_and_fuse
+from datacube.storage._load import _default_fuser
+from datacube.storage._read import read_time_slice
+from datacube.testutils import mk_test_image
+from datacube.testutils.io import RasterFileDataSource, write_gtiff
+
+TILE_SHAPE = (1024, 1024)
+NODATA = -999
+
+
+def legacy_reproject_and_fuse(datasources, destination, dst_geobox, dst_nodata):
+    destination.fill(dst_nodata)
+    buffer_ = np.full(destination.shape, dst_nodata, dtype=destination.dtype)
+    for source in datasources:
+        with source.open() as rdr:
+            roi = read_time_slice(rdr, buffer_, dst_geobox, 'nearest', dst_nodata)
+
+        if not roi_is_empty(roi):
+            _default_fuser(destination[roi], buffer_[roi], dst_nodata)
+            buffer_[roi] = dst_nodata
+    return destination
+
+
+def make_sources(folder, n):
+    """ Write ``n`` tiles, each one shifted by a few pixels relative to the previous one.
+    """
+    folder.mkdir()
+    h, w = TILE_SHAPE
+    xx = mk_test_image(w, h, nodata=NODATA)
+    sources = []
+    geobox = None
+    for i in range(n):
+        mm = write_gtiff(folder/f'src-{i:03d}.tif', xx,
+                         resolution=(10, -10),
+                         offset=(10*(i % 7)*3, -10*(i % 5)*4),
+                         nodata=NODATA)
+        sources.append(RasterFileDataSource(mm.path, 1))
+        geobox = mm.geobox if geobox is None else geobox
+
+    # destination is larger than any one source
+    return sources, gbx.pad(geobox, 32)
+
+
+def run(label, impl, sources, geobox, repeats):
+    times = []
+    peaks = []
+    out = None
+    for _ in range(repeats):
+        dst = np.empty(geobox.shape, dtype='int16')
+        tracemalloc.start()
+        start = monotonic()
+        out = impl(sources, dst, geobox, NODATA)
+        times.append(monotonic() - start)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        peaks.append(peak)
+
+    print(f"Test {label}: {min(times):.4f}s best, {sum(times)/repeats:.4f}s avg, "
+          f"{max(peaks)/2**20:.1f}MiB peak allocated")
+    return out
+
+
+def main(args):
+    counts = [int(a) for a in args] or [1, 10, 50]
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in counts:
+            sources, geobox = make_sources(Path(tmp)/f'n{n}', n)
+            repeats = 5 if n < 50 else 3
+            print(f"{n} sources, destination {geobox.shape.yx}")
+            expect = run(f"legacy-{n}", legacy_reproject_and_fuse, sources, geobox, repeats)
+            actual = run(f"current-{n}", reproject_and_fuse, sources, geobox, repeats)
+            if not np.array_equal(expect, actual):
+                print(f"Output mismatch for {n} sources")
+            print()
+            print("-----------------------------------------------------------------")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
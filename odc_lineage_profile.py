@@ -0,0 +1,128 @@
+"""
+Compare loading lineage trees with a recursive query against the previous
+implementation, which issued one query per tree level from Python.
+
+A synthetic lineage graph of 100k datasets in 6 levels is written to a postgis
+index. Every derived dataset has sources in the level below, with neighbouring
+datasets sharing sources. Source trees are then loaded for datasets in the top
+level and derived trees for datasets in the bottom level, with and without a
+depth limit. The lineage relations are removed again afterwards.
+
+Usage: python odc_lineage_profile.py [ENV] [N_TREES]
+"""
+import sys
+
+from time import monotonic
+from uuid import uuid4
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+
+from datacube import Datacube
+from datacube.drivers.postgis._schema import DatasetLineage
+from datacube.model import LineageDirection, LineageRelation
+
+LEVEL_SIZES = (51200, 25600, 12800, 6400, 3200, 800)
+CLASSIFIER = "odc_lineage_profile"
+
+
+def make_graph():
+    levels = [[uuid4() for _ in range(LEVEL_SIZES[0])]]
+    relations = []
+    for size in LEVEL_SIZES[1:]:
+        sources = levels[-1]
+        fan = len(sources) // size
+        derived = [uuid4() for _ in range(size)]
+        for i, derived_id in enumerate(derived):
+            # Each dataset shares a source with its neighbour
+            for j in range(i * fan, i * fan + fan + 1):
+                relations.append(LineageRelation(classifier=CLASSIFIER,
+                                                 source_id=sources[j % len(sources)],
+                                                 derived_id=derived_id))
+        levels.append(derived)
+    return levels, relations
+
+
+def legacy_load(conn, roots, direction, depth, ids_so_far=None):
+    # Naive manually-recursive implementation, one query per tree level
+    if ids_so_far is None:
+        ids_so_far = set(roots)
+    qry = select(DatasetLineage)
+    if direction == LineageDirection.SOURCES:
+        qry = qry.where(DatasetLineage.derived_dataset_ref.in_(roots))
+    else:
+        qry = qry.where(DatasetLineage.source_dataset_ref.in_(roots))
+    relations = []
+    next_lvl_ids = set()
+    for row in conn._connection.execute(qry):
+        rel = LineageRelation(classifier=row.classifier,
+                              source_id=row.source_dataset_ref,
+                              derived_id=row.derived_dataset_ref)
+        relations.append(rel)
+        next_id = rel.source_id if direction == LineageDirection.SOURCES else rel.derived_id
+        if next_id not in ids_so_far:
+            next_lvl_ids.add(next_id)
+            ids_so_far.add(next_id)
+    next_depth = depth - 1
+    recurse = True
+    if depth == 0:
+        next_depth = 0
+    elif depth == 1:
+        recurse = False
+    if recurse and next_lvl_ids:
+        relations.extend(legacy_load(conn, next_lvl_ids, direction, next_depth, ids_so_far))
+    return relations
+
+
+def current_load(conn, roots, direction, depth):
+    return conn.load_lineage_relations(roots, direction, depth)
+
+
+def run(label, impl, conn, roots, direction, depth):
+    start = monotonic()
+    relations = set()
+    for root in roots:
+        relations.update(impl(conn, [root], direction, depth))
+    elapsed = monotonic() - start
+    print(f"Test {label}: {len(roots)} trees, {len(relations)} relations in {elapsed:.4f}s")
+    return relations, elapsed
+
+
+def main(args):
+    env = args[0] if args else "datacube_real"
+    n = int(args[1]) if len(args) > 1 else 20
+    print("Testing on database ", env)
+    dc = Datacube(env=env)
+    if not dc.index.supports_external_lineage:
+        print("Requires an index with external lineage support (postgis)")
+        return
+    levels, relations = make_graph()
+    print(f"Writing {sum(LEVEL_SIZES)} datasets, {len(relations)} lineage relations")
+    with dc.index._active_connection(transaction=True) as conn:
+        conn._connection.execute(insert(DatasetLineage), [
+            {"derived_dataset_ref": rel.derived_id, "source_dataset_ref": rel.source_id, "classifier": rel.classifier}
+            for rel in relations
+        ])
+    try:
+        tests = {
+            "sources": (levels[-1][:n], LineageDirection.SOURCES, 0),
+            "sources-depth-3": (levels[-1][:n], LineageDirection.SOURCES, 3),
+            "derived": (levels[0][:n], LineageDirection.DERIVED, 0),
+        }
+        with dc.index._active_connection() as conn:
+            for name, (roots, direction, depth) in tests.items():
+                expect, before = run(f"legacy-{name}", legacy_load, conn, roots, direction, depth)
+                actual, after = run(f"recursive-{name}", current_load, conn, roots, direction, depth)
+                if expect != actual:
+                    print(f"Lineage relations differ for {name}")
+                print(f"Speedup: {before / after if after else float('inf'):.1f}x")
+                print()
+                print("-----------------------------------------------------------------")
+    finally:
+        with dc.index._active_connection(transaction=True) as conn:
+            for level in levels[1:]:
+                conn.remove_lineage_relations(level, LineageDirection.SOURCES)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,106 @@
+"""
+Compare memory index dataset search against a full scan of the product.
+
+The scan is a copy of the previous search implementation, which cloned every
+dataset of the product and then checked it against the query.
+
+Usage: python odc_memory_search_profile.py [N_DATASETS]
+"""
+import sys
+import uuid
+
+from datetime import datetime, timedelta, timezone
+from time import monotonic
+
+from datacube import Datacube
+from datacube.cfg import ODCConfig
+from datacube.index import fields
+from datacube.model import Dataset, Range
+
+PRODUCT = "bench_product"
+T0 = datetime(2000, 1, 1, tzinfo=timezone.utc)
+
+
+def make_index(n):
+    cfg = ODCConfig(text="bench:\n  index_driver: memory\n")
+    dc = Datacube(env=cfg["bench"])
+    dc.index.products.add_document({
+        "name": PRODUCT,
+        "description": "Memory index search benchmark",
+        "metadata_type": "eo3",
+        "license": "CC-BY-4.0",
+        "metadata": {"product": {"name": PRODUCT}},
+        "measurements": [{"name": "band", "dtype": "int16", "nodata": -1, "units": "1"}],
+    })
+    product = dc.index.products.get_by_name(PRODUCT)
+    for i in range(n):
+        lat, lon = -45 + (i % 90), 110 + (i * 7) % 45
+        doc = {
+            "id": str(uuid.uuid4()),
+            "$schema": "https://schemas.opendatacube.org/dataset",
+            "product": {"name": PRODUCT},
+            "crs": "EPSG:4326",
+            "properties": {
+                "datetime": (T0 + timedelta(hours=6 * i)).isoformat(),
+                "eo:platform": f"platform-{i % 4}",
+                "eo:cloud_cover": float(i % 101),
+                "odc:region_code": f"{i % 500:05d}",
+            },
+            "extent": {"lat": {"begin": lat, "end": lat + 1}, "lon": {"begin": lon, "end": lon + 1}},
+            "lineage": {},
+        }
+        dc.index.datasets.add(Dataset(product, doc, uri=f"file:///bench/{i}.yaml"), with_lineage=False)
+    return dc
+
+
+def legacy_search(dc, **query):
+    index = dc.index.datasets
+    product = dc.index.products.get_by_name(PRODUCT)
+    exprs = tuple(fields.to_expressions(product.metadata_type.dataset_fields.get, **query))
+    for dsid in index._by_product.get(PRODUCT, set()):
+        ds = index.get(dsid, include_sources=True)
+        if all(expr.evaluate(ds.metadata_doc) for expr in exprs):
+            yield ds
+
+
+def current_search(dc, **query):
+    return dc.index.datasets.search(product=PRODUCT, **query)
+
+
+QUERIES = {
+    "time": dict(time=Range(T0 + timedelta(days=30), T0 + timedelta(days=37))),
+    "platform": dict(platform="platform-1"),
+    "region": dict(region_code="00042"),
+    "lat-lon": dict(lat=Range(-10.0, -9.5), lon=Range(125.0, 135.0)),
+    "cloud-time": dict(cloud_cover=Range(None, 10.0), time=Range(T0, T0 + timedelta(days=365))),
+}
+
+
+def run(label, impl, dc, query, repeats):
+    times = []
+    count = 0
+    for _ in range(repeats):
+        start = monotonic()
+        count = sum(1 for _ in impl(dc, **query))
+        times.append(monotonic() - start)
+    print(f"Test {label}: {count} datasets, {min(times):.4f}s best, {sum(times)/repeats:.4f}s avg")
+    return count
+
+
+def main(args):
+    n = int(args[0]) if args else 2000
+    start = monotonic()
+    dc = make_index(n)
+    print(f"Indexed {n} datasets in {monotonic() - start:.1f}s")
+    print()
+    for name, query in QUERIES.items():
+        expect = run(f"scan-{name}", legacy_search, dc, query, 1)
+        actual = run(f"indexed-{name}", current_search, dc, query, 3)
+        if expect != actual:
+            print(f"Count mismatch for {name}: {actual} vs {expect}")
+        print()
+        print("-----------------------------------------------------------------")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
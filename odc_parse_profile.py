@@ -0,0 +1,83 @@
+"""
+Compare metadata document parsing against the pure Python parsers.
+
+Every YAML and JSON document under tests/data (and the YAML documents
+converted to JSON) is parsed with the pure Python
+PyYAML loader (without implicit dates) and the standard library json module,
+and with datacube's document loaders, which use libyaml and orjson when
+available. The parsed documents must be identical.
+
+Usage: python odc_parse_profile.py [REPEATS]
+"""
+import io
+import json
+import sys
+
+from pathlib import Path
+from time import monotonic
+
+import yaml
+
+from datacube.utils.documents import NoDatesSafeLoader, load_from_json, load_from_yaml
+
+DATA = Path(__file__).parent / "tests" / "data"
+
+
+class PyNoDatesSafeLoader(yaml.SafeLoader):  # pylint: disable=too-many-ancestors
+    yaml_implicit_resolvers = {
+        first: [(tag, regexp) for tag, regexp in resolvers if tag != 'tag:yaml.org,2002:timestamp']
+        for first, resolvers in yaml.SafeLoader.yaml_implicit_resolvers.items()
+    }
+
+
+def python_yaml(data):
+    return list(yaml.load_all(io.BytesIO(data), Loader=PyNoDatesSafeLoader))
+
+
+def python_json(data):
+    return [json.load(io.BytesIO(data))]
+
+
+def datacube_yaml(data):
+    return list(load_from_yaml(io.BytesIO(data)))
+
+
+def datacube_json(data):
+    return list(load_from_json(io.BytesIO(data)))
+
+
+def run(label, impl, files, repeats):
+    start = monotonic()
+    for _ in range(repeats):
+        for data in files.values():
+            impl(data)
+    elapsed = monotonic() - start
+    print(f"Test {label}: {len(files) * repeats} files in {elapsed:.4f}s")
+    return elapsed
+
+
+def main(args):
+    repeats = int(args[0]) if args else 50
+    yaml_files = {p: p.read_bytes() for p in sorted(DATA.rglob("*.y*ml"))}
+    json_files = {p: p.read_bytes() for p in sorted(DATA.rglob("*.json"))}
+    # The JSON fixtures are few and small: also parse the YAML documents as JSON
+    for path, data in yaml_files.items():
+        for i, doc in enumerate(python_yaml(data)):
+            json_files[path.with_suffix(f".{i}.json")] = json.dumps(doc, default=str).encode("utf-8")
+    print(f"libyaml: {yaml.__with_libyaml__}, loader: {NoDatesSafeLoader.__mro__[1].__name__}")
+    print()
+
+    for name, files, baseline, impl in (("yaml", yaml_files, python_yaml, datacube_yaml),
+                                        ("json", json_files, python_json, datacube_json)):
+        for path, data in files.items():
+            if baseline(data) != impl(data):
+                print(f"Parsed documents differ for {path}")
+        before = run(f"python-{name}", baseline, files, repeats)
+        after = run(f"datacube-{name}", impl, files, repeats)
+        print(f"Speedup: {before / after if after else float('inf'):.1f}x")
+        print()
+        print("-----------------------------------------------------------------")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
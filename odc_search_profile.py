@@ -31,8 +31,11 @@ def benchmark(test, dc, label, n):
         total += end - start
         total_first += first - start
     print(f"Test {label}-count: {count} rows")
-    print(f"Test {label}-avg: {total/n}s  ({total/(n*count)})s/row")
-    print(f"Test {label}-avg-to-first-return: {total_first/n}s  ({total/(n*count)})s/row")
+    if count:
+        print(f"Test {label}-avg: {total/n}s  ({total/(n*count)})s/row  ({n*count/total:.0f} rows/s)")
+    else:
+        print(f"Test {label}-avg: {total/n}s")
+    print(f"Test {label}-avg-to-first-return: {total_first/n}s")
     print()
     print("-----------------------------------------------------------------")
 
@@ -0,0 +1,75 @@
+"""
+Compare the spatial prefilter used by index drivers without spatial indexes.
+
+Runs `select_datasets_inside_polygon` against a copy of the previous
+implementation, which reprojected the extent of every dataset on its own and
+tested it against the query polygon one dataset at a time.
+
+Dataset extents are scene footprints spread over Australia, in the UTM zone
+of the scene or in EPSG:4326.
+
+Usage: python odc_select_polygon_profile.py [N_DATASETS]
+"""
+import sys
+
+from time import monotonic
+from types import SimpleNamespace
+
+import numpy as np
+from odc.geo import CRS
+from odc.geo.geom import box, intersects
+
+from datacube.api.core import select_datasets_inside_polygon
+
+EPSG4326 = CRS("EPSG:4326")
+
+
+def make_datasets(n):
+    rng = np.random.default_rng(0)
+    datasets = []
+    for i, (lon, lat) in enumerate(zip(rng.uniform(114, 152, n), rng.uniform(-43, -12, n))):
+        extent = box(lon, lat, lon + 1.5, lat + 1.5, crs=EPSG4326)
+        if i % 4:
+            zone = int((lon + 180) // 6) + 1
+            extent = extent.to_crs(CRS(f"EPSG:{32700 + zone}"))
+        datasets.append(SimpleNamespace(id=i, extent=extent))
+    return datasets
+
+
+def legacy_select(datasets, polygon):
+    query_crs = polygon.crs
+    for dataset in datasets:
+        if intersects(polygon, dataset.extent.to_crs(query_crs)):
+            yield dataset
+
+
+QUERIES = {
+    "albers-region": box(1_000_000, -4_000_000, 1_600_000, -3_400_000, crs="EPSG:3577"),
+    "lonlat-small": box(148.5, -36.0, 149.5, -35.0, crs=EPSG4326),
+    "lonlat-continent": box(110, -45, 155, -10, crs=EPSG4326),
+}
+
+
+def run(label, impl, datasets, polygon):
+    start = monotonic()
+    ids = [ds.id for ds in impl(datasets, polygon)]
+    elapsed = monotonic() - start
+    print(f"Test {label}: {len(ids)} of {len(datasets)} datasets in {elapsed:.4f}s")
+    return ids, elapsed
+
+
+def main(args):
+    n = int(args[0]) if args else 100_000
+    datasets = make_datasets(n)
+    for name, polygon in QUERIES.items():
+        expect, before = run(f"legacy-{name}", legacy_select, datasets, polygon)
+        actual, after = run(f"batched-{name}", select_datasets_inside_polygon, datasets, polygon)
+        if expect != actual:
+            print(f"Selected datasets differ for {name}")
+        print(f"Speedup: {before / after if after else float('inf'):.1f}x")
+        print()
+        print("-----------------------------------------------------------------")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -44,7 +44,7 @@ doc_require = [
 ]
 
 extras_require = {
-    'performance': ['ciso8601', 'bottleneck'],
+    'performance': ['ciso8601', 'bottleneck', 'orjson'],
     'distributed': ['distributed', 'dask[distributed]'],
     'doc': doc_require,
     's3': ['boto3', 'botocore'],
@@ -53,6 +53,7 @@ extras_require = {
     'cf': ['compliance-checker>=4.0.0'],
     'netcdf': ['netcdf4'],
     'postgres': ['psycopg2'],
+    'arrow': ['pyarrow>=14'],
 }
 
 extras_require['dev'] = sorted(set(sum([extras_require[k] for k in [
@@ -12,7 +12,7 @@ from types import SimpleNamespace
 import pytest
 
 from datacube.api.query import GroupBy
-from datacube.api.core import _calculate_chunk_sizes, output_geobox
+from datacube.api.core import _calculate_chunk_sizes, _dataset_tiles, output_geobox, select_datasets_inside_polygon
 from datacube import Datacube
 from datacube.testutils.geom import AlbersGS
 from datacube.testutils import mk_sample_dataset, suppress_deprecations
@@ -62,6 +62,47 @@ def test_group_datasets_by_time():
     assert len(xx.data[1]) == 1
 
 
+@pytest.mark.parametrize("group_by_name", ["time", "solar_day"])
+def test_group_datasets_vectorised(group_by_name):
+    from datacube.api.query import query_group_by
+    from datacube.model import Range
+
+    rng = np.random.default_rng(42)
+    t0 = datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone.utc)
+    tz = datetime.timezone(datetime.timedelta(hours=-5))
+    datasets = []
+    for i in range(300):
+        # Few distinct timestamps and ids, so that groups and sort keys have ties
+        time = t0 + datetime.timedelta(hours=int(rng.integers(0, 100)) * 7)
+        if i % 3 == 0:
+            time = time.astimezone(tz)
+        elif i % 3 == 1:
+            time = time.replace(tzinfo=None)
+        lon = float(rng.uniform(-180, 179))
+        datasets.append(SimpleNamespace(center_time=time,
+                                        metadata=SimpleNamespace(lon=Range(lon, lon + 1)),
+                                        id=UUID(int=int(rng.integers(0, 50)) << 64),
+                                        value=i))
+
+    group_by = query_group_by(group_by_name)
+    assert group_by.group_keys is not None
+    generic = GroupBy(group_by.group_by_func, group_by.dimension, group_by.units,
+                      sort_key=group_by.sort_key, group_key=group_by.group_key)
+    expect = Datacube.group_datasets(datasets, generic)
+    grouped = Datacube.group_datasets(iter(datasets), group_by)
+
+    assert grouped.time.dtype == expect.time.dtype
+    assert (grouped.time.values == expect.time.values).all()
+    assert grouped.time.attrs == expect.time.attrs
+    assert [[ds.value for ds in dss] for dss in grouped.values] == [[ds.value for ds in dss] for dss in expect.values]
+
+    # Datasets without ids fall back to the generic implementation
+    for ds in datasets:
+        del ds.id
+    grouped = Datacube.group_datasets(datasets[:1], group_by)
+    assert grouped.values[0] == (datasets[0],)
+
+
 def test_grouped_datasets_should_be_in_consistent_order():
     datasets = [
         {'time': datetime.datetime(2016, 1, 1, 0, 1), 'value': 'foo'},
@@ -116,6 +157,65 @@ def test_dask_chunks():
         _calculate_chunk_sizes(sources, geobox, {'zz': 1})
 
 
+def test_dataset_tiles():
+    from odc.geo.geobox import GeoboxTiles
+    from odc.geo import geobox as gbx
+    from datacube.testutils.geom import epsg4326, epsg3857
+
+    geobox = AlbersGS.tile_geobox((15, -40))
+    base = gbx.zoom_out(geobox, 4)
+    gbt = GeoboxTiles(base, (30, 70))
+
+    src_geoboxes = [
+        geobox[:100, :100],
+        geobox[1000:1500, 3000:3999],
+        gbx.translate_pix(geobox, -1000, 200),
+        gbx.translate_pix(geobox, 10_000, 10_000),
+        gbx.translate_pix(geobox.to_crs(epsg4326), 3000, 1000),
+        geobox.to_crs(epsg3857),
+        gbx.rotate(geobox[300:600, 300:600], 30),
+    ]
+    dss = [mk_sample_dataset([dict(name='a')], id=str(UUID(int=i)), geobox=g)
+           for i, g in enumerate(src_geoboxes)]
+
+    expect = [sorted(gbt.tiles(ds.extent)) for ds in dss]
+    assert [sorted(tiles) for tiles in _dataset_tiles(dss, gbt)] == expect
+    assert expect[3] == []
+    assert len(expect[5]) == gbt.shape[0] * gbt.shape[1]
+
+    assert _dataset_tiles([], gbt) == []
+
+
+def test_select_datasets_inside_polygon():
+    from odc.geo import geobox as gbx
+    from odc.geo.geom import intersects
+    from datacube.testutils.geom import epsg4326, epsg3857
+
+    geobox = AlbersGS.tile_geobox((15, -40))
+    src_geoboxes = [
+        geobox[:100, :100],
+        geobox[1000:1500, 3000:3999],
+        gbx.translate_pix(geobox, -1000, 200),
+        gbx.translate_pix(geobox, 10_000, 10_000),
+        gbx.translate_pix(geobox.to_crs(epsg4326), 3000, 1000),
+        geobox.to_crs(epsg3857),
+        gbx.rotate(geobox[300:600, 300:600], 30),
+        gbx.translate_pix(geobox[:100, :100], 0, -100),  # touches the polygon edge
+    ]
+    dss = [mk_sample_dataset([dict(name='a')], id=str(UUID(int=i)), geobox=g)
+           for i, g in enumerate(src_geoboxes)]
+    polygon = geobox[:2000, :2000].extent
+
+    expect = [ds for ds in dss if intersects(polygon, ds.extent.to_crs(polygon.crs))]
+    assert 0 < len(expect) < len(dss)
+    assert list(select_datasets_inside_polygon(dss, polygon)) == expect
+    assert list(select_datasets_inside_polygon(iter(dss), polygon, batch_size=3)) == expect
+
+    # Datasets without an extent are never inside the polygon
+    no_extent = SimpleNamespace(extent=None)
+    assert list(select_datasets_inside_polygon([no_extent] + dss, polygon)) == expect
+
+
 def test_index_validation():
     index = MagicMock()
     with pytest.raises(ValueError) as e:
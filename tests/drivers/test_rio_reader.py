@@ -13,7 +13,9 @@ import pytest
 import warnings
 
 from datacube.drivers.rio._reader import (
+    DEFAULT_MAX_OPEN_FILES,
     RDEntry,
+    RIOLoadContext,
     _dc_crs,
     _rio_uri,
     _rio_band_idx,
@@ -219,3 +221,62 @@ def test_testutils_iodriver(data_folder):
     assert src.shape == (2000, 4000)
     assert src.nodata == -999
     assert src.dtype == np.dtype(np.int16)
+
+
+def test_rio_driver_file_handle_cache(data_folder):
+    base = "file://" + str(data_folder) + "/metadata.yml"
+
+    rdr = mk_rio_driver()
+    b1 = mk_band('a', base, path="test.tif", format=GeoTIFF)
+    b2 = mk_band('b', base, path="test.tif", format=GeoTIFF, band=2)
+
+    load_ctx = rdr.new_load_context(iter([b1, b2]), None)
+    assert isinstance(load_ctx, RIOLoadContext)
+    assert load_ctx.max_open_files == DEFAULT_MAX_OPEN_FILES
+    assert len(load_ctx) == 0
+
+    src1 = rdr.open(b1, load_ctx).result()
+    src2 = rdr.open(b2, load_ctx).result()
+    assert len(load_ctx) == 1
+    assert (load_ctx.hits, load_ctx.misses) == (1, 1)
+
+    xx = src1.read().result()
+    yy = src2.read().result()
+    assert xx.shape == src1.shape
+    assert yy.shape == src2.shape
+    assert load_ctx.hits == 3
+
+    # context is re-used by the next load
+    assert rdr.new_load_context(iter([b1]), load_ctx) is load_ctx
+    rdr.open(b1, load_ctx).result()
+    assert (load_ctx.hits, load_ctx.misses) == (4, 1)
+
+    load_ctx.close()
+    assert len(load_ctx) == 0
+
+    # evicted handles are re-opened on read
+    np.testing.assert_array_equal(src1.read().result(), xx)
+    assert load_ctx.misses == 2
+
+    with pytest.raises(ValueError):
+        RIOLoadContext(0)
+
+
+def test_rio_load_context_eviction(data_folder):
+    uris = [str(data_folder) + '/' + fname
+            for fname in ('test.tif', 'sample_tile_151_-29.tif')]
+    ctx = RIOLoadContext(max_open_files=1)
+
+    with ctx.open(uris[0]) as src0:
+        with ctx.open(uris[1]) as src1:
+            # src0 is evicted, but still in use so should stay open
+            assert uris[0] not in ctx
+            assert uris[1] in ctx
+            assert not src0.closed
+        assert not src1.closed
+    assert src0.closed
+
+    ctx.close()
+    assert src1.closed
+    assert len(ctx) == 0
+    assert (ctx.hits, ctx.misses) == (0, 2)
@@ -0,0 +1,116 @@
+# This file is part of the Open Data Cube, see https://opendatacube.org for more information
+#
+# Copyright (c) 2015-2025 ODC Contributors
+# SPDX-License-Identifier: Apache-2.0
+from unittest.mock import MagicMock
+
+from datacube.index._catalogue import Catalogue, CatalogueCache
+from datacube.model import MetadataType, Product
+from datacube.testutils import mk_sample_product
+
+
+def _mk_catalogue():
+    metadata_type = MetadataType({
+        "name": "eo_sample",
+        "description": "Sample",
+        "dataset": {
+            "id": ["id"],
+            "sources": ["lineage", "source_datasets"],
+            "search_fields": {
+                "platform": {"description": "Platform", "offset": ["platform"]},
+                "region_code": {"description": "Region", "offset": ["region_code"]},
+            },
+        },
+    }, id_=1)
+    products = []
+    for i, (name, platform) in enumerate([("ls8_a", "landsat-8"), ("ls8_b", "landsat-8"), ("s2_a", "sentinel-2a")]):
+        product = mk_sample_product(name, metadata_type=metadata_type)
+        products.append(Product(metadata_type, dict(product.definition, metadata={"platform": platform}), id_=i))
+    return Catalogue([metadata_type], products)
+
+
+def test_catalogue_lookups():
+    catalogue = _mk_catalogue()
+    assert [p.name for p in catalogue.products] == ["ls8_a", "ls8_b", "s2_a"]
+    assert catalogue.products_by_id[2].name == "s2_a"
+    assert catalogue.products_by_name["ls8_b"].id == 1
+    assert catalogue.metadata_types_by_name["eo_sample"].id == 1
+
+
+def test_catalogue_search_robust():
+    catalogue = _mk_catalogue()
+
+    def search(**query):
+        return {p.name: remaining for p, remaining in catalogue.search_robust(query, ignore_fields=("geopolygon",))}
+
+    assert search(platform="landsat-8") == {"ls8_a": {}, "ls8_b": {}}
+    assert search(platform=["landsat-8", "sentinel-2a"], product="s2_a") == {"s2_a": {}}
+    # Fields not defined by the product documents remain to be matched against datasets
+    assert search(platform="landsat-8", region_code="x") == {"ls8_a": {"region_code": "x"},
+                                                             "ls8_b": {"region_code": "x"}}
+    assert search(metadata_type="eo_sample", geopolygon="poly") == {
+        "ls8_a": {"geopolygon": "poly"},
+        "ls8_b": {"geopolygon": "poly"},
+        "s2_a": {"geopolygon": "poly"},
+    }
+    # Unknown fields and metadata types cannot match
+    assert search(cloud_cover=5) == {}
+    assert search(metadata_type="eo3") == {}
+
+
+def test_catalogue_cache():
+    catalogue = _mk_catalogue()
+    generation = MagicMock(return_value=1)
+    load = MagicMock(return_value=catalogue)
+    cache = CatalogueCache(generation, load, ttl=3600)
+
+    assert cache.get() is catalogue
+    assert cache.get() is catalogue
+    assert load.call_count == 1
+    assert generation.call_count == 1
+
+    # Unchanged generation does not reload
+    assert cache.get(validate=True) is catalogue
+    assert (load.call_count, generation.call_count) == (1, 2)
+
+    generation.return_value = 2
+    cache.get(validate=True)
+    assert (load.call_count, generation.call_count) == (2, 3)
+
+    # Checked once per transaction, and again on next use outside it
+    transaction, other_transaction = object(), object()
+    cache.get(transaction=transaction)
+    cache.get(transaction=transaction)
+    assert (load.call_count, generation.call_count) == (2, 4)
+    cache.get(transaction=other_transaction)
+    assert (load.call_count, generation.call_count) == (2, 5)
+    cache.get()
+    cache.get()
+    assert (load.call_count, generation.call_count) == (2, 6)
+
+    cache.invalidate()
+    cache.get()
+    assert (load.call_count, generation.call_count) == (3, 7)
+
+    # Zero TTL always checks the generation
+    cache.ttl = 0
+    cache.get()
+    cache.get()
+    assert (load.call_count, generation.call_count) == (3, 9)
+
+
+def test_catalogue_cache_lookup():
+    catalogue = _mk_catalogue()
+    product = catalogue.products[0]
+    generation = MagicMock(return_value=1)
+    load = MagicMock(return_value=catalogue)
+    cache = CatalogueCache(generation, load, ttl=3600)
+
+    assert cache.lookup("products_by_name", product.name) is product
+    assert (load.call_count, generation.call_count) == (1, 1)
+    # Misses check for a newer catalogue before giving up
+    assert cache.lookup("products_by_id", -1) is None
+    assert (load.call_count, generation.call_count) == (1, 2)
+    generation.return_value = 2
+    assert cache.lookup("metadata_types_by_name", "missing", transaction=object()) is None
+    assert (load.call_count, generation.call_count) == (2, 4)
@@ -0,0 +1,67 @@
+# This file is part of the Open Data Cube, see https://opendatacube.org for more information
+#
+# Copyright (c) 2015-2025 ODC Contributors
+# SPDX-License-Identifier: Apache-2.0
+from unittest.mock import MagicMock
+
+import pytest
+
+from datacube.index._clone import CloneCheckpoint, clone_datasets, format_batch_status
+from datacube.index.abstract import BatchStatus
+
+
+def test_format_batch_status():
+    assert format_batch_status(BatchStatus(120, 3, 60.0), "datasets") == \
+        "120 datasets loaded (3 skipped) in 60.00seconds (120.00 datasets/min)"
+    assert format_batch_status(BatchStatus(0, 0, 0.0), "products") == \
+        "0 products loaded (0 skipped) in 0.00seconds (0.00 products/min)"
+
+
+def test_clone_checkpoint(tmp_path):
+    path = tmp_path / "clone.json"
+    checkpoint = CloneCheckpoint(path, "origin", "dest")
+    assert not path.exists()
+    assert checkpoint.phase("products") is None
+    checkpoint.record_phase("products", BatchStatus(2, 1, 1.5, ("a", "b", "c")))
+    checkpoint.record_product("a", BatchStatus(10, 0, 2.0))
+
+    resumed = CloneCheckpoint(path, "origin", "dest")
+    assert resumed.phase("products") == BatchStatus(2, 1, 1.5, {"a", "b", "c"})
+    assert resumed.phase("datasets") is None
+    assert resumed.product("a") == BatchStatus(10, 0, 2.0, None)
+    assert resumed.product("b") is None
+
+    with pytest.raises(ValueError):
+        CloneCheckpoint(path, "origin", "other")
+
+    # No file: progress is only tracked in memory
+    unsaved = CloneCheckpoint(None, "origin", "dest")
+    unsaved.record_product("a", BatchStatus(10, 0, 2.0))
+    assert unsaved.product("a") == BatchStatus(10, 0, 2.0, None)
+
+
+def test_clone_datasets_resume(tmp_path):
+    path = tmp_path / "clone.json"
+    index = MagicMock()
+    index.datasets.bulk_add.return_value = BatchStatus(5, 1, 1.0)
+    origin_index = MagicMock()
+
+    checkpoint = CloneCheckpoint(path, "origin", "dest")
+    checkpoint.record_product("a", BatchStatus(10, 0, 2.0))
+    res = clone_datasets(index, origin_index, ["a", "b", "c"], checkpoint)
+    assert (res.completed, res.skipped) == (10, 2)
+    assert index.datasets.bulk_add.call_count == 2
+    assert [c.args[0] for c in index.products.get_by_name_unsafe.call_args_list] == ["b", "c"]
+    assert CloneCheckpoint(path, "origin", "dest").product("c") == BatchStatus(5, 1, 1.0, None)
+
+    # Nothing left to do
+    res = clone_datasets(index, origin_index, ["a", "b", "c"], checkpoint)
+    assert (res.completed, res.skipped) == (0, 0)
+    assert index.datasets.bulk_add.call_count == 2
+
+    with pytest.raises(ValueError):
+        clone_datasets(index, origin_index, ["d"], checkpoint, workers=0)
+    # Worker processes cannot share non-persistent indexes
+    index.supports_persistance = False
+    with pytest.raises(ValueError):
+        clone_datasets(index, origin_index, ["d"], checkpoint, workers=2)
@@ -10,7 +10,10 @@ from datacube.drivers.postgres._fields import SimpleDocField, NumericRangeDocFie
     IntDocField
 from datacube.utils.uris import split_uri
 from datacube.drivers.postgres._schema import DATASET
+from datacube.index.fields import to_columns
 from datacube.model import Range
+from datetime import datetime, timezone
+import numpy
 import pytest
 
 
@@ -122,3 +125,38 @@ def test_get_range_field():
     assert isinstance(field, RangeDocField)
     extracted = field.extract({'extents': {'geospatial_lat_min': 2, 'geospatial_lat_max': 4}})
     assert extracted == Range(begin=2, end=4)
+
+
+def test_to_columns():
+    fields = parse_fields({
+        'platform': {'offset': ['platform']},
+        'cloud_cover': {'type': 'double', 'offset': ['cloud_cover']},
+        'gqa': {'type': 'integer', 'offset': ['gqa']},
+        'time': {'type': 'datetime-range', 'min_offset': [['begin']], 'max_offset': [['end']]},
+    }, DATASET.c.metadata)
+    fields['custom'] = None
+    t1 = datetime(2020, 1, 1, tzinfo=timezone.utc)
+    t2 = datetime(2020, 1, 2, tzinfo=timezone.utc)
+    columns = to_columns(fields, [
+        ('ls8', 12.5, 1, Range(t1, t2), {'a': 1}),
+        ('ls9', None, None, Range(t2, None), None),
+    ], ['platform', 'cloud_cover', 'gqa', 'time', 'custom'])
+    assert list(columns) == ['platform', 'cloud_cover', 'gqa', 'time_begin', 'time_end', 'custom']
+    assert columns['platform'].tolist() == ['ls8', 'ls9']
+    assert columns['cloud_cover'][0] == 12.5
+    assert numpy.isnan(columns['cloud_cover'][1])
+    # Integer columns with missing values fall back to float
+    assert columns['gqa'].dtype == numpy.float64
+    assert columns['time_begin'].dtype == numpy.dtype('datetime64[us]')
+    assert columns['time_begin'][1] == numpy.datetime64('2020-01-02T00:00:00')
+    assert numpy.isnat(columns['time_end'][1])
+    assert columns['custom'].tolist() == [{'a': 1}, None]
+
+    # Fields missing from the rows are returned as missing values
+    columns = to_columns(fields, [('ls8', 1)], ['platform', 'gqa'])
+    assert columns['gqa'].dtype == numpy.int64
+    assert numpy.isnan(columns['cloud_cover'][0])
+    assert numpy.isnat(columns['time_begin'][0])
+
+    columns = to_columns(fields, [])
+    assert all(len(column) == 0 for column in columns.values())
@@ -6,7 +6,20 @@ import pytest
 
 from unittest.mock import MagicMock
 
-from datacube.index.hl import Doc2Dataset
+from datacube.index.hl import Doc2Dataset, ProductRule, ProductRuleIndex, product_matcher
+from datacube.model import Dataset, Product
+from datacube.model.utils import BadMatch
+from datacube.testutils import dataset_maker, mk_sample_eo
+
+
+def mk_product(name, metadata):
+    return Product(mk_sample_eo(), {
+        "name": name,
+        "description": "Sample",
+        "metadata_type": "eo",
+        "metadata": metadata,
+        "measurements": [],
+    })
 
 
 def test_support_validation(non_geo_dataset_doc, eo_dataset_doc):
@@ -38,3 +51,68 @@ def test_support_validation(non_geo_dataset_doc, eo_dataset_doc):
     resolver = Doc2Dataset(idx, products=["product_a"], eo3=False)
     _, err = resolver(eo_dataset_doc, "//location/")
     assert "Legacy metadata formats" in err
+
+
+def test_product_rule_index():
+    rules = [ProductRule(mk_product(f"p{i}", {"product_type": f"P{i}", "platform": "sat"}),
+                         {"product_type": f"P{i}", "platform": "sat"})
+             for i in range(10)]
+    rules.append(ProductRule(mk_product("any_level1", {"level": 1}), {"level": 1}))
+    rules.append(ProductRule(mk_product("everything", {}), {}))
+    idx = ProductRuleIndex(rules)
+    assert idx.path == ("product_type",)
+
+    def names(doc):
+        return [rule.product.name for rule in idx.candidates(doc)]
+
+    assert names({"product_type": "p3", "platform": "sat"}) == ["p3", "any_level1", "everything"]
+    assert names({"platform": "sat"}) == ["any_level1", "everything"]
+    assert names({"product_type": ["P3"]}) == [rule.product.name for rule in rules]
+
+    match = product_matcher(rules[:10])
+    assert match({"product_type": "P4", "platform": "SAT"}).name == "p4"
+    with pytest.raises(BadMatch, match="No matching Product"):
+        match({"product_type": "P4", "platform": "other"})
+    with pytest.raises(BadMatch, match="matches several products"):
+        product_matcher(rules)({"product_type": "P4", "platform": "sat", "level": 1})
+
+
+def test_resolve_many_legacy_lineage():
+    products = [mk_product(name, {"product_type": name}) for name in ("A", "S")]
+    source_doc = dataset_maker(None)("S", product_type="S")
+    docs = [dataset_maker(i)("A", product_type="A", sources={"s": source_doc}) for i in range(6)]
+    db = {}
+
+    def bulk_get(ids):
+        return [db[id_] for id_ in ids if id_ in db]
+
+    idx = MagicMock()
+    idx.supports_lineage = True
+    idx.supports_external_lineage = False
+    idx.supports_legacy = True
+    idx.supports_nongeo = True
+    idx.products.get_all.return_value = products
+    idx.datasets.bulk_get.side_effect = bulk_get
+
+    resolver = Doc2Dataset(idx, eo3=False, fail_on_missing_lineage=True)
+    results = list(resolver.resolve_many(((doc, f"file:///{i}.yaml") for i, doc in enumerate(docs)),
+                                         batch_size=2))
+    assert [str(err) for _, err in results] == [str(resolver(docs[0], "file:///0.yaml")[1])] * 6
+    assert "missing from DB" in str(results[0][1])
+
+    source = Dataset(products[1], source_doc)
+    db[source.id] = source
+    idx.datasets.bulk_get.reset_mock()
+    results = list(resolver.resolve_many(((doc, f"file:///{i}.yaml") for i, doc in enumerate(docs)),
+                                         batch_size=2))
+    # One lookup per batch, with the source dataset cached after the first
+    assert idx.datasets.bulk_get.call_count == 3
+    assert all(source.id not in set(call.args[0]) for call in idx.datasets.bulk_get.call_args_list[1:])
+    for i, (ds, err) in enumerate(results):
+        assert err is None
+        expected, _ = resolver(docs[i], f"file:///{i}.yaml")
+        assert ds.id == expected.id
+        assert ds.uri == f"file:///{i}.yaml"
+        assert ds.product.name == "A"
+        assert ds.sources["s"].id == source.id
+        assert ds.sources["s"].product.name == "S"
@@ -0,0 +1,137 @@
+# This file is part of the Open Data Cube, see https://opendatacube.org for more information
+#
+# Copyright (c) 2015-2025 ODC Contributors
+# SPDX-License-Identifier: Apache-2.0
+import datetime
+from uuid import uuid4
+
+from datacube.index.fields import to_expressions
+from datacube.index.memory._search import IntervalIndex, ProductSearchIndex, ValueIndex
+from datacube.model import Not, Range, metadata_from_doc
+
+METADATA_DOC = {
+    "name": "test",
+    "description": "test search fields",
+    "dataset": {
+        "id": ["id"],
+        "sources": ["lineage", "source_datasets"],
+        "label": ["label"],
+        "creation_dt": ["creation_dt"],
+        "search_fields": {
+            "platform": {"description": "", "offset": ["platform"]},
+            "cloud_cover": {"description": "", "type": "double", "offset": ["cloud_cover"]},
+            "time": {
+                "description": "",
+                "type": "datetime-range",
+                "min_offset": [["start"]],
+                "max_offset": [["end"]],
+            },
+        },
+    },
+}
+
+
+def _docs(n):
+    t0 = datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone.utc)
+    return {
+        uuid4(): {
+            "platform": f"sat-{i % 3}",
+            "cloud_cover": float(i),
+            "start": (t0 + datetime.timedelta(days=i)).isoformat(),
+            "end": (t0 + datetime.timedelta(days=i, hours=1)).isoformat(),
+        }
+        for i in range(n)
+    }
+
+
+def test_value_index():
+    idx = ValueIndex()
+    a, b, c = uuid4(), uuid4(), uuid4()
+    idx.add(1.0, a)
+    idx.add(2.0, b)
+    idx.add(2.0, c)
+    idx.add(None, c)
+    assert idx.equals(2.0) == {b, c}
+    assert idx.equals(3.0) == set()
+    assert idx.between(1.5, None) == {b, c}
+    assert idx.between(None, 1.0) == {a}
+    assert idx.between(None, None) == {a, b, c}
+
+    idx.remove(2.0, b)
+    assert idx.between(1.5, 2.5) == {c}
+
+    # Not orderable: cannot narrow down range searches
+    idx.add("x", a)
+    assert idx.between(0, 1) is None
+    assert idx.equals("x") == {a}
+    assert idx.equals([1]) is None
+
+
+def test_interval_index():
+    idx = IntervalIndex()
+    a, b, c, d = uuid4(), uuid4(), uuid4(), uuid4()
+    idx.add(Range(0, 10), a)
+    idx.add(Range(5, 6), b)
+    idx.add(Range(20, 21), c)
+    idx.add(Range(None, 3), d)
+    idx.add(None, uuid4())
+
+    assert idx.overlaps(8, 9) == {a, d}
+    assert idx.overlaps(6, 6) == {a, b, d}
+    assert idx.overlaps(10, 20) == {a, c, d}
+    assert idx.overlaps(None, 4) == {a, d}
+    assert idx.overlaps(30, None) == {d}
+
+    idx.remove(Range(0, 10), a)
+    assert idx.overlaps(8, 9) == {d}
+
+
+def test_product_search_index():
+    mt = metadata_from_doc(METADATA_DOC)
+    docs = _docs(100)
+    idx = ProductSearchIndex(mt)
+    for id_, doc in docs.items():
+        idx.add(id_, doc)
+    assert idx.is_current(mt)
+
+    def check(**query):
+        exprs = to_expressions(mt.dataset_fields.get, **query)
+        expected = {id_ for id_, doc in docs.items() if all(e.evaluate(doc) for e in exprs)}
+        candidates = idx.candidates(exprs)
+        assert candidates is not None
+        assert expected <= candidates
+        return expected, candidates
+
+    expected, candidates = check(platform="sat-1")
+    assert len(expected) == 33
+    assert candidates == expected
+
+    expected, candidates = check(platform=["sat-1", "sat-2"], cloud_cover=Range(10, 19))
+    assert candidates == expected
+    assert len(expected) == 7
+
+    expected, candidates = check(time=Range(datetime.datetime(2020, 1, 11), datetime.datetime(2020, 1, 20, 12)))
+    assert len(expected) == 10
+    assert candidates == expected
+
+    # Not expressions cannot use the index, but other terms still narrow the search
+    exprs = to_expressions(mt.dataset_fields.get, platform=Not("sat-1"))
+    assert idx.candidates(exprs) is None
+    exprs = to_expressions(mt.dataset_fields.get, platform=Not("sat-1"), cloud_cover=Range(None, 4))
+    assert len(idx.candidates(exprs)) == 5
+
+    for id_, doc in list(docs.items())[:50]:
+        idx.remove(id_, doc)
+        del docs[id_]
+    expected, candidates = check(platform="sat-1")
+    assert candidates == expected
+
+
+def test_product_search_index_unindexable_values():
+    mt = metadata_from_doc(METADATA_DOC)
+    idx = ProductSearchIndex(mt)
+    idx.add(uuid4(), {"platform": "sat-1", "cloud_cover": "cloudy"})
+    exprs = to_expressions(mt.dataset_fields.get, cloud_cover=Range(0, 10))
+    assert idx.candidates(exprs) is None
+    exprs = to_expressions(mt.dataset_fields.get, platform="sat-1")
+    assert len(idx.candidates(exprs)) == 1
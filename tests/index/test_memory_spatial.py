@@ -0,0 +1,48 @@
+# This file is part of the Open Data Cube, see https://opendatacube.org for more information
+#
+# Copyright (c) 2015-2025 ODC Contributors
+# SPDX-License-Identifier: Apache-2.0
+from uuid import uuid4
+
+from odc.geo import CRS
+from odc.geo.geom import box, polygon
+
+from datacube.index.memory._spatial import SpatialIndex
+
+epsg4326 = CRS("EPSG:4326")
+epsg3577 = CRS("EPSG:3577")
+
+
+def test_spatial_index():
+    idx = SpatialIndex(epsg4326)
+    a, b, c = uuid4(), uuid4(), uuid4()
+    assert idx.add(a, box(148, -36, 149, -35, crs=epsg4326))
+    assert idx.add(b, box(148.5, -35.5, 149.5, -34.5, crs=epsg4326))
+    assert idx.add(c, box(130, -25, 131, -24, crs=epsg4326).to_crs(epsg3577))
+    assert len(idx) == 3
+
+    assert idx.intersects(box(148.9, -35.4, 149.0, -35.3, crs=epsg4326)) == {a, b}
+    assert idx.intersects(box(130.5, -24.5, 130.6, -24.4, crs=epsg4326).to_crs(epsg3577)) == {c}
+    assert idx.intersects(box(0, 0, 1, 1, crs=epsg4326)) == set()
+
+    ext = idx.extent([a, b, uuid4()])
+    assert ext.crs == epsg4326
+    assert abs(ext.area - 1.75) < 1e-6
+    assert idx.extent([uuid4()]) is None
+
+    # Replacing and removing extents
+    assert idx.add(a, box(0, 0, 1, 1, crs=epsg4326))
+    assert idx.intersects(box(0.5, 0.5, 0.6, 0.6, crs=epsg4326)) == {a}
+    idx.remove(a)
+    idx.remove(a)
+    assert idx.intersects(box(0.5, 0.5, 0.6, 0.6, crs=epsg4326)) == set()
+    assert len(idx) == 2
+
+
+def test_spatial_index_antimeridian():
+    idx = SpatialIndex(epsg4326)
+    a = uuid4()
+    idx.add(a, polygon(((178, 25), (-178, 25), (-178, 23), (178, 23), (178, 25)), crs=epsg4326))
+    assert idx.intersects(box(179, 24, 179.5, 24.5, crs=epsg4326)) == {a}
+    assert idx.intersects(box(-179.5, 24, -179, 24.5, crs=epsg4326)) == {a}
+    assert idx.intersects(box(0, 24, 1, 24.5, crs=epsg4326)) == set()
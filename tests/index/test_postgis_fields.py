@@ -9,7 +9,7 @@ from decimal import Decimal
 import pytest
 
 from datacube.drivers.postgis._fields import NumericDocField, IntDocField, DoubleDocField, DateDocField, \
-    UnindexableValue
+    SimpleDocField, UnindexableValue
 from datacube.drivers.postgis._schema import Dataset
 
 
@@ -35,3 +35,77 @@ def test_date_parse():
     assert fld.parse_value("2020-07-22T14:45:22.452434+0000") == datetime.datetime(
         2020, 7, 22, 14, 45, 22, 452434, tzinfo=datetime.timezone.utc
     )
+
+
+def test_row_decoder():
+    from datacube.drivers.postgis._api import _row_decoder, _dataset_fields
+
+    fields = _dataset_fields() + (DateDocField("t", "field for testing", Dataset.metadata_doc, True, offset=["t"]),)
+    decode_row = _row_decoder(fields)
+    row = decode_row((
+        "10c4a9fe-2890-11e6-8ec8-a7e9ef0a35a0",
+        None,
+        "user",
+        1,
+        2,
+        {"t": "2020-07-22T14:45:22.452434+00:00"},
+        None,
+        "file:///tmp/ds.yaml",
+        "2020-07-22T14:45:22.452434+00:00",
+    ))
+    assert list(row) == ["id", "indexed_time", "indexed_by", "product_id", "metadata_type_id",
+                         "metadata_doc", "archived", "uri", "t"]
+    assert row["t"] == datetime.datetime(2020, 7, 22, 14, 45, 22, 452434, tzinfo=datetime.timezone.utc)
+    assert row["metadata_doc"] == {"t": "2020-07-22T14:45:22.452434+00:00"}
+    assert row["product_id"] == 1
+    assert row["uri"] == "file:///tmp/ds.yaml"
+
+
+def test_search_value_expressions():
+    from pathlib import Path
+    from sqlalchemy.dialects import postgresql
+    from datacube.drivers.postgis._api import non_native_fields
+    from datacube.utils import read_documents
+
+    default_types = Path(__file__).parents[2] / "datacube" / "index" / "postgis" / "default-metadata-types.yaml"
+    for _, doc in read_documents(default_types):
+        for name, field in non_native_fields(doc).items():
+            # Every field of the default metadata types can be indexed without leaving the database
+            expr = field.search_value_expression
+            assert expr is not None, f"{doc['name']}.{name}"
+            assert "metadata" in str(expr.compile(dialect=postgresql.dialect()))
+
+
+def test_search_values_to_python():
+    from datacube.drivers.postgis._api import extract_dataset_search_values, _copy_text
+    from datacube.drivers.postgis._fields import NumericRangeDocField, DateRangeDocField
+
+    fields = {
+        "platform": SimpleDocField("platform", "", Dataset.metadata_doc, True, offset=["platform"]),
+        "cloud_cover": DoubleDocField("cloud_cover", "", Dataset.metadata_doc, True, offset=["cloud_cover"]),
+        "lat": NumericRangeDocField("lat", "", Dataset.metadata_doc, True, min_offset=[["lat", "begin"]],
+                                    max_offset=[["lat", "end"]]),
+        "time": DateRangeDocField("time", "", Dataset.metadata_doc, True, min_offset=[["time", "begin"]],
+                                  max_offset=[["time", "end"]]),
+    }
+    doc = {
+        "platform": "landsat-8",
+        "cloud_cover": float("nan"),
+        "lat": {"begin": -35.5, "end": -34.0},
+        "time": {"begin": "2020-07-22T14:45:22+10:00", "end": "2020-07-22T14:45:22+10:00"},
+    }
+    values = extract_dataset_search_values(doc, fields)
+    # NaNs cannot be indexed
+    assert set(values) == {"platform", "lat", "time"}
+    assert values["platform"] == ("string", "landsat-8")
+    assert values["lat"] == ("numeric-range", (-35.5, -34.0))
+    ftype, (low, high) = values["time"]
+    assert ftype == "datetime-range"
+    assert low == high == datetime.datetime(2020, 7, 22, 4, 45, 22, tzinfo=datetime.timezone.utc)
+
+    assert DoubleDocField("d", "", Dataset.metadata_doc, True).search_value_to_python(1.5) == (1.5, 1.5)
+    assert _copy_text(None) == "\\N"
+    assert _copy_text(low) == "2020-07-22T04:45:22+00:00"
+    assert _copy_text({"a": "tab\there"}) == '{"a": "tab\\\\there"}'
+    assert _copy_text("back\\slash\nnewline") == "back\\\\slash\\nnewline"
+    assert _copy_text(True) == "true"
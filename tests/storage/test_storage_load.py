@@ -6,7 +6,9 @@
 """
 
 import numpy as np
+import pytest
 
+from datacube.drivers.rio._reader import RDEntry
 from datacube.storage._load import (
     xr_load, _default_fuser
 )
@@ -81,3 +83,60 @@ def test_new_xr_load(data_folder):
 
     np.testing.assert_array_equal(im[0], xx.a.values[0])
     np.testing.assert_array_equal(im[1], xx.b.values[0])
+
+
+@pytest.mark.parametrize("max_in_flight", [1, 3, 8])
+def test_new_xr_load_pipelined(data_folder, max_in_flight):
+    base = "file://" + str(data_folder) + "/metadata.yml"
+
+    rdr = RDEntry().new_instance({'max_workers': 4})
+
+    bands = [dict(name='a', path='test.tif'),
+             dict(name='b', band=2, path='test.tif')]
+    dss = [mk_sample_dataset(bands, base, timestamp='2018-07-19') for _ in range(3)]
+    dss.append(mk_sample_dataset(bands, base, timestamp='2018-07-20'))
+    # broken dataset in the middle of a group
+    dss.insert(1, mk_sample_dataset([dict(name=b['name'], path='no-such-file.tif') for b in bands],
+                                    base, timestamp='2018-07-19'))
+
+    sources = Datacube.group_datasets(dss, 'time')
+    assert [len(x) for x in sources.values] == [4, 1]
+
+    im, meta = rio_slurp(str(data_folder) + '/test.tif')
+    measurements = [ds.product.measurements[n].copy() for n in ('a', 'b') for ds in dss[:1]]
+
+    fused = []
+
+    def fuser(dst, src):
+        fused.append(src.shape)
+        # order dependent fuser
+        dst[:] = dst // 2 + src
+
+    for m in measurements:
+        m['fuser'] = fuser
+
+    with pytest.raises(IOError):
+        xr_load(sources, meta.geobox, measurements, rdr, max_in_flight=max_in_flight)
+
+    fused = []
+    xx, ctx = xr_load(sources, meta.geobox, measurements, rdr,
+                      skip_broken_datasets=True,
+                      max_in_flight=max_in_flight)
+    assert len(fused) == 8
+
+    for i, name in enumerate(('a', 'b')):
+        nodata = measurements[i].nodata
+        expect = np.full_like(im[i], nodata)
+        for _ in range(3):
+            expect = expect // 2 + im[i]
+        np.testing.assert_array_equal(expect, xx[name].values[0])
+        np.testing.assert_array_equal(np.full_like(im[i], nodata) // 2 + im[i], xx[name].values[1])
+
+    _, ctx2 = xr_load(sources, meta.geobox, measurements, rdr,
+                      driver_ctx_prev=ctx,
+                      skip_broken_datasets=True,
+                      max_in_flight=max_in_flight)
+    assert ctx2 is ctx
+
+    with pytest.raises(ValueError):
+        xr_load(sources, meta.geobox, measurements, rdr, max_in_flight=0)
@@ -8,7 +8,9 @@ import pytest
 from rasterio.enums import Resampling
 
 from datacube.storage._read import (
+    cached_reproject_roi,
     read_time_slice,
+    read_time_slice_roi,
     read_time_slice_v2,
     pick_read_scale,
     rdr_geobox)
@@ -121,6 +123,133 @@ def test_read_paste(nearest_resampling, tmpdir):
     np.testing.assert_array_equal(xx[1::2, 1::2], yy)
 
 
+@pytest.mark.parametrize("dst_dtype, dst_nodata, fallback_nodata", [
+    ('int16', -999, -999),
+    ('int16', -33, -999),
+    ('int16', -999, None),
+    ('float32', np.nan, -999),
+    ('float32', None, -999),
+])
+def test_read_time_slice_roi(tmpdir, dst_dtype, dst_nodata, fallback_nodata):
+    from datacube.testutils import mk_test_image
+    from datacube.testutils.io import write_gtiff
+    from pathlib import Path
+
+    pp = Path(str(tmpdir))
+
+    xx = mk_test_image(128, 64, nodata=-999)
+    mm = write_gtiff(pp/'tst-read-roi-128x64-int16.tif', xx, nodata=None)
+
+    geoboxes = [
+        mm.geobox,
+        gbx.flipy(gbx.flipx(mm.geobox)),
+        mm.geobox[10:19, 31:47],
+        gbx.translate_pix(mm.geobox, -3, -10),
+        gbx.translate_pix(mm.geobox, 10000, -10000),
+        gbx.zoom_out(mm.geobox, 2),
+        gbx.zoom_out(gbx.pad(mm.geobox, 10), 0.873),
+    ]
+
+    fill_value = np.nan if dst_nodata is None else dst_nodata
+    for geobox in geoboxes:
+        with RasterFileDataSource(mm.path, 1, nodata=fallback_nodata).open() as rdr:
+            yy = np.full(geobox.shape, fill_value, dtype=dst_dtype)
+            roi_expect = read_time_slice(rdr, yy, geobox, 'nearest', fill_value)
+
+        with RasterFileDataSource(mm.path, 1, nodata=fallback_nodata).open() as rdr:
+            pix, roi = read_time_slice_roi(rdr, geobox, np.dtype(dst_dtype), 'nearest', dst_nodata)
+
+        assert roi == roi_expect
+        if roi_is_empty(roi):
+            assert pix is None
+            continue
+
+        assert pix.dtype == np.dtype(dst_dtype)
+        assert pix.shape == roi_shape(roi)
+        np.testing.assert_array_equal(yy[roi], pix)
+
+
+def test_read_time_slice_roi_readonly(tmpdir):
+    from datacube.testutils import mk_test_image
+    from datacube.testutils.io import write_gtiff
+    from pathlib import Path
+
+    class CachingReader:
+        """ Returns read-only arrays it keeps hold of, like a driver with a block cache """
+        def __init__(self, rdr):
+            self._rdr = rdr
+            self.returned = []
+
+        def __getattr__(self, name):
+            return getattr(self._rdr, name)
+
+        def read(self, *args, **kwargs):
+            pix = self._rdr.read(*args, **kwargs)
+            pix.setflags(write=False)
+            self.returned.append((pix, pix.copy()))
+            return pix
+
+    pp = Path(str(tmpdir))
+    xx = mk_test_image(128, 64, nodata=-999)
+    mm = write_gtiff(pp/'tst-read-roi-readonly.tif', xx, nodata=None)
+
+    with RasterFileDataSource(mm.path, 1, nodata=-999).open() as rdr:
+        caching = CachingReader(rdr)
+        pix, roi = read_time_slice_roi(caching, mm.geobox, np.dtype('int16'), 'nearest', -33)
+
+    assert (pix[xx == -999] == -33).all()
+    assert caching.returned
+    for returned, original in caching.returned:
+        np.testing.assert_array_equal(returned, original)
+
+
+def test_cached_reproject_roi(tmpdir):
+    from datacube.testutils import mk_test_image
+    from datacube.testutils.io import write_gtiff
+    from datacube.testutils.iodriver import open_reader
+    from pathlib import Path
+
+    pp = Path(str(tmpdir))
+    xx = mk_test_image(128, 64, nodata=None)
+    mm = write_gtiff(pp/'tst-plan-cache-128x64-int16.tif', xx, nodata=None)
+
+    cached_reproject_roi.cache_clear()
+    dst_geobox = gbx.zoom_out(gbx.pad(mm.geobox, 10), 0.873)
+
+    outputs = []
+    for _ in range(3):
+        with RasterFileDataSource(mm.path, 1).open() as rdr:
+            yy = np.full(dst_geobox.shape, -1, dtype='int16')
+            roi = read_time_slice(rdr, yy, dst_geobox, 'nearest', -1)
+        outputs.append(yy)
+
+    info = cached_reproject_roi.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (2, 1, 1)
+    for yy in outputs[1:]:
+        np.testing.assert_array_equal(yy, outputs[0])
+
+    cached_reproject_roi.cache_clear()
+    for _ in range(3):
+        pix, roi_v2 = read_time_slice_v2(open_reader(mm.path), dst_geobox, 'nearest', -1)
+        assert roi_v2 == roi
+        np.testing.assert_array_equal(outputs[0][roi], pix)
+
+    info = cached_reproject_roi.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (2, 1, 1)
+
+    # cached plan is already padded, and matches a fresh one
+    rr = cached_reproject_roi(mm.geobox, dst_geobox, 0.9)
+    rr_ = compute_reproject_roi(mm.geobox, dst_geobox, ttol=0.9)
+    assert rr.paste_ok is False
+    assert roi_shape(rr.roi_dst) != roi_shape(rr_.roi_dst)
+
+    # different tolerance is a different entry
+    n = cached_reproject_roi.cache_info().currsize
+    cached_reproject_roi(mm.geobox, dst_geobox, 0.01)
+    assert cached_reproject_roi.cache_info().currsize == n + 1
+    cached_reproject_roi.cache_clear()
+
+
 @nearest_resampling_parametrize
 def test_read_with_reproject(nearest_resampling, tmpdir):
     from datacube.testutils import mk_test_image
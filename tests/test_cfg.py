@@ -221,6 +221,9 @@ def test_single_env(single_env_config):
     assert cfg['new']['db_iam_authentication']
     assert cfg['new'].db_iam_timeout == 600
     assert cfg['new']['db_connection_timeout'] == 60
+    assert cfg['new'].db_search_fetch_size == 1000
+    assert cfg['new'].db_catalogue_cache_ttl == 60
+    assert cfg['new'].db_bulk_add_copy is False
 
 
 def assert_simple_aliases(cfg):
@@ -281,6 +284,16 @@ def test_rawdict(simple_dict):
     assert_simple_options(cfg)
 
 
+def test_pickle_environment(simple_config):
+    import pickle
+    from datacube.cfg import ODCConfig
+    cfg = ODCConfig(text=simple_config)
+    env = pickle.loads(pickle.dumps(cfg["new"]))
+    assert env._name == "new"
+    assert env.index_driver == cfg["new"].index_driver
+    assert env.db_url == cfg["new"].db_url
+
+
 def test_noenv_overrides_in_text(simple_config, monkeypatch):
     monkeypatch.setenv("ODC_LEGACY_DB_USERNAME", "bar")
     monkeypatch.setenv("ODC_NEW_DB_USERNAME", "bar")
@@ -384,6 +397,7 @@ def test_envvar_overrides(path_to_yaml_config, monkeypatch):
     monkeypatch.setenv("ODC_LEGACY_DB_USERNAME", "bar")
     monkeypatch.setenv("ODC_NEW_DB_USERNAME", "bar")
     monkeypatch.setenv("ODC_NEW2_DB_CONNECTION_TIMEOUT", "20")
+    monkeypatch.setenv("ODC_NEW2_DB_SEARCH_FETCH_SIZE", "0")
     monkeypatch.setenv("DATACUBE_IAM_AUTHENTICATION", "yes")
 
     from datacube.cfg import ODCConfig
@@ -394,6 +408,7 @@ def test_envvar_overrides(path_to_yaml_config, monkeypatch):
         assert cfg["new"].db_iam_authentication
         assert cfg["new2"].db_iam_authentication
         assert cfg["new2"].db_connection_timeout == 20
+        assert cfg["new2"].db_search_fetch_size == 0
         assert cfg["new"].db_username != 'bar'
 
 
@@ -215,6 +215,95 @@ def test_load_data_cbk(tmpdir):
     assert progress_call_data == [(1, 4), (2, 4)]
 
 
+def test_load_data_concurrent(tmpdir):
+    from datacube.api import TerminateCurrentLoad
+
+    tmpdir = Path(str(tmpdir))
+
+    spatial = dict(resolution=(15, -15),
+                   offset=(11230, 1381110),)
+
+    nodata = -999
+    aa = mk_test_image(96, 64, 'int16', nodata=nodata)
+
+    dss = []
+    for i, timestamp in enumerate(['2018-07-19', '2018-07-19', '2018-07-20', '2018-07-21']):
+        bands = [SimpleNamespace(name=name, values=aa + i, nodata=nodata)
+                 for name in ['aa', 'bb', 'cc']]
+        ds, geobox = gen_tiff_dataset(bands,
+                                      tmpdir,
+                                      prefix='ds{}-'.format(i),
+                                      timestamp=timestamp,
+                                      **spatial)
+        dss.append(ds)
+
+    sources = Datacube.group_datasets(dss, 'time')
+    mm = dss[0].product.measurements
+
+    def custom_fuser(dest, delta):
+        dest[:] = dest * 2 + delta
+
+    expect = Datacube.load_data(sources, geobox, mm, fuse_func=custom_fuser)
+
+    progress_call_data = []
+
+    def progress_cbk(n, nt):
+        progress_call_data.append((n, nt))
+
+    ds_data = Datacube.load_data(sources, geobox, mm, fuse_func=custom_fuser,
+                                 progress_cbk=progress_cbk, read_concurrency=4)
+    assert 'dc_partial_load' not in ds_data.attrs
+    for name in ['aa', 'bb', 'cc']:
+        np.testing.assert_array_equal(expect[name].values, ds_data[name].values)
+    assert progress_call_data == [(n, 12) for n in range(1, 13)]
+
+    def progress_cbk_fail_early(n, nt):
+        progress_call_data.append((n, nt))
+        raise TerminateCurrentLoad()
+
+    progress_call_data = []
+    ds_data = Datacube.load_data(sources, geobox, mm,
+                                 progress_cbk=progress_cbk_fail_early, read_concurrency=4)
+    assert ds_data.dc_partial_load is True
+    assert progress_call_data == [(1, 12)]
+
+
+def test_dask_load_matches_xr_load(tmpdir):
+    from odc.geo import geobox as gbx
+
+    tmpdir = Path(str(tmpdir))
+
+    nodata = -999
+    aa = mk_test_image(96, 64, 'int16', nodata=nodata)
+
+    dss, geoboxes = [], []
+    for i, (timestamp, offset) in enumerate([('2018-07-19', (11230, 1381110)),
+                                             ('2018-07-19', (11230 + 15*40, 1381110 - 15*20)),
+                                             ('2018-07-20', (11230 + 15*70, 1381110))]):
+        ds, geobox = gen_tiff_dataset([SimpleNamespace(name='aa', values=aa + i, nodata=nodata)],
+                                      tmpdir,
+                                      prefix='ds{}-'.format(i),
+                                      timestamp=timestamp,
+                                      resolution=(15, -15),
+                                      offset=offset)
+        dss.append(ds)
+        geoboxes.append(geobox)
+
+    geobox = gbx.pad(geoboxes[0], 80)
+    sources = Datacube.group_datasets(dss, 'time')
+    mm = [dss[0].product.measurements['aa']]
+
+    expect = Datacube.load_data(sources, geobox, mm)
+    for dask_chunks in [{'x': 16, 'y': 16}, {'x': 50, 'y': 33}, {'time': 2, 'x': -1, 'y': 40}]:
+        xx = Datacube.load_data(sources, geobox, mm, dask_chunks=dask_chunks)
+        assert xx.aa.data.chunksize[1:] == tuple(min(dask_chunks[d], n) if dask_chunks[d] > 0 else n
+                                                 for d, n in zip('yx', geobox.shape.yx))
+        np.testing.assert_array_equal(expect.aa.values, xx.aa.values)
+
+        # only chunks that are needed are computed
+        np.testing.assert_array_equal(expect.aa.values[1, :7, -5:], xx.aa[1, :7, -5:].values)
+
+
 def test_hdf5_lock_release_on_failure():
     from datacube.storage._rio import RasterDatasetDataSource, HDF5_LOCK
     from datacube.storage import BandInfo
@@ -199,3 +199,30 @@ def test_bad_field_definition():
 def test_expression():
     assert Expression() == Expression()
     assert (Expression() == object()) is False
+
+
+def test_between_expressions():
+    xx = get_dataset_fields(METADATA_DOC)
+    assert xx['x_integer'].between(4466778, None).evaluate(SAMPLE_DOC)
+    assert xx['x_integer'].between(None, 4466778).evaluate(SAMPLE_DOC)
+    assert not xx['x_integer'].between(0, 4466777).evaluate(SAMPLE_DOC)
+    assert xx['x_double'].between(6, 7).evaluate(SAMPLE_DOC)
+    assert not xx['x_double'].between(6, 7).evaluate({})
+
+    # naive datetimes are treated as UTC, strings are parsed
+    assert xx['x_datetime'].between(datetime.datetime(1999, 4, 15),
+                                    datetime.datetime(1999, 4, 16, tzinfo=datetime.timezone.utc)).evaluate(SAMPLE_DOC)
+    assert xx['x_datetime'].between('1999-04-15', '1999-04-16').evaluate(SAMPLE_DOC)
+    assert not xx['x_datetime'].between('1999-04-16', None).evaluate(SAMPLE_DOC)
+
+    xx = get_dataset_fields(METADATA_DOC_RANGES)
+    # ranges overlap, end points included
+    assert xx['x_range'].between(4, 10).evaluate(SAMPLE_DOC_RANGES)
+    assert xx['x_range'].between(-1, 1).evaluate(SAMPLE_DOC_RANGES)
+    assert xx['x_range'].between(2, 3).evaluate(SAMPLE_DOC_RANGES)
+    assert not xx['x_range'].between(4.5, None).evaluate(SAMPLE_DOC_RANGES)
+    assert not xx['x_range'].between(None, 0.5).evaluate(SAMPLE_DOC_RANGES)
+    assert xx['t_range'].between(datetime.datetime(1999, 4, 16), None).evaluate(SAMPLE_DOC_RANGES)
+    assert not xx['t_range'].between(datetime.datetime(1999, 4, 16, 1), None).evaluate(SAMPLE_DOC_RANGES)
+    assert not xx['ab'].between(0, 10).evaluate({})
+    assert xx['ab'].between(0, 10).evaluate(dict(a=3))
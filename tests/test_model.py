@@ -6,7 +6,7 @@ import pytest
 import numpy
 from copy import deepcopy
 from datacube.testutils import mk_sample_dataset, mk_sample_product
-from datacube.model import (Product, GridSpec, Measurement,
+from datacube.model import (Dataset, Product, GridSpec, Measurement,
                             MetadataType, Range, ranges_overlap)
 from odc.geo import CRS, BoundingBox
 from odc.geo.geom import polygon
@@ -82,6 +82,77 @@ def test_dataset_basics():
     assert ds.transform is None
 
 
+def test_dataset_from_index():
+    ds = mk_sample_dataset([dict(name='a')])
+    ds_ = Dataset._from_index(ds.product, ds.metadata_doc, uri=ds.uri)
+    assert ds_ == ds
+    assert ds_.uri == ds.uri
+    assert ds_.has_multiple_uris() is False
+    assert ds_.sources is None
+    assert ds_.archived_time is None
+    assert ds_.crs == ds.crs
+    assert ds_.extent == ds.extent
+
+    ds_ = Dataset._from_index(ds.product, ds.metadata_doc)
+    assert ds_.uri is None
+    assert ds_.uri_scheme == ''
+
+
+def test_dataset_cached_metadata():
+    ds = mk_sample_dataset([dict(name='a')], geobox=AlbersGS.tile_geobox((15, -40)))
+    assert ds.metadata is ds.metadata
+    assert ds.extent is ds.extent
+    crs, extent = ds.crs, ds.extent
+    assert crs == AlbersGS.crs
+
+    # Replacing the document resets everything read from it
+    doc = deepcopy(ds.metadata_doc)
+    doc['id'] = '4ec8fe97-e8b9-11e4-87ff-1040f381a756'
+    del doc['grid_spatial']
+    ds.metadata_doc = doc
+    assert str(ds.id) == '4ec8fe97-e8b9-11e4-87ff-1040f381a756'
+    assert ds.crs is None and ds.extent is None
+
+    # Cached values can still be overridden and reset
+    ds.extent = extent
+    assert ds.extent is extent
+    del ds.extent
+    assert ds.extent is None
+
+
+def test_dataset_lean():
+    import pickle
+
+    ds = mk_sample_dataset([dict(name='a', path='a.tiff')], geobox=AlbersGS.tile_geobox((15, -40)))
+    loaded = []
+
+    def load_doc(id_):
+        loaded.append(id_)
+        return deepcopy(ds.metadata_doc)
+
+    lean = Dataset._lean(ds.product, ds.id, load_doc, uri=ds.uri, time=ds.time,
+                         grid_spatial=ds.metadata_doc['grid_spatial']['projection'])
+    assert lean == ds
+    assert lean.uri == ds.uri
+    assert lean.time == ds.time
+    assert lean.center_time == ds.center_time
+    assert lean.crs == ds.crs
+    assert lean.extent == ds.extent
+    assert not loaded
+
+    # The document is fetched once, when first needed
+    assert measurement_paths(lean) == measurement_paths(ds)
+    assert lean.metadata_doc == ds.metadata_doc
+    assert loaded == [ds.id]
+
+    # Pickled lean datasets carry their document
+    lean = Dataset._lean(ds.product, ds.id, load_doc, uri=ds.uri)
+    unpickled = pickle.loads(pickle.dumps(lean))
+    assert unpickled.metadata_doc == ds.metadata_doc
+    assert unpickled.extent == ds.extent
+    assert len(loaded) == 2
+
+
 def test_dataset_measurement_paths():
     format = 'GeoTiff'
 
@@ -7,7 +7,12 @@ Test utility functions from :module:`datacube.utils`
 
 
 """
+import datetime
+import io
+import json
 import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 from collections import OrderedDict
 from types import SimpleNamespace
@@ -26,6 +31,8 @@ from datacube.utils import (read_documents, InvalidDocException,
 from datacube.utils.changes import check_doc_unchanged, get_doc_changes, MISSING, DocumentMismatchError
 from datacube.utils.documents import (
     parse_yaml,
+    load_from_json,
+    load_from_yaml,
     without_lineage_sources,
     _open_from_s3,
     netcdf_extract_string,
@@ -158,6 +165,32 @@ def test_parse_yaml():
     assert parse_yaml('a: 10') == {'a': 10}
 
 
+def test_load_from_yaml_no_dates():
+    text = "a: 2020-01-02\nb: 2020-01-02T03:04:05Z\nc: [1, 2.5, yes, null]\n---\nd: x\n"
+    assert list(load_from_yaml(io.StringIO(text))) == [
+        {"a": "2020-01-02", "b": "2020-01-02T03:04:05Z", "c": [1, 2.5, True, None]},
+        {"d": "x"},
+    ]
+    docs = list(load_from_yaml(io.StringIO(text), parse_dates=True))
+    assert docs[0]["a"] == datetime.date(2020, 1, 2)
+
+
+@pytest.mark.parametrize("text", [
+    '{"a": [1, 2.5, true, null], "b": {"c": "\u00e9"}}',
+    '{"nan": NaN, "inf": Infinity}',
+    '{"big": 123456789012345678901234567890}',
+    '{"a": -9223372036854775809, "b": -9999999999999999999, "c": 9223372036854775807}',
+])
+@pytest.mark.parametrize("with_orjson", [True, False])
+def test_load_from_json(text, with_orjson, monkeypatch):
+    if not with_orjson:
+        monkeypatch.setattr("datacube.utils.documents.orjson", None)
+    expected = json.loads(text)
+    for data in (text.encode("utf-8"), text.encode("utf-16")):
+        docs = list(load_from_json(io.BytesIO(data)))
+        assert json.dumps(docs) == json.dumps([expected])
+
+
 def test_read_docs_from_local_path(sample_document_files):
     _test_read_docs_impl(sample_document_files)
 
@@ -192,6 +225,8 @@ def test_read_docs_from_s3(sample_document_files, monkeypatch):
             mocked_s3_objs.append(('s3://mybucket/' + fname, ndocs))
 
         _test_read_docs_impl(mocked_s3_objs)
+        s3_urls = [url for url, _ in mocked_s3_objs]
+        assert list(read_documents(*s3_urls, uri=True, jobs=2)) == list(read_documents(*s3_urls, uri=True))
 
     with pytest.raises(RuntimeError):
         with _open_from_s3("https://not-s3.ga/file.txt"):
@@ -211,6 +246,62 @@ def test_read_docs_from_http(sample_document_files, httpserver):
     _test_read_docs_impl(http_docs)
 
 
+def test_read_docs_prefetch_from_http(sample_document_files, httpserver):
+    http_docs = []
+    for abs_fname, ndocs in sample_document_files:
+        if abs_fname.endswith('gz') or abs_fname.endswith('nc'):
+            continue
+        path = "/" + Path(abs_fname).name
+        httpserver.expect_request(path).respond_with_data(open(abs_fname).read())
+        http_docs.append(httpserver.url_for(path))
+    for i in range(20):
+        httpserver.expect_request(f"/doc-{i}.json").respond_with_data(json.dumps({"n": i}))
+        http_docs.append(httpserver.url_for(f"/doc-{i}.json"))
+
+    expected = list(read_documents(*http_docs, uri=True))
+    assert len(expected) == 25
+    assert list(read_documents(*http_docs, uri=True, jobs=4)) == expected
+
+    # Documents before a file that fails to load are still returned
+    missing = httpserver.url_for("/missing.json")
+    docs = read_documents(*http_docs, missing, *http_docs, uri=True, jobs=4)
+    assert [next(docs) for _ in expected] == expected
+    with pytest.raises(InvalidDocException, match="missing.json"):
+        next(docs)
+
+
+def test_read_docs_http_keepalive():
+    connections = []
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def setup(self):
+            super().setup()
+            connections.append(self.client_address)
+
+        def do_GET(self):
+            body = json.dumps({"path": self.path}).encode()
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("localhost", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        urls = [f"http://localhost:{server.server_port}/{i}.json" for i in range(30)]
+        docs = list(read_documents(*urls, jobs=3))
+        assert [doc["path"] for _, doc in docs] == [f"/{i}.json" for i in range(30)]
+        assert len(connections) <= 3
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
 def _test_read_docs_impl(sample_documents: Iterable[Tuple[str, int]]):
     # Test case for returning URIs pointing to documents
     for doc_url, num_docs in sample_documents:
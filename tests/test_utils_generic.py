@@ -2,8 +2,10 @@
 #
 # Copyright (c) 2015-2025 ODC Contributors
 # SPDX-License-Identifier: Apache-2.0
+import pytest
 from queue import Queue
 from datacube.utils.generic import (
+    batched,
     qmap,
     it2q,
     map_with_lookahead,
@@ -25,6 +27,16 @@ def test_map_with_lookahead():
     assert list(map_with_lookahead(iter([1]), if_many=if_many)) == [1]
 
 
+def test_batched():
+    assert list(batched([], 3)) == []
+    assert list(batched(range(5), 2)) == [[0, 1], [2, 3], [4]]
+    assert list(batched(iter(range(4)), 2)) == [[0, 1], [2, 3]]
+    assert list(batched(range(3), 10)) == [[0, 1, 2]]
+
+    with pytest.raises(ValueError):
+        list(batched(range(3), 0))
+
+
 def test_qmap():
     q = Queue(maxsize=100)
     it2q(range(10), q)
@@ -6,6 +6,7 @@
 Module
 """
 from pathlib import Path
+from unittest import mock
 
 import pytest
 
@@ -99,3 +100,18 @@ def test_ui_path_doc_stream(httpserver):
     for input_path, (doc, resolved_path) in zip(input_paths, ui_path_doc_stream(input_paths)):
         assert doc == {}
         assert input_path == resolved_path
+
+
+def test_ui_path_doc_stream_jobs(httpserver):
+    docs = {f'dataset_{i}.yaml': f'id: {i}\n' for i in range(5)}
+    for filename, content in docs.items():
+        httpserver.expect_request(f'/{filename}').respond_with_data(content)
+    httpserver.expect_request('/broken.yaml').respond_with_data('id: [', status=200)
+
+    input_paths = [httpserver.url_for(filename) for filename in docs]
+    input_paths.insert(2, httpserver.url_for('broken.yaml'))
+    logger = mock.MagicMock()
+
+    stream = ui_path_doc_stream(input_paths, logger=logger, raw=True, jobs=3)
+    assert [doc['id'] for _, doc in stream] == list(range(5))
+    logger.error.assert_called_once_with('Failed reading documents from %s', httpserver.url_for('broken.yaml'))